@@ -23,6 +23,11 @@ from graphrag.api.query import (
     multi_index_global_search,
     multi_index_local_search,
 )
+from graphrag.api.query_engine import (
+    GraphRagQueryEngine,
+    QueryIndex,
+    load_query_index,
+)
 from graphrag.prompt_tune.types import DocSelectionType
 
 __all__ = [  # noqa: RUF022
@@ -41,6 +46,10 @@ __all__ = [  # noqa: RUF022
     "multi_index_drift_search",
     "multi_index_global_search",
     "multi_index_local_search",
+    # query engine API
+    "GraphRagQueryEngine",
+    "QueryIndex",
+    "load_query_index",
     # prompt tuning API
     "DocSelectionType",
     "generate_indexing_prompts",
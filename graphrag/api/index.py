@@ -27,6 +27,7 @@ async def build_index(
     config: GraphRagConfig,
     method: IndexingMethod = IndexingMethod.Standard,
     is_update_run: bool = False,
+    is_resume_run: bool = False,
     memory_profile: bool = False,
     callbacks: list[WorkflowCallbacks] | None = None,
     progress_logger: ProgressLogger | None = None,
@@ -39,6 +40,8 @@ async def build_index(
         The configuration.
     method : IndexingMethod default=IndexingMethod.Standard
         Styling of indexing to perform (full LLM, NLP + LLM, etc.).
+    is_resume_run : bool default=False
+        Whether to skip workflows whose checkpointed inputs and config are unchanged.
     memory_profile : bool
         Whether to enable memory profiling.
     callbacks : list[WorkflowCallbacks] | None default=None
@@ -72,6 +75,7 @@ async def build_index(
         callbacks=callbacks,
         logger=progress_logger,
         is_update_run=is_update_run,
+        is_resume_run=is_resume_run,
     ):
         outputs.append(output)
         if progress_logger:
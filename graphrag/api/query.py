@@ -40,7 +40,7 @@ from graphrag.query.factory import (
 )
 from graphrag.query.indexer_adapters import (
     read_indexer_communities,
-    read_indexer_covariates,
+    read_indexer_covariate_table,
     read_indexer_entities,
     read_indexer_relationships,
     read_indexer_report_embeddings,
@@ -162,6 +162,20 @@ def global_search_streaming(
         community_level=community_level,
         dynamic_community_selection=dynamic_community_selection,
     )
+    if (
+        dynamic_community_selection
+        and config.global_search.dynamic_search_embedding_threshold is not None
+    ):
+        read_indexer_report_embeddings(
+            reports,
+            get_embedding_store(
+                config_args={
+                    index: store.model_dump()
+                    for index, store in config.vector_store.items()
+                },
+                embedding_name=community_full_content_embedding,
+            ),
+        )
     entities_ = read_indexer_entities(
         entities, communities, community_level=community_level
     )
@@ -443,7 +457,9 @@ def local_search_streaming(
     )
 
     entities_ = read_indexer_entities(entities, communities, community_level)
-    covariates_ = read_indexer_covariates(covariates) if covariates is not None else []
+    covariates_ = (
+        read_indexer_covariate_table(covariates) if covariates is not None else []
+    )
     prompt = load_search_prompt(config.root_dir, config.local_search.prompt)
 
     search_engine = get_local_search_engine(
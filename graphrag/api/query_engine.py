@@ -0,0 +1,621 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""
+Query Engine Session API.
+
+The search functions in graphrag.api.query adapt the index outputs, connect to the vector stores
+and create LLM clients on every call. The GraphRagQueryEngine does all of that once per index and
+keeps it warm, so a long-lived service can answer any number of concurrent queries and switch to a
+new index version without interrupting the queries in flight.
+
+Contains the following:
+ - QueryIndex: The index outputs searched by a query engine.
+ - load_query_index: Load the index outputs from the configured output storage.
+ - GraphRagQueryEngine: A long-lived query engine over a single index.
+
+WARNING: This API is under development and may undergo changes in future releases.
+Backwards compatibility is not guaranteed at this time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from graphrag.cache.json_pipeline_cache import JsonPipelineCache
+from graphrag.callbacks.noop_query_callbacks import NoopQueryCallbacks
+from graphrag.config.embeddings import (
+    community_full_content_embedding,
+    entity_description_embedding,
+    text_unit_text_embedding,
+)
+from graphrag.config.enums import SearchMethod
+from graphrag.query.factory import (
+    get_basic_search_engine,
+    get_drift_search_engine,
+    get_global_search_engine,
+    get_local_search_engine,
+)
+from graphrag.query.indexer_adapters import (
+    read_indexer_communities,
+    read_indexer_covariate_table,
+    read_indexer_entities,
+    read_indexer_relationships,
+    read_indexer_report_embeddings,
+    read_indexer_reports,
+    read_indexer_text_units,
+)
+from graphrag.query.llm.get_client import get_llm, get_text_embedder
+from graphrag.query.structured_search.drift_search.drift_context import (
+    DRIFTSearchContextBuilder,
+)
+from graphrag.storage.factory import StorageFactory
+from graphrag.utils.api import get_embedding_store, load_search_prompt
+from graphrag.utils.storage import load_table_from_storage, storage_has_table
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable
+
+    import pandas as pd
+
+    from graphrag.callbacks.query_callbacks import QueryCallbacks
+    from graphrag.config.models.graph_rag_config import GraphRagConfig
+    from graphrag.query.llm.oai.chat_openai import ChatOpenAI
+    from graphrag.query.llm.oai.embedding import OpenAIEmbedding
+    from graphrag.query.structured_search.base import BaseSearch
+    from graphrag.vector_stores.base import BaseVectorStore
+
+log = logging.getLogger(__name__)
+
+DEFAULT_COMMUNITY_LEVEL = 2
+DEFAULT_RESPONSE_TYPE = "Multiple Paragraphs"
+
+QueryResult = tuple[
+    str | dict[str, Any] | list[dict[str, Any]],
+    str | list["pd.DataFrame"] | dict[str, "pd.DataFrame"],
+]
+
+
+@dataclass
+class QueryIndex:
+    """The index outputs searched by a query engine."""
+
+    entities: pd.DataFrame
+    communities: pd.DataFrame
+    community_reports: pd.DataFrame
+    text_units: pd.DataFrame
+    relationships: pd.DataFrame
+    covariates: pd.DataFrame | None = None
+    version: str | None = None
+    """An identifier of the index version, e.g. the output directory it was loaded from."""
+
+
+async def load_query_index(
+    config: GraphRagConfig, version: str | None = None
+) -> QueryIndex:
+    """Load the index outputs from the configured output storage."""
+    output_config = config.output.model_dump()
+    storage = StorageFactory().create_storage(
+        storage_type=output_config["type"], kwargs=output_config
+    )
+    names = [
+        "entities",
+        "communities",
+        "community_reports",
+        "text_units",
+        "relationships",
+    ]
+    tables = await asyncio.gather(*[
+        load_table_from_storage(name, storage) for name in names
+    ])
+    covariates = (
+        await load_table_from_storage("covariates", storage)
+        if await storage_has_table("covariates", storage)
+        else None
+    )
+    return QueryIndex(
+        **dict(zip(names, tables, strict=True)),
+        covariates=covariates,
+        version=version or config.output.base_dir,
+    )
+
+
+class GraphRagQueryEngine:
+    """A long-lived query engine over a single index.
+
+    The index outputs are adapted into query models once per community level, and the context
+    builders, vector store connections, LLM clients and prompts are created on first use and then
+    shared by every query. Each query still gets its own search engine, so queries can run
+    concurrently, each with its own callbacks.
+    """
+
+    def __init__(self, config: GraphRagConfig, index: QueryIndex):
+        """Create a query engine over an index."""
+        self._session = _IndexSession(config, index, _QueryClients(config))
+
+    @classmethod
+    async def load(
+        cls,
+        config: GraphRagConfig,
+        warm: list[SearchMethod] | None = None,
+        community_level: int = DEFAULT_COMMUNITY_LEVEL,
+    ) -> GraphRagQueryEngine:
+        """Load the index from the configured output storage, warming the given search methods."""
+        engine = cls(config, await load_query_index(config))
+        if warm:
+            await engine.warm(warm, community_level)
+        return engine
+
+    async def warm(
+        self,
+        methods: list[SearchMethod],
+        community_level: int = DEFAULT_COMMUNITY_LEVEL,
+    ) -> None:
+        """Prepare everything the given search methods need, so their first query does not pay for it."""
+        await self._session.warm(methods, community_level)
+
+    @property
+    def config(self) -> GraphRagConfig:
+        """The configuration queries are run with."""
+        return self._session.config
+
+    @property
+    def index(self) -> QueryIndex:
+        """The index currently being searched."""
+        return self._session.index
+
+    async def swap(
+        self,
+        index: QueryIndex,
+        config: GraphRagConfig | None = None,
+        warm: list[SearchMethod] | None = None,
+        community_level: int = DEFAULT_COMMUNITY_LEVEL,
+    ) -> None:
+        """Switch to a new index version.
+
+        The new index is prepared (and warmed for the given search methods) off the event loop
+        while queries keep being served from the current one. Queries already running finish on
+        the index they started with.
+        """
+        if config is None:
+            session = _IndexSession(self.config, index, self._session.clients)
+        else:
+            session = _IndexSession(config, index, _QueryClients(config))
+        if warm:
+            await session.warm(warm, community_level)
+        self._session = session
+        log.info("query engine switched to index version %s", index.version)
+
+    async def reload(
+        self,
+        config: GraphRagConfig | None = None,
+        warm: list[SearchMethod] | None = None,
+        community_level: int = DEFAULT_COMMUNITY_LEVEL,
+    ) -> None:
+        """Load the index again from the output storage of the (new) configuration and switch to it."""
+        index = await load_query_index(config or self.config)
+        await self.swap(index, config, warm, community_level)
+
+    async def global_search(
+        self,
+        query: str,
+        community_level: int | None = DEFAULT_COMMUNITY_LEVEL,
+        dynamic_community_selection: bool = False,
+        response_type: str = DEFAULT_RESPONSE_TYPE,
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> QueryResult:
+        """Perform a global search and return the response and context data."""
+        return await _collect(
+            lambda callbacks: self.global_search_streaming(
+                query,
+                community_level,
+                dynamic_community_selection,
+                response_type,
+                callbacks,
+            ),
+            callbacks,
+        )
+
+    def global_search_streaming(
+        self,
+        query: str,
+        community_level: int | None = DEFAULT_COMMUNITY_LEVEL,
+        dynamic_community_selection: bool = False,
+        response_type: str = DEFAULT_RESPONSE_TYPE,
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> AsyncGenerator:
+        """Perform a global search and return the response via a generator."""
+        return self._session.global_engine(
+            community_level, dynamic_community_selection, response_type, callbacks
+        ).stream_search(query=query)
+
+    async def local_search(
+        self,
+        query: str,
+        community_level: int = DEFAULT_COMMUNITY_LEVEL,
+        response_type: str = DEFAULT_RESPONSE_TYPE,
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> QueryResult:
+        """Perform a local search and return the response and context data."""
+        return await _collect(
+            lambda callbacks: self.local_search_streaming(
+                query, community_level, response_type, callbacks
+            ),
+            callbacks,
+        )
+
+    def local_search_streaming(
+        self,
+        query: str,
+        community_level: int = DEFAULT_COMMUNITY_LEVEL,
+        response_type: str = DEFAULT_RESPONSE_TYPE,
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> AsyncGenerator:
+        """Perform a local search and return the response via a generator."""
+        return self._session.local_engine(
+            community_level, response_type, callbacks
+        ).stream_search(query=query)
+
+    async def drift_search(
+        self,
+        query: str,
+        community_level: int = DEFAULT_COMMUNITY_LEVEL,
+        response_type: str = DEFAULT_RESPONSE_TYPE,
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> QueryResult:
+        """Perform a DRIFT search and return the response and context data."""
+        return await _collect(
+            lambda callbacks: self.drift_search_streaming(
+                query, community_level, response_type, callbacks
+            ),
+            callbacks,
+        )
+
+    def drift_search_streaming(
+        self,
+        query: str,
+        community_level: int = DEFAULT_COMMUNITY_LEVEL,
+        response_type: str = DEFAULT_RESPONSE_TYPE,
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> AsyncGenerator:
+        """Perform a DRIFT search and return the response via a generator."""
+        return self._session.drift_engine(
+            community_level, response_type, callbacks
+        ).stream_search(query=query)
+
+    async def basic_search(
+        self, query: str, callbacks: list[QueryCallbacks] | None = None
+    ) -> QueryResult:
+        """Perform a basic search and return the response and context data."""
+        return await _collect(
+            lambda callbacks: self.basic_search_streaming(query, callbacks), callbacks
+        )
+
+    def basic_search_streaming(
+        self, query: str, callbacks: list[QueryCallbacks] | None = None
+    ) -> AsyncGenerator:
+        """Perform a basic search and return the response via a generator."""
+        return self._session.basic_engine(callbacks).stream_search(query=query)
+
+
+class _QueryClients:
+    """The LLM clients shared by every query, created on first use."""
+
+    def __init__(self, config: GraphRagConfig):
+        self.config = config
+        self._llm: ChatOpenAI | None = None
+        self._text_embedder: OpenAIEmbedding | None = None
+
+    @property
+    def llm(self) -> ChatOpenAI:
+        if self._llm is None:
+            self._llm = get_llm(self.config)
+        return self._llm
+
+    @property
+    def text_embedder(self) -> OpenAIEmbedding:
+        if self._text_embedder is None:
+            self._text_embedder = get_text_embedder(self.config)
+        return self._text_embedder
+
+
+class _IndexSession:
+    """The query models, vector stores and context builders of one index version."""
+
+    def __init__(
+        self, config: GraphRagConfig, index: QueryIndex, clients: _QueryClients
+    ):
+        self.config = config
+        self.index = index
+        self.clients = clients
+        self._values: dict[tuple, Any] = {}
+
+    async def warm(self, methods: list[SearchMethod], community_level: int) -> None:
+        """Load what the search methods need off the event loop, then run their async setup on it."""
+        for method in methods:
+            match method:
+                case SearchMethod.GLOBAL:
+                    engine = await asyncio.to_thread(
+                        self.global_engine,
+                        community_level,
+                        False,
+                        DEFAULT_RESPONSE_TYPE,
+                    )
+                    # build the map context batches, which do not depend on the query
+                    await engine.context_builder.build_context(
+                        query="", **engine.context_builder_params
+                    )
+                case SearchMethod.LOCAL:
+                    await asyncio.to_thread(
+                        self.local_engine, community_level, DEFAULT_RESPONSE_TYPE
+                    )
+                case SearchMethod.DRIFT:
+                    await asyncio.to_thread(
+                        self.drift_engine, community_level, DEFAULT_RESPONSE_TYPE
+                    )
+                case SearchMethod.BASIC:
+                    await asyncio.to_thread(self.basic_engine)
+
+    def global_engine(
+        self,
+        community_level: int | None,
+        dynamic_community_selection: bool,
+        response_type: str,
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> BaseSearch:
+        config = self.config.global_search
+        key = ("global", community_level, dynamic_community_selection)
+        # the reports rated by dynamic community selection are prefiltered by their embeddings
+        prefilter = (
+            dynamic_community_selection
+            and config.dynamic_search_embedding_threshold is not None
+        )
+
+        def create(context_builder=None):
+            index = self.index
+            return get_global_search_engine(
+                self.config,
+                reports=self._get(
+                    ("global_reports", community_level, dynamic_community_selection),
+                    lambda: self.global_reports(
+                        community_level, dynamic_community_selection, prefilter
+                    ),
+                ),
+                entities=self.entities(community_level),
+                communities=self._get(
+                    ("communities",),
+                    lambda: read_indexer_communities(
+                        index.communities, index.community_reports
+                    ),
+                ),
+                response_type=response_type,
+                dynamic_community_selection=dynamic_community_selection,
+                map_system_prompt=self.prompt(config.map_prompt),
+                reduce_system_prompt=self.prompt(config.reduce_prompt),
+                general_knowledge_inclusion_prompt=self.prompt(config.knowledge_prompt),
+                callbacks=callbacks,
+                llm=self.clients.llm,
+                context_builder=context_builder,
+                context_cache=self.global_context_cache()
+                if config.persist_context and not dynamic_community_selection
+                else None,
+                text_embedder=self.clients.text_embedder if prefilter else None,
+            )
+
+        return self._engine(key, create)
+
+    def local_engine(
+        self,
+        community_level: int,
+        response_type: str,
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> BaseSearch:
+        key = ("local", community_level)
+
+        def create(context_builder=None):
+            index = self.index
+            covariates = self._get(
+                ("covariates",),
+                lambda: read_indexer_covariate_table(index.covariates)
+                if index.covariates is not None
+                else [],
+            )
+            return get_local_search_engine(
+                config=self.config,
+                reports=self.reports(community_level),
+                text_units=self.text_units(),
+                entities=self.entities(community_level),
+                relationships=self.relationships(),
+                covariates={"claims": covariates},
+                description_embedding_store=self.embedding_store(
+                    entity_description_embedding
+                ),
+                response_type=response_type,
+                system_prompt=self.prompt(self.config.local_search.prompt),
+                callbacks=callbacks,
+                llm=self.clients.llm,
+                text_embedder=self.clients.text_embedder,
+                context_builder=context_builder,
+            )
+
+        return self._engine(key, create)
+
+    def drift_engine(
+        self,
+        community_level: int,
+        response_type: str,
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> BaseSearch:
+        # the DRIFT context builder carries the response type into its local searches
+        key = ("drift", community_level, response_type)
+
+        def create(context_builder=None):
+            reports, report_embeddings = self._get(
+                ("drift_reports", community_level),
+                lambda: self.drift_reports(community_level),
+            )
+            return get_drift_search_engine(
+                config=self.config,
+                reports=reports,
+                report_embeddings=report_embeddings,
+                text_units=self.text_units(),
+                entities=self.entities(community_level),
+                relationships=self.relationships(),
+                description_embedding_store=self.embedding_store(
+                    entity_description_embedding
+                ),
+                local_system_prompt=self.prompt(self.config.drift_search.prompt),
+                reduce_system_prompt=self.prompt(
+                    self.config.drift_search.reduce_prompt
+                ),
+                response_type=response_type,
+                callbacks=callbacks,
+                llm=self.clients.llm,
+                text_embedder=self.clients.text_embedder,
+                context_builder=context_builder,
+            )
+
+        return self._engine(key, create)
+
+    def basic_engine(self, callbacks: list[QueryCallbacks] | None = None) -> BaseSearch:
+        def create(context_builder=None):
+            return get_basic_search_engine(
+                config=self.config,
+                text_units=self.text_units(),
+                text_unit_embeddings=self.embedding_store(text_unit_text_embedding),
+                system_prompt=self.prompt(self.config.basic_search.prompt),
+                callbacks=callbacks,
+                llm=self.clients.llm,
+                text_embedder=self.clients.text_embedder,
+                context_builder=context_builder,
+            )
+
+        return self._engine(("basic",), create)
+
+    def entities(self, community_level: int | None) -> list:
+        return self._get(
+            ("entities", community_level),
+            lambda: read_indexer_entities(
+                self.index.entities, self.index.communities, community_level
+            ),
+        )
+
+    def reports(self, community_level: int) -> list:
+        return self._get(
+            ("reports", community_level),
+            lambda: read_indexer_reports(
+                self.index.community_reports, self.index.communities, community_level
+            ),
+        )
+
+    def global_reports(
+        self,
+        community_level: int | None,
+        dynamic_community_selection: bool,
+        embeddings: bool,
+    ) -> list:
+        reports = read_indexer_reports(
+            self.index.community_reports,
+            self.index.communities,
+            community_level=community_level,
+            dynamic_community_selection=dynamic_community_selection,
+        )
+        if embeddings:
+            read_indexer_report_embeddings(
+                reports, self.embedding_store(community_full_content_embedding)
+            )
+        return reports
+
+    def drift_reports(self, community_level: int) -> tuple[list, np.ndarray | None]:
+        # kept apart from the other reports, which do not need their embeddings
+        reports = read_indexer_reports(
+            self.index.community_reports, self.index.communities, community_level
+        )
+        embeddings = read_indexer_report_embeddings(
+            reports, self.embedding_store(community_full_content_embedding)
+        )
+        # normalized once for the DRIFT context builders of every response type,
+        # which report missing embeddings themselves
+        if embeddings.shape[1] == 0 or np.isnan(embeddings).any():
+            return reports, None
+        return reports, DRIFTSearchContextBuilder.normalize_report_embeddings(
+            embeddings
+        )
+
+    def global_context_cache(self) -> JsonPipelineCache:
+        """Persist the global search map context batches next to the index outputs."""
+
+        def create() -> JsonPipelineCache:
+            output_config = self.config.output.model_dump()
+            storage = StorageFactory().create_storage(
+                storage_type=output_config["type"], kwargs=output_config
+            )
+            return JsonPipelineCache(storage.child("global_search_context"))
+
+        return self._get(("global_context_cache",), create)
+
+    def text_units(self) -> list:
+        return self._get(
+            ("text_units",), lambda: read_indexer_text_units(self.index.text_units)
+        )
+
+    def relationships(self) -> list:
+        return self._get(
+            ("relationships",),
+            lambda: read_indexer_relationships(self.index.relationships),
+        )
+
+    def embedding_store(self, embedding_name: str) -> BaseVectorStore:
+        return self._get(
+            ("embedding_store", embedding_name),
+            lambda: get_embedding_store(
+                config_args={
+                    index: store.model_dump()
+                    for index, store in self.config.vector_store.items()
+                },
+                embedding_name=embedding_name,
+            ),
+        )
+
+    def prompt(self, path: str | None) -> str | None:
+        return self._get(
+            ("prompt", path), lambda: load_search_prompt(self.config.root_dir, path)
+        )
+
+    def _engine(self, key: tuple, create: Callable[..., BaseSearch]) -> BaseSearch:
+        """Create a search engine, reusing the context builder of the first one created for the key."""
+        context_builder = self._values.get(("context_builder", *key))
+        engine = create(context_builder)
+        if context_builder is None:
+            self._values[("context_builder", *key)] = engine.context_builder
+        return engine
+
+    def _get(self, key: tuple, create: Callable[[], Any]) -> Any:
+        if key not in self._values:
+            self._values[key] = create()
+        return self._values[key]
+
+
+async def _collect(
+    stream: Callable[[list[QueryCallbacks]], AsyncGenerator],
+    callbacks: list[QueryCallbacks] | None,
+) -> QueryResult:
+    """Run a streaming search to completion, returning the full response and its context data."""
+    full_response = ""
+    context_data = {}
+
+    def on_context(context: Any) -> None:
+        nonlocal context_data
+        context_data = context
+
+    local_callbacks = NoopQueryCallbacks()
+    local_callbacks.on_context = on_context
+
+    async for chunk in stream([*(callbacks or []), local_callbacks]):
+        full_response += chunk
+    return full_response, context_data
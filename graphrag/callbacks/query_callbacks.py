@@ -6,7 +6,7 @@
 from typing import Any
 
 from graphrag.callbacks.llm_callbacks import BaseLLMCallback
-from graphrag.query.structured_search.base import SearchResult
+from graphrag.query.structured_search.base import MapResponseStats, SearchResult
 
 
 class QueryCallbacks(BaseLLMCallback):
@@ -21,6 +21,9 @@ class QueryCallbacks(BaseLLMCallback):
     def on_map_response_end(self, map_response_outputs: list[SearchResult]) -> None:
         """Handle the end of map operation."""
 
+    def on_map_response_stats(self, map_response_stats: MapResponseStats) -> None:
+        """Handle the latency statistics of the map operation."""
+
     def on_reduce_response_start(
         self, reduce_response_context: str | dict[str, Any]
     ) -> None:
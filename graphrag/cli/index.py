@@ -72,6 +72,7 @@ def index_cli(
     dry_run: bool,
     skip_validation: bool,
     output_dir: Path | None,
+    resume: bool = False,
 ):
     """Run the pipeline with the given config."""
     cli_overrides = {}
@@ -85,6 +86,7 @@ def index_cli(
         config=config,
         method=method,
         is_update_run=False,
+        is_resume_run=resume,
         verbose=verbose,
         memprofile=memprofile,
         cache=cache,
@@ -118,6 +120,7 @@ def update_cli(
         config=config,
         method=method,
         is_update_run=True,
+        is_resume_run=False,
         verbose=verbose,
         memprofile=memprofile,
         cache=cache,
@@ -131,6 +134,7 @@ def _run_index(
     config,
     method,
     is_update_run,
+    is_resume_run,
     verbose,
     memprofile,
     cache,
@@ -173,6 +177,7 @@ def _run_index(
             config=config,
             method=method,
             is_update_run=is_update_run,
+            is_resume_run=is_resume_run,
             memory_profile=memprofile,
             progress_logger=progress_logger,
         )
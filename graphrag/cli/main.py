@@ -162,6 +162,12 @@ def _index_cli(
             resolve_path=True,
         ),
     ] = None,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            help="Skip workflows whose inputs and configuration are unchanged since their last successful run."
+        ),
+    ] = False,
 ):
     """Build a knowledge graph index."""
     from graphrag.cli.index import index_cli
@@ -177,6 +183,7 @@ def _index_cli(
         skip_validation=skip_validation,
         output_dir=output,
         method=method,
+        resume=resume,
     )
 
 
@@ -469,3 +476,83 @@ def _query_cli(
             )
         case _:
             raise ValueError(INVALID_METHOD_ERROR)
+
+
+@app.command("serve")
+def _serve_cli(
+    config: Annotated[
+        Path | None,
+        typer.Option(
+            help="The configuration to use.",
+            exists=True,
+            file_okay=True,
+            readable=True,
+            autocompletion=path_autocomplete(
+                file_okay=True, dir_okay=False, match_wildcard="*"
+            ),
+        ),
+    ] = None,
+    data: Annotated[
+        Path | None,
+        typer.Option(
+            help="Indexing pipeline output directory (i.e. contains the parquet files).",
+            exists=True,
+            dir_okay=True,
+            readable=True,
+            resolve_path=True,
+            autocompletion=path_autocomplete(
+                file_okay=False, dir_okay=True, match_wildcard="*"
+            ),
+        ),
+    ] = None,
+    root: Annotated[
+        Path,
+        typer.Option(
+            help="The project root directory.",
+            exists=True,
+            dir_okay=True,
+            writable=True,
+            resolve_path=True,
+            autocompletion=path_autocomplete(
+                file_okay=False, dir_okay=True, match_wildcard="*"
+            ),
+        ),
+    ] = Path(),  # set default to current directory
+    host: Annotated[
+        str, typer.Option(help="The host to serve HTTP requests on.")
+    ] = "127.0.0.1",
+    port: Annotated[
+        int, typer.Option(help="The port to serve HTTP requests on.")
+    ] = 8000,
+    stdin: Annotated[
+        bool,
+        typer.Option(
+            help="Read JSON line requests from stdin and write responses to stdout instead of serving HTTP."
+        ),
+    ] = False,
+    warm: Annotated[
+        list[SearchMethod] | None,
+        typer.Option(
+            help="A query algorithm to prepare for before serving the first request. Can be given more than once."
+        ),
+    ] = None,
+    community_level: Annotated[
+        int,
+        typer.Option(
+            help="The community level to prepare the warmed query algorithms for."
+        ),
+    ] = 2,
+):
+    """Load a knowledge graph index once and serve queries over it."""
+    from graphrag.cli.serve import run_query_server
+
+    run_query_server(
+        config_filepath=config,
+        data_dir=data,
+        root_dir=root,
+        host=host,
+        port=port,
+        stdin=stdin,
+        warm=warm,
+        community_level=community_level,
+    )
@@ -0,0 +1,222 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""CLI implementation of the serve subcommand.
+
+Serves queries from a GraphRagQueryEngine kept loaded for the lifetime of the process, either over
+a local HTTP endpoint or as JSON lines on stdin/stdout.
+
+Each request is a JSON object:
+ - {"method": "local", "query": "...", "community_level": 2, "response_type": "..."} runs a query
+   (global queries also accept "dynamic_community_selection").
+ - {"command": "reload", "data": "<output dir>"} switches to a new index version, reloading the
+   configured output directory if no data directory is given.
+ - {"command": "status"} returns the index version being served.
+
+Over HTTP, queries are POSTed to /query, reloads to /reload and the status is at GET /status. On
+stdin, requests may carry an "id" which is echoed back, as responses are written in completion
+order.
+"""
+
+import asyncio
+import json
+import sys
+from collections.abc import Awaitable, Callable
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from graphrag.api.query_engine import (
+    DEFAULT_COMMUNITY_LEVEL,
+    DEFAULT_RESPONSE_TYPE,
+    GraphRagQueryEngine,
+)
+from graphrag.config.enums import SearchMethod
+from graphrag.config.load_config import load_config
+from graphrag.logger.print_progress import PrintProgressLogger
+
+logger = PrintProgressLogger("")
+
+MAX_REQUEST_BYTES = 1 << 20
+
+ReloadFn = Callable[[str | None], Awaitable[None]]
+
+
+def run_query_server(
+    config_filepath: Path | None,
+    data_dir: Path | None,
+    root_dir: Path,
+    host: str,
+    port: int,
+    stdin: bool,
+    warm: list[SearchMethod] | None = None,
+    community_level: int = DEFAULT_COMMUNITY_LEVEL,
+):
+    """Load an index once and serve queries over it until interrupted."""
+    root = root_dir.resolve()
+    cli_overrides = {}
+    if data_dir:
+        cli_overrides["output.base_dir"] = str(data_dir)
+    config = load_config(root, config_filepath, cli_overrides)
+
+    async def serve() -> None:
+        engine = await GraphRagQueryEngine.load(config, warm, community_level)
+
+        async def reload(data: str | None) -> None:
+            overrides = {**cli_overrides}
+            if data:
+                overrides["output.base_dir"] = str(Path(data).resolve())
+            await engine.reload(
+                load_config(root, config_filepath, overrides), warm, community_level
+            )
+
+        if stdin:
+            await serve_stdin(engine, reload)
+        else:
+            await serve_http(engine, reload, host, port)
+
+    asyncio.run(serve())
+
+
+async def handle_request(
+    engine: GraphRagQueryEngine, request: dict[str, Any], reload: ReloadFn
+) -> dict[str, Any]:
+    """Answer a single server request."""
+    match request.get("command", "query"):
+        case "query":
+            response, context_data = await run_query(engine, request)
+            return {
+                "response": response,
+                "context_data": _to_json(context_data),
+                "version": engine.index.version,
+            }
+        case "reload":
+            await reload(request.get("data"))
+            return {"version": engine.index.version}
+        case "status":
+            return {"version": engine.index.version}
+        case command:
+            msg = f"Unknown command: {command}"
+            raise ValueError(msg)
+
+
+async def run_query(engine: GraphRagQueryEngine, request: dict[str, Any]):
+    """Run the query described by a request."""
+    query = request["query"]
+    community_level = request.get("community_level", DEFAULT_COMMUNITY_LEVEL)
+    response_type = request.get("response_type", DEFAULT_RESPONSE_TYPE)
+    match SearchMethod(request.get("method", SearchMethod.LOCAL.value)):
+        case SearchMethod.LOCAL:
+            return await engine.local_search(query, community_level, response_type)
+        case SearchMethod.GLOBAL:
+            return await engine.global_search(
+                query,
+                community_level,
+                request.get("dynamic_community_selection", False),
+                response_type,
+            )
+        case SearchMethod.DRIFT:
+            return await engine.drift_search(query, community_level, response_type)
+        case SearchMethod.BASIC:
+            return await engine.basic_search(query)
+
+
+async def serve_stdin(engine: GraphRagQueryEngine, reload: ReloadFn) -> None:
+    """Answer JSON line requests from stdin concurrently, writing a JSON line per response."""
+    loop = asyncio.get_running_loop()
+    tasks: set[asyncio.Task] = set()
+
+    async def answer(line: str) -> None:
+        request: dict[str, Any] = {}
+        try:
+            request = json.loads(line)
+            result = await handle_request(engine, request, reload)
+        except Exception as e:  # noqa: BLE001
+            result = {"error": str(e)}
+        if "id" in request:
+            result = {"id": request["id"], **result}
+        sys.stdout.write(json.dumps(result, default=str) + "\n")
+        sys.stdout.flush()
+
+    while line := await loop.run_in_executor(None, sys.stdin.readline):
+        if not line.strip():
+            continue
+        task = asyncio.create_task(answer(line))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    await asyncio.gather(*tasks)
+
+
+async def serve_http(
+    engine: GraphRagQueryEngine, reload: ReloadFn, host: str, port: int
+) -> None:
+    """Answer JSON requests over a minimal local HTTP/1.1 endpoint."""
+
+    async def on_connection(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            status, result = await _answer_http(engine, reload, reader)
+        except Exception as e:  # noqa: BLE001
+            status, result = HTTPStatus.BAD_REQUEST, {"error": str(e)}
+        body = json.dumps(result, default=str).encode()
+        writer.write(
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n".encode()
+            + body
+        )
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(on_connection, host, port)
+    logger.success(f"Serving queries on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+async def _answer_http(
+    engine: GraphRagQueryEngine, reload: ReloadFn, reader: asyncio.StreamReader
+) -> tuple[HTTPStatus, dict[str, Any]]:
+    request_line = (await reader.readline()).decode().split()
+    if len(request_line) < 2:
+        return HTTPStatus.BAD_REQUEST, {"error": "malformed request"}
+    verb, path = request_line[0], request_line[1]
+    headers = {}
+    while (line := (await reader.readline()).decode().strip()) != "":
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0))
+    if length > MAX_REQUEST_BYTES:
+        return HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "request too large"}
+    request = json.loads(await reader.readexactly(length)) if length else {}
+
+    match verb, path:
+        case "POST", "/query":
+            return HTTPStatus.OK, await handle_request(
+                engine, {**request, "command": "query"}, reload
+            )
+        case "POST", "/reload":
+            return HTTPStatus.OK, await handle_request(
+                engine, {**request, "command": "reload"}, reload
+            )
+        case "GET", "/status":
+            return HTTPStatus.OK, await handle_request(
+                engine, {"command": "status"}, reload
+            )
+        case _:
+            return HTTPStatus.NOT_FOUND, {"error": f"no route for {verb} {path}"}
+
+
+def _to_json(value: Any) -> Any:
+    """Convert the context data of a response into JSON-compatible values."""
+    if isinstance(value, pd.DataFrame):
+        return value.to_dict(orient="records")
+    if isinstance(value, dict):
+        return {key: _to_json(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_to_json(item) for item in value]
+    return value
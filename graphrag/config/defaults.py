@@ -8,6 +8,7 @@ from pathlib import Path
 from graphrag.config.enums import (
     AsyncType,
     AuthType,
+    BatchType,
     CacheType,
     ChunkStrategyType,
     InputFileType,
@@ -39,6 +40,7 @@ LLM_N = 1
 LLM_REQUEST_TIMEOUT = 180.0
 LLM_TOKENS_PER_MINUTE = 50_000
 LLM_REQUESTS_PER_MINUTE = 1_000
+LLM_SHARED_RATE_LIMITS = True
 RETRY_STRATEGY = "native"
 LLM_MAX_RETRIES = 10
 LLM_MAX_RETRY_WAIT = 10.0
@@ -66,6 +68,7 @@ CHUNK_GROUP_BY_COLUMNS = ["id"]
 CHUNK_STRATEGY = ChunkStrategyType.tokens
 CHUNK_PREPEND_METADATA = False
 CHUNK_SIZE_INCLUDES_METADATA = False
+CHUNK_NUM_THREADS = 8
 
 # Claim extraction
 DESCRIPTION = "Any claims or facts that could be relevant to information discovery."
@@ -130,7 +133,26 @@ SNAPSHOTS_EMBEDDINGS = False
 OUTPUT_BASE_DIR = "output"
 OUTPUT_TYPE = OutputType.file
 UPDATE_OUTPUT_BASE_DIR = "update_output"
+SCHEDULER_MAX_CONCURRENT_WORKFLOWS = 1
+SCHEDULER_CONCURRENT_REQUESTS = None
+TABLE_CACHE_MAX_SIZE_MB = 1024
+TABLE_CACHE_ARROW_DTYPES = False
+BATCH_ENABLED = False
+BATCH_TYPE = BatchType.openai
+BATCH_BASE_DIR = "batch"
+BATCH_OPERATIONS = [
+    "extract_graph",
+    "summarize_descriptions",
+    "extract_claims",
+    "community_reports",
+]
+BATCH_MAX_SIZE = 50_000
+BATCH_MAX_WAIT = 30.0
+BATCH_POLL_INTERVAL = 60.0
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_CONCURRENT_REQUESTS = 10_000
 SUMMARIZE_DESCRIPTIONS_MAX_LENGTH = 500
+SUMMARIZE_DESCRIPTIONS_TREE_REDUCE = False
 SUMMARIZE_MODEL_ID = DEFAULT_CHAT_MODEL_ID
 UMAP_ENABLED = False
 
@@ -149,6 +171,9 @@ VECTOR_STORE_CONTAINER_NAME = "default"
 VECTOR_STORE_OVERWRITE = True
 VECTOR_STORE_DEFAULT_ID = "default_vector_store"
 
+# Query context building
+TOKEN_COUNT_CACHE_CHARS = 16_000_000
+
 # Local Search
 LOCAL_SEARCH_TEXT_UNIT_PROP = 0.5
 LOCAL_SEARCH_COMMUNITY_PROP = 0.15
@@ -170,6 +195,10 @@ GLOBAL_SEARCH_DATA_MAX_TOKENS = 12_000
 GLOBAL_SEARCH_MAP_MAX_TOKENS = 1000
 GLOBAL_SEARCH_REDUCE_MAX_TOKENS = 2_000
 GLOBAL_SEARCH_CONCURRENCY = 32
+GLOBAL_SEARCH_PERSIST_CONTEXT = False
+GLOBAL_SEARCH_EARLY_REDUCE_FRACTION = 1.0
+GLOBAL_SEARCH_EARLY_REDUCE_SCORE = None
+GLOBAL_SEARCH_MAP_DEADLINE = None
 
 # Global Search with dynamic community selection
 DYNAMIC_SEARCH_LLM_MODEL = "gpt-4o-mini"
@@ -179,6 +208,9 @@ DYNAMIC_SEARCH_NUM_REPEATS = 1
 DYNAMIC_SEARCH_USE_SUMMARY = False
 DYNAMIC_SEARCH_CONCURRENT_COROUTINES = 16
 DYNAMIC_SEARCH_MAX_LEVEL = 2
+DYNAMIC_SEARCH_RATING_CACHE_SIZE = 10_000
+DYNAMIC_SEARCH_RATING_CACHE_TTL = 3600
+DYNAMIC_SEARCH_EMBEDDING_THRESHOLD = None
 
 # DRIFT Search
 DRIFT_SEARCH_LLM_TEMPERATURE = 0
@@ -187,6 +219,8 @@ DRIFT_SEARCH_LLM_N = 1
 DRIFT_SEARCH_MAX_TOKENS = 12_000
 DRIFT_SEARCH_DATA_MAX_TOKENS = 12_000
 DRIFT_SEARCH_CONCURRENCY = 32
+DRIFT_SEARCH_QUERY_CONCURRENCY = 8
+DRIFT_SEARCH_TOKENS_PER_MINUTE = None
 
 DRIFT_SEARCH_K_FOLLOW_UPS = 20
 DRIFT_SEARCH_PRIMER_FOLDS = 5
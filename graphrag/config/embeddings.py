@@ -25,6 +25,11 @@ all_embeddings: set[str] = {
     community_full_content_embedding,
     text_unit_text_embedding,
 }
+community_report_embeddings: set[str] = {
+    community_title_embedding,
+    community_summary_embedding,
+    community_full_content_embedding,
+}
 required_embeddings: set[str] = {
     entity_description_embedding,
     community_full_content_embedding,
@@ -173,3 +173,16 @@ class NounPhraseExtractorType(str, Enum):
     """Noun phrase extractor based on dependency parsing and NER using SpaCy."""
     CFG = "cfg"
     """Noun phrase extractor combining CFG-based noun-chunk extraction and NER."""
+
+
+class BatchType(str, Enum):
+    """The batch service used to run LLM requests in batch mode."""
+
+    openai = "openai"
+    """The OpenAI (or Azure OpenAI) batch API."""
+    file = "file"
+    """Batch jobs are written to and their results read from a local directory."""
+
+    def __repr__(self):
+        """Get a string representation."""
+        return f'"{self.value}"'
@@ -0,0 +1,73 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Parameterization settings for the default configuration."""
+
+from pathlib import Path
+
+from pydantic import BaseModel, Field, model_validator
+
+import graphrag.config.defaults as defs
+from graphrag.config.enums import BatchType
+
+
+class BatchConfig(BaseModel):
+    """Configuration section for running indexing LLM requests as batch jobs."""
+
+    enabled: bool = Field(
+        description="Whether to send the LLM requests of the batch operations as batch jobs instead of one request at a time.",
+        default=defs.BATCH_ENABLED,
+    )
+    type: BatchType | str = Field(
+        description="The batch service to submit jobs to.", default=defs.BATCH_TYPE
+    )
+    base_dir: str = Field(
+        description="The directory batch jobs are exchanged through, for the file batch type.",
+        default=defs.BATCH_BASE_DIR,
+    )
+    operations: list[str] = Field(
+        description="The indexing operations whose LLM requests are batched.",
+        default=defs.BATCH_OPERATIONS,
+    )
+    max_batch_size: int = Field(
+        description="The maximum number of requests in a single batch job.",
+        default=defs.BATCH_MAX_SIZE,
+    )
+    max_wait: float = Field(
+        description="The number of seconds to wait for more requests before submitting a partial batch job.",
+        default=defs.BATCH_MAX_WAIT,
+    )
+    poll_interval: float = Field(
+        description="The number of seconds between batch job status checks.",
+        default=defs.BATCH_POLL_INTERVAL,
+    )
+    completion_window: str = Field(
+        description="The time frame within which a batch job should be processed.",
+        default=defs.BATCH_COMPLETION_WINDOW,
+    )
+    concurrent_requests: int = Field(
+        description="The number of rows each batch operation keeps in flight, which bounds the size of the batch jobs it produces.",
+        default=defs.BATCH_CONCURRENT_REQUESTS,
+    )
+
+    def _validate_operations(self) -> None:
+        """Validate that only operations supporting batch mode are listed."""
+        unsupported = set(self.operations) - set(defs.BATCH_OPERATIONS)
+        if unsupported:
+            msg = f"Batch mode is not supported for operations: {sorted(unsupported)}. Supported operations are {defs.BATCH_OPERATIONS}."
+            raise ValueError(msg)
+
+    @model_validator(mode="after")
+    def _validate_model(self):
+        """Validate the batch settings."""
+        self._validate_operations()
+        return self
+
+    def resolved_settings(self, root_dir: str, operation: str) -> dict | None:
+        """Get the batch settings to pass to an operation's strategy, or None if the operation is not batched."""
+        if not self.enabled or operation not in self.operations:
+            return None
+        return {
+            **self.model_dump(),
+            "base_dir": str(Path(root_dir) / self.base_dir),
+        }
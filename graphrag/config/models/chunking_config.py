@@ -34,3 +34,7 @@ class ChunkingConfig(BaseModel):
         description="Count metadata in max tokens.",
         default=defs.CHUNK_SIZE_INCLUDES_METADATA,
     )
+    num_threads: int = Field(
+        description="The number of native threads used to encode documents.",
+        default=defs.CHUNK_NUM_THREADS,
+    )
@@ -53,6 +53,16 @@ class DRIFTSearchConfig(BaseModel):
         default=defs.DRIFT_SEARCH_CONCURRENCY,
     )
 
+    query_concurrency: int = Field(
+        description="The number of concurrent requests of a single query, out of the concurrent requests shared by the queries of a search engine.",
+        default=defs.DRIFT_SEARCH_QUERY_CONCURRENCY,
+    )
+
+    tokens_per_minute: int | None = Field(
+        description="The number of tokens per minute shared by the queries of a search engine.",
+        default=defs.DRIFT_SEARCH_TOKENS_PER_MINUTE,
+    )
+
     drift_k_followups: int = Field(
         description="The number of top global results to retrieve.",
         default=defs.DRIFT_SEARCH_K_FOLLOW_UPS,
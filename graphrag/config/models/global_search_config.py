@@ -52,6 +52,22 @@ class GlobalSearchConfig(BaseModel):
         description="The number of concurrent requests.",
         default=defs.GLOBAL_SEARCH_CONCURRENCY,
     )
+    persist_context: bool = Field(
+        description="Persist the map context batches next to the index outputs, so they are only built once per community level.",
+        default=defs.GLOBAL_SEARCH_PERSIST_CONTEXT,
+    )
+    early_reduce_fraction: float = Field(
+        description="The fraction of the map batches to wait for before reducing, cancelling the rest.",
+        default=defs.GLOBAL_SEARCH_EARLY_REDUCE_FRACTION,
+    )
+    early_reduce_score: float | None = Field(
+        description="The total key point score of the map responses to wait for before reducing, cancelling the rest.",
+        default=defs.GLOBAL_SEARCH_EARLY_REDUCE_SCORE,
+    )
+    map_deadline: float | None = Field(
+        description="The number of seconds to wait for map responses before reducing, cancelling the rest.",
+        default=defs.GLOBAL_SEARCH_MAP_DEADLINE,
+    )
 
     # configurations for dynamic community selection
     dynamic_search_llm: str = Field(
@@ -82,3 +98,15 @@ class GlobalSearchConfig(BaseModel):
         description="The maximum level of community hierarchy to consider if none of the processed communities are relevant",
         default=defs.DYNAMIC_SEARCH_MAX_LEVEL,
     )
+    dynamic_search_rating_cache_size: int = Field(
+        description="The number of community ratings to reuse across queries",
+        default=defs.DYNAMIC_SEARCH_RATING_CACHE_SIZE,
+    )
+    dynamic_search_rating_cache_ttl: float | None = Field(
+        description="The number of seconds a community rating is reused for",
+        default=defs.DYNAMIC_SEARCH_RATING_CACHE_TTL,
+    )
+    dynamic_search_embedding_threshold: float | None = Field(
+        description="The minimum cosine similarity of a community report embedding to the query embedding to rate the report, skipping the rest",
+        default=defs.DYNAMIC_SEARCH_EMBEDDING_THRESHOLD,
+    )
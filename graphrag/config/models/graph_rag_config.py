@@ -11,6 +11,7 @@ from pydantic import BaseModel, Field, model_validator
 import graphrag.config.defaults as defs
 from graphrag.config.errors import LanguageModelConfigMissingError
 from graphrag.config.models.basic_search_config import BasicSearchConfig
+from graphrag.config.models.batch_config import BatchConfig
 from graphrag.config.models.cache_config import CacheConfig
 from graphrag.config.models.chunking_config import ChunkingConfig
 from graphrag.config.models.cluster_graph_config import ClusterGraphConfig
@@ -27,10 +28,12 @@ from graphrag.config.models.local_search_config import LocalSearchConfig
 from graphrag.config.models.output_config import OutputConfig
 from graphrag.config.models.prune_graph_config import PruneGraphConfig
 from graphrag.config.models.reporting_config import ReportingConfig
+from graphrag.config.models.scheduler_config import SchedulerConfig
 from graphrag.config.models.snapshots_config import SnapshotsConfig
 from graphrag.config.models.summarize_descriptions_config import (
     SummarizeDescriptionsConfig,
 )
+from graphrag.config.models.table_cache_config import TableCacheConfig
 from graphrag.config.models.text_embedding_config import TextEmbeddingConfig
 from graphrag.config.models.umap_config import UmapConfig
 from graphrag.config.models.vector_store_config import VectorStoreConfig
@@ -268,6 +271,24 @@ class GraphRagConfig(BaseModel):
     )
     """List of workflows to run, in execution order."""
 
+    scheduler: SchedulerConfig = Field(
+        description="The workflow scheduling configuration to use.",
+        default=SchedulerConfig(),
+    )
+    """The workflow scheduling configuration to use."""
+
+    table_cache: TableCacheConfig = Field(
+        description="The in-memory table cache configuration to use.",
+        default=TableCacheConfig(),
+    )
+    """The in-memory table cache configuration to use."""
+
+    batch: BatchConfig = Field(
+        description="The batch mode configuration to use.",
+        default=BatchConfig(),
+    )
+    """The batch mode configuration to use."""
+
     def _validate_vector_store_db_uri(self) -> None:
         """Validate the vector store configuration."""
         for store in self.vector_store.values():
@@ -199,6 +199,14 @@ class LanguageModelConfig(BaseModel):
         description="The number of requests per minute to use for the LLM service.",
         default=defs.LLM_REQUESTS_PER_MINUTE,
     )
+    shared_rate_limits: bool = Field(
+        description="Whether to enforce the requests and tokens per minute limits across every model calling the same deployment in the process, instead of per model.",
+        default=defs.LLM_SHARED_RATE_LIMITS,
+    )
+    rate_limit_key: str | None = Field(
+        description="The key of the shared rate limits this model draws from. Defaults to the API base and deployment name (or model).",
+        default=None,
+    )
     retry_strategy: str = Field(
         description="The retry strategy to use for the LLM service.",
         default=defs.RETRY_STRATEGY,
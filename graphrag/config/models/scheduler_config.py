@@ -0,0 +1,21 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Parameterization settings for the default configuration."""
+
+from pydantic import BaseModel, Field
+
+import graphrag.config.defaults as defs
+
+
+class SchedulerConfig(BaseModel):
+    """Configuration section for scheduling the pipeline workflows."""
+
+    max_concurrent_workflows: int = Field(
+        description="The maximum number of independent workflows to run at once. A value of 1 runs the workflows one at a time in list order.",
+        default=defs.SCHEDULER_MAX_CONCURRENT_WORKFLOWS,
+    )
+    concurrent_requests: int | None = Field(
+        description="The number of LLM-bound rows allowed in flight across all concurrently running workflows. If not set, each workflow is only bound by its own model's concurrent_requests.",
+        default=defs.SCHEDULER_CONCURRENT_REQUESTS,
+    )
@@ -21,6 +21,10 @@ class SummarizeDescriptionsConfig(BaseModel):
         description="The description summarization maximum length.",
         default=defs.SUMMARIZE_DESCRIPTIONS_MAX_LENGTH,
     )
+    tree_reduce: bool = Field(
+        description="Whether to summarize long description lists as a tree of concurrent partial summaries.",
+        default=defs.SUMMARIZE_DESCRIPTIONS_TREE_REDUCE,
+    )
     strategy: dict | None = Field(
         description="The override strategy to use.", default=None
     )
@@ -47,4 +51,5 @@ class SummarizeDescriptionsConfig(BaseModel):
             if self.prompt
             else None,
             "max_summary_length": self.max_length,
+            "tree_reduce": self.tree_reduce,
         }
@@ -0,0 +1,21 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Parameterization settings for the default configuration."""
+
+from pydantic import BaseModel, Field
+
+import graphrag.config.defaults as defs
+
+
+class TableCacheConfig(BaseModel):
+    """Configuration section for the in-memory table cache used during indexing."""
+
+    max_size_mb: int = Field(
+        description="The maximum in-memory size of the cached tables, in megabytes. A value of 0 disables the cache.",
+        default=defs.TABLE_CACHE_MAX_SIZE_MB,
+    )
+    arrow_dtypes: bool = Field(
+        description="Whether to load and cache tables with Arrow-backed dtypes, which use less memory for strings and lists.",
+        default=defs.TABLE_CACHE_ARROW_DTYPES,
+    )
@@ -8,6 +8,7 @@ from dataclasses import dataclass as dc_dataclass
 from dataclasses import field
 
 from graphrag.cache.pipeline_cache import PipelineCache
+from graphrag.index.table_cache import TableCache, TableCacheStats
 from graphrag.storage.pipeline_storage import PipelineStorage
 
 
@@ -27,6 +28,9 @@ class PipelineRunStats:
     workflows: dict[str, dict[str, float]] = field(default_factory=dict)
     """A dictionary of workflows."""
 
+    table_cache: TableCacheStats = field(default_factory=TableCacheStats)
+    """Hits and bytes saved by the in-memory table cache."""
+
 
 @dc_dataclass
 class PipelineRunContext:
@@ -37,3 +41,5 @@ class PipelineRunContext:
     "Long-term storage for pipeline verbs to use. Items written here will be written to the storage provider."
     cache: PipelineCache
     "Cache instance for reading previous LLM responses."
+    table_cache: TableCache | None = None
+    "Optional in-memory cache of the tables written to and read from storage, so workflows can skip deserializing them."
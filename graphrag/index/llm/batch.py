@@ -0,0 +1,281 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Run chat completion requests as JSONL batch jobs instead of one request at a time."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
+from uuid import uuid4
+
+from openai.types.chat import ChatCompletion
+
+from graphrag.config.enums import BatchType
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from fnllm.openai.types.client import OpenAIClient
+
+log = logging.getLogger(__name__)
+
+_FINISHED_STATUSES = {"completed", "expired", "cancelled"}
+
+
+class BatchError(Exception):
+    """Exception raised when a batch job or one of its requests fails."""
+
+
+class BatchClient(ABC):
+    """A service that runs JSONL batch jobs of chat completion requests.
+
+    Jobs use the OpenAI batch format: each input line holds a `custom_id`, `method`, `url` and
+    request `body`, and each output line holds the `custom_id` with either a `response` (with its
+    `status_code` and `body`) or an `error`.
+    """
+
+    @abstractmethod
+    async def submit(self, requests: bytes) -> str:
+        """Submit a JSONL job and return its id."""
+
+    @abstractmethod
+    async def poll(self, batch_id: str) -> bytes | None:
+        """Get the JSONL output of a finished job, or None while it is still running.
+
+        Raises BatchError if the job failed as a whole.
+        """
+
+
+class FileBatchClient(BatchClient):
+    """A batch client exchanging jobs through a local directory.
+
+    Each job is written to `<id>.input.jsonl` and is finished once a runner writes its results
+    to `<id>.output.jsonl`, or a failure message to `<id>.error.txt`.
+    """
+
+    def __init__(self, base_dir: str, **_kwargs: Any):
+        """Create a file batch client."""
+        self._base_dir = Path(base_dir)
+
+    async def submit(self, requests: bytes) -> str:
+        """Write the job to the batch directory."""
+        batch_id = uuid4().hex
+        self._base_dir.mkdir(parents=True, exist_ok=True)
+        # write to a temporary name first, so a runner never picks up a partial job
+        temp_path = self._base_dir / f".{batch_id}.input.jsonl.tmp"
+        await asyncio.to_thread(temp_path.write_bytes, requests)
+        temp_path.replace(self._base_dir / f"{batch_id}.input.jsonl")
+        return batch_id
+
+    async def poll(self, batch_id: str) -> bytes | None:
+        """Read the job output if the runner has written it."""
+        error_path = self._base_dir / f"{batch_id}.error.txt"
+        if error_path.exists():
+            raise BatchError(error_path.read_text(encoding="utf-8"))
+        output_path = self._base_dir / f"{batch_id}.output.jsonl"
+        if not output_path.exists():
+            return None
+        return await asyncio.to_thread(output_path.read_bytes)
+
+
+class OpenAIBatchClient(BatchClient):
+    """A batch client for the OpenAI and Azure OpenAI batch APIs."""
+
+    def __init__(
+        self, client: OpenAIClient, endpoint: str, completion_window: str, **_kwargs
+    ):
+        """Create an OpenAI batch client."""
+        self._client = client
+        self._endpoint = endpoint
+        self._completion_window = completion_window
+
+    async def submit(self, requests: bytes) -> str:
+        """Upload the job input and create the batch."""
+        input_file = await self._client.files.create(
+            file=("batch.jsonl", requests), purpose="batch"
+        )
+        batch = await self._client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=self._endpoint,  # type: ignore
+            completion_window=self._completion_window,  # type: ignore
+        )
+        return batch.id
+
+    async def poll(self, batch_id: str) -> bytes | None:
+        """Check the batch status and download its results once it has finished."""
+        batch = await self._client.batches.retrieve(batch_id)
+        if batch.status == "failed":
+            errors = (batch.errors and batch.errors.data) or []
+            msg = (
+                f"Batch {batch_id} failed: {'; '.join(str(e.message) for e in errors)}"
+            )
+            raise BatchError(msg)
+        if batch.status not in _FINISHED_STATUSES:
+            return None
+        # expired and cancelled batches still report the requests that did complete
+        output = b""
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                content = await self._client.files.content(file_id)
+                output += content.read().rstrip(b"\n") + b"\n"
+        return output
+
+
+class BatchClientFactory:
+    """A factory class for batch clients.
+
+    Includes a method for users to register a custom batch client implementation.
+
+    Every argument is passed to each batch client as kwargs, so implementations pick the ones they need.
+    """
+
+    batch_client_types: ClassVar[dict[str, type]] = {}
+
+    @classmethod
+    def register(cls, batch_type: str, batch_client: type):
+        """Register a custom batch client implementation."""
+        cls.batch_client_types[batch_type] = batch_client
+
+    @classmethod
+    def create_batch_client(
+        cls, batch_type: BatchType | str, kwargs: dict
+    ) -> BatchClient:
+        """Create a batch client from the provided type."""
+        match batch_type:
+            case BatchType.openai:
+                return OpenAIBatchClient(**kwargs)
+            case BatchType.file:
+                return FileBatchClient(**kwargs)
+            case _:
+                if batch_type in cls.batch_client_types:
+                    return cls.batch_client_types[batch_type](**kwargs)
+                msg = f"Unknown batch type: {batch_type}"
+                raise ValueError(msg)
+
+
+class BatchChatClient:
+    """Stands in for the OpenAI client of a chat LLM, turning completion requests into batch jobs.
+
+    Concurrent requests are collected until either max_batch_size of them are waiting or max_wait
+    seconds have passed since the first one, then submitted as one job. Each caller gets its own
+    completion back once the job finishes, so the LLM's caching, JSON parsing and history handling
+    work exactly as with the regular client.
+    """
+
+    def __init__(
+        self,
+        batch_client: BatchClient,
+        *,
+        url: str,
+        max_batch_size: int,
+        max_wait: float,
+        poll_interval: float,
+        model: str | None = None,
+    ):
+        """Create a batching chat client."""
+        self.chat = _Chat(_Completions(self))
+        self._batch_client = batch_client
+        self._url = url
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._poll_interval = poll_interval
+        self._model = model
+        self._pending: list[tuple[str, dict[str, Any], asyncio.Future]] = []
+        self._flush_task: asyncio.Task | None = None
+        self._jobs: set[asyncio.Task] = set()
+
+    async def complete(
+        self, messages: Iterable[Any], **parameters: Any
+    ) -> ChatCompletion:
+        """Queue a chat completion request and wait for its result."""
+        body = {**parameters, "messages": list(messages)}
+        if self._model:
+            body["model"] = self._model
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((uuid4().hex, body, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._submit()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+        return await future
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._max_wait)
+        self._flush_task = None
+        self._submit()
+
+    def _submit(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        # callers that were cancelled while waiting no longer need a result
+        requests = [request for request in self._pending if not request[2].done()]
+        self._pending = []
+        if not requests:
+            return
+        job = asyncio.create_task(self._run_job(requests))
+        self._jobs.add(job)
+        job.add_done_callback(self._jobs.discard)
+
+    async def _run_job(
+        self, requests: list[tuple[str, dict[str, Any], asyncio.Future]]
+    ) -> None:
+        futures = {custom_id: future for custom_id, _, future in requests}
+        try:
+            lines = [
+                json.dumps({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": self._url,
+                    "body": body,
+                })
+                for custom_id, body, _ in requests
+            ]
+            batch_id = await self._batch_client.submit("\n".join(lines).encode())
+            log.info("submitted batch %s with %d requests", batch_id, len(requests))
+            while True:
+                output = await self._batch_client.poll(batch_id)
+                if output is not None:
+                    break
+                await asyncio.sleep(self._poll_interval)
+            log.info("batch %s finished", batch_id)
+            _resolve(futures, output)
+        except Exception as e:  # noqa: BLE001
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            for custom_id, future in futures.items():
+                if not future.done():
+                    future.set_exception(BatchError(f"no result for {custom_id}"))
+
+
+def _resolve(futures: dict[str, asyncio.Future], output: bytes) -> None:
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        result = json.loads(line)
+        future = futures.get(result.get("custom_id"))
+        if future is None or future.done():
+            continue
+        response = result.get("response") or {}
+        if result.get("error") or response.get("status_code") != 200:
+            error = result.get("error") or response.get("body", {}).get("error")
+            future.set_exception(BatchError(f"batch request failed: {error}"))
+        else:
+            future.set_result(ChatCompletion.model_validate(response["body"]))
+
+
+class _Completions:
+    def __init__(self, client: BatchChatClient):
+        self.create = client.complete
+
+
+class _Chat:
+    def __init__(self, completions: _Completions):
+        self.completions = completions
@@ -26,25 +26,42 @@ from graphrag.config.enums import LLMType
 from graphrag.config.models.language_model_config import (
     LanguageModelConfig,  # noqa: TC001
 )
+from graphrag.index.llm.batch import BatchChatClient, BatchClientFactory
 from graphrag.index.llm.manager import ChatLLMSingleton, EmbeddingsLLMSingleton
+from graphrag.index.llm.rate_limits import (
+    DeploymentRateLimiter,
+    DeploymentRateLimiterSingleton,
+    estimate_tokens,
+    pending_reservation,
+    retry_after,
+)
 
 from .mock_llm import MockChatLLM
 
 if TYPE_CHECKING:
-    from fnllm.types import ChatLLM, EmbeddingsLLM
+    from fnllm.limiting import Manifest
+    from fnllm.types import ChatLLM, EmbeddingsLLM, LLMUsageMetrics
 
     from graphrag.cache.pipeline_cache import PipelineCache
     from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+    from graphrag.config.models.batch_config import BatchConfig
     from graphrag.index.typing import ErrorHandlerFn
 
 log = logging.getLogger(__name__)
 
 
 class GraphRagLLMEvents(LLMEvents):
-    """LLM events handler that calls the error handler."""
+    """LLM events handler that calls the error handler and applies the shared deployment rate limits."""
 
-    def __init__(self, on_error: ErrorHandlerFn):
+    def __init__(
+        self,
+        on_error: ErrorHandlerFn,
+        rate_limiter: DeploymentRateLimiter | None = None,
+        output_tokens: int = 0,
+    ):
         self._on_error = on_error
+        self._rate_limiter = rate_limiter
+        self._output_tokens = output_tokens
 
     async def on_error(
         self,
@@ -55,6 +72,32 @@ class GraphRagLLMEvents(LLMEvents):
         """Handle an fnllm error."""
         self._on_error(error, traceback, arguments)
 
+    async def on_limit_acquired(self, manifest: Manifest) -> None:
+        """Wait for the shared deployment limits before a request is sent."""
+        if self._rate_limiter is None:
+            return
+        estimate = estimate_tokens(manifest.request_tokens, self._output_tokens)
+        await self._rate_limiter.acquire(estimate)
+        pending_reservation.set(estimate)
+
+    async def on_usage(self, usage: LLMUsageMetrics) -> None:
+        """Feed the actual token usage of a request back to the shared limits."""
+        estimate = pending_reservation.get()
+        if self._rate_limiter is None or estimate is None:
+            return
+        pending_reservation.set(None)
+        self._rate_limiter.record_usage(estimate, usage.total_tokens)
+
+    async def on_retryable_error(
+        self, error: BaseException, attempt_number: int
+    ) -> None:
+        """Pause the shared deployment limits when the service asks to retry later."""
+        if self._rate_limiter is None:
+            return
+        seconds = retry_after(error)
+        if seconds:
+            self._rate_limiter.backoff(seconds)
+
 
 class GraphRagLLMCache(LLMCache):
     """A cache for the pipeline."""
@@ -104,15 +147,35 @@ def load_llm(
     callbacks: WorkflowCallbacks,
     cache: PipelineCache | None,
     chat_only=False,
+    batch: BatchConfig | None = None,
 ) -> ChatLLM:
-    """Load the LLM for the entity extraction chain."""
-    singleton_llm = ChatLLMSingleton().get_llm(name)
+    """Load the LLM for the entity extraction chain.
+
+    If a batch configuration is given, the LLM sends its requests as batch jobs. It shares the
+    cache of the regular LLM with the same name, so responses are reused across both modes.
+    """
+    singleton_name = f"{name}_batch" if batch is not None else name
+    singleton_llm = ChatLLMSingleton().get_llm(singleton_name)
     if singleton_llm is not None:
         return singleton_llm
 
     on_error = _create_error_handler(callbacks)
     llm_type = config.type
 
+    if batch is not None:
+        if llm_type not in batch_loaders:
+            msg = f"LLM type {llm_type} does not support batch mode"
+            raise ValueError(msg)
+        llm_instance = _load_openai_batch_chat_llm(
+            on_error,
+            create_cache(cache, name),
+            config,
+            batch,
+            azure=llm_type == LLMType.AzureOpenAIChat,
+        )
+        ChatLLMSingleton().set_llm(singleton_name, llm_instance)
+        return llm_instance
+
     if llm_type in loaders:
         if chat_only and not loaders[llm_type]["chat"]:
             msg = f"LLM type {llm_type} does not support chat"
@@ -177,6 +240,48 @@ def _load_openai_chat_llm(
         _create_openai_config(config, azure),
         on_error,
         cache,
+        _get_rate_limiter(config),
+        config.max_tokens,
+    )
+
+
+def _load_openai_batch_chat_llm(
+    on_error: ErrorHandlerFn,
+    cache: LLMCache | None,
+    config: LanguageModelConfig,
+    batch: BatchConfig,
+    azure=False,
+) -> ChatLLM:
+    # batch jobs draw from their own quota, so requests are not rate limited or capped here
+    openai_config = _create_openai_config(config, azure).model_copy(
+        update={
+            "requests_per_minute": None,
+            "tokens_per_minute": None,
+            "max_concurrency": None,
+        }
+    )
+    endpoint = "/chat/completions" if azure else "/v1/chat/completions"
+    batch_client = BatchClientFactory.create_batch_client(
+        batch.type,
+        {
+            **batch.model_dump(),
+            "client": create_openai_client(openai_config),
+            "endpoint": endpoint,
+        },
+    )
+    client = BatchChatClient(
+        batch_client,
+        url=endpoint,
+        max_batch_size=batch.max_batch_size,
+        max_wait=batch.max_wait,
+        poll_interval=batch.poll_interval,
+        model=config.deployment_name if azure else None,
+    )
+    return create_openai_chat_llm(
+        openai_config,
+        client=client,  # type: ignore
+        cache=cache,
+        events=GraphRagLLMEvents(on_error),
     )
 
 
@@ -190,11 +295,23 @@ def _load_openai_embeddings_llm(
         _create_openai_config(config, azure),
         on_error,
         cache,
+        _get_rate_limiter(config),
     )
 
 
+def _get_rate_limiter(config: LanguageModelConfig) -> DeploymentRateLimiter | None:
+    if not config.shared_rate_limits:
+        return None
+    return DeploymentRateLimiterSingleton().get_limiter(config)
+
+
 def _create_openai_config(config: LanguageModelConfig, azure: bool) -> OpenAIConfig:
     encoding_model = config.encoding_model
+    # shared limits are enforced through the LLM events instead of per LLM instance
+    requests_per_minute = (
+        None if config.shared_rate_limits else config.requests_per_minute
+    )
+    tokens_per_minute = None if config.shared_rate_limits else config.tokens_per_minute
     json_strategy = (
         JsonStrategy.VALID if config.model_supports_json else JsonStrategy.LOOSE
     )
@@ -221,8 +338,8 @@ def _create_openai_config(config: LanguageModelConfig, azure: bool) -> OpenAICon
             organization=config.organization,
             max_retries=config.max_retries,
             max_retry_wait=config.max_retry_wait,
-            requests_per_minute=config.requests_per_minute,
-            tokens_per_minute=config.tokens_per_minute,
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
             audience=audience,
             retry_strategy=RetryStrategy(config.retry_strategy),
             timeout=config.request_timeout,
@@ -241,8 +358,8 @@ def _create_openai_config(config: LanguageModelConfig, azure: bool) -> OpenAICon
         retry_strategy=RetryStrategy(config.retry_strategy),
         max_retries=config.max_retries,
         max_retry_wait=config.max_retry_wait,
-        requests_per_minute=config.requests_per_minute,
-        tokens_per_minute=config.tokens_per_minute,
+        requests_per_minute=requests_per_minute,
+        tokens_per_minute=tokens_per_minute,
         timeout=config.request_timeout,
         max_concurrency=config.concurrent_requests,
         model=config.model,
@@ -296,11 +413,15 @@ loaders = {
     },
 }
 
+batch_loaders = {LLMType.OpenAIChat, LLMType.AzureOpenAIChat}
+
 
 def _create_openai_chat_llm(
     configuration: OpenAIConfig,
     on_error: ErrorHandlerFn,
     cache: LLMCache,
+    rate_limiter: DeploymentRateLimiter | None = None,
+    output_tokens: int = 0,
 ) -> ChatLLM:
     """Create an openAI chat llm."""
     client = create_openai_client(configuration)
@@ -308,7 +429,7 @@ def _create_openai_chat_llm(
         configuration,
         client=client,
         cache=cache,
-        events=GraphRagLLMEvents(on_error),
+        events=GraphRagLLMEvents(on_error, rate_limiter, output_tokens),
     )
 
 
@@ -316,6 +437,7 @@ def _create_openai_embeddings_llm(
     configuration: OpenAIConfig,
     on_error: ErrorHandlerFn,
     cache: LLMCache,
+    rate_limiter: DeploymentRateLimiter | None = None,
 ) -> EmbeddingsLLM:
     """Create an openAI embeddings llm."""
     client = create_openai_client(configuration)
@@ -323,5 +445,5 @@ def _create_openai_embeddings_llm(
         configuration,
         client=client,
         cache=cache,
-        events=GraphRagLLMEvents(on_error),
+        events=GraphRagLLMEvents(on_error, rate_limiter),
     )
@@ -0,0 +1,212 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Process-wide request and token rate limits shared by every LLM calling the same deployment."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import re
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from graphrag.config.models.language_model_config import LanguageModelConfig
+
+log = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+"""Rough number of characters per token, used to turn the serialized prompt size into a token estimate."""
+
+_RETRY_AFTER_MESSAGE = re.compile(r"try again in (\d+(?:\.\d+)?) ?(ms|second)", re.I)
+
+
+class TokenBucket:
+    """A token bucket refilled continuously at capacity per period.
+
+    Waiters are served in arrival order, so a large request cannot be starved by a stream of small ones.
+    The level may go negative when actual usage exceeds what was reserved, delaying later requests.
+    """
+
+    def __init__(self, capacity: int, per: float = 60.0):
+        """Create a full bucket."""
+        self.capacity = capacity
+        self.per = per
+        self.level = float(capacity)
+        self.paused_until = 0.0
+        self._last_refill = time.monotonic()
+        self._lock: asyncio.Lock | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """Wait until the amount is available and take it, returning the time spent waiting."""
+        amount = min(amount, self.capacity)
+        start = time.monotonic()
+        async with self._get_lock():
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self.paused_until - now
+                if wait <= 0:
+                    if self.level >= amount:
+                        self.level -= amount
+                        return now - start
+                    wait = (amount - self.level) * self.per / self.capacity
+                await asyncio.sleep(wait)
+
+    def adjust(self, amount: float) -> None:
+        """Take (or give back, if negative) tokens outside of acquire, e.g. to account for actual usage."""
+        self._refill(time.monotonic())
+        self.level = min(self.level - amount, self.capacity)
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for the given number of seconds."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self.level = min(self.level + elapsed * self.capacity / self.per, self.capacity)
+
+    def _get_lock(self) -> asyncio.Lock:
+        # limiters outlive event loops (e.g. one asyncio.run per CLI command), and locks are bound to a loop
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        return self._lock
+
+
+@dataclass
+class RateLimitStats:
+    """Usage seen by a deployment rate limiter."""
+
+    requests: int = field(default=0)
+    """Number of requests let through."""
+
+    estimated_tokens: int = field(default=0)
+    """Tokens reserved from prompt-size estimates."""
+
+    actual_tokens: int = field(default=0)
+    """Tokens reported as used by the service."""
+
+    throttled_seconds: float = field(default=0)
+    """Total time requests spent waiting for the limiter."""
+
+    rate_limit_errors: int = field(default=0)
+    """Number of rate limit errors returned by the service."""
+
+
+class DeploymentRateLimiter:
+    """Requests-per-minute and tokens-per-minute limits for a single deployment."""
+
+    def __init__(self, requests_per_minute: int | None, tokens_per_minute: int | None):
+        """Create a new limiter. A missing or zero limit is not enforced."""
+        self.requests = (
+            TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.stats = RateLimitStats()
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        """Wait for a request slot and the estimated number of tokens."""
+        waited = 0.0
+        if self.requests is not None:
+            waited += await self.requests.acquire(1)
+        if self.tokens is not None:
+            waited += await self.tokens.acquire(estimated_tokens)
+        self.stats.requests += 1
+        self.stats.estimated_tokens += estimated_tokens
+        self.stats.throttled_seconds += waited
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token budget with the usage reported for a request."""
+        self.stats.actual_tokens += actual_tokens
+        if self.tokens is not None:
+            self.tokens.adjust(actual_tokens - estimated_tokens)
+
+    def backoff(self, seconds: float) -> None:
+        """Pause every request to the deployment after the service asked to retry later."""
+        self.stats.rate_limit_errors += 1
+        log.warning("rate limited by the service, pausing requests for %.1fs", seconds)
+        for bucket in (self.requests, self.tokens):
+            if bucket is not None:
+                bucket.pause(seconds)
+
+    def update_limits(
+        self, requests_per_minute: int | None, tokens_per_minute: int | None
+    ) -> None:
+        """Tighten the limits if another model sharing the deployment is configured lower."""
+        if requests_per_minute and (
+            self.requests is None or requests_per_minute < self.requests.capacity
+        ):
+            self.requests = TokenBucket(requests_per_minute)
+        if tokens_per_minute and (
+            self.tokens is None or tokens_per_minute < self.tokens.capacity
+        ):
+            self.tokens = TokenBucket(tokens_per_minute)
+
+
+@cache
+class DeploymentRateLimiterSingleton:
+    """A singleton class for the rate limiters shared by every model calling the same deployment."""
+
+    def __init__(self):
+        self.limiters: dict[str, DeploymentRateLimiter] = {}
+
+    def get_limiter(self, config: LanguageModelConfig) -> DeploymentRateLimiter:
+        """Get the shared limiter of a model's deployment, creating it on first use."""
+        key = rate_limit_key(config)
+        limiter = self.limiters.get(key)
+        if limiter is None:
+            limiter = DeploymentRateLimiter(
+                config.requests_per_minute, config.tokens_per_minute
+            )
+            self.limiters[key] = limiter
+        else:
+            limiter.update_limits(config.requests_per_minute, config.tokens_per_minute)
+        return limiter
+
+
+def rate_limit_key(config: LanguageModelConfig) -> str:
+    """Get the key identifying the quota a model draws from."""
+    if config.rate_limit_key:
+        return config.rate_limit_key
+    return "|".join([
+        config.api_base or "",
+        config.deployment_name or config.model,
+    ])
+
+
+def estimate_tokens(serialized_prompt_size: int, output_tokens: int = 0) -> int:
+    """Estimate the tokens a request will use from the size of its serialized prompt and the output reserved."""
+    return math.ceil(serialized_prompt_size / CHARS_PER_TOKEN) + output_tokens
+
+
+def retry_after(error: BaseException) -> float | None:
+    """Get the number of seconds the service asked to wait before retrying, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        pass
+    match = _RETRY_AFTER_MESSAGE.search(str(error))
+    if match is None:
+        return None
+    value = float(match.group(1))
+    return value / 1000 if match.group(2).lower() == "ms" else value
+
+
+pending_reservation: ContextVar[int | None] = ContextVar(
+    "pending_reservation", default=None
+)
+"""The tokens reserved for the request currently being made in this task, reconciled when its usage is reported."""
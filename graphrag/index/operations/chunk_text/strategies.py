@@ -8,11 +8,13 @@ from collections.abc import Iterable
 import nltk
 import tiktoken
 
+import graphrag.config.defaults as defs
 from graphrag.config.models.chunking_config import ChunkingConfig
 from graphrag.index.operations.chunk_text.typing import TextChunk
 from graphrag.index.text_splitting.text_splitting import (
     Tokenizer,
-    split_multiple_texts_on_tokens,
+    chunk_token_arrays,
+    encode_texts,
 )
 from graphrag.logger.progress import ProgressTicker
 
@@ -32,27 +34,50 @@ def get_encoding_fn(encoding_name):
     return encode, decode
 
 
+def get_tokenizer(
+    encoding_name: str,
+    tokens_per_chunk: int,
+    chunk_overlap: int,
+    num_threads: int = defs.CHUNK_NUM_THREADS,
+) -> Tokenizer:
+    """Get a tokenizer that encodes batches of texts on native threads."""
+    enc = tiktoken.get_encoding(encoding_name)
+    encode, decode = get_encoding_fn(encoding_name)
+
+    def encode_batch(texts: list[str]) -> list[list[int]]:
+        return enc.encode_batch(
+            [text if isinstance(text, str) else f"{text}" for text in texts],
+            num_threads=num_threads,
+        )
+
+    return Tokenizer(
+        chunk_overlap=chunk_overlap,
+        tokens_per_chunk=tokens_per_chunk,
+        encode=encode,
+        decode=decode,
+        encode_batch=encode_batch,
+    )
+
+
 def run_tokens(
     input: list[str],
     config: ChunkingConfig,
     tick: ProgressTicker,
 ) -> Iterable[TextChunk]:
     """Chunks text into chunks based on encoding tokens."""
-    tokens_per_chunk = config.size
-    chunk_overlap = config.overlap
-    encoding_name = config.encoding_model
-
-    encode, decode = get_encoding_fn(encoding_name)
-    return split_multiple_texts_on_tokens(
-        input,
-        Tokenizer(
-            chunk_overlap=chunk_overlap,
-            tokens_per_chunk=tokens_per_chunk,
-            encode=encode,
-            decode=decode,
-        ),
-        tick,
+    tokenizer = get_tokenizer(
+        config.encoding_model, config.size, config.overlap, config.num_threads
     )
+    for tokens, doc_indices in chunk_token_arrays(
+        encode_texts(input, tokenizer, tick),
+        tokenizer.tokens_per_chunk,
+        tokenizer.chunk_overlap,
+    ):
+        yield TextChunk(
+            text_chunk=tokenizer.decode(tokens.tolist()),
+            source_doc_indices=doc_indices,
+            n_tokens=len(tokens),
+        )
 
 
 def run_sentences(
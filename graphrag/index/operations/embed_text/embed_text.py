@@ -3,6 +3,8 @@
 
 """A module containing embed_text, load_strategy and create_row_from_embedding_data methods definition."""
 
+import hashlib
+import json
 import logging
 from enum import Enum
 from typing import Any
@@ -44,6 +46,8 @@ async def embed_text(
     embedding_name: str,
     id_column: str = "id",
     title_column: str | None = None,
+    upsert: bool = False,
+    removed_ids: list[str] | None = None,
 ):
     """
     Embed a piece of text into a vector space. The operation outputs a new column containing a mapping between doc_id and vector.
@@ -75,6 +79,10 @@ async def embed_text(
             type: lancedb # The type of vector store to use, available options are: azure_ai_search, lancedb
             <...>
     ```
+
+    With a vector store, each document records a hash of its content. When upsert is set, only the rows
+    whose document is missing or has a different content hash are embedded and upserted, the
+    documents of removed_ids are deleted, and the rest of the collection is left as is.
     """
     vector_store_config = strategy.get("vector_store")
 
@@ -96,6 +104,8 @@ async def embed_text(
             vector_store_config=vector_store_workflow_config,
             id_column=id_column,
             title_column=title_column,
+            upsert=upsert,
+            removed_ids=removed_ids,
         )
 
     return await _text_embed_in_memory(
@@ -134,6 +144,8 @@ async def _text_embed_with_vector_store(
     vector_store_config: dict,
     id_column: str = "id",
     title_column: str | None = None,
+    upsert: bool = False,
+    removed_ids: list[str] | None = None,
 ):
     strategy_type = strategy["type"]
     strategy_exec = load_strategy(strategy_type)
@@ -170,6 +182,28 @@ async def _text_embed_with_vector_store(
         else:
             total_rows += 1
 
+    model = (strategy_config.get("llm") or {}).get("model")
+    content_hashes = [
+        _content_hash(model, text, doc_title)
+        for text, doc_title in zip(input[embed_column], input[title], strict=True)
+    ]
+
+    if upsert:
+        return await _text_embed_upsert(
+            input=input,
+            callbacks=callbacks,
+            cache=cache,
+            embed_column=embed_column,
+            strategy_exec=strategy_exec,
+            strategy_config=strategy_config,
+            vector_store=vector_store,
+            insert_batch_size=insert_batch_size,
+            content_hashes=content_hashes,
+            id_column=id_column,
+            title_column=title,
+            removed_ids=removed_ids or [],
+        )
+
     i = 0
     starting_index = 0
 
@@ -180,6 +214,7 @@ async def _text_embed_with_vector_store(
         texts: list[str] = batch[embed_column].to_numpy().tolist()
         titles: list[str] = batch[title].to_numpy().tolist()
         ids: list[str] = batch[id_column].to_numpy().tolist()
+        hashes = content_hashes[insert_batch_size * i : insert_batch_size * (i + 1)]
         result = await strategy_exec(texts, callbacks, cache, strategy_config)
         if result.embeddings:
             embeddings = [
@@ -188,19 +223,7 @@ async def _text_embed_with_vector_store(
             all_results.extend(embeddings)
 
         vectors = result.embeddings or []
-        documents: list[VectorStoreDocument] = []
-        for doc_id, doc_text, doc_title, doc_vector in zip(
-            ids, texts, titles, vectors, strict=True
-        ):
-            if type(doc_vector) is np.ndarray:
-                doc_vector = doc_vector.tolist()
-            document = VectorStoreDocument(
-                id=doc_id,
-                text=doc_text,
-                vector=doc_vector,
-                attributes={"title": doc_title},
-            )
-            documents.append(document)
+        documents = _create_documents(ids, texts, titles, vectors, hashes)
 
         vector_store.load_documents(documents, overwrite and i == 0)
         starting_index += len(documents)
@@ -209,6 +232,91 @@ async def _text_embed_with_vector_store(
     return all_results
 
 
+async def _text_embed_upsert(
+    input: pd.DataFrame,
+    callbacks: WorkflowCallbacks,
+    cache: PipelineCache,
+    embed_column: str,
+    strategy_exec: TextEmbeddingStrategy,
+    strategy_config: dict[str, Any],
+    vector_store: BaseVectorStore,
+    insert_batch_size: int,
+    content_hashes: list[str],
+    id_column: str,
+    title_column: str,
+    removed_ids: list[str],
+):
+    """Embed and upsert the rows whose document is missing or outdated, and delete the removed documents."""
+    ids: list[str] = input[id_column].to_numpy().tolist()
+    existing = vector_store.search_by_ids(ids)
+    all_results: list[Any] = [
+        document.vector
+        if document.vector is not None
+        and document.attributes.get("content_hash") == content_hash
+        else None
+        for document, content_hash in zip(existing, content_hashes, strict=True)
+    ]
+    outdated = [row for row, vector in enumerate(all_results) if vector is None]
+    log.info(
+        "embedding %s new or changed rows out of %s, deleting %s",
+        len(outdated),
+        len(ids),
+        len(removed_ids),
+    )
+
+    for start in range(0, len(outdated), insert_batch_size):
+        rows = outdated[start : start + insert_batch_size]
+        batch = input.iloc[rows]
+        texts: list[str] = batch[embed_column].to_numpy().tolist()
+        result = await strategy_exec(texts, callbacks, cache, strategy_config)
+        vectors = result.embeddings or [None] * len(rows)
+        for row, vector in zip(rows, vectors, strict=True):
+            all_results[row] = vector
+        vector_store.upsert(
+            _create_documents(
+                batch[id_column].to_numpy().tolist(),
+                texts,
+                batch[title_column].to_numpy().tolist(),
+                vectors,
+                [content_hashes[row] for row in rows],
+            )
+        )
+
+    if removed_ids:
+        vector_store.delete(removed_ids)
+
+    return all_results
+
+
+def _create_documents(
+    ids: list[str],
+    texts: list[str],
+    titles: list[str],
+    vectors: list,
+    content_hashes: list[str],
+) -> list[VectorStoreDocument]:
+    documents: list[VectorStoreDocument] = []
+    for doc_id, doc_text, doc_title, doc_vector, content_hash in zip(
+        ids, texts, titles, vectors, content_hashes, strict=True
+    ):
+        if type(doc_vector) is np.ndarray:
+            doc_vector = doc_vector.tolist()
+        document = VectorStoreDocument(
+            id=doc_id,
+            text=doc_text,
+            vector=doc_vector,
+            attributes={"title": doc_title, "content_hash": content_hash},
+        )
+        documents.append(document)
+    return documents
+
+
+def _content_hash(model: str | None, text: Any, title: Any) -> str:
+    """Hash what the document of a row depends on, so unchanged rows can be skipped on update."""
+    content = json.dumps([model, text, title], ensure_ascii=False, default=str)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
 def _create_vector_store(
     vector_store_config: dict, collection_name: str
 ) -> BaseVectorStore:
@@ -14,6 +14,7 @@ import graphrag.config.defaults as defs
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.enums import AsyncType
+from graphrag.config.models.batch_config import BatchConfig
 from graphrag.config.models.language_model_config import LanguageModelConfig
 from graphrag.index.llm.load_llm import load_llm
 from graphrag.index.operations.extract_covariates.claim_extractor import ClaimExtractor
@@ -94,11 +95,17 @@ async def run_extract_claims(
 ) -> CovariateExtractionResult:
     """Run the Claim extraction chain."""
     llm_config = LanguageModelConfig(**strategy_config["llm"])
+    batch_config = (
+        BatchConfig(**strategy_config["batch"])
+        if strategy_config.get("batch")
+        else None
+    )
     llm = load_llm(
         "extract_claims",
         llm_config,
         callbacks=callbacks,
         cache=cache,
+        batch=batch_config,
     )
     extraction_prompt = strategy_config.get("extraction_prompt")
     max_gleanings = strategy_config.get("max_gleanings", defs.CLAIM_MAX_GLEANINGS)
@@ -16,12 +16,13 @@ from graphrag.index.operations.extract_graph.typing import (
     EntityExtractStrategy,
     ExtractEntityStrategyType,
 )
-from graphrag.index.run.derive_from_rows import derive_from_rows
+from graphrag.index.run.derive_from_rows import derive_from_rows_stream
 
 log = logging.getLogger(__name__)
 
 
 DEFAULT_ENTITY_TYPES = ["organization", "person", "geo", "event"]
+DEFAULT_MERGE_BATCH_SIZE = 100
 
 
 async def extract_graph(
@@ -34,6 +35,7 @@ async def extract_graph(
     async_mode: AsyncType = AsyncType.AsyncIO,
     entity_types=DEFAULT_ENTITY_TYPES,
     num_threads: int = 4,
+    merge_batch_size: int = DEFAULT_MERGE_BATCH_SIZE,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Extract entities from a piece of text.
@@ -112,25 +114,33 @@ async def extract_graph(
             strategy_config,
         )
         num_started += 1
-        return [result.entities, result.relationships, result.graph]
+        return [result.entities, result.relationships]
 
-    results = await derive_from_rows(
+    # the flat records are concatenated a batch at a time as they stream in, so only a batch of
+    # small per-unit frames is held before being compacted. The compacted batches stay in memory
+    # rather than being spilled to storage: this operation only receives the cache, and the flat
+    # records are much smaller than the per-unit graphs they replaced
+    entity_dfs = []
+    relationship_dfs = []
+    entity_batches = []
+    relationship_batches = []
+    async for result in derive_from_rows_stream(
         text_units,
         run_strategy,
         callbacks,
         async_type=async_mode,
         num_threads=num_threads,
-    )
-
-    entity_dfs = []
-    relationship_dfs = []
-    for result in results:
+    ):
         if result:
             entity_dfs.append(pd.DataFrame(result[0]))
             relationship_dfs.append(pd.DataFrame(result[1]))
+        if len(entity_dfs) >= merge_batch_size:
+            entity_batches.append(_concat_records(entity_dfs))
+            relationship_batches.append(_concat_records(relationship_dfs))
+            entity_dfs, relationship_dfs = [], []
 
-    entities = _merge_entities(entity_dfs)
-    relationships = _merge_relationships(relationship_dfs)
+    entities = _merge_entities([*entity_batches, *entity_dfs])
+    relationships = _merge_relationships([*relationship_batches, *relationship_dfs])
 
     return (entities, relationships)
 
@@ -150,27 +160,59 @@ def _load_strategy(strategy_type: ExtractEntityStrategyType) -> EntityExtractStr
             raise ValueError(msg)
 
 
-def _merge_entities(entity_dfs) -> pd.DataFrame:
-    all_entities = pd.concat(entity_dfs, ignore_index=True)
-    return (
-        all_entities.groupby(["title", "type"], sort=False)
+ENTITY_COLUMNS = ["title", "type", "description", "text_unit_ids", "frequency"]
+RELATIONSHIP_COLUMNS = ["source", "target", "description", "text_unit_ids", "weight"]
+
+
+def _concat_records(dfs: list[pd.DataFrame]) -> pd.DataFrame:
+    dfs = [df for df in dfs if len(df) > 0]
+    if len(dfs) == 0:
+        return pd.DataFrame()
+    return pd.concat(dfs, ignore_index=True)
+
+
+def _merge_entities(entity_dfs: list[pd.DataFrame]) -> pd.DataFrame:
+    all_entities = _concat_records(entity_dfs)
+    if len(all_entities) == 0:
+        return pd.DataFrame(columns=ENTITY_COLUMNS)
+    # a record repeated within a text unit (e.g. by a gleaning) is only counted once
+    return _with_lists(
+        all_entities.drop_duplicates(["title", "type", "description", "source_id"])
+        .groupby(["title", "type"], sort=False)
         .agg(
             description=("description", list),
-            text_unit_ids=("source_id", list),
-            frequency=("source_id", "count"),
+            text_unit_ids=("source_id", "unique"),
+            frequency=("source_id", "nunique"),
         )
         .reset_index()
     )
 
 
-def _merge_relationships(relationship_dfs) -> pd.DataFrame:
-    all_relationships = pd.concat(relationship_dfs, ignore_index=False)
-    return (
-        all_relationships.groupby(["source", "target"], sort=False)
+def _merge_relationships(relationship_dfs: list[pd.DataFrame]) -> pd.DataFrame:
+    all_relationships = _concat_records(relationship_dfs)
+    if len(all_relationships) == 0:
+        return pd.DataFrame(columns=RELATIONSHIP_COLUMNS)
+    # every occurrence adds to the weight, while a description repeated within a text unit is listed once
+    weights = all_relationships.groupby(["source", "target"], sort=False)[
+        "weight"
+    ].sum()
+    return _with_lists(
+        all_relationships.drop_duplicates([
+            "source",
+            "target",
+            "description",
+            "source_id",
+        ])
+        .groupby(["source", "target"], sort=False)
         .agg(
             description=("description", list),
-            text_unit_ids=("source_id", list),
-            weight=("weight", "sum"),
+            text_unit_ids=("source_id", "unique"),
         )
+        .join(weights)
         .reset_index()
     )
+
+
+def _with_lists(df: pd.DataFrame) -> pd.DataFrame:
+    df["text_unit_ids"] = [ids.tolist() for ids in df["text_unit_ids"]]
+    return df
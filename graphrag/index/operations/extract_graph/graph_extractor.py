@@ -6,11 +6,10 @@
 import logging
 import re
 import traceback
-from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
-import networkx as nx
+import pandas as pd
 import tiktoken
 from fnllm.types import ChatLLM
 
@@ -28,6 +27,11 @@ DEFAULT_RECORD_DELIMITER = "##"
 DEFAULT_COMPLETION_DELIMITER = "<|COMPLETE|>"
 DEFAULT_ENTITY_TYPES = ["organization", "person", "geo", "event"]
 
+ENTITY_RECORD_COLUMNS = ["title", "type", "description", "source_id"]
+RELATIONSHIP_RECORD_COLUMNS = ["source", "target", "description", "source_id", "weight"]
+
+_RECORD_BOUNDS = re.compile(r"^\(|\)$")
+
 log = logging.getLogger(__name__)
 
 
@@ -35,7 +39,8 @@ log = logging.getLogger(__name__)
 class GraphExtractionResult:
     """Unipartite graph extraction result class definition."""
 
-    output: nx.Graph
+    entities: pd.DataFrame
+    relationships: pd.DataFrame
     source_docs: dict[Any, Any]
 
 
@@ -138,14 +143,15 @@ class GraphExtractor:
                     },
                 )
 
-        output = await self._process_results(
+        entities, relationships = await self._process_results(
             all_records,
             prompt_variables.get(self._tuple_delimiter_key, DEFAULT_TUPLE_DELIMITER),
             prompt_variables.get(self._record_delimiter_key, DEFAULT_RECORD_DELIMITER),
         )
 
         return GraphExtractionResult(
-            output=output,
+            entities=entities,
+            relationships=relationships,
             source_docs=source_doc_map,
         )
 
@@ -190,120 +196,80 @@ class GraphExtractor:
         results: dict[int, str],
         tuple_delimiter: str,
         record_delimiter: str,
-    ) -> nx.Graph:
-        """Parse the result string to create an undirected unipartite graph.
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Parse the result strings into flat entity and relationship records.
+
+        Every record is kept as its own row, keyed by the index of the document it came from, and
+        duplicates are left for the corpus-wide merge to group. Relationships are undirected: each
+        one is oriented from the endpoint that appears first in its document, so that (A, B) and
+        (B, A) in a document merge into one relationship. Relationship endpoints that are not
+        described as entities in the same document get an untyped entity row.
 
         Args:
             - results - dict of results from the extraction chain
             - tuple_delimiter - delimiter between tuples in an output record, default is '<|>'
             - record_delimiter - delimiter between records, default is '##'
         Returns:
-            - output - unipartite graph in graphML format
+            - entities - title, type, description and source_id columns
+            - relationships - source, target, description, source_id and weight columns
         """
-        graph = nx.Graph()
+        entities: dict[str, list] = {key: [] for key in ENTITY_RECORD_COLUMNS}
+        relationships: dict[str, list] = {
+            key: [] for key in RELATIONSHIP_RECORD_COLUMNS
+        }
+        # the position of each title in the order of first appearance in its document
+        order: dict[tuple[str, str], int] = {}
         for source_doc_id, extracted_data in results.items():
-            records = [r.strip() for r in extracted_data.split(record_delimiter)]
-
-            for record in records:
-                record = re.sub(r"^\(|\)$", "", record.strip())
-                record_attributes = record.split(tuple_delimiter)
-
+            source_id = str(source_doc_id)
+            for record in extracted_data.split(record_delimiter):
+                record_attributes = _RECORD_BOUNDS.sub("", record.strip()).split(
+                    tuple_delimiter
+                )
                 if record_attributes[0] == '"entity"' and len(record_attributes) >= 4:
-                    # add this record as a node in the G
-                    entity_name = clean_str(record_attributes[1].upper())
-                    entity_type = clean_str(record_attributes[2].upper())
-                    entity_description = clean_str(record_attributes[3])
-
-                    if entity_name in graph.nodes():
-                        node = graph.nodes[entity_name]
-                        if self._join_descriptions:
-                            node["description"] = "\n".join(
-                                list({
-                                    *_unpack_descriptions(node),
-                                    entity_description,
-                                })
-                            )
-                        else:
-                            if len(entity_description) > len(node["description"]):
-                                node["description"] = entity_description
-                        node["source_id"] = ", ".join(
-                            list({
-                                *_unpack_source_ids(node),
-                                str(source_doc_id),
-                            })
-                        )
-                        node["type"] = (
-                            entity_type if entity_type != "" else node["type"]
-                        )
-                    else:
-                        graph.add_node(
-                            entity_name,
-                            type=entity_type,
-                            description=entity_description,
-                            source_id=str(source_doc_id),
-                        )
-
-                if (
+                    title = clean_str(record_attributes[1].upper())
+                    order.setdefault((title, source_id), len(order))
+                    entities["title"].append(title)
+                    entities["type"].append(clean_str(record_attributes[2].upper()))
+                    entities["description"].append(clean_str(record_attributes[3]))
+                    entities["source_id"].append(source_id)
+                elif (
                     record_attributes[0] == '"relationship"'
                     and len(record_attributes) >= 5
                 ):
-                    # add this record as edge
                     source = clean_str(record_attributes[1].upper())
                     target = clean_str(record_attributes[2].upper())
-                    edge_description = clean_str(record_attributes[3])
-                    edge_source_id = clean_str(str(source_doc_id))
                     try:
                         weight = float(record_attributes[-1])
                     except ValueError:
                         weight = 1.0
-
-                    if source not in graph.nodes():
-                        graph.add_node(
-                            source,
-                            type="",
-                            description="",
-                            source_id=edge_source_id,
-                        )
-                    if target not in graph.nodes():
-                        graph.add_node(
-                            target,
-                            type="",
-                            description="",
-                            source_id=edge_source_id,
-                        )
-                    if graph.has_edge(source, target):
-                        edge_data = graph.get_edge_data(source, target)
-                        if edge_data is not None:
-                            weight += edge_data["weight"]
-                            if self._join_descriptions:
-                                edge_description = "\n".join(
-                                    list({
-                                        *_unpack_descriptions(edge_data),
-                                        edge_description,
-                                    })
-                                )
-                            edge_source_id = ", ".join(
-                                list({
-                                    *_unpack_source_ids(edge_data),
-                                    str(source_doc_id),
-                                })
-                            )
-                    graph.add_edge(
-                        source,
-                        target,
-                        weight=weight,
-                        description=edge_description,
-                        source_id=edge_source_id,
-                    )
-
-        return graph
-
-
-def _unpack_descriptions(data: Mapping) -> list[str]:
-    value = data.get("description", None)
-    return [] if value is None else value.split("\n")
-
-
-def _unpack_source_ids(data: Mapping) -> list[str]:
-    value = data.get("source_id", None)
-    return [] if value is None else value.split(", ")
+                    order.setdefault((source, source_id), len(order))
+                    order.setdefault((target, source_id), len(order))
+                    if order[target, source_id] < order[source, source_id]:
+                        source, target = target, source
+                    relationships["source"].append(source)
+                    relationships["target"].append(target)
+                    relationships["description"].append(clean_str(record_attributes[3]))
+                    relationships["source_id"].append(source_id)
+                    relationships["weight"].append(weight)
+
+        described = set(zip(entities["title"], entities["source_id"], strict=True))
+        for title, source_id in order:
+            if (title, source_id) not in described:
+                entities["title"].append(title)
+                entities["type"].append("")
+                entities["description"].append("")
+                entities["source_id"].append(source_id)
+
+        entity_df = pd.DataFrame(entities, columns=ENTITY_RECORD_COLUMNS)
+        if not self._join_descriptions:
+            # keep only the longest description of each entity in each document
+            entity_df = (
+                entity_df.assign(length=entity_df["description"].str.len())
+                .sort_values("length", ascending=False, kind="stable")
+                .drop_duplicates(["title", "type", "source_id"])
+                .sort_index()
+                .drop(columns=["length"])
+            )
+        return entity_df, pd.DataFrame(
+            relationships, columns=RELATIONSHIP_RECORD_COLUMNS
+        )
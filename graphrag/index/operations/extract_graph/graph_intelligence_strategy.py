@@ -3,12 +3,12 @@
 
 """A module containing run_graph_intelligence,  run_extract_graph and _create_text_splitter methods to run graph intelligence."""
 
-import networkx as nx
 from fnllm.types import ChatLLM
 
 import graphrag.config.defaults as defs
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+from graphrag.config.models.batch_config import BatchConfig
 from graphrag.config.models.language_model_config import LanguageModelConfig
 from graphrag.index.llm.load_llm import load_llm
 from graphrag.index.operations.extract_graph.graph_extractor import GraphExtractor
@@ -29,11 +29,13 @@ async def run_graph_intelligence(
 ) -> EntityExtractionResult:
     """Run the graph intelligence entity extraction strategy."""
     llm_config = LanguageModelConfig(**args["llm"])
+    batch_config = BatchConfig(**args["batch"]) if args.get("batch") else None
     llm = load_llm(
         "extract_graph",
         llm_config,
         callbacks=callbacks,
         cache=cache,
+        batch=batch_config,
     )
     return await run_extract_graph(llm, docs, entity_types, callbacks, args)
 
@@ -74,26 +76,11 @@ async def run_extract_graph(
         },
     )
 
-    graph = results.output
-    # Map the "source_id" back to the "id" field
-    for _, node in graph.nodes(data=True):  # type: ignore
-        if node is not None:
-            node["source_id"] = ",".join(
-                docs[int(id)].id for id in node["source_id"].split(",")
-            )
+    # Map the "source_id" document indices back to the document ids
+    doc_ids = {str(index): doc.id for index, doc in enumerate(docs)}
+    entities = results.entities
+    entities["source_id"] = entities["source_id"].map(doc_ids)
+    relationships = results.relationships
+    relationships["source_id"] = relationships["source_id"].map(doc_ids)
 
-    for _, _, edge in graph.edges(data=True):  # type: ignore
-        if edge is not None:
-            edge["source_id"] = ",".join(
-                docs[int(id)].id for id in edge["source_id"].split(",")
-            )
-
-    entities = [
-        ({"title": item[0], **(item[1] or {})})
-        for item in graph.nodes(data=True)
-        if item is not None
-    ]
-
-    relationships = nx.to_pandas_edgelist(graph)
-
-    return EntityExtractionResult(entities, relationships, graph)
+    return EntityExtractionResult(entities, relationships)
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
-import networkx as nx
+import pandas as pd
 
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
@@ -29,11 +29,14 @@ class Document:
 
 @dataclass
 class EntityExtractionResult:
-    """Entity extraction result class definition."""
+    """Entity extraction result class definition.
 
-    entities: list[ExtractedEntity]
-    relationships: list[ExtractedRelationship]
-    graph: nx.Graph | None
+    Entities have one row per extracted record, with title, type, description and source_id
+    columns. Relationships have source, target, description, source_id and weight columns.
+    """
+
+    entities: pd.DataFrame
+    relationships: pd.DataFrame
 
 
 EntityExtractStrategy = Callable[
@@ -29,7 +29,11 @@ def build_mixed_context(context: list[dict], max_tokens: int) -> str:
 
     for idx, sub_community_context in enumerate(sorted_context):
         if exceeded_limit:
-            if sub_community_context[schemas.FULL_CONTENT]:
+            # sub-communities whose report is not available have no (or a missing) full content
+            if (
+                pd.notna(sub_community_context[schemas.FULL_CONTENT])
+                and (sub_community_context[schemas.FULL_CONTENT])
+            ):
                 substitute_reports.append({
                     schemas.COMMUNITY_ID: sub_community_context[schemas.SUB_COMMUNITY],
                     schemas.FULL_CONTENT: sub_community_context[schemas.FULL_CONTENT],
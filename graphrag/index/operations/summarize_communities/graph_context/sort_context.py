@@ -81,10 +81,10 @@ def sort_context(
     # Sort edges by degree (desc) and ID (asc)
     edges.sort(key=lambda x: (-x.get(edge_degree_column, 0), x.get(edge_id_column, "")))
 
-    # Deduplicate and build context incrementally
+    # Deduplicate, recording the size of each list after every edge is added
     edge_ids, nodes_ids, claims_ids = set(), set(), set()
     sorted_edges, sorted_nodes, sorted_claims = [], [], []
-    context_string = ""
+    steps: list[tuple[int, int, int]] = []
 
     for edge in edges:
         source, target = edge[edge_source_column], edge[edge_target_column]
@@ -108,18 +108,34 @@ def sort_context(
             edge_ids.add(edge[schemas.SHORT_ID])
             sorted_edges.append(edge)
 
-        # Generate new context string
-        new_context_string = _get_context_string(
-            sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
+        steps.append((len(sorted_nodes), len(sorted_edges), len(sorted_claims)))
+
+    def _step_context_string(step: int) -> str:
+        node_count, edge_count, claim_count = steps[step]
+        return _get_context_string(
+            sorted_nodes[:node_count],
+            sorted_edges[:edge_count],
+            sorted_claims[:claim_count],
+            sub_community_reports,
         )
-        if max_tokens and num_tokens(new_context_string) > max_tokens:
-            break
-        context_string = new_context_string
 
-    # Return the final context string
-    return context_string or _get_context_string(
-        sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
-    )
+    if not steps:
+        return _get_context_string([], [], [], sub_community_reports)
+    if not max_tokens:
+        return _step_context_string(len(steps) - 1)
+
+    # The context only grows with each edge, so bisect for the most edges that fit
+    # rather than encoding the context after every edge
+    fitted_steps, max_steps = 0, len(steps)
+    while fitted_steps < max_steps:
+        middle = (fitted_steps + max_steps + 1) // 2
+        if num_tokens(_step_context_string(middle - 1)) <= max_tokens:
+            fitted_steps = middle
+        else:
+            max_steps = middle - 1
+
+    # If not even the first edge fits, return the context with it anyway
+    return _step_context_string(max(fitted_steps - 1, 0))
 
 
 def parallel_sort_context_batch(community_df, max_tokens, parallel=False):
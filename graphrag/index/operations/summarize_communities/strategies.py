@@ -10,6 +10,7 @@ from fnllm.types import ChatLLM
 
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+from graphrag.config.models.batch_config import BatchConfig
 from graphrag.config.models.language_model_config import LanguageModelConfig
 from graphrag.index.llm.load_llm import load_llm
 from graphrag.index.operations.summarize_communities.community_reports_extractor import (
@@ -20,7 +21,6 @@ from graphrag.index.operations.summarize_communities.typing import (
     Finding,
     StrategyConfig,
 )
-from graphrag.index.utils.rate_limiter import RateLimiter
 
 log = logging.getLogger(__name__)
 
@@ -35,11 +35,13 @@ async def run_graph_intelligence(
 ) -> CommunityReport | None:
     """Run the graph intelligence entity extraction strategy."""
     llm_config = LanguageModelConfig(**args["llm"])
+    batch_config = BatchConfig(**args["batch"]) if args.get("batch") else None
     llm = load_llm(
         "community_reporting",
         llm_config,
         callbacks=callbacks,
         cache=cache,
+        batch=batch_config,
     )
     return await _run_extractor(llm, community, input, level, args, callbacks)
 
@@ -52,8 +54,6 @@ async def _run_extractor(
     args: StrategyConfig,
     callbacks: WorkflowCallbacks,
 ) -> CommunityReport | None:
-    # RateLimiter
-    rate_limiter = RateLimiter(rate=1, per=60)
     extractor = CommunityReportsExtractor(
         llm,
         extraction_prompt=args.get("extraction_prompt", None),
@@ -64,7 +64,6 @@ async def _run_extractor(
     )
 
     try:
-        await rate_limiter.acquire()
         results = await extractor({"input_text": input})
         report = results.structured_output
         if report is None:
@@ -3,14 +3,16 @@
 
 """A module containing create_community_reports and load_strategy methods definition."""
 
+import asyncio
 import logging
+import traceback
 from collections.abc import Callable
+from typing import Any
 
 import pandas as pd
 
 import graphrag.model.schemas as schemas
 from graphrag.cache.pipeline_cache import PipelineCache
-from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.enums import AsyncType
 from graphrag.index.operations.summarize_communities.typing import (
@@ -21,7 +23,7 @@ from graphrag.index.operations.summarize_communities.typing import (
 from graphrag.index.operations.summarize_communities.utils import (
     get_levels,
 )
-from graphrag.index.run.derive_from_rows import derive_from_rows
+from graphrag.index.run.derive_from_rows import ParallelizationError, shared_budget
 from graphrag.logger.progress import progress_ticker
 
 log = logging.getLogger(__name__)
@@ -39,8 +41,13 @@ async def summarize_communities(
     async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
 ):
-    """Generate community summaries."""
-    reports: list[CommunityReport | None] = []
+    """Generate community summaries.
+
+    Communities are scheduled bottom-up along the community hierarchy rather than level by level.
+    A community whose local context fits in max_input_length starts right away. A community whose
+    local context is too large waits for the reports of its sub-communities, so the context builder
+    can substitute them for their local contexts, and starts as soon as they are done.
+    """
     tick = progress_ticker(callbacks.progress, len(local_contexts))
     strategy_exec = load_strategy(strategy["type"])
     strategy_config = {**strategy}
@@ -57,42 +64,140 @@ async def summarize_communities(
 
     levels = get_levels(nodes)
 
-    level_contexts = []
-    for level in levels:
-        level_context = level_context_builder(
-            pd.DataFrame(reports),
+    # the contexts built without sub-community reports, used by communities that do not wait for them
+    level_contexts = [
+        level_context_builder(
+            pd.DataFrame(),
             community_hierarchy_df=community_hierarchy,
             local_context_df=local_contexts,
             level=level,
             max_tokens=max_input_length,
         )
-        level_contexts.append(level_context)
-
-    for level_context in level_contexts:
-
-        async def run_generate(record):
-            result = await _generate_report(
-                strategy_exec,
-                community_id=record[schemas.COMMUNITY_ID],
-                community_level=record[schemas.COMMUNITY_LEVEL],
-                community_context=record[schemas.CONTEXT_STRING],
-                callbacks=callbacks,
-                cache=cache,
-                strategy=strategy_config,
+        for level in levels
+    ]
+
+    sub_communities = _get_sub_communities(local_contexts, community_hierarchy)
+    semaphore = asyncio.Semaphore(num_threads or 4)
+    errors: list[tuple[BaseException, str]] = []
+    tasks: dict[Any, asyncio.Task[CommunityReport | None]] = {}
+
+    async def run_generate(record: pd.Series, level: int) -> CommunityReport | None:
+        children = sub_communities.get(record[schemas.COMMUNITY_ID], [])
+        if children:
+            child_reports = [
+                report
+                for report in await asyncio.gather(*[
+                    tasks[child] for child in children
+                ])
+                if report is not None
+            ]
+            if child_reports:
+                record = await _substitute_reports(
+                    record,
+                    level,
+                    children,
+                    pd.DataFrame(child_reports),
+                    community_hierarchy,
+                    local_contexts,
+                    level_context_builder,
+                    max_input_length,
+                    async_mode,
+                )
+
+        async with semaphore, shared_budget():
+            try:
+                return await _generate_report(
+                    strategy_exec,
+                    community_id=record[schemas.COMMUNITY_ID],
+                    community_level=record[schemas.COMMUNITY_LEVEL],
+                    community_context=record[schemas.CONTEXT_STRING],
+                    callbacks=callbacks,
+                    cache=cache,
+                    strategy=strategy_config,
+                )
+            except Exception as e:  # noqa: BLE001
+                errors.append((e, traceback.format_exc()))
+                return None
+            finally:
+                tick()
+
+    # levels are sorted bottom-up, so the tasks of sub-communities exist before their parents need them
+    for level, level_context in zip(levels, level_contexts, strict=True):
+        for _, record in level_context.iterrows():
+            tasks[record[schemas.COMMUNITY_ID]] = asyncio.create_task(
+                run_generate(record, level)
             )
-            tick()
-            return result
-
-        local_reports = await derive_from_rows(
-            level_context,
-            run_generate,
-            callbacks=NoopWorkflowCallbacks(),
-            num_threads=num_threads,
-            async_type=async_mode,
+
+    try:
+        reports = await asyncio.gather(*tasks.values())
+    finally:
+        for task in tasks.values():
+            task.cancel()
+
+    if errors:
+        raise ParallelizationError(len(errors), errors[0][1])
+
+    return pd.DataFrame([report for report in reports if report is not None])
+
+
+def _get_sub_communities(
+    local_contexts: pd.DataFrame, community_hierarchy: pd.DataFrame
+) -> dict[Any, list[Any]]:
+    """Map each community whose local context is too large to its sub-communities that have a context."""
+    exceeded = local_contexts.loc[
+        local_contexts.loc[:, schemas.CONTEXT_EXCEED_FLAG].astype(bool),
+        schemas.COMMUNITY_ID,
+    ]
+    with_context = set(local_contexts.loc[:, schemas.COMMUNITY_ID])
+    hierarchy = community_hierarchy.loc[
+        community_hierarchy.loc[:, schemas.COMMUNITY_ID].isin(exceeded)
+        & community_hierarchy.loc[:, schemas.SUB_COMMUNITY].isin(with_context)
+    ]
+    return (
+        hierarchy.groupby(schemas.COMMUNITY_ID)[schemas.SUB_COMMUNITY]
+        .agg(list)
+        .to_dict()
+    )
+
+
+async def _substitute_reports(
+    record: pd.Series,
+    level: int,
+    children: list[Any],
+    child_reports: pd.DataFrame,
+    community_hierarchy: pd.DataFrame,
+    local_contexts: pd.DataFrame,
+    level_context_builder: Callable,
+    max_input_length: int,
+    async_mode: AsyncType,
+) -> pd.Series:
+    """Rebuild the context of a community, substituting the reports of its sub-communities for their local contexts."""
+    community_id = record[schemas.COMMUNITY_ID]
+
+    def build() -> pd.DataFrame:
+        return level_context_builder(
+            child_reports,
+            community_hierarchy_df=community_hierarchy.loc[
+                community_hierarchy.loc[:, schemas.COMMUNITY_ID] == community_id
+            ],
+            local_context_df=local_contexts.loc[
+                local_contexts.loc[:, schemas.COMMUNITY_ID].isin([
+                    community_id,
+                    *children,
+                ])
+            ],
+            level=level,
+            max_tokens=max_input_length,
         )
-        reports.extend([lr for lr in local_reports if lr is not None])
 
-    return pd.DataFrame(reports)
+    if async_mode == AsyncType.Threaded:
+        context = await asyncio.to_thread(build)
+    else:
+        context = build()
+    context = context.loc[context.loc[:, schemas.COMMUNITY_ID] == community_id]
+    if context.empty:
+        return record
+    return context.iloc[0]
 
 
 async def _generate_report(
@@ -3,11 +3,14 @@
 
 """A module containing 'GraphExtractionResult' and 'GraphExtractor' models."""
 
+import asyncio
+import hashlib
 import json
 from dataclasses import dataclass
 
 from fnllm.types import ChatLLM
 
+from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.index.typing import ErrorHandlerFn
 from graphrag.index.utils.tokens import num_tokens_from_string
 from graphrag.prompts.index.summarize_descriptions import SUMMARIZE_PROMPT
@@ -16,6 +19,9 @@ from graphrag.prompts.index.summarize_descriptions import SUMMARIZE_PROMPT
 DEFAULT_MAX_INPUT_TOKENS = 4_000
 # Max token count for LLM answers
 DEFAULT_MAX_SUMMARY_LENGTH = 500
+# In tree-reduce mode, a group of descriptions at least half full also ends before a description whose
+# hash is a multiple of this, so that group boundaries realign shortly after an inserted or removed description
+GROUP_BOUNDARY_MODULUS = 8
 
 
 @dataclass
@@ -36,6 +42,8 @@ class SummarizeExtractor:
     _on_error: ErrorHandlerFn
     _max_summary_length: int
     _max_input_tokens: int
+    _tree_reduce: bool
+    _cache: PipelineCache | None
 
     def __init__(
         self,
@@ -46,6 +54,8 @@ class SummarizeExtractor:
         on_error: ErrorHandlerFn | None = None,
         max_summary_length: int | None = None,
         max_input_tokens: int | None = None,
+        tree_reduce: bool = False,
+        cache: PipelineCache | None = None,
     ):
         """Init method definition."""
         # TODO: streamline construction
@@ -57,6 +67,8 @@ class SummarizeExtractor:
         self._on_error = on_error or (lambda _e, _s, _d: None)
         self._max_summary_length = max_summary_length or DEFAULT_MAX_SUMMARY_LENGTH
         self._max_input_tokens = max_input_tokens or DEFAULT_MAX_INPUT_TOKENS
+        self._tree_reduce = tree_reduce
+        self._cache = cache
 
     async def __call__(
         self,
@@ -95,6 +107,11 @@ class SummarizeExtractor:
         usable_tokens = self._max_input_tokens - num_tokens_from_string(
             self._summarization_prompt
         )
+        if self._tree_reduce:
+            return await self._reduce_descriptions(
+                sorted_id, descriptions, usable_tokens
+            )
+
         descriptions_collected = []
         result = ""
 
@@ -122,6 +139,82 @@ class SummarizeExtractor:
 
         return result
 
+    async def _reduce_descriptions(
+        self,
+        id: str | tuple[str, str] | list[str],
+        descriptions: list[str],
+        usable_tokens: int,
+    ) -> str:
+        """Summarize groups of descriptions concurrently, then the partial summaries, until one is left."""
+        while True:
+            groups = self._group_descriptions(descriptions, usable_tokens)
+            if len(groups) == 1:
+                return await self._summarize_group(id, groups[0])
+            descriptions = sorted(
+                await asyncio.gather(*[
+                    self._summarize_group(id, group) for group in groups
+                ])
+            )
+
+    def _group_descriptions(
+        self, descriptions: list[str], usable_tokens: int
+    ) -> list[list[str]]:
+        """Split sorted descriptions into consecutive groups that fit the token budget.
+
+        Every group but a trailing one has at least two descriptions, so each round at least halves
+        the number of descriptions.
+        """
+        groups: list[list[str]] = []
+        group: list[str] = []
+        group_tokens = 0
+        for description in descriptions:
+            tokens = num_tokens_from_string(description)
+            if len(group) > 1 and (
+                group_tokens + tokens > usable_tokens
+                or (
+                    group_tokens * 2 >= usable_tokens
+                    and _hash(description) % GROUP_BOUNDARY_MODULUS == 0
+                )
+            ):
+                groups.append(group)
+                group, group_tokens = [], 0
+            group.append(description)
+            group_tokens += tokens
+        if len(group) == 1 and groups:
+            groups[-1].append(group[0])
+        else:
+            groups.append(group)
+        return groups
+
+    async def _summarize_group(
+        self, id: str | tuple[str, str] | list[str], descriptions: list[str]
+    ) -> str:
+        """Summarize a group of descriptions, reusing the cached summary of the same group if there is one."""
+        if len(descriptions) == 1:
+            return descriptions[0]
+        if self._cache is None:
+            return await self._summarize_descriptions_with_llm(id, descriptions)
+
+        key = _hexdigest(
+            json.dumps(
+                [
+                    id,
+                    sorted(descriptions),
+                    self._summarization_prompt,
+                    self._max_summary_length,
+                ],
+                ensure_ascii=False,
+            )
+        )
+        cached = await self._cache.get(key)
+        if cached is not None:
+            return cached
+        result = await self._summarize_descriptions_with_llm(id, descriptions)
+        await self._cache.set(
+            key, result, {"id": id, "descriptions": len(descriptions)}
+        )
+        return result
+
     async def _summarize_descriptions_with_llm(
         self, id: str | tuple[str, str] | list[str], descriptions: list[str]
     ):
@@ -138,3 +231,11 @@ class SummarizeExtractor:
         )
         # Calculate result
         return str(response.output.content)
+
+
+def _hexdigest(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def _hash(value: str) -> int:
+    return int(_hexdigest(value)[:16], 16)
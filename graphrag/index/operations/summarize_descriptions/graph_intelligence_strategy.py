@@ -7,6 +7,7 @@ from fnllm.types import ChatLLM
 
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+from graphrag.config.models.batch_config import BatchConfig
 from graphrag.config.models.language_model_config import LanguageModelConfig
 from graphrag.index.llm.load_llm import load_llm
 from graphrag.index.operations.summarize_descriptions.description_summary_extractor import (
@@ -27,13 +28,17 @@ async def run_graph_intelligence(
 ) -> SummarizedDescriptionResult:
     """Run the graph intelligence entity extraction strategy."""
     llm_config = LanguageModelConfig(**args["llm"])
+    batch_config = BatchConfig(**args["batch"]) if args.get("batch") else None
     llm = load_llm(
         "summarize_descriptions",
         llm_config,
         callbacks=callbacks,
         cache=cache,
+        batch=batch_config,
+    )
+    return await run_summarize_descriptions(
+        llm, id, descriptions, callbacks, args, cache=cache
     )
-    return await run_summarize_descriptions(llm, id, descriptions, callbacks, args)
 
 
 async def run_summarize_descriptions(
@@ -42,6 +47,7 @@ async def run_summarize_descriptions(
     descriptions: list[str],
     callbacks: WorkflowCallbacks,
     args: StrategyConfig,
+    cache: PipelineCache | None = None,
 ) -> SummarizedDescriptionResult:
     """Run the entity extraction chain."""
     # Extraction Arguments
@@ -62,6 +68,9 @@ async def run_summarize_descriptions(
         ),
         max_summary_length=args.get("max_summary_length", None),
         max_input_tokens=max_tokens,
+        tree_reduce=args.get("tree_reduce", False),
+        # partial summaries are only cached in tree-reduce mode
+        cache=cache.child("summarize_descriptions_partials") if cache else None,
     )
 
     result = await extractor(id=id, descriptions=descriptions)
@@ -0,0 +1,112 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Infer the table dependencies between the workflows of a pipeline."""
+
+import ast
+import inspect
+import logging
+import textwrap
+from dataclasses import dataclass, field
+
+from graphrag.index.typing import WorkflowFunction
+
+log = logging.getLogger(__name__)
+
+# storage helpers that read a table, with the position of the table name argument
+_READ_FUNCTIONS = {"load_table_from_storage": 0, "storage_has_table": 0}
+# storage helpers that write or remove a table, with the position of the table name argument
+_WRITE_FUNCTIONS = {"write_table_to_storage": 1, "delete_table_from_storage": 0}
+
+
+@dataclass
+class WorkflowTableIO:
+    """The tables a workflow reads and writes through the storage helpers."""
+
+    inputs: set[str] = field(default_factory=set)
+    """Tables loaded (or probed) by the workflow."""
+
+    outputs: set[str] = field(default_factory=set)
+    """Tables written (or deleted) by the workflow."""
+
+
+def infer_table_io(workflow: WorkflowFunction) -> WorkflowTableIO | None:
+    """Infer the input and output tables of a workflow function from its source.
+
+    Only calls made directly in the workflow function with a literal table name are recognized,
+    which is how all built-in workflows are written. None is returned if the source is unavailable
+    or a table name is computed at runtime; such workflows must be scheduled as barriers.
+    """
+    try:
+        source = textwrap.dedent(inspect.getsource(workflow))
+        tree = ast.parse(source)
+    except (OSError, TypeError, SyntaxError):
+        log.warning("could not inspect source of workflow %s", workflow)
+        return None
+
+    table_io = WorkflowTableIO()
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        name = _function_name(node.func)
+        if name in _READ_FUNCTIONS:
+            target = table_io.inputs
+            position = _READ_FUNCTIONS[name]
+        elif name in _WRITE_FUNCTIONS:
+            target = table_io.outputs
+            position = _WRITE_FUNCTIONS[name]
+        else:
+            continue
+        table = _table_name_argument(node, position)
+        if table is None:
+            return None
+        target.add(table)
+    return table_io
+
+
+def build_dependency_graph(
+    workflows: list[tuple[str, WorkflowTableIO | None]],
+) -> dict[str, set[str]]:
+    """Build a map of workflow name to the names of the workflows it must wait for.
+
+    The list order is the reference execution order: a workflow depends on an earlier one if it
+    reads a table the earlier one writes, writes a table the earlier one reads, or writes the same
+    table. Workflows whose table usage is unknown depend on, and are depended on by, everything.
+    """
+    dependencies: dict[str, set[str]] = {}
+    for index, (name, current) in enumerate(workflows):
+        dependencies[name] = set()
+        for previous_name, previous in workflows[:index]:
+            if current is None or previous is None or _conflicts(previous, current):
+                dependencies[name].add(previous_name)
+    return dependencies
+
+
+def _conflicts(first: WorkflowTableIO, second: WorkflowTableIO) -> bool:
+    return bool(
+        first.outputs & second.inputs
+        or first.inputs & second.outputs
+        or first.outputs & second.outputs
+    )
+
+
+def _function_name(func: ast.expr) -> str | None:
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    return None
+
+
+def _table_name_argument(node: ast.Call, position: int) -> str | None:
+    argument = None
+    if len(node.args) > position:
+        argument = node.args[position]
+    else:
+        argument = next(
+            (keyword.value for keyword in node.keywords if keyword.arg == "name"),
+            None,
+        )
+    if isinstance(argument, ast.Constant) and isinstance(argument.value, str):
+        return argument.value
+    return None
@@ -7,7 +7,9 @@ import asyncio
 import inspect
 import logging
 import traceback
-from collections.abc import Awaitable, Callable, Coroutine, Hashable
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine, Hashable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from contextvars import ContextVar
 from typing import Any, TypeVar, cast
 
 import pandas as pd
@@ -20,6 +22,14 @@ from graphrag.logger.progress import progress_ticker
 logger = logging.getLogger(__name__)
 ItemType = TypeVar("ItemType")
 
+shared_request_budget: ContextVar[asyncio.Semaphore | None] = ContextVar(
+    "shared_request_budget", default=None
+)
+"""An optional semaphore shared by every concurrently running workflow, bounding the total number of rows in flight."""
+
+REORDER_BUFFER_FACTOR = 8
+"""The default number of rows running or waiting to be yielded in order by derive_from_rows_stream, per unit of concurrency."""
+
 
 class ParallelizationError(ValueError):
     """Exception for invalid parallel processing."""
@@ -74,7 +84,7 @@ async def derive_from_rows_asyncio_threads(
         tasks = [asyncio.to_thread(execute, row) for row in input.iterrows()]
 
         async def execute_task(task: Coroutine) -> ItemType | None:
-            async with semaphore:
+            async with semaphore, shared_budget():
                 # fire off the thread
                 thread = await task
                 return await thread
@@ -104,7 +114,7 @@ async def derive_from_rows_asyncio(
         async def execute_row_protected(
             row: tuple[Hashable, pd.Series],
         ) -> ItemType | None:
-            async with semaphore:
+            async with semaphore, shared_budget():
                 return await execute(row)
 
         tasks = [
@@ -115,8 +125,111 @@ async def derive_from_rows_asyncio(
     return await _derive_from_rows_base(input, transform, callbacks, gather)
 
 
+async def derive_from_rows_stream(
+    input: pd.DataFrame,
+    transform: Callable[[pd.Series], Awaitable[ItemType]],
+    callbacks: WorkflowCallbacks | None = None,
+    num_threads: int = 4,
+    async_type: AsyncType = AsyncType.AsyncIO,
+    buffer_size: int | None = None,
+) -> AsyncIterator[ItemType | None]:
+    """
+    Apply a generic transform function to each row, yielding the results in row order as they complete.
+
+    Rows are read lazily. A new row is scheduled whenever any row completes, keeping up to twice the
+    concurrency of rows running, and results completed ahead of an earlier row wait in a reorder
+    buffer. At most `buffer_size` rows (default: REORDER_BUFFER_FACTOR times the concurrency) are
+    running or waiting at any time, so memory is bounded by the concurrency rather than by the size
+    of the input, and a slow row only holds up scheduling once the buffer is full. Errors are
+    reported once the input is exhausted, as in derive_from_rows.
+    """
+    callbacks = callbacks or NoopWorkflowCallbacks()
+    if async_type not in (AsyncType.AsyncIO, AsyncType.Threaded):
+        msg = f"Unsupported scheduling type {async_type}"
+        raise ValueError(msg)
+    concurrency = num_threads or 4
+    semaphore = asyncio.Semaphore(concurrency)
+    capacity = max(buffer_size or concurrency * REORDER_BUFFER_FACTOR, 1)
+    max_running = min(concurrency * 2, capacity)
+
+    tick = progress_ticker(callbacks.progress, num_total=len(input))
+    errors: list[tuple[BaseException, str]] = []
+
+    async def execute(row: pd.Series) -> ItemType | None:
+        async with semaphore, shared_budget():
+            try:
+                if async_type == AsyncType.Threaded:
+                    result = await asyncio.to_thread(transform, row)
+                else:
+                    result = transform(row)
+                if inspect.iscoroutine(result):
+                    result = await result
+            except Exception as e:  # noqa: BLE001
+                errors.append((e, traceback.format_exc()))
+                return None
+            else:
+                return cast("ItemType", result)
+            finally:
+                tick(1)
+
+    rows = enumerate(_iter_rows(input))
+    running: dict[asyncio.Task, int] = {}
+    completed: dict[int, ItemType | None] = {}
+    next_index = 0
+
+    def schedule() -> None:
+        while len(running) < max_running and len(running) + len(completed) < capacity:
+            item = next(rows, None)
+            if item is None:
+                return
+            index, row = item
+            running[asyncio.create_task(execute(row))] = index
+
+    try:
+        schedule()
+        while running or completed:
+            # rows are scheduled in order, so the next row to yield is either completed or running
+            while next_index in completed:
+                result = completed.pop(next_index)
+                next_index += 1
+                schedule()
+                yield result
+            if not running:
+                break
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                completed[running.pop(task)] = task.result()
+            schedule()
+    finally:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+
+    tick.done()
+
+    for error, stack in errors:
+        callbacks.error("parallel transformation error", error, stack)
+
+    if len(errors) > 0:
+        raise ParallelizationError(len(errors), errors[0][1])
+
+
+def _iter_rows(input: pd.DataFrame):
+    """Lazily build a Series per row from the column arrays, without materializing every row up front."""
+    columns = input.columns
+    for index, *values in input.itertuples(index=True, name=None):
+        yield pd.Series(values, index=columns, name=index, dtype=object)
+
+
 ItemType = TypeVar("ItemType")
 
+
+def shared_budget() -> AbstractAsyncContextManager:
+    """Hold a slot of the request budget shared by every running workflow, if there is one."""
+    budget = shared_request_budget.get()
+    return budget if budget is not None else nullcontext()
+
+
 ExecuteFn = Callable[[tuple[Hashable, pd.Series]], Awaitable[ItemType | None]]
 GatherFn = Callable[[ExecuteFn], Awaitable[list[ItemType | None]]]
 
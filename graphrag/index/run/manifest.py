@@ -0,0 +1,277 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Per-workflow checkpoints used to resume a pipeline run."""
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.run.dependencies import WorkflowTableIO
+from graphrag.storage.pipeline_storage import PipelineStorage
+
+log = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "manifest.json"
+
+INPUT_CHECKPOINT = "input"
+"""The checkpoint name of the raw input documents, which are written before any workflow runs."""
+
+# the config sections that can change the outputs of each built-in workflow
+_WORKFLOW_CONFIG_SECTIONS: dict[str, list[str]] = {
+    "create_base_text_units": ["chunks"],
+    "create_final_documents": [],
+    "extract_graph": ["extract_graph", "summarize_descriptions"],
+    "extract_graph_nlp": ["extract_graph_nlp"],
+    "prune_graph": ["prune_graph"],
+    "finalize_graph": ["embed_graph", "umap", "snapshots"],
+    "extract_covariates": ["extract_claims"],
+    "create_communities": ["cluster_graph"],
+    "create_final_text_units": ["extract_claims"],
+    "create_community_reports": ["community_reports", "extract_claims"],
+    "create_community_reports_text": ["community_reports"],
+    "generate_text_embeddings": ["embed_text", "snapshots"],
+    "generate_community_report_embeddings": ["embed_text", "snapshots"],
+}
+
+# the language model settings that can change a model's responses
+_MODEL_FINGERPRINT_FIELDS = {
+    "type",
+    "model",
+    "deployment_name",
+    "encoding_model",
+    "max_tokens",
+    "temperature",
+    "top_p",
+    "n",
+    "frequency_penalty",
+    "presence_penalty",
+    "model_supports_json",
+    "responses",
+}
+
+
+@dataclass
+class WorkflowCheckpoint:
+    """A record of a completed workflow."""
+
+    fingerprint: str
+    """Hash of the workflow's input table versions and configuration."""
+
+    outputs: dict[str, str] = field(default_factory=dict)
+    """Content hash of each table written by the workflow."""
+
+
+@dataclass
+class PipelineManifest:
+    """The checkpoints of the workflows completed in an output storage."""
+
+    workflows: dict[str, WorkflowCheckpoint] = field(default_factory=dict)
+    """A dictionary of workflow checkpoints."""
+
+
+async def load_manifest(storage: PipelineStorage) -> PipelineManifest:
+    """Load the manifest from the storage, returning an empty one if it is missing or unreadable."""
+    if not await storage.has(MANIFEST_FILENAME):
+        return PipelineManifest()
+    try:
+        data = json.loads(await storage.get(MANIFEST_FILENAME))
+        return PipelineManifest(
+            workflows={
+                name: WorkflowCheckpoint(**checkpoint)
+                for name, checkpoint in data.get("workflows", {}).items()
+            }
+        )
+    except (json.JSONDecodeError, TypeError):
+        log.warning("could not parse %s, starting from scratch", MANIFEST_FILENAME)
+        return PipelineManifest()
+
+
+async def dump_manifest(manifest: PipelineManifest, storage: PipelineStorage) -> None:
+    """Dump the manifest to the storage."""
+    await storage.set(
+        MANIFEST_FILENAME, json.dumps(asdict(manifest), indent=4, ensure_ascii=False)
+    )
+
+
+def content_hash(value: bytes) -> str:
+    """Hash the serialized content of a table."""
+    return hashlib.sha256(value).hexdigest()
+
+
+async def table_version(name: str, storage: PipelineStorage) -> str | None:
+    """Get the content hash of a table in storage, or None if it does not exist.
+
+    Tables written with `set_table` in this process reuse the hash taken while writing them, so
+    only tables left by an earlier run are read back and hashed.
+    """
+    filename = f"{name}.parquet"
+    if not await storage.has(filename):
+        return None
+    version = storage.table_version(filename)
+    if version is None:
+        version = content_hash(await storage.get(filename, as_bytes=True))
+    return version
+
+
+def fingerprint_workflow(
+    name: str, input_versions: dict[str, str | None], config: GraphRagConfig
+) -> str:
+    """Compute the fingerprint of a workflow from its input table versions and config slice."""
+    payload = {
+        "workflow": name,
+        "inputs": dict(sorted(input_versions.items())),
+        "config": _config_slice(name, config),
+    }
+    return content_hash(json.dumps(payload, sort_keys=True, default=str).encode())
+
+
+async def plan_resume(
+    workflows: list[tuple[str, WorkflowTableIO | None]],
+    manifest: PipelineManifest,
+    input_version: str,
+    config: GraphRagConfig,
+    storage: PipelineStorage,
+) -> set[str]:
+    """Find the workflows that can be skipped when resuming a run.
+
+    A workflow is skipped if its fingerprint, computed from the recorded versions of the tables it
+    reads, matches its checkpoint. Because several tables are overwritten in place, a skipped
+    workflow is still re-run if a workflow that does run needs a version of its outputs that is no
+    longer in storage, or if an earlier writer of the same table runs and would clobber it.
+    The returned set includes INPUT_CHECKPOINT if the raw documents do not need to be rewritten.
+    """
+    steps = [(INPUT_CHECKPOINT, WorkflowTableIO(outputs={"documents"})), *workflows]
+    stored_versions: dict[str, str | None] = {}
+
+    async def stored_version(table: str) -> str | None:
+        if table not in stored_versions:
+            stored_versions[table] = await table_version(table, storage)
+        return stored_versions[table]
+
+    forced: set[str] = set()
+    while True:
+        skipped = await _find_skippable(
+            steps, manifest, input_version, config, forced, stored_version
+        )
+        conflicts = await _find_conflicts(steps, manifest, skipped, stored_version)
+        if conflicts <= forced:
+            return skipped
+        forced |= conflicts
+
+
+async def _find_skippable(
+    steps: list[tuple[str, WorkflowTableIO | None]],
+    manifest: PipelineManifest,
+    input_version: str,
+    config: GraphRagConfig,
+    forced: set[str],
+    stored_version,
+) -> set[str]:
+    predicted: dict[str, str | None] = {}
+    unknown: set[str] = set()
+    skipped: set[str] = set()
+    for name, table_io in steps:
+        if table_io is None:
+            # anything could have been written, so nothing downstream can be trusted
+            return skipped
+        checkpoint = manifest.workflows.get(name)
+        if checkpoint is None or name in forced or table_io.inputs & unknown:
+            unknown |= table_io.outputs
+            continue
+        if name == INPUT_CHECKPOINT:
+            fingerprint = input_version
+        else:
+            versions = {
+                table: predicted[table]
+                if table in predicted
+                else await stored_version(table)
+                for table in table_io.inputs
+            }
+            fingerprint = fingerprint_workflow(name, versions, config)
+        if fingerprint != checkpoint.fingerprint:
+            unknown |= table_io.outputs
+            continue
+        skipped.add(name)
+        unknown -= table_io.outputs
+        predicted.update(checkpoint.outputs)
+    return skipped
+
+
+async def _find_conflicts(
+    steps: list[tuple[str, WorkflowTableIO | None]],
+    manifest: PipelineManifest,
+    skipped: set[str],
+    stored_version,
+) -> set[str]:
+    tables = {
+        table
+        for _, table_io in steps
+        if table_io is not None
+        for table in table_io.inputs | table_io.outputs
+    }
+    conflicts: set[str] = set()
+    for table in tables:
+        last_writer: str | None = None
+
+        async def is_stale(writer: str | None, table: str = table) -> bool:
+            if writer not in skipped:
+                return False
+            recorded = manifest.workflows[writer].outputs.get(table)
+            return await stored_version(table) != recorded
+
+        for name, table_io in steps:
+            reads = table_io is None or table in table_io.inputs
+            writes = table_io is None or table in table_io.outputs
+            # a workflow that runs reads whatever is in storage, which must be the skipped writer's version
+            if reads and name not in skipped and await is_stale(last_writer):
+                conflicts.add(last_writer)  # type: ignore
+            # a skipped writer must not be clobbered by an earlier writer that runs
+            if (
+                writes
+                and name in skipped
+                and last_writer is not None
+                and last_writer not in skipped
+            ):
+                conflicts.add(name)
+            if writes:
+                last_writer = name
+        # the final version of every table must be the one recorded by its last writer
+        if await is_stale(last_writer):
+            conflicts.add(last_writer)  # type: ignore
+    return conflicts
+
+
+def _config_slice(name: str, config: GraphRagConfig) -> dict[str, Any]:
+    sections = _WORKFLOW_CONFIG_SECTIONS.get(name)
+    if sections is None:
+        # custom workflows can read any part of the config
+        return config.model_dump(
+            exclude={"root_dir": True, "models": {"__all__": {"api_key"}}}
+        )
+    config_slice = {}
+    for section_name in sections:
+        section = getattr(config, section_name)
+        values = section.model_dump()
+        for key, value in values.items():
+            # prompts are configured as paths, so fingerprint the prompt text itself
+            if key.endswith("prompt") and isinstance(value, str):
+                prompt_path = Path(config.root_dir) / value
+                if prompt_path.is_file():
+                    values[key] = prompt_path.read_text(encoding="utf-8")
+        model_id = values.get("model_id")
+        if model_id in config.models:
+            values["model"] = config.models[model_id].model_dump(
+                include=_MODEL_FINGERPRINT_FIELDS
+            )
+        vector_store_id = values.get("vector_store_id")
+        if vector_store_id in config.vector_store:
+            values["vector_store"] = config.vector_store[vector_store_id].model_dump(
+                exclude={"api_key"}
+            )
+        config_slice[section_name] = values
+    return config_slice
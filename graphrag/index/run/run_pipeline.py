@@ -3,6 +3,7 @@
 
 """Different methods to run the pipeline."""
 
+import asyncio
 import json
 import logging
 import re
@@ -21,8 +22,21 @@ from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.context import PipelineRunStats
 from graphrag.index.input.factory import create_input
+from graphrag.index.run.dependencies import build_dependency_graph, infer_table_io
+from graphrag.index.run.derive_from_rows import shared_request_budget
+from graphrag.index.run.manifest import (
+    INPUT_CHECKPOINT,
+    PipelineManifest,
+    WorkflowCheckpoint,
+    dump_manifest,
+    fingerprint_workflow,
+    load_manifest,
+    plan_resume,
+    table_version,
+)
 from graphrag.index.run.utils import create_callback_chain, create_run_context
-from graphrag.index.typing import Pipeline, PipelineRunResult
+from graphrag.index.table_cache import TableCache
+from graphrag.index.typing import Pipeline, PipelineRunResult, WorkflowFunctionOutput
 from graphrag.index.update.incremental_index import (
     get_delta_docs,
     update_dataframe_outputs,
@@ -31,11 +45,17 @@ from graphrag.logger.base import ProgressLogger
 from graphrag.logger.null_progress import NullProgressLogger
 from graphrag.logger.progress import Progress
 from graphrag.storage.factory import StorageFactory
-from graphrag.storage.pipeline_storage import PipelineStorage
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.storage.pipeline_storage import PipelineStorage, table_content_hash
 
 log = logging.getLogger(__name__)
 
+REPORT_WORKFLOWS = ("create_community_reports", "create_community_reports_text")
+EMBEDDING_WORKFLOWS = (
+    "generate_text_embeddings",
+    "generate_community_report_embeddings",
+)
+"""The workflows generating community reports, which update runs only apply to the communities that changed."""
+
 
 async def run_pipeline(
     pipeline: Pipeline,
@@ -44,6 +64,7 @@ async def run_pipeline(
     callbacks: list[WorkflowCallbacks] | None = None,
     logger: ProgressLogger | None = None,
     is_update_run: bool = False,
+    is_resume_run: bool = False,
 ) -> AsyncIterable[PipelineRunResult]:
     """Run all workflows using a simplified pipeline."""
     root_dir = config.root_dir
@@ -66,6 +87,10 @@ async def run_pipeline(
 
     if is_update_run:
         progress_logger.info("Running incremental indexing.")
+        if is_resume_run:
+            progress_logger.warning(
+                "Resuming is not supported for incremental indexing, running all workflows."
+            )
 
         delta_dataset = await get_delta_docs(dataset, storage)
 
@@ -87,9 +112,21 @@ async def run_pipeline(
             previous_storage = timestamped_storage.child("previous")
             await _copy_previous_output(storage, previous_storage)
 
+            # the reports and embeddings are generated once the outputs are merged, for what changed
+            workflows = list(pipeline)
+            report_workflow = next(
+                (function for name, function in workflows if name in REPORT_WORKFLOWS),
+                None,
+            )
+            delta_pipeline = (
+                workflow
+                for workflow in workflows
+                if workflow[0] not in {*REPORT_WORKFLOWS, *EMBEDDING_WORKFLOWS}
+            )
+
             # Run the pipeline on the new documents
             async for table in _run_pipeline(
-                pipeline=pipeline,
+                pipeline=delta_pipeline,
                 config=config,
                 dataset=delta_dataset.new_inputs,
                 cache=cache,
@@ -109,6 +146,7 @@ async def run_pipeline(
                 cache=cache,
                 callbacks=NoopWorkflowCallbacks(),
                 progress_logger=progress_logger,
+                report_workflow=report_workflow,
             )
 
     else:
@@ -122,6 +160,7 @@ async def run_pipeline(
             storage=storage,
             callbacks=callback_chain,
             logger=progress_logger,
+            resume=is_resume_run,
         ):
             yield table
 
@@ -134,37 +173,146 @@ async def _run_pipeline(
     storage: PipelineStorage,
     callbacks: WorkflowCallbacks,
     logger: ProgressLogger,
+    resume: bool = False,
 ) -> AsyncIterable[PipelineRunResult]:
     start_time = time.time()
 
-    context = create_run_context(storage=storage, cache=cache, stats=None)
+    table_cache = (
+        TableCache(
+            config.table_cache.max_size_mb * 1024 * 1024,
+            arrow_dtypes=config.table_cache.arrow_dtypes,
+        )
+        if config.table_cache.max_size_mb > 0
+        else None
+    )
+    context = create_run_context(
+        storage=storage, cache=cache, stats=None, table_cache=table_cache
+    )
 
     log.info("Final # of rows loaded: %s", len(dataset))
     context.stats.num_documents = len(dataset)
     last_workflow = "starting documents"
 
+    workflows = list(pipeline)
+    workflow_functions = dict(workflows)
+    table_ios = {name: infer_table_io(function) for name, function in workflows}
+    dependencies = build_dependency_graph(list(table_ios.items()))
+    max_concurrent_workflows = max(config.scheduler.max_concurrent_workflows, 1)
+    request_budget = (
+        asyncio.Semaphore(config.scheduler.concurrent_requests)
+        if config.scheduler.concurrent_requests
+        else None
+    )
+
     conf = config.model_copy()
+    pending = [name for name, _ in workflows]
+    completed: set[str] = set()
+    running: dict[asyncio.Task, tuple[str, float]] = {}
+
+    # content hashes of the table versions produced so far, used to fingerprint each workflow
+    versions: dict[str, str | None] = {}
+    manifest_lock = asyncio.Lock()
+    manifest = await load_manifest(storage) if resume else PipelineManifest()
+    # a resumed run compares the input to its checkpoint before deciding whether to rewrite it
+    input_version = (
+        await asyncio.to_thread(table_content_hash, dataset) if resume else None
+    )
+
+    async def save_manifest() -> None:
+        async with manifest_lock:
+            await dump_manifest(manifest, context.storage)
+
+    async def run_workflow(name: str, conf: GraphRagConfig) -> WorkflowFunctionOutput:
+        # each task runs in a copy of the current context, so this only affects the workflow's own rows
+        shared_request_budget.set(request_budget)
+        table_io = table_ios[name]
+        fingerprint = None
+        if table_io is not None:
+            for table in table_io.inputs - versions.keys():
+                versions[table] = await table_version(table, context.storage)
+            fingerprint = fingerprint_workflow(
+                name, {table: versions[table] for table in table_io.inputs}, conf
+            )
+        manifest.workflows.pop(name, None)
+        await save_manifest()
+
+        progress = logger.child(name, transient=False)
+        callbacks.workflow_start(name, None)
+        result = await workflow_functions[name](conf, context, callbacks)
+        progress(Progress(percent=1))
+        callbacks.workflow_end(name, result)
+
+        if table_io is None or fingerprint is None:
+            # the workflow may have written anything, so re-read versions from storage
+            versions.clear()
+        else:
+            outputs = {
+                table: await table_version(table, context.storage)
+                for table in table_io.outputs
+            }
+            versions.update(outputs)
+            manifest.workflows[name] = WorkflowCheckpoint(
+                fingerprint=fingerprint,
+                outputs={
+                    table: version
+                    for table, version in outputs.items()
+                    if version is not None
+                },
+            )
+            await save_manifest()
+        return result
+
     try:
         await _dump_stats(context.stats, context.storage)
-        await write_table_to_storage(dataset, "documents", context.storage)
-
-        for name, workflow_function in pipeline:
-            last_workflow = name
-            progress = logger.child(name, transient=False)
-            callbacks.workflow_start(name, None)
-            work_time = time.time()
-            result = await workflow_function(
-                conf,
-                context,
-                callbacks,
+
+        skipped = (
+            await plan_resume(
+                list(table_ios.items()), manifest, input_version, conf, storage
+            )
+            if input_version is not None
+            else set()
+        )
+        if input_version is None or INPUT_CHECKPOINT not in skipped:
+            input_version = await context.storage.set_table(
+                "documents.parquet", dataset
             )
-            progress(Progress(percent=1))
-            callbacks.workflow_end(name, result)
-            if result.config:
-                conf = result.config
-            yield PipelineRunResult(name, result.result, conf, None)
+        versions["documents"] = input_version
+        manifest.workflows[INPUT_CHECKPOINT] = WorkflowCheckpoint(
+            fingerprint=input_version, outputs={"documents": input_version}
+        )
+        await save_manifest()
 
-            context.stats.workflows[name] = {"overall": time.time() - work_time}
+        for name in [name for name in pending if name in skipped]:
+            logger.info(f"Skipping {name}, its outputs are up to date.")  # noqa: G004
+            pending.remove(name)
+            completed.add(name)
+            versions.update(manifest.workflows[name].outputs)
+            yield PipelineRunResult(name, None, conf, None)
+
+        while pending or running:
+            # start every workflow whose dependencies are satisfied, in pipeline order
+            for name in list(pending):
+                if len(running) >= max_concurrent_workflows:
+                    break
+                if dependencies[name] <= completed:
+                    pending.remove(name)
+                    last_workflow = name
+                    task = asyncio.create_task(run_workflow(name, conf))
+                    running[task] = (name, time.time())
+
+            done, _ = await asyncio.wait(
+                running.keys(), return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in sorted(done, key=lambda task: running[task][1]):
+                name, work_time = running.pop(task)
+                last_workflow = name
+                result = task.result()
+                if result.config:
+                    conf = result.config
+                completed.add(name)
+                yield PipelineRunResult(name, result.result, conf, None)
+
+                context.stats.workflows[name] = {"overall": time.time() - work_time}
 
         context.stats.total_runtime = time.time() - start_time
         await _dump_stats(context.stats, context.storage)
@@ -174,6 +322,11 @@ async def _run_pipeline(
         callbacks.error("Error running pipeline!", e, traceback.format_exc())
         yield PipelineRunResult(last_workflow, None, conf, [e])
 
+    finally:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+
 
 async def _dump_stats(stats: PipelineRunStats, storage: PipelineStorage) -> None:
     """Dump the stats to the storage."""
@@ -186,7 +339,8 @@ async def _copy_previous_output(
     storage: PipelineStorage,
     copy_storage: PipelineStorage,
 ):
-    for file in storage.find(re.compile(r"\.parquet$")):
-        base_name = file[0].replace(".parquet", "")
-        table = await load_table_from_storage(base_name, storage)
-        await write_table_to_storage(table, base_name, copy_storage)
+    # the storages copy the files without reading the tables, e.g. as hard links on disk
+    await asyncio.gather(*[
+        storage.copy(key, copy_storage)
+        for key, _ in storage.find(re.compile(r"\.parquet$"))
+    ])
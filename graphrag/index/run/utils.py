@@ -9,6 +9,7 @@ from graphrag.callbacks.progress_workflow_callbacks import ProgressWorkflowCallb
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.callbacks.workflow_callbacks_manager import WorkflowCallbacksManager
 from graphrag.index.context import PipelineRunContext, PipelineRunStats
+from graphrag.index.table_cache import TableCache
 from graphrag.logger.base import ProgressLogger
 from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
 from graphrag.storage.pipeline_storage import PipelineStorage
@@ -18,12 +19,17 @@ def create_run_context(
     storage: PipelineStorage | None,
     cache: PipelineCache | None,
     stats: PipelineRunStats | None,
+    table_cache: TableCache | None = None,
 ) -> PipelineRunContext:
     """Create the run context for the pipeline."""
+    stats = stats or PipelineRunStats()
+    if table_cache is not None:
+        stats.table_cache = table_cache.stats
     return PipelineRunContext(
-        stats=stats or PipelineRunStats(),
+        stats=stats,
         cache=cache or InMemoryCache(),
         storage=storage or MemoryPipelineStorage(),
+        table_cache=table_cache,
     )
 
 
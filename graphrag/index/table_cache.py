@@ -0,0 +1,153 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the 'TableCache' and 'TableCacheStats' models."""
+
+import copy
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from graphrag.storage.pipeline_storage import PipelineStorage
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class TableCacheStats:
+    """Table cache stats."""
+
+    hits: int = field(default=0)
+    """Number of table loads served from memory."""
+
+    misses: int = field(default=0)
+    """Number of table loads that had to read from storage."""
+
+    evictions: int = field(default=0)
+    """Number of tables evicted to stay within the memory budget."""
+
+    bytes_saved: int = field(default=0)
+    """In-memory size of the tables served from memory instead of being deserialized."""
+
+
+class TableCache:
+    """A write-through, memory-bounded LRU cache of the tables read and written during a pipeline run.
+
+    Tables are converted through Arrow on the way in, so a cached table has the same dtypes as one read
+    back from parquet, and copied on the way out, because workflows mutate the frames they load. The
+    copy includes the list and array cells of object columns, such as `text_unit_ids`, which
+    workflows also mutate in place.
+    """
+
+    _tables: OrderedDict[tuple[PipelineStorage, str], tuple[pd.DataFrame, int]]
+
+    def __init__(
+        self,
+        max_bytes: int,
+        arrow_dtypes: bool = False,
+        stats: TableCacheStats | None = None,
+    ):
+        """Create a new cache holding at most max_bytes of tables."""
+        self.max_bytes = max_bytes
+        self.arrow_dtypes = arrow_dtypes
+        self.stats = stats or TableCacheStats()
+        self._tables = OrderedDict()
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """The in-memory size of the cached tables."""
+        return self._size
+
+    def get(
+        self, storage: PipelineStorage, name: str, columns: list[str] | None = None
+    ) -> pd.DataFrame | None:
+        """Get a copy of a cached table, or None if it is not cached."""
+        key = (storage, name)
+        entry = self._tables.get(key)
+        if entry is None or (
+            columns is not None and not set(columns) <= set(entry[0].columns)
+        ):
+            self.stats.misses += 1
+            return None
+        self._tables.move_to_end(key)
+        table, size = entry
+        if columns is not None:
+            table = table[columns]
+        self.stats.hits += 1
+        self.stats.bytes_saved += size
+        return _copy_table(table)
+
+    def put(
+        self,
+        storage: PipelineStorage,
+        name: str,
+        table: pd.DataFrame,
+        converted: bool = False,
+    ) -> None:
+        """Cache a copy of a table, evicting the least recently used tables to stay within budget.
+
+        Set converted if the table was just read from parquet, so it only needs to be copied.
+        """
+        self.invalidate(storage, name)
+        try:
+            table = _copy_table(table) if converted else self._convert(table)
+        except (pa.ArrowException, TypeError, ValueError):
+            log.debug("could not convert table %s to arrow, not caching it", name)
+            return
+        size = int(table.memory_usage(index=True, deep=True).sum())
+        if size > self.max_bytes:
+            log.debug("table %s is too large to cache (%d bytes)", name, size)
+            return
+        self._tables[storage, name] = (table, size)
+        self._size += size
+        while self._size > self.max_bytes:
+            _, (_, evicted_size) = self._tables.popitem(last=False)
+            self._size -= evicted_size
+            self.stats.evictions += 1
+
+    def invalidate(self, storage: PipelineStorage, name: str) -> None:
+        """Drop a table from the cache."""
+        entry = self._tables.pop((storage, name), None)
+        if entry is not None:
+            self._size -= entry[1]
+
+    def clear(self) -> None:
+        """Drop every table from the cache."""
+        self._tables.clear()
+        self._size = 0
+
+    def _convert(self, table: pd.DataFrame) -> pd.DataFrame:
+        return pa.Table.from_pandas(table).to_pandas(
+            types_mapper=pd.ArrowDtype if self.arrow_dtypes else None
+        )
+
+
+def _copy_table(table: pd.DataFrame) -> pd.DataFrame:
+    copied = table.copy()
+    for column in copied.columns:
+        if not pd.api.types.is_object_dtype(copied[column]):
+            continue
+        values = copied[column].to_numpy()
+        first = next((value for value in values if value is not None), None)
+        # cells of a column read back from parquet share a type, so columns of strings are skipped
+        if isinstance(first, np.ndarray | list | dict | set):
+            copied[column] = pd.Series(
+                [_copy_cell(value) for value in values],
+                index=copied.index,
+                dtype=object,
+            )
+    return copied
+
+
+def _copy_cell(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    if isinstance(value, list | dict | set):
+        return copy.deepcopy(value)
+    return value
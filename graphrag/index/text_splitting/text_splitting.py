@@ -1,14 +1,16 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""A module containing the 'Tokenizer', 'TextSplitter', 'NoopTextSplitter' and 'TokenTextSplitter' models."""
+"""A module containing the 'Tokenizer', 'TextSplitter', 'NoopTextSplitter', 'TokenTextSplitter' and 'TokenArrayTextSplitter' models."""
 
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Collection, Iterable
+from collections.abc import Callable, Collection, Iterable, Iterator
 from dataclasses import dataclass
+from itertools import islice
 from typing import Any, Literal, cast
 
+import numpy as np
 import pandas as pd
 import tiktoken
 
@@ -19,10 +21,20 @@ from graphrag.logger.progress import ProgressTicker
 EncodedText = list[int]
 DecodeFn = Callable[[EncodedText], str]
 EncodeFn = Callable[[str], EncodedText]
+EncodeBatchFn = Callable[[list[str]], list[EncodedText]]
 LengthFn = Callable[[str], int]
 
 log = logging.getLogger(__name__)
 
+TOKEN_DTYPE = np.int32
+"""Token ids are stored as int32, which holds every id of the supported encodings at half the size of int64."""
+
+DEFAULT_ENCODE_BATCH_SIZE = 256
+"""Number of texts encoded together, which is what native encoding threads can parallelize over."""
+
+DEFAULT_FLUSH_TOKENS = 1 << 16
+"""Number of buffered tokens at which pending token arrays are concatenated and chunked."""
+
 
 @dataclass(frozen=True)
 class Tokenizer:
@@ -36,6 +48,8 @@ class Tokenizer:
     """ Function to decode a list of token ids to a string"""
     encode: EncodeFn
     """ Function to encode a string to a list of token ids"""
+    encode_batch: EncodeBatchFn | None = None
+    """ Optional function to encode several strings at once, e.g. on native threads"""
 
 
 class TextSplitter(ABC):
@@ -130,14 +144,41 @@ class TokenTextSplitter(TextSplitter):
             msg = f"Attempting to split a non-string value, actual is {type(text)}"
             raise TypeError(msg)
 
-        tokenizer = Tokenizer(
+        return split_single_text_on_tokens(text=text, tokenizer=self._get_tokenizer())
+
+    def _get_tokenizer(self) -> Tokenizer:
+        return Tokenizer(
             chunk_overlap=self._chunk_overlap,
             tokens_per_chunk=self._chunk_size,
             decode=self._tokenizer.decode,
             encode=lambda text: self.encode(text),
+            encode_batch=lambda texts: self._tokenizer.encode_batch(
+                texts,
+                allowed_special=self._allowed_special,
+                disallowed_special=self._disallowed_special,
+            ),
         )
 
-        return split_single_text_on_tokens(text=text, tokenizer=tokenizer)
+
+class TokenArrayTextSplitter(TokenTextSplitter):
+    """Token text splitter that splits a list of texts as consecutive documents.
+
+    The token ids of all the texts are held in a single int32 array with the offsets of each text,
+    instead of one Python object per token, and the texts of each chunk are found by binary search
+    over the offsets.
+    """
+
+    def split_text(self, text: str | list[str]) -> list[str]:
+        """Split text method."""
+        if isinstance(text, list):
+            return [chunk.text_chunk for chunk in self.split_texts(text)]
+        return super().split_text(text)
+
+    def split_texts(
+        self, texts: list[str], tick: ProgressTicker | None = None
+    ) -> list[TextChunk]:
+        """Split the texts into chunks that record the indices of the texts they come from."""
+        return split_multiple_texts_on_tokens(texts, self._get_tokenizer(), tick)
 
 
 def split_single_text_on_tokens(text: str, tokenizer: Tokenizer) -> list[str]:
@@ -159,35 +200,151 @@ def split_single_text_on_tokens(text: str, tokenizer: Tokenizer) -> list[str]:
     return result
 
 
-# Adapted from - https://github.com/langchain-ai/langchain/blob/77b359edf5df0d37ef0d539f678cf64f5557cb54/libs/langchain/langchain/text_splitter.py#L471
-# So we could have better control over the chunking process
+@dataclass(frozen=True)
+class EncodedTexts:
+    """The token ids of several texts, concatenated into a single array."""
+
+    tokens: np.ndarray
+    """ Token ids of every text, one after the other"""
+    offsets: np.ndarray
+    """ Position of the first token of each text in tokens, followed by the total number of tokens"""
+
+    @classmethod
+    def from_arrays(cls, token_arrays: Iterable[np.ndarray]) -> "EncodedTexts":
+        """Concatenate the token arrays of several texts."""
+        arrays = list(token_arrays)
+        offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        np.cumsum([len(array) for array in arrays], out=offsets[1:])
+        tokens = (
+            np.concatenate(arrays) if arrays else np.empty(0, dtype=TOKEN_DTYPE)
+        ).astype(TOKEN_DTYPE, copy=False)
+        return cls(tokens=tokens, offsets=offsets)
+
+    def __len__(self) -> int:
+        """Get the total number of tokens."""
+        return len(self.tokens)
+
+    def doc_indices(self, start: int, end: int) -> list[int]:
+        """Get the indices of the texts with tokens between the start and end positions."""
+        return _doc_indices(self.offsets, start, end)
+
+    def windows(
+        self, tokens_per_chunk: int, chunk_overlap: int
+    ) -> Iterator[tuple[np.ndarray, list[int]]]:
+        """Slide a chunk window over the tokens, yielding each chunk's token ids with the indices of its texts."""
+        start = 0
+        while start < len(self.tokens):
+            end = min(start + tokens_per_chunk, len(self.tokens))
+            yield self.tokens[start:end], self.doc_indices(start, end)
+            start += tokens_per_chunk - chunk_overlap
+
+
 def split_multiple_texts_on_tokens(
-    texts: list[str], tokenizer: Tokenizer, tick: ProgressTicker
+    texts: list[str], tokenizer: Tokenizer, tick: ProgressTicker | None = None
 ) -> list[TextChunk]:
     """Split multiple texts and return chunks with metadata using the tokenizer."""
-    result = []
-    mapped_ids = []
-
-    for source_doc_idx, text in enumerate(texts):
-        encoded = tokenizer.encode(text)
-        if tick:
-            tick(1)  # Track progress if tick callback is provided
-        mapped_ids.append((source_doc_idx, encoded))
-
-    input_ids = [
-        (source_doc_idx, id) for source_doc_idx, ids in mapped_ids for id in ids
+    encoded = EncodedTexts.from_arrays(encode_texts(texts, tokenizer, tick))
+    return [
+        TextChunk(tokenizer.decode(tokens.tolist()), doc_indices, len(tokens))
+        for tokens, doc_indices in encoded.windows(
+            tokenizer.tokens_per_chunk, tokenizer.chunk_overlap
+        )
     ]
 
-    start_idx = 0
-    cur_idx = min(start_idx + tokenizer.tokens_per_chunk, len(input_ids))
-    chunk_ids = input_ids[start_idx:cur_idx]
 
-    while start_idx < len(input_ids):
-        chunk_text = tokenizer.decode([id for _, id in chunk_ids])
-        doc_indices = list({doc_idx for doc_idx, _ in chunk_ids})
-        result.append(TextChunk(chunk_text, doc_indices, len(chunk_ids)))
-        start_idx += tokenizer.tokens_per_chunk - tokenizer.chunk_overlap
-        cur_idx = min(start_idx + tokenizer.tokens_per_chunk, len(input_ids))
-        chunk_ids = input_ids[start_idx:cur_idx]
-
-    return result
+def _doc_indices(
+    offsets: np.ndarray, start: int, end: int, first_doc: int = 0
+) -> list[int]:
+    """Find the texts overlapping the [start, end) token range by binary search over their offsets.
+
+    The offsets may belong to a run of texts starting at text first_doc.
+    """
+    first = int(np.searchsorted(offsets, start, side="right")) - 1
+    last = int(np.searchsorted(offsets, end - 1, side="right")) - 1
+    indices = np.arange(first, last + 1)
+    # texts without tokens share their offset with the next text and are not part of any chunk
+    indices = indices[offsets[indices + 1] > offsets[indices]]
+    # the indices go through a set like the chunk ids were always built from, so they come out in
+    # the same order and chunk ids hashed from them stay the same
+    return list(set((indices + first_doc).tolist()))
+
+
+def encode_texts(
+    texts: Iterable[str],
+    tokenizer: Tokenizer,
+    tick: ProgressTicker | None = None,
+    batch_size: int = DEFAULT_ENCODE_BATCH_SIZE,
+) -> Iterator[np.ndarray]:
+    """Lazily encode texts a batch at a time, yielding a token array per text."""
+    iterator = iter(texts)
+    while batch := list(islice(iterator, batch_size)):
+        if tokenizer.encode_batch is not None:
+            encoded = tokenizer.encode_batch(batch)
+        else:
+            encoded = [tokenizer.encode(text) for text in batch]
+        if tick:
+            tick(len(batch))
+        for ids in encoded:
+            yield np.asarray(ids, dtype=TOKEN_DTYPE)
+
+
+def chunk_token_arrays(
+    token_arrays: Iterable[np.ndarray],
+    tokens_per_chunk: int,
+    chunk_overlap: int,
+    flush_tokens: int = DEFAULT_FLUSH_TOKENS,
+) -> Iterator[tuple[np.ndarray, list[int]]]:
+    """Slide a chunk window over the concatenated token arrays.
+
+    Yields the token ids of each chunk with the indices of the arrays they come from, giving the
+    same chunks as split_multiple_texts_on_tokens. Chunks are yielded as soon as their tokens are
+    available, so only about flush_tokens tokens are held at a time besides the current array.
+    """
+    stride = tokens_per_chunk - chunk_overlap
+    # the buffered tokens, starting at global position base, and the global offsets of the
+    # arrays they belong to, starting with array first_doc
+    tokens = np.empty(0, dtype=TOKEN_DTYPE)
+    base = 0
+    first_doc = 0
+    doc_offsets = np.empty(0, dtype=np.int64)
+    pending: list[np.ndarray] = []
+    pending_offsets: list[int] = []
+    total = 0
+    start = 0
+
+    def flush() -> np.ndarray:
+        nonlocal tokens, base, first_doc, doc_offsets, pending, pending_offsets, start
+        tokens = np.concatenate([tokens[start:], *pending]).astype(
+            TOKEN_DTYPE, copy=False
+        )
+        base += start
+        doc_offsets = np.concatenate([
+            doc_offsets,
+            np.asarray(pending_offsets, dtype=np.int64),
+        ])
+        # arrays ending before the buffer are no longer needed
+        dropped = max(int(np.searchsorted(doc_offsets, base, side="right")) - 1, 0)
+        first_doc += dropped
+        doc_offsets = doc_offsets[dropped:]
+        pending, pending_offsets = [], []
+        start = 0
+        return np.append(doc_offsets, total) - base
+
+    def window(bounds: np.ndarray, end: int) -> tuple[np.ndarray, list[int]]:
+        return tokens[start:end], _doc_indices(bounds, start, end, first_doc)
+
+    for array in token_arrays:
+        pending.append(array)
+        pending_offsets.append(total)
+        total += len(array)
+        if total - base - len(tokens) < max(flush_tokens, tokens_per_chunk):
+            continue
+        bounds = flush()
+        while start + tokens_per_chunk <= len(tokens):
+            yield window(bounds, start + tokens_per_chunk)
+            start += stride
+
+    bounds = flush()
+    while start < len(tokens):
+        yield window(bounds, min(start + tokens_per_chunk, len(tokens)))
+        start += stride
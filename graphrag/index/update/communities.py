@@ -3,147 +3,257 @@
 
 """Dataframe operations and utils for Incremental Indexing."""
 
+from dataclasses import dataclass, field
+
 import pandas as pd
 
+from graphrag.index.operations.cluster_graph import cluster_graph
+from graphrag.index.operations.create_graph import create_graph
+from graphrag.index.utils.stable_lcc import stable_largest_connected_component
+from graphrag.index.workflows.create_communities import build_communities
+
+COMMUNITY_COLUMNS = [
+    "id",
+    "human_readable_id",
+    "community",
+    "level",
+    "parent",
+    "children",
+    "title",
+    "entity_ids",
+    "relationship_ids",
+    "text_unit_ids",
+    "period",
+    "size",
+]
+
+
+@dataclass
+class CommunityDelta:
+    """Dataclass to hold the changes to the communities of an incremental update.
+
+    Attributes
+    ----------
+    added : list[int]
+        The communities that did not exist before the update.
+    changed : list[int]
+        The communities with the same entities as before, whose content changed.
+    removed : list[int]
+        The communities that no longer exist after the update.
+    """
+
+    added: list[int] = field(default_factory=list)
+    changed: list[int] = field(default_factory=list)
+    removed: list[int] = field(default_factory=list)
+
+    @property
+    def outdated(self) -> list[int]:
+        """The communities whose report has to be generated again."""
+        return self.added + self.changed
 
-def _update_and_merge_communities(
+
+def _recluster_communities(
     old_communities: pd.DataFrame,
-    delta_communities: pd.DataFrame,
-) -> tuple[pd.DataFrame, dict]:
-    """Update and merge communities.
+    merged_entities: pd.DataFrame,
+    merged_relationships: pd.DataFrame,
+    delta_entities: pd.DataFrame,
+    delta_relationships: pd.DataFrame,
+    max_cluster_size: int,
+    use_lcc: bool,
+    seed: int | None = None,
+) -> tuple[pd.DataFrame, CommunityDelta]:
+    """Recluster the parts of the merged graph touched by the update.
 
     Parameters
     ----------
     old_communities : pd.DataFrame
-        The old communities.
-    delta_communities : pd.DataFrame
-        The delta communities.
-    community_id_mapping : dict
-        The community id mapping.
+        The communities of the previous index.
+    merged_entities : pd.DataFrame
+        The merged entities, which keep the ids of the previous entities.
+    merged_relationships : pd.DataFrame
+        The merged relationships.
+    delta_entities : pd.DataFrame
+        The entities extracted from the new documents.
+    delta_relationships : pd.DataFrame
+        The relationships extracted from the new documents.
+    max_cluster_size : int
+        The maximum cluster size of the hierarchical clustering.
+    use_lcc : bool
+        Whether to only cluster the largest connected component.
+    seed : int | None
+        The seed of the clustering.
 
     Returns
     -------
     pd.DataFrame
-        The updated communities.
+        The merged communities.
+    CommunityDelta
+        The communities added, changed and removed by the update.
     """
     # Check if size and period columns exist in the old_communities. If not, add them
     if "size" not in old_communities.columns:
         old_communities["size"] = None
     if "period" not in old_communities.columns:
         old_communities["period"] = None
+    old_communities["community"] = old_communities["community"].astype(int)
 
-    # Same for delta_communities
-    if "size" not in delta_communities.columns:
-        delta_communities["size"] = None
-    if "period" not in delta_communities.columns:
-        delta_communities["period"] = None
-
-    # Increment all community ids by the max of the old communities
-    old_max_community_id = old_communities["community"].fillna(0).astype(int).max()
-    # Increment only the non-NaN values in delta_communities["community"]
-    community_id_mapping = {
-        v: v + old_max_community_id + 1
-        for k, v in delta_communities["community"].dropna().astype(int).items()
-    }
-    community_id_mapping.update({-1: -1})
+    graph = create_graph(merged_relationships)
+    if use_lcc:
+        graph = stable_largest_connected_component(graph)
 
-    # Look for community ids in community and replace them with the corresponding id in the mapping
-    delta_communities["community"] = (
-        delta_communities["community"]
-        .astype(int)
-        .apply(lambda x: community_id_mapping.get(x, x))
+    titles = dict(zip(merged_entities["id"], merged_entities["title"], strict=True))
+    members = old_communities["entity_ids"].apply(
+        lambda ids: {titles[entity_id] for entity_id in ids if entity_id in titles}
+    )
+    touched = (
+        set(delta_entities["title"])
+        | set(delta_relationships["source"])
+        | set(delta_relationships["target"])
     )
 
-    delta_communities["parent"] = (
-        delta_communities["parent"]
-        .astype(int)
-        .apply(lambda x: community_id_mapping.get(x, x))
+    # root communities without touched entities keep their whole subtree, the rest of the graph is reclustered
+    roots = old_communities["level"] == 0
+    kept_roots = roots & members.apply(
+        lambda titles: titles.isdisjoint(touched) and titles <= graph.nodes.keys()
+    )
+    kept = _with_descendants(
+        old_communities, set(old_communities.loc[kept_roots, "community"])
     )
+    kept_communities = old_communities.loc[old_communities["community"].isin(kept)]
+    kept_titles = set().union(*members[kept_roots])
+    region = graph.subgraph([node for node in graph.nodes if node not in kept_titles])
 
-    old_communities["community"] = old_communities["community"].astype(int)
+    delta = CommunityDelta()
+    reclustered = old_communities.loc[~old_communities["community"].isin(kept)]
+    if len(region.nodes) == 0:
+        delta.removed = reclustered["community"].tolist()
+        return _with_children(kept_communities), delta
 
-    # Merge the final communities
-    merged_communities = pd.concat(
-        [old_communities, delta_communities], ignore_index=True, copy=False
+    # seed the clustering with the previous root partition of the reclustered nodes
+    starting_communities = {
+        title: int(community)
+        for community, titles in zip(
+            old_communities.loc[roots & ~kept_roots, "community"],
+            members[roots & ~kept_roots],
+            strict=True,
+        )
+        for title in titles
+        if title in region
+    }
+    clusters = cluster_graph(
+        region,
+        max_cluster_size,
+        use_lcc=False,
+        seed=seed,
+        starting_communities=starting_communities,
     )
+    communities = build_communities(clusters, merged_entities, merged_relationships)
 
-    # Rename title
-    merged_communities["title"] = "Community " + merged_communities["community"].astype(
-        str
+    # communities with the same entities at the same level keep their id, the others get new ones
+    previous = {
+        (int(level), frozenset(entity_ids)): row
+        for level, entity_ids, row in zip(
+            reclustered["level"],
+            reclustered["entity_ids"],
+            reclustered.itertuples(index=False),
+            strict=True,
+        )
+    }
+    entities_touched = set(
+        merged_entities.loc[merged_entities["title"].isin(touched), "id"]
     )
-    # Re-assign the human_readable_id
-    merged_communities["human_readable_id"] = merged_communities["community"]
+    next_id = int(old_communities["community"].max()) + 1
+    id_mapping = {-1: -1}
+    for index, row in communities.iterrows():
+        match = previous.get((int(row["level"]), frozenset(row["entity_ids"])))
+        if match is None:
+            id_mapping[row["community"]] = next_id
+            delta.added.append(next_id)
+            next_id += 1
+            continue
+        id_mapping[row["community"]] = int(match.community)
+        communities.loc[index, "id"] = match.id
+        if entities_touched.isdisjoint(row["entity_ids"]) and set(
+            row["relationship_ids"]
+        ) == set(match.relationship_ids):
+            communities.loc[index, "period"] = match.period
+        else:
+            delta.changed.append(int(match.community))
+
+    communities["community"] = communities["community"].map(id_mapping)
+    communities["parent"] = communities["parent"].map(id_mapping)
+    communities["human_readable_id"] = communities["community"]
+    communities["title"] = "Community " + communities["community"].astype(str)
+
+    delta.removed = sorted(set(reclustered["community"]) - set(id_mapping.values()))
+    return _with_children(
+        pd.concat([kept_communities, communities], ignore_index=True)
+    ), delta
+
+
+def _with_descendants(communities: pd.DataFrame, community_ids: set) -> set:
+    """Add the descendants of the given communities, following the parent of each community."""
+    result = set(community_ids)
+    for level in sorted(communities["level"].unique()):
+        at_level = communities.loc[communities["level"] == level]
+        result.update(at_level.loc[at_level["parent"].isin(result), "community"])
+    return result
 
-    merged_communities = merged_communities.loc[
-        :,
-        [
-            "id",
-            "human_readable_id",
-            "community",
-            "parent",
-            "level",
-            "title",
-            "entity_ids",
-            "relationship_ids",
-            "text_unit_ids",
-            "period",
-            "size",
-        ],
-    ]
-    return merged_communities, community_id_mapping
+
+def _with_children(communities: pd.DataFrame) -> pd.DataFrame:
+    """Collect the children of each community from the parents, so the tree goes both ways."""
+    children = communities.groupby("parent")["community"].agg(list)
+    communities = communities.reset_index(drop=True)
+    communities["children"] = communities["community"].map(
+        lambda community: children.get(community, [])
+    )
+    return communities.loc[:, COMMUNITY_COLUMNS]
 
 
-def _update_and_merge_community_reports(
+def _update_community_reports(
     old_community_reports: pd.DataFrame,
-    delta_community_reports: pd.DataFrame,
-    community_id_mapping: dict,
+    new_community_reports: pd.DataFrame | None,
+    merged_communities: pd.DataFrame,
+    community_delta: CommunityDelta,
 ) -> pd.DataFrame:
-    """Update and merge community reports.
+    """Merge the reports of the unchanged communities with the regenerated ones.
 
     Parameters
     ----------
     old_community_reports : pd.DataFrame
         The old community reports.
-    delta_community_reports : pd.DataFrame
-        The delta community reports.
-    community_id_mapping : dict
-        The community id mapping.
+    new_community_reports : pd.DataFrame | None
+        The reports generated for the added and changed communities, if any.
+    merged_communities : pd.DataFrame
+        The merged communities.
+    community_delta : CommunityDelta
+        The communities added, changed and removed by the update.
 
     Returns
     -------
     pd.DataFrame
         The updated community reports.
     """
-    # Check if size and period columns exist in the old_community_reports. If not, add them
-    if "size" not in old_community_reports.columns:
-        old_community_reports["size"] = None
-    if "period" not in old_community_reports.columns:
-        old_community_reports["period"] = None
-
-    # Same for delta_community_reports
-    if "size" not in delta_community_reports.columns:
-        delta_community_reports["size"] = None
-    if "period" not in delta_community_reports.columns:
-        delta_community_reports["period"] = None
-
-    # Look for community ids in community and replace them with the corresponding id in the mapping
-    delta_community_reports["community"] = (
-        delta_community_reports["community"]
-        .astype(int)
-        .apply(lambda x: community_id_mapping.get(x, x))
-    )
-
-    delta_community_reports["parent"] = (
-        delta_community_reports["parent"]
-        .astype(int)
-        .apply(lambda x: community_id_mapping.get(x, x))
-    )
-
     old_community_reports["community"] = old_community_reports["community"].astype(int)
+    kept_reports = old_community_reports.loc[
+        ~old_community_reports["community"].isin(
+            community_delta.removed + community_delta.changed
+        )
+        & old_community_reports["community"].isin(merged_communities["community"])
+    ]
+    # the hierarchy around a kept report may have changed
+    kept_reports = kept_reports.drop(
+        columns=["parent", "children", "size", "period"], errors="ignore"
+    ).merge(
+        merged_communities.loc[
+            :, ["community", "parent", "children", "size", "period"]
+        ],
+        on="community",
+        how="left",
+    )
 
-    # Merge the final community reports
     merged_community_reports = pd.concat(
-        [old_community_reports, delta_community_reports], ignore_index=True, copy=False
+        [kept_reports, new_community_reports], ignore_index=True, copy=False
     )
 
     # Maintain type compat with query
@@ -161,8 +271,9 @@ def _update_and_merge_community_reports(
             "id",
             "human_readable_id",
             "community",
-            "parent",
             "level",
+            "parent",
+            "children",
             "title",
             "summary",
             "full_content",
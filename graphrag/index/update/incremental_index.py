@@ -12,9 +12,12 @@ from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.embeddings import get_embedded_fields, get_embedding_settings
 from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.run.utils import create_run_context
+from graphrag.index.typing import WorkflowFunction
 from graphrag.index.update.communities import (
-    _update_and_merge_communities,
-    _update_and_merge_community_reports,
+    CommunityDelta,
+    _recluster_communities,
+    _update_community_reports,
 )
 from graphrag.index.update.entities import (
     _group_and_resolve_entities,
@@ -23,6 +26,7 @@ from graphrag.index.update.entities import (
 from graphrag.index.update.relationships import _update_and_merge_relationships
 from graphrag.index.workflows.generate_text_embeddings import generate_text_embeddings
 from graphrag.logger.print_progress import ProgressLogger
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
 from graphrag.storage.pipeline_storage import PipelineStorage
 from graphrag.utils.storage import (
     load_table_from_storage,
@@ -87,6 +91,7 @@ async def update_dataframe_outputs(
     cache: PipelineCache,
     callbacks: WorkflowCallbacks,
     progress_logger: ProgressLogger,
+    report_workflow: WorkflowFunction | None = None,
 ) -> None:
     """Update the mergeable outputs.
 
@@ -98,6 +103,8 @@ async def update_dataframe_outputs(
         The storage used to store the subset of new dataframes in the update run.
     output_storage : PipelineStorage
         The storage used to store the updated dataframes (the final incremental output).
+    report_workflow : WorkflowFunction | None
+        The workflow generating the reports of the communities added or changed by the update.
     """
     progress_logger.info("Updating Documents")
     final_documents_df = await _concat_dataframes(
@@ -129,19 +136,34 @@ async def update_dataframe_outputs(
         progress_logger.info("Updating Covariates")
         await _update_covariates(previous_storage, delta_storage, output_storage)
 
-    # Merge final communities
+    # Recluster the communities touched by the update
     progress_logger.info("Updating Communities")
-    community_id_mapping = await _update_communities(
-        previous_storage, delta_storage, output_storage
+    merged_communities, community_delta = await _update_communities(
+        previous_storage,
+        delta_storage,
+        output_storage,
+        merged_entities_df,
+        merged_relationships_df,
+        config,
+    )
+    progress_logger.info(
+        f"Communities added: {len(community_delta.added)}, changed: {len(community_delta.changed)}, removed: {len(community_delta.removed)}"  # noqa: G004
     )
 
-    # Merge community reports
+    # Regenerate the reports of the added and changed communities
     progress_logger.info("Updating Community Reports")
-    merged_community_reports = await _update_community_reports(
-        previous_storage, delta_storage, output_storage, community_id_mapping
+    merged_community_reports = await _update_reports(
+        previous_storage,
+        output_storage,
+        merged_communities,
+        community_delta,
+        config,
+        cache,
+        callbacks,
+        report_workflow,
     )
 
-    # Generate text embeddings
+    # Embed the new and changed rows into the existing vector stores
     progress_logger.info("Updating Text Embeddings")
     embedded_fields = get_embedded_fields(config)
     text_embed = get_embedding_settings(config)
@@ -157,21 +179,72 @@ async def update_dataframe_outputs(
         text_embed_config=text_embed,
         embedded_fields=embedded_fields,
         snapshot_embeddings_enabled=config.snapshots.embeddings,
+        upsert=True,
+        removed_ids={
+            "entities": await _removed_ids(
+                "entities", previous_storage, merged_entities_df
+            ),
+            "relationships": await _removed_ids(
+                "relationships", previous_storage, merged_relationships_df
+            ),
+            "text_units": await _removed_ids(
+                "text_units", previous_storage, merged_text_units
+            ),
+            "community_reports": await _removed_ids(
+                "community_reports", previous_storage, merged_community_reports
+            ),
+        },
     )
 
 
-async def _update_community_reports(
-    previous_storage, delta_storage, output_storage, community_id_mapping
-):
+async def _removed_ids(
+    name: str, previous_storage: PipelineStorage, merged_df: pd.DataFrame
+) -> list[str]:
+    """Get the ids of a previous table that are not in the merged table, to delete their embeddings."""
+    old_df = await load_table_from_storage(name, previous_storage)
+    return sorted(set(old_df["id"]) - set(merged_df["id"]))
+
+
+async def _update_reports(
+    previous_storage: PipelineStorage,
+    output_storage: PipelineStorage,
+    merged_communities: pd.DataFrame,
+    community_delta: CommunityDelta,
+    config: GraphRagConfig,
+    cache: PipelineCache,
+    callbacks: WorkflowCallbacks,
+    report_workflow: WorkflowFunction | None,
+) -> pd.DataFrame:
     """Update the community reports output."""
     old_community_reports = await load_table_from_storage(
         "community_reports", previous_storage
     )
-    delta_community_reports = await load_table_from_storage(
-        "community_reports", delta_storage
-    )
-    merged_community_reports = _update_and_merge_community_reports(
-        old_community_reports, delta_community_reports, community_id_mapping
+
+    new_community_reports = None
+    if report_workflow is not None and community_delta.outdated:
+        # run the report workflow over the merged tables, restricted to the outdated communities
+        storage = MemoryPipelineStorage()
+        for name in ["entities", "relationships", "text_units", "covariates"]:
+            if await storage_has_table(name, output_storage):
+                await write_table_to_storage(
+                    await load_table_from_storage(name, output_storage), name, storage
+                )
+        outdated = merged_communities.loc[
+            merged_communities["community"].isin(community_delta.outdated)
+        ]
+        await write_table_to_storage(outdated, "communities", storage)
+        await report_workflow(
+            config, create_run_context(storage, cache, None), callbacks
+        )
+        new_community_reports = await load_table_from_storage(
+            "community_reports", storage
+        )
+
+    merged_community_reports = _update_community_reports(
+        old_community_reports,
+        new_community_reports,
+        merged_communities,
+        community_delta,
     )
 
     await write_table_to_storage(
@@ -181,17 +254,32 @@ async def _update_community_reports(
     return merged_community_reports
 
 
-async def _update_communities(previous_storage, delta_storage, output_storage):
+async def _update_communities(
+    previous_storage: PipelineStorage,
+    delta_storage: PipelineStorage,
+    output_storage: PipelineStorage,
+    merged_entities: pd.DataFrame,
+    merged_relationships: pd.DataFrame,
+    config: GraphRagConfig,
+) -> tuple[pd.DataFrame, CommunityDelta]:
     """Update the communities output."""
     old_communities = await load_table_from_storage("communities", previous_storage)
-    delta_communities = await load_table_from_storage("communities", delta_storage)
-    merged_communities, community_id_mapping = _update_and_merge_communities(
-        old_communities, delta_communities
+    delta_entities = await load_table_from_storage("entities", delta_storage)
+    delta_relationships = await load_table_from_storage("relationships", delta_storage)
+    merged_communities, community_delta = _recluster_communities(
+        old_communities,
+        merged_entities,
+        merged_relationships,
+        delta_entities,
+        delta_relationships,
+        max_cluster_size=config.cluster_graph.max_cluster_size,
+        use_lcc=config.cluster_graph.use_lcc,
+        seed=config.cluster_graph.seed,
     )
 
     await write_table_to_storage(merged_communities, "communities", output_storage)
 
-    return community_id_mapping
+    return merged_communities, community_delta
 
 
 async def _update_covariates(previous_storage, delta_storage, output_storage):
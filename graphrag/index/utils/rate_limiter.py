@@ -21,20 +21,25 @@ class RateLimiter:
         self.per = per
         self.allowance = rate
         self.last_check = time.monotonic()
+        self._lock = asyncio.Lock()
 
     async def acquire(self):
         """Acquire a token from the rate limiter."""
-        current = time.monotonic()
-        elapsed = current - self.last_check
-        self.last_check = current
-        self.allowance += elapsed * (self.rate / self.per)
-
-        if self.allowance > self.rate:
-            self.allowance = self.rate
-
-        if self.allowance < 1.0:
-            sleep_time = (1.0 - self.allowance) * (self.per / self.rate)
-            await asyncio.sleep(sleep_time)
-            self.allowance = 0.0
-        else:
-            self.allowance -= 1.0
+        # the allowance must be updated atomically, or concurrent callers that read it before
+        # one of them sleeps are all let through
+        async with self._lock:
+            current = time.monotonic()
+            elapsed = current - self.last_check
+            self.last_check = current
+            self.allowance += elapsed * (self.rate / self.per)
+
+            if self.allowance > self.rate:
+                self.allowance = self.rate
+
+            if self.allowance < 1.0:
+                sleep_time = (1.0 - self.allowance) * (self.per / self.rate)
+                await asyncio.sleep(sleep_time)
+                self.allowance = 0.0
+                self.last_check = time.monotonic()
+            else:
+                self.allowance -= 1.0
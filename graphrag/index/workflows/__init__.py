@@ -36,6 +36,9 @@ from .extract_graph_nlp import (
 from .finalize_graph import (
     run_workflow as run_finalize_graph,
 )
+from .generate_community_report_embeddings import (
+    run_workflow as run_generate_community_report_embeddings,
+)
 from .generate_text_embeddings import (
     run_workflow as run_generate_text_embeddings,
 )
@@ -56,5 +59,6 @@ PipelineFactory.register_all({
     "extract_graph": run_extract_graph,
     "finalize_graph": run_finalize_graph,
     "generate_text_embeddings": run_generate_text_embeddings,
+    "generate_community_report_embeddings": run_generate_community_report_embeddings,
     "prune_graph": run_prune_graph,
 })
@@ -4,19 +4,30 @@
 """A module containing run_workflow method definition."""
 
 import json
+from collections.abc import Iterator
+from itertools import islice
 from typing import Any, cast
 
 import pandas as pd
 
+import graphrag.config.defaults as defs
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
-from graphrag.config.models.chunking_config import ChunkStrategyType
+from graphrag.config.models.chunking_config import ChunkingConfig, ChunkStrategyType
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.context import PipelineRunContext
-from graphrag.index.operations.chunk_text.chunk_text import chunk_text
-from graphrag.index.operations.chunk_text.strategies import get_encoding_fn
+from graphrag.index.operations.chunk_text.chunk_text import (
+    load_strategy,
+    run_strategy,
+)
+from graphrag.index.operations.chunk_text.strategies import get_tokenizer
+from graphrag.index.text_splitting.text_splitting import (
+    Tokenizer,
+    chunk_token_arrays,
+    encode_texts,
+)
 from graphrag.index.typing import WorkflowFunctionOutput
 from graphrag.index.utils.hashing import gen_sha512_hash
-from graphrag.logger.progress import Progress
+from graphrag.logger.progress import Progress, progress_ticker
 from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 
@@ -26,7 +37,9 @@ async def run_workflow(
     callbacks: WorkflowCallbacks,
 ) -> WorkflowFunctionOutput:
     """All the steps to transform base text_units."""
-    documents = await load_table_from_storage("documents", context.storage)
+    documents = await load_table_from_storage(
+        "documents", context.storage, table_cache=context.table_cache
+    )
 
     chunks = config.chunks
 
@@ -40,9 +53,12 @@ async def run_workflow(
         strategy=chunks.strategy,
         prepend_metadata=chunks.prepend_metadata,
         chunk_size_includes_metadata=chunks.chunk_size_includes_metadata,
+        num_threads=chunks.num_threads,
     )
 
-    await write_table_to_storage(output, "text_units", context.storage)
+    await write_table_to_storage(
+        output, "text_units", context.storage, table_cache=context.table_cache
+    )
 
     return WorkflowFunctionOutput(result=output, config=None)
 
@@ -57,6 +73,7 @@ def create_base_text_units(
     strategy: ChunkStrategyType,
     prepend_metadata: bool = False,
     chunk_size_includes_metadata: bool = False,
+    num_threads: int = defs.CHUNK_NUM_THREADS,
 ) -> pd.DataFrame:
     """All the steps to transform base text_units."""
     sort = documents.sort_values(by=["id"], ascending=[True])
@@ -82,69 +99,90 @@ def create_base_text_units(
     )
     aggregated.rename(columns={"text_with_ids": "texts"}, inplace=True)
 
-    def chunker(row: dict[str, Any]) -> Any:
-        line_delimiter = ".\n"
-        metadata_str = ""
-        metadata_tokens = 0
-
-        if prepend_metadata and "metadata" in row:
-            metadata = row["metadata"]
-            if isinstance(metadata, str):
-                metadata = json.loads(metadata)
-            if isinstance(metadata, dict):
-                metadata_str = (
-                    line_delimiter.join(f"{k}: {v}" for k, v in metadata.items())
-                    + line_delimiter
-                )
-
-            if chunk_size_includes_metadata:
-                encode, _ = get_encoding_fn(encoding_model)
-                metadata_tokens = len(encode(metadata_str))
-                if metadata_tokens >= size:
-                    message = "Metadata tokens exceeds the maximum tokens per chunk. Please increase the tokens per chunk."
-                    raise ValueError(message)
-
-        chunked = chunk_text(
-            pd.DataFrame([row]).reset_index(drop=True),
-            column="texts",
-            size=size - metadata_tokens,
-            overlap=overlap,
-            encoding_model=encoding_model,
-            strategy=strategy,
-            callbacks=callbacks,
-        )[0]
-
-        if prepend_metadata:
-            for index, chunk in enumerate(chunked):
-                if isinstance(chunk, str):
-                    chunked[index] = metadata_str + chunk
-                else:
-                    chunked[index] = (
-                        (chunk[0], metadata_str + chunk[1], chunk[2]) if chunk else None
-                    )
-
-        row["chunks"] = chunked
-        return row
-
-    aggregated = aggregated.apply(lambda row: chunker(row), axis=1)
-
-    aggregated = cast("pd.DataFrame", aggregated[[*group_by_columns, "chunks"]])
-    aggregated = aggregated.explode("chunks")
-    aggregated.rename(
-        columns={
-            "chunks": "chunk",
-        },
-        inplace=True,
-    )
-    aggregated["id"] = aggregated.apply(
-        lambda row: gen_sha512_hash(row, ["chunk"]), axis=1
+    tick = progress_ticker(callbacks.progress, len(sort))
+    tokenizer = get_tokenizer(encoding_model, size, overlap, num_threads)
+    config = ChunkingConfig(
+        size=size,
+        overlap=overlap,
+        encoding_model=encoding_model,
+        num_threads=num_threads,
     )
-    aggregated[["document_ids", "chunk", "n_tokens"]] = pd.DataFrame(
-        aggregated["chunk"].tolist(), index=aggregated.index
-    )
-    # rename for downstream consumption
-    aggregated.rename(columns={"chunk": "text"}, inplace=True)
 
-    return cast(
-        "pd.DataFrame", aggregated[aggregated["text"].notna()].reset_index(drop=True)
+    # every group is encoded through one stream, so encoding batches span group boundaries
+    encoded = (
+        encode_texts(
+            (text for texts in aggregated["texts"] for _, text in texts),
+            tokenizer,
+            tick,
+        )
+        if strategy == ChunkStrategyType.tokens
+        else None
     )
+
+    def chunker(
+        texts: list[tuple[str, str]], metadata_str: str, metadata_tokens: int
+    ) -> Iterator[tuple[list[str], str, int | None]]:
+        if encoded is None:
+            for doc_ids, text, n_tokens in run_strategy(
+                load_strategy(strategy), texts, config, tick
+            ):  # type: ignore
+                yield doc_ids, metadata_str + text, n_tokens
+            return
+        for tokens, doc_indices in chunk_token_arrays(
+            islice(encoded, len(texts)), size - metadata_tokens, overlap
+        ):
+            yield (
+                [texts[doc_index][0] for doc_index in doc_indices],
+                metadata_str + tokenizer.decode(tokens.tolist()),
+                len(tokens),
+            )
+
+    groups: list[list[Any]] = []
+    chunks: list[tuple[list[str], str, int | None]] = []
+    for row in aggregated.to_dict("records"):
+        metadata_str, metadata_tokens = _metadata_prefix(
+            row, tokenizer, prepend_metadata, chunk_size_includes_metadata
+        )
+        group = [row[column] for column in group_by_columns]
+        for chunk in chunker(row["texts"], metadata_str, metadata_tokens):
+            groups.append(group)
+            chunks.append(chunk)
+
+    output = pd.DataFrame(groups, columns=group_by_columns)
+    output["text"] = [chunk[1] for chunk in chunks]
+    output["id"] = [gen_sha512_hash({"chunk": chunk}, ["chunk"]) for chunk in chunks]
+    output["document_ids"] = [chunk[0] for chunk in chunks]
+    output["n_tokens"] = [chunk[2] for chunk in chunks]
+
+    return cast("pd.DataFrame", output[output["text"].notna()].reset_index(drop=True))
+
+
+def _metadata_prefix(
+    row: dict[str, Any],
+    tokenizer: Tokenizer,
+    prepend_metadata: bool,
+    chunk_size_includes_metadata: bool,
+) -> tuple[str, int]:
+    """Get the metadata text prepended to the chunks of a group, and its number of tokens if it counts towards the chunk size."""
+    if not prepend_metadata or "metadata" not in row:
+        return "", 0
+
+    line_delimiter = ".\n"
+    metadata_str = ""
+    metadata = row["metadata"]
+    if isinstance(metadata, str):
+        metadata = json.loads(metadata)
+    if isinstance(metadata, dict):
+        metadata_str = (
+            line_delimiter.join(f"{k}: {v}" for k, v in metadata.items())
+            + line_delimiter
+        )
+
+    if not chunk_size_includes_metadata:
+        return metadata_str, 0
+
+    metadata_tokens = len(tokenizer.encode(metadata_str))
+    if metadata_tokens >= tokenizer.tokens_per_chunk:
+        message = "Metadata tokens exceeds the maximum tokens per chunk. Please increase the tokens per chunk."
+        raise ValueError(message)
+    return metadata_str, metadata_tokens
@@ -13,7 +13,7 @@ import pandas as pd
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.context import PipelineRunContext
-from graphrag.index.operations.cluster_graph import cluster_graph
+from graphrag.index.operations.cluster_graph import Communities, cluster_graph
 from graphrag.index.operations.create_graph import create_graph
 from graphrag.index.typing import WorkflowFunctionOutput
 from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
@@ -25,8 +25,12 @@ async def run_workflow(
     _callbacks: WorkflowCallbacks,
 ) -> WorkflowFunctionOutput:
     """All the steps to transform final communities."""
-    entities = await load_table_from_storage("entities", context.storage)
-    relationships = await load_table_from_storage("relationships", context.storage)
+    entities = await load_table_from_storage(
+        "entities", context.storage, table_cache=context.table_cache
+    )
+    relationships = await load_table_from_storage(
+        "relationships", context.storage, table_cache=context.table_cache
+    )
 
     max_cluster_size = config.cluster_graph.max_cluster_size
     use_lcc = config.cluster_graph.use_lcc
@@ -40,7 +44,9 @@ async def run_workflow(
         seed=seed,
     )
 
-    await write_table_to_storage(output, "communities", context.storage)
+    await write_table_to_storage(
+        output, "communities", context.storage, table_cache=context.table_cache
+    )
 
     return WorkflowFunctionOutput(result=output, config=None)
 
@@ -62,6 +68,13 @@ def create_communities(
         seed=seed,
     )
 
+    return build_communities(clusters, entities, relationships)
+
+
+def build_communities(
+    clusters: Communities, entities: pd.DataFrame, relationships: pd.DataFrame
+) -> pd.DataFrame:
+    """Build the communities table of a clustering, with the entities, relationships and text units of each community."""
     communities = pd.DataFrame(
         clusters, columns=pd.Index(["level", "community", "parent", "title"])
     ).explode("title")
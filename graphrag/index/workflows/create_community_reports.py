@@ -39,14 +39,22 @@ async def run_workflow(
     callbacks: WorkflowCallbacks,
 ) -> WorkflowFunctionOutput:
     """All the steps to transform community reports."""
-    edges = await load_table_from_storage("relationships", context.storage)
-    entities = await load_table_from_storage("entities", context.storage)
-    communities = await load_table_from_storage("communities", context.storage)
+    edges = await load_table_from_storage(
+        "relationships", context.storage, table_cache=context.table_cache
+    )
+    entities = await load_table_from_storage(
+        "entities", context.storage, table_cache=context.table_cache
+    )
+    communities = await load_table_from_storage(
+        "communities", context.storage, table_cache=context.table_cache
+    )
     claims = None
     if config.extract_claims.enabled and await storage_has_table(
         "covariates", context.storage
     ):
-        claims = await load_table_from_storage("covariates", context.storage)
+        claims = await load_table_from_storage(
+            "covariates", context.storage, table_cache=context.table_cache
+        )
 
     community_reports_llm_settings = config.get_language_model_config(
         config.community_reports.model_id
@@ -56,6 +64,10 @@ async def run_workflow(
     summarization_strategy = config.community_reports.resolved_strategy(
         config.root_dir, community_reports_llm_settings
     )
+    batch = config.batch.resolved_settings(config.root_dir, "community_reports")
+    if batch is not None:
+        summarization_strategy["batch"] = batch
+        num_threads = config.batch.concurrent_requests
 
     output = await create_community_reports(
         edges_input=edges,
@@ -69,7 +81,9 @@ async def run_workflow(
         num_threads=num_threads,
     )
 
-    await write_table_to_storage(output, "community_reports", context.storage)
+    await write_table_to_storage(
+        output, "community_reports", context.storage, table_cache=context.table_cache
+    )
 
     return WorkflowFunctionOutput(result=output, config=None)
 
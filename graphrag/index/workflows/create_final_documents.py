@@ -18,12 +18,18 @@ async def run_workflow(
     _callbacks: WorkflowCallbacks,
 ) -> WorkflowFunctionOutput:
     """All the steps to transform final documents."""
-    documents = await load_table_from_storage("documents", context.storage)
-    text_units = await load_table_from_storage("text_units", context.storage)
+    documents = await load_table_from_storage(
+        "documents", context.storage, table_cache=context.table_cache
+    )
+    text_units = await load_table_from_storage(
+        "text_units", context.storage, table_cache=context.table_cache
+    )
 
     output = create_final_documents(documents, text_units)
 
-    await write_table_to_storage(output, "documents", context.storage)
+    await write_table_to_storage(
+        output, "documents", context.storage, table_cache=context.table_cache
+    )
 
     return WorkflowFunctionOutput(result=output, config=None)
 
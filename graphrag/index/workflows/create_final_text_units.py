@@ -22,16 +22,22 @@ async def run_workflow(
     _callbacks: WorkflowCallbacks,
 ) -> WorkflowFunctionOutput:
     """All the steps to transform the text units."""
-    text_units = await load_table_from_storage("text_units", context.storage)
-    final_entities = await load_table_from_storage("entities", context.storage)
+    text_units = await load_table_from_storage(
+        "text_units", context.storage, table_cache=context.table_cache
+    )
+    final_entities = await load_table_from_storage(
+        "entities", context.storage, table_cache=context.table_cache
+    )
     final_relationships = await load_table_from_storage(
-        "relationships", context.storage
+        "relationships", context.storage, table_cache=context.table_cache
     )
     final_covariates = None
     if config.extract_claims.enabled and await storage_has_table(
         "covariates", context.storage
     ):
-        final_covariates = await load_table_from_storage("covariates", context.storage)
+        final_covariates = await load_table_from_storage(
+            "covariates", context.storage, table_cache=context.table_cache
+        )
 
     output = create_final_text_units(
         text_units,
@@ -40,7 +46,9 @@ async def run_workflow(
         final_covariates,
     )
 
-    await write_table_to_storage(output, "text_units", context.storage)
+    await write_table_to_storage(
+        output, "text_units", context.storage, table_cache=context.table_cache
+    )
 
     return WorkflowFunctionOutput(result=output, config=None)
 
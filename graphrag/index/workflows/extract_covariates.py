@@ -26,7 +26,9 @@ async def run_workflow(
     callbacks: WorkflowCallbacks,
 ) -> WorkflowFunctionOutput:
     """All the steps to extract and format covariates."""
-    text_units = await load_table_from_storage("text_units", context.storage)
+    text_units = await load_table_from_storage(
+        "text_units", context.storage, table_cache=context.table_cache
+    )
 
     extract_claims_llm_settings = config.get_language_model_config(
         config.extract_claims.model_id
@@ -37,6 +39,10 @@ async def run_workflow(
 
     async_mode = extract_claims_llm_settings.async_mode
     num_threads = extract_claims_llm_settings.concurrent_requests
+    batch = config.batch.resolved_settings(config.root_dir, "extract_claims")
+    if batch is not None:
+        extraction_strategy["batch"] = batch
+        num_threads = config.batch.concurrent_requests
 
     output = await extract_covariates(
         text_units,
@@ -49,7 +55,9 @@ async def run_workflow(
         num_threads=num_threads,
     )
 
-    await write_table_to_storage(output, "covariates", context.storage)
+    await write_table_to_storage(
+        output, "covariates", context.storage, table_cache=context.table_cache
+    )
 
     return WorkflowFunctionOutput(result=output, config=None)
 
@@ -28,7 +28,12 @@ async def run_workflow(
     callbacks: WorkflowCallbacks,
 ) -> WorkflowFunctionOutput:
     """All the steps to create the base entity graph."""
-    text_units = await load_table_from_storage("text_units", context.storage)
+    text_units = await load_table_from_storage(
+        "text_units",
+        context.storage,
+        columns=["id", "text"],
+        table_cache=context.table_cache,
+    )
 
     extract_graph_llm_settings = config.get_language_model_config(
         config.extract_graph.model_id
@@ -36,6 +41,11 @@ async def run_workflow(
     extraction_strategy = config.extract_graph.resolved_strategy(
         config.root_dir, extract_graph_llm_settings
     )
+    extraction_num_threads = extract_graph_llm_settings.concurrent_requests
+    extraction_batch = config.batch.resolved_settings(config.root_dir, "extract_graph")
+    if extraction_batch is not None:
+        extraction_strategy["batch"] = extraction_batch
+        extraction_num_threads = config.batch.concurrent_requests
 
     summarization_llm_settings = config.get_language_model_config(
         config.summarize_descriptions.model_id
@@ -43,21 +53,32 @@ async def run_workflow(
     summarization_strategy = config.summarize_descriptions.resolved_strategy(
         config.root_dir, summarization_llm_settings
     )
+    summarization_num_threads = summarization_llm_settings.concurrent_requests
+    summarization_batch = config.batch.resolved_settings(
+        config.root_dir, "summarize_descriptions"
+    )
+    if summarization_batch is not None:
+        summarization_strategy["batch"] = summarization_batch
+        summarization_num_threads = config.batch.concurrent_requests
 
     entities, relationships = await extract_graph(
         text_units=text_units,
         callbacks=callbacks,
         cache=context.cache,
         extraction_strategy=extraction_strategy,
-        extraction_num_threads=extract_graph_llm_settings.concurrent_requests,
+        extraction_num_threads=extraction_num_threads,
         extraction_async_mode=extract_graph_llm_settings.async_mode,
         entity_types=config.extract_graph.entity_types,
         summarization_strategy=summarization_strategy,
-        summarization_num_threads=summarization_llm_settings.concurrent_requests,
+        summarization_num_threads=summarization_num_threads,
     )
 
-    await write_table_to_storage(entities, "entities", context.storage)
-    await write_table_to_storage(relationships, "relationships", context.storage)
+    await write_table_to_storage(
+        entities, "entities", context.storage, table_cache=context.table_cache
+    )
+    await write_table_to_storage(
+        relationships, "relationships", context.storage, table_cache=context.table_cache
+    )
 
     return WorkflowFunctionOutput(
         result={
@@ -24,7 +24,9 @@ async def run_workflow(
     _callbacks: WorkflowCallbacks,
 ) -> WorkflowFunctionOutput:
     """All the steps to create the base entity graph."""
-    text_units = await load_table_from_storage("text_units", context.storage)
+    text_units = await load_table_from_storage(
+        "text_units", context.storage, table_cache=context.table_cache
+    )
 
     entities, relationships = await extract_graph_nlp(
         text_units,
@@ -32,8 +34,12 @@ async def run_workflow(
         extraction_config=config.extract_graph_nlp,
     )
 
-    await write_table_to_storage(entities, "entities", context.storage)
-    await write_table_to_storage(relationships, "relationships", context.storage)
+    await write_table_to_storage(
+        entities, "entities", context.storage, table_cache=context.table_cache
+    )
+    await write_table_to_storage(
+        relationships, "relationships", context.storage, table_cache=context.table_cache
+    )
 
     return WorkflowFunctionOutput(
         result={
@@ -54,6 +54,7 @@ def _get_workflows_list(
                 "create_final_text_units",
                 "create_community_reports",
                 "generate_text_embeddings",
+                "generate_community_report_embeddings",
             ]
         case IndexingMethod.Fast:
             return [
@@ -66,4 +67,5 @@ def _get_workflows_list(
                 "create_final_text_units",
                 "create_community_reports_text",
                 "generate_text_embeddings",
+                "generate_community_report_embeddings",
             ]
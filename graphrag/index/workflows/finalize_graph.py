@@ -23,8 +23,12 @@ async def run_workflow(
     callbacks: WorkflowCallbacks,
 ) -> WorkflowFunctionOutput:
     """All the steps to create the base entity graph."""
-    entities = await load_table_from_storage("entities", context.storage)
-    relationships = await load_table_from_storage("relationships", context.storage)
+    entities = await load_table_from_storage(
+        "entities", context.storage, table_cache=context.table_cache
+    )
+    relationships = await load_table_from_storage(
+        "relationships", context.storage, table_cache=context.table_cache
+    )
 
     final_entities, final_relationships = finalize_graph(
         entities,
@@ -34,8 +38,15 @@ async def run_workflow(
         layout_enabled=config.umap.enabled,
     )
 
-    await write_table_to_storage(final_entities, "entities", context.storage)
-    await write_table_to_storage(final_relationships, "relationships", context.storage)
+    await write_table_to_storage(
+        final_entities, "entities", context.storage, table_cache=context.table_cache
+    )
+    await write_table_to_storage(
+        final_relationships,
+        "relationships",
+        context.storage,
+        table_cache=context.table_cache,
+    )
 
     if config.snapshots.graphml:
         # todo: extract graphs at each level, and add in meta like descriptions
@@ -0,0 +1,46 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing run_workflow method definition."""
+
+from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+from graphrag.config.embeddings import (
+    community_report_embeddings,
+    get_embedded_fields,
+    get_embedding_settings,
+)
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.context import PipelineRunContext
+from graphrag.index.typing import WorkflowFunctionOutput
+from graphrag.index.workflows.generate_text_embeddings import generate_text_embeddings
+from graphrag.utils.storage import load_table_from_storage
+
+
+async def run_workflow(
+    config: GraphRagConfig,
+    context: PipelineRunContext,
+    callbacks: WorkflowCallbacks,
+) -> WorkflowFunctionOutput:
+    """All the steps to embed the community reports."""
+    final_community_reports = await load_table_from_storage(
+        "community_reports", context.storage, table_cache=context.table_cache
+    )
+
+    embedded_fields = get_embedded_fields(config) & community_report_embeddings
+    text_embed = get_embedding_settings(config)
+
+    await generate_text_embeddings(
+        final_documents=None,
+        final_relationships=None,
+        final_text_units=None,
+        final_entities=None,
+        final_community_reports=final_community_reports,
+        callbacks=callbacks,
+        cache=context.cache,
+        storage=context.storage,
+        text_embed_config=text_embed,
+        embedded_fields=embedded_fields,
+        snapshot_embeddings_enabled=config.snapshots.embeddings,
+    )
+
+    return WorkflowFunctionOutput(result=None, config=None)
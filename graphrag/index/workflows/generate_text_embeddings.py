@@ -11,6 +11,7 @@ from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.embeddings import (
     community_full_content_embedding,
+    community_report_embeddings,
     community_summary_embedding,
     community_title_embedding,
     document_text_embedding,
@@ -36,18 +37,25 @@ async def run_workflow(
     context: PipelineRunContext,
     callbacks: WorkflowCallbacks,
 ) -> WorkflowFunctionOutput:
-    """All the steps to transform community reports."""
-    final_documents = await load_table_from_storage("documents", context.storage)
+    """All the steps to embed the documents, text units and graph.
+
+    The community reports are embedded by a separate workflow, so these embeddings don't wait for
+    the reports to be generated.
+    """
+    final_documents = await load_table_from_storage(
+        "documents", context.storage, table_cache=context.table_cache
+    )
     final_relationships = await load_table_from_storage(
-        "relationships", context.storage
+        "relationships", context.storage, table_cache=context.table_cache
     )
-    final_text_units = await load_table_from_storage("text_units", context.storage)
-    final_entities = await load_table_from_storage("entities", context.storage)
-    final_community_reports = await load_table_from_storage(
-        "community_reports", context.storage
+    final_text_units = await load_table_from_storage(
+        "text_units", context.storage, table_cache=context.table_cache
+    )
+    final_entities = await load_table_from_storage(
+        "entities", context.storage, table_cache=context.table_cache
     )
 
-    embedded_fields = get_embedded_fields(config)
+    embedded_fields = get_embedded_fields(config) - community_report_embeddings
     text_embed = get_embedding_settings(config)
 
     await generate_text_embeddings(
@@ -55,7 +63,7 @@ async def run_workflow(
         final_relationships=final_relationships,
         final_text_units=final_text_units,
         final_entities=final_entities,
-        final_community_reports=final_community_reports,
+        final_community_reports=None,
         callbacks=callbacks,
         cache=context.cache,
         storage=context.storage,
@@ -79,32 +87,43 @@ async def generate_text_embeddings(
     text_embed_config: dict,
     embedded_fields: set[str],
     snapshot_embeddings_enabled: bool = False,
+    upsert: bool = False,
+    removed_ids: dict[str, list[str]] | None = None,
 ) -> None:
-    """All the steps to generate all embeddings."""
+    """All the steps to generate all embeddings.
+
+    When upsert is set, only new or changed rows are embedded into the existing vector stores, and
+    the documents of the removed ids of each table are deleted.
+    """
+    removed_ids = removed_ids or {}
     embedding_param_map = {
         document_text_embedding: {
             "data": final_documents.loc[:, ["id", "text"]]
             if final_documents is not None
             else None,
             "embed_column": "text",
+            "removed_ids": removed_ids.get("documents"),
         },
         relationship_description_embedding: {
             "data": final_relationships.loc[:, ["id", "description"]]
             if final_relationships is not None
             else None,
             "embed_column": "description",
+            "removed_ids": removed_ids.get("relationships"),
         },
         text_unit_text_embedding: {
             "data": final_text_units.loc[:, ["id", "text"]]
             if final_text_units is not None
             else None,
             "embed_column": "text",
+            "removed_ids": removed_ids.get("text_units"),
         },
         entity_title_embedding: {
             "data": final_entities.loc[:, ["id", "title"]]
             if final_entities is not None
             else None,
             "embed_column": "title",
+            "removed_ids": removed_ids.get("entities"),
         },
         entity_description_embedding: {
             "data": final_entities.loc[:, ["id", "title", "description"]].assign(
@@ -113,24 +132,28 @@ async def generate_text_embeddings(
             if final_entities is not None
             else None,
             "embed_column": "title_description",
+            "removed_ids": removed_ids.get("entities"),
         },
         community_title_embedding: {
             "data": final_community_reports.loc[:, ["id", "title"]]
             if final_community_reports is not None
             else None,
             "embed_column": "title",
+            "removed_ids": removed_ids.get("community_reports"),
         },
         community_summary_embedding: {
             "data": final_community_reports.loc[:, ["id", "summary"]]
             if final_community_reports is not None
             else None,
             "embed_column": "summary",
+            "removed_ids": removed_ids.get("community_reports"),
         },
         community_full_content_embedding: {
             "data": final_community_reports.loc[:, ["id", "full_content"]]
             if final_community_reports is not None
             else None,
             "embed_column": "full_content",
+            "removed_ids": removed_ids.get("community_reports"),
         },
     }
 
@@ -143,6 +166,7 @@ async def generate_text_embeddings(
             storage=storage,
             text_embed_config=text_embed_config,
             snapshot_embeddings_enabled=snapshot_embeddings_enabled,
+            upsert=upsert,
             **embedding_param_map[field],
         )
 
@@ -156,6 +180,8 @@ async def _run_and_snapshot_embeddings(
     storage: PipelineStorage,
     text_embed_config: dict,
     snapshot_embeddings_enabled: bool,
+    upsert: bool = False,
+    removed_ids: list[str] | None = None,
 ) -> None:
     """All the steps to generate single embedding."""
     if text_embed_config:
@@ -166,6 +192,8 @@ async def _run_and_snapshot_embeddings(
             embed_column=embed_column,
             embedding_name=name,
             strategy=text_embed_config["strategy"],
+            upsert=upsert,
+            removed_ids=removed_ids,
         )
 
         if snapshot_embeddings_enabled is True:
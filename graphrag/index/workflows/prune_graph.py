@@ -22,8 +22,12 @@ async def run_workflow(
     _callbacks: WorkflowCallbacks,
 ) -> WorkflowFunctionOutput:
     """All the steps to create the base entity graph."""
-    entities = await load_table_from_storage("entities", context.storage)
-    relationships = await load_table_from_storage("relationships", context.storage)
+    entities = await load_table_from_storage(
+        "entities", context.storage, table_cache=context.table_cache
+    )
+    relationships = await load_table_from_storage(
+        "relationships", context.storage, table_cache=context.table_cache
+    )
 
     pruned_entities, pruned_relationships = prune_graph(
         entities,
@@ -31,8 +35,15 @@ async def run_workflow(
         pruning_config=config.prune_graph,
     )
 
-    await write_table_to_storage(pruned_entities, "entities", context.storage)
-    await write_table_to_storage(pruned_relationships, "relationships", context.storage)
+    await write_table_to_storage(
+        pruned_entities, "entities", context.storage, table_cache=context.table_cache
+    )
+    await write_table_to_storage(
+        pruned_relationships,
+        "relationships",
+        context.storage,
+        table_cache=context.table_cache,
+    )
 
     return WorkflowFunctionOutput(
         result={
@@ -12,7 +12,7 @@ import tiktoken
 
 from graphrag.model.community_report import CommunityReport
 from graphrag.model.entity import Entity
-from graphrag.query.llm.text_utils import num_tokens
+from graphrag.query.llm.text_utils import TokenCounter
 
 log = logging.getLogger(__name__)
 
@@ -38,6 +38,7 @@ def build_community_context(
     single_batch: bool = True,
     context_name: str = "Reports",
     random_state: int = 86,
+    token_counter: TokenCounter | None = None,
 ) -> tuple[str | list[str], dict[str, pd.DataFrame]]:
     """
     Prepare community report data table as context data for system prompt.
@@ -112,6 +113,7 @@ def build_community_context(
         else []
     )
     header = _get_header(attributes)
+    token_counter = token_counter or TokenCounter(token_encoder)
     all_context_text: list[str] = []
     all_context_records: list[pd.DataFrame] = []
 
@@ -125,7 +127,7 @@ def build_community_context(
         batch_text = (
             f"-----{context_name}-----" + "\n" + column_delimiter.join(header) + "\n"
         )
-        batch_tokens = num_tokens(batch_text, token_encoder)
+        batch_tokens = token_counter(batch_text)
         batch_records = []
 
     def _cut_batch() -> None:
@@ -150,10 +152,13 @@ def build_community_context(
     # initialize the first batch
     _init_batch()
 
-    for report in selected_reports:
-        new_context_text, new_context = _report_context_text(report, attributes)
-        new_tokens = num_tokens(new_context_text, token_encoder)
-
+    report_contexts = [
+        _report_context_text(report, attributes) for report in selected_reports
+    ]
+    report_tokens = token_counter.counts([text for text, _ in report_contexts])
+    for (new_context_text, new_context), new_tokens in zip(
+        report_contexts, report_tokens.tolist(), strict=True
+    ):
         if batch_tokens + new_tokens > max_tokens:
             # add the current batch to the context data and start a new batch if we are in multi-batch mode
             _cut_batch()
@@ -5,24 +5,67 @@
 
 import asyncio
 import logging
-from collections import Counter
-from copy import deepcopy
-from time import time
+from collections import Counter, OrderedDict
+from time import monotonic, time
 from typing import Any
 
+import numpy as np
 import tiktoken
 
 from graphrag.model.community import Community
 from graphrag.model.community_report import CommunityReport
 from graphrag.query.context_builder.rate_prompt import RATE_QUERY
 from graphrag.query.context_builder.rate_relevancy import rate_relevancy
-from graphrag.query.llm.base import BaseLLM
+from graphrag.query.llm.base import BaseLLM, BaseTextEmbedding
 
 log = logging.getLogger(__name__)
 
 DEFAULT_RATE_LLM_PARAMS = {"temperature": 0.0, "max_tokens": 2000}
 
 
+class RatingCache:
+    """An LRU cache of community ratings by query and community, with entries expiring after a time to live.
+
+    Queries are normalized for case and whitespace, so trivially different queries share ratings.
+    """
+
+    def __init__(self, max_size: int, ttl: float | None = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._ratings: OrderedDict[tuple[str, str], tuple[int, float]] = OrderedDict()
+
+    def get(self, query: str, community: str) -> int | None:
+        """Get the rating of a community for a query, or None if it is not cached or has expired."""
+        key = (self._normalize(query), community)
+        entry = self._ratings.get(key)
+        if entry is None:
+            return None
+        rating, created = entry
+        if self.ttl is not None and monotonic() - created >= self.ttl:
+            del self._ratings[key]
+            return None
+        self._ratings.move_to_end(key)
+        return rating
+
+    def put(self, query: str, community: str, rating: int) -> None:
+        """Cache the rating of a community for a query, evicting the least recently used ratings."""
+        if self.max_size <= 0:
+            return
+        key = (self._normalize(query), community)
+        self._ratings[key] = (rating, monotonic())
+        self._ratings.move_to_end(key)
+        while len(self._ratings) > self.max_size:
+            self._ratings.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Return the number of cached ratings."""
+        return len(self._ratings)
+
+    @staticmethod
+    def _normalize(query: str) -> str:
+        return " ".join(query.lower().split())
+
+
 class DynamicCommunitySelection:
     """Dynamic community selection to select community reports that are relevant to the query.
 
@@ -43,6 +86,10 @@ class DynamicCommunitySelection:
         max_level: int = 2,
         concurrent_coroutines: int = 8,
         llm_kwargs: Any = DEFAULT_RATE_LLM_PARAMS,
+        rating_cache_size: int = 0,
+        rating_cache_ttl: float | None = None,
+        text_embedder: BaseTextEmbedding | None = None,
+        embedding_threshold: float | None = None,
     ):
         self.llm = llm
         self.token_encoder = token_encoder
@@ -70,15 +117,38 @@ class DynamicCommunitySelection:
         # start from root communities (level 0)
         self.starting_communities = self.levels["0"]
 
+        # ratings are reused across queries
+        self.rating_cache = RatingCache(rating_cache_size, rating_cache_ttl)
+
+        # reports whose embedding is not similar enough to the query embedding are not rated,
+        # reports without an embedding are always rated
+        self.text_embedder = text_embedder
+        self.embedding_threshold = embedding_threshold
+        embedded = [
+            report
+            for report in community_reports
+            if report.full_content_embedding is not None
+        ]
+        self._embedded_communities = [report.community_id for report in embedded]
+        embeddings = np.array(
+            [report.full_content_embedding for report in embedded] or [[]],
+            dtype=np.float32,
+        )
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        self._embeddings = embeddings / np.where(norms == 0, 1, norms)
+
     async def select(self, query: str) -> tuple[list[CommunityReport], dict[str, Any]]:
         """
         Select relevant communities with respect to the query.
 
+        Communities are rated concurrently, and the children of a relevant community are rated as
+        soon as its own rating returns, without waiting for the rest of its level.
+
         Args:
             query: the query to rate against
         """
         start = time()
-        queue = deepcopy(self.starting_communities)
+        similarities = await self._similarities(query)
         level = 0
 
         ratings = {}  # store the ratings for each community
@@ -88,69 +158,67 @@ class DynamicCommunitySelection:
             "output_tokens": 0,
         }
         relevant_communities = set()
+        pending: dict[asyncio.Task, str] = {}
 
-        while queue:
-            gather_results = await asyncio.gather(*[
-                rate_relevancy(
-                    query=query,
-                    description=(
-                        self.reports[community].summary
-                        if self.use_summary
-                        else self.reports[community].full_content
-                    ),
-                    llm=self.llm,
-                    token_encoder=self.token_encoder,
-                    rate_query=self.rate_query,
-                    num_repeats=self.num_repeats,
-                    semaphore=self.semaphore,
-                    **self.llm_kwargs,
-                )
-                for community in queue
-            ])
-
-            communities_to_rate = []
-            for community, result in zip(queue, gather_results, strict=True):
-                rating = result["rating"]
-                log.debug(
-                    "dynamic community selection: community %s rating %s",
-                    community,
-                    rating,
-                )
-                ratings[community] = rating
-                llm_info["llm_calls"] += result["llm_calls"]
-                llm_info["prompt_tokens"] += result["prompt_tokens"]
-                llm_info["output_tokens"] += result["output_tokens"]
-                if rating >= self.threshold:
-                    relevant_communities.add(community)
-                    # find children nodes of the current node and append them to the queue
-                    # TODO check why some sub_communities are NOT in report_df
-                    if community in self.communities:
-                        for child in self.communities[community].children:
-                            if child in self.reports:
-                                communities_to_rate.append(child)
-                            else:
-                                log.debug(
-                                    "dynamic community selection: cannot find community %s in reports",
-                                    child,
-                                )
-                    # remove parent node if the current node is deemed relevant
-                    if not self.keep_parent and community in self.communities:
-                        relevant_communities.discard(self.communities[community].parent)
-            queue = communities_to_rate
-            level += 1
-            if (
-                (len(queue) == 0)
-                and (len(relevant_communities) == 0)
-                and (str(level) in self.levels)
-                and (level <= self.max_level)
-            ):
-                log.info(
-                    "dynamic community selection: no relevant community "
-                    "reports, adding all reports at level %s to rate.",
-                    level,
+        def schedule(communities: list[str]) -> None:
+            for community in communities:
+                task = asyncio.create_task(self._rate(query, community, similarities))
+                pending[task] = community
+
+        schedule(self.starting_communities)
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
-                # append all communities at the next level to queue
-                queue = self.levels[str(level)]
+                for task in done:
+                    community = pending.pop(task)
+                    result = task.result()
+                    rating = result["rating"]
+                    log.debug(
+                        "dynamic community selection: community %s rating %s",
+                        community,
+                        rating,
+                    )
+                    ratings[community] = rating
+                    llm_info["llm_calls"] += result["llm_calls"]
+                    llm_info["prompt_tokens"] += result["prompt_tokens"]
+                    llm_info["output_tokens"] += result["output_tokens"]
+                    if rating >= self.threshold:
+                        relevant_communities.add(community)
+                        # find children nodes of the current node and rate them right away
+                        # TODO check why some sub_communities are NOT in report_df
+                        if community in self.communities:
+                            children = []
+                            for child in self.communities[community].children:
+                                if child in self.reports:
+                                    children.append(child)
+                                else:
+                                    log.debug(
+                                        "dynamic community selection: cannot find community %s in reports",
+                                        child,
+                                    )
+                            schedule(children)
+                        # remove parent node if the current node is deemed relevant
+                        if not self.keep_parent and community in self.communities:
+                            relevant_communities.discard(
+                                self.communities[community].parent
+                            )
+                if not pending and not relevant_communities:
+                    level += 1
+                    if str(level) in self.levels and level <= self.max_level:
+                        log.info(
+                            "dynamic community selection: no relevant community "
+                            "reports, adding all reports at level %s to rate.",
+                            level,
+                        )
+                        # rate all communities at the next level
+                        schedule(self.levels[str(level)])
+        finally:
+            for task in pending:
+                task.cancel()
+            # wait for the cancellations so no rating outlives the selection
+            await asyncio.gather(*pending, return_exceptions=True)
 
         community_reports = [
             self.reports[community] for community in relevant_communities
@@ -172,3 +240,54 @@ class DynamicCommunitySelection:
 
         llm_info["ratings"] = ratings
         return community_reports, llm_info
+
+    async def _rate(
+        self, query: str, community: str, similarities: dict[str, float]
+    ) -> dict[str, Any]:
+        """Rate a community, from the rating cache or the embedding prefilter if possible."""
+        rating = self.rating_cache.get(query, community)
+        if rating is None and similarities.get(community, np.inf) < (
+            self.embedding_threshold or 0
+        ):
+            log.debug(
+                "dynamic community selection: community %s skipped by the embedding prefilter",
+                community,
+            )
+            rating = 0
+        if rating is not None:
+            return {
+                "rating": rating,
+                "llm_calls": 0,
+                "prompt_tokens": 0,
+                "output_tokens": 0,
+            }
+
+        result = await rate_relevancy(
+            query=query,
+            description=(
+                self.reports[community].summary
+                if self.use_summary
+                else self.reports[community].full_content
+            ),
+            llm=self.llm,
+            token_encoder=self.token_encoder,
+            rate_query=self.rate_query,
+            num_repeats=self.num_repeats,
+            semaphore=self.semaphore,
+            **self.llm_kwargs,
+        )
+        self.rating_cache.put(query, community, result["rating"])
+        return result
+
+    async def _similarities(self, query: str) -> dict[str, float]:
+        """Get the cosine similarity of the query to each embedded report, if prefiltering."""
+        if (
+            self.text_embedder is None
+            or self.embedding_threshold is None
+            or not self._embedded_communities
+        ):
+            return {}
+        embedding = np.array(await self.text_embedder.aembed(query), dtype=np.float32)
+        norm = np.linalg.norm(embedding)
+        similarities = self._embeddings @ (embedding / (norm if norm else 1))
+        return dict(zip(self._embedded_communities, similarities.tolist(), strict=True))
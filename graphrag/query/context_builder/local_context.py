@@ -4,6 +4,7 @@
 """Local Context Builder."""
 
 from collections import defaultdict
+from collections.abc import Sequence
 from typing import Any, cast
 
 import pandas as pd
@@ -12,6 +13,8 @@ import tiktoken
 from graphrag.model.covariate import Covariate
 from graphrag.model.entity import Entity
 from graphrag.model.relationship import Relationship
+from graphrag.query.input.retrieval.adjacency import Adjacency
+from graphrag.query.input.retrieval.covariate_table import CovariateIndex
 from graphrag.query.input.retrieval.covariates import (
     get_candidate_covariates,
     to_covariate_dataframe,
@@ -24,7 +27,7 @@ from graphrag.query.input.retrieval.relationships import (
     get_out_network_relationships,
     to_relationship_dataframe,
 )
-from graphrag.query.llm.text_utils import num_tokens
+from graphrag.query.llm.text_utils import TokenCounter, fit_token_budget
 
 
 def build_entity_context(
@@ -35,6 +38,7 @@ def build_entity_context(
     rank_description: str = "number of relationships",
     column_delimiter: str = "|",
     context_name="Entities",
+    token_counter: TokenCounter | None = None,
 ) -> tuple[str, pd.DataFrame]:
     """Prepare entity data table as context data for system prompt."""
     if len(selected_entities) == 0:
@@ -52,9 +56,8 @@ def build_entity_context(
     )
     header.extend(attribute_cols)
     current_context_text += column_delimiter.join(header) + "\n"
-    current_tokens = num_tokens(current_context_text, token_encoder)
 
-    all_context_records = [header]
+    records = []
     for entity in selected_entities:
         new_context = [
             entity.short_id if entity.short_id else "",
@@ -70,31 +73,27 @@ def build_entity_context(
                 else ""
             )
             new_context.append(field_value)
-        new_context_text = column_delimiter.join(new_context) + "\n"
-        new_tokens = num_tokens(new_context_text, token_encoder)
-        if current_tokens + new_tokens > max_tokens:
-            break
-        current_context_text += new_context_text
-        all_context_records.append(new_context)
-        current_tokens += new_tokens
-
-    if len(all_context_records) > 1:
-        record_df = pd.DataFrame(
-            all_context_records[1:], columns=cast("Any", all_context_records[0])
-        )
-    else:
-        record_df = pd.DataFrame()
-
-    return current_context_text, record_df
+        records.append(new_context)
+
+    return _pack_records(
+        current_context_text,
+        header,
+        records,
+        column_delimiter,
+        max_tokens,
+        token_counter or TokenCounter(token_encoder),
+    )
 
 
 def build_covariates_context(
     selected_entities: list[Entity],
-    covariates: list[Covariate],
+    covariates: Sequence[Covariate],
     token_encoder: tiktoken.Encoding | None = None,
     max_tokens: int = 8000,
     column_delimiter: str = "|",
     context_name: str = "Covariates",
+    adjacency: CovariateIndex | None = None,
+    token_counter: TokenCounter | None = None,
 ) -> tuple[str, pd.DataFrame]:
     """Prepare covariate data tables as context data for system prompt."""
     # create an empty list of covariates
@@ -102,7 +101,6 @@ def build_covariates_context(
         return "", pd.DataFrame()
 
     selected_covariates = list[Covariate]()
-    record_df = pd.DataFrame()
 
     # add context header
     current_context_text = f"-----{context_name}-----" + "\n"
@@ -113,14 +111,18 @@ def build_covariates_context(
     attribute_cols = list(attributes.keys()) if len(covariates) > 0 else []
     header.extend(attribute_cols)
     current_context_text += column_delimiter.join(header) + "\n"
-    current_tokens = num_tokens(current_context_text, token_encoder)
 
-    all_context_records = [header]
-    for entity in selected_entities:
-        selected_covariates.extend([
-            cov for cov in covariates if cov.subject_id == entity.title
-        ])
+    if adjacency is not None:
+        selected_covariates = adjacency.get_grouped(
+            entity.title for entity in selected_entities
+        )
+    else:
+        for entity in selected_entities:
+            selected_covariates.extend([
+                cov for cov in covariates if cov.subject_id == entity.title
+            ])
 
+    records = []
     for covariate in selected_covariates:
         new_context = [
             covariate.short_id if covariate.short_id else "",
@@ -133,23 +135,16 @@ def build_covariates_context(
                 else ""
             )
             new_context.append(field_value)
-
-        new_context_text = column_delimiter.join(new_context) + "\n"
-        new_tokens = num_tokens(new_context_text, token_encoder)
-        if current_tokens + new_tokens > max_tokens:
-            break
-        current_context_text += new_context_text
-        all_context_records.append(new_context)
-        current_tokens += new_tokens
-
-        if len(all_context_records) > 1:
-            record_df = pd.DataFrame(
-                all_context_records[1:], columns=cast("Any", all_context_records[0])
-            )
-        else:
-            record_df = pd.DataFrame()
-
-    return current_context_text, record_df
+        records.append(new_context)
+
+    return _pack_records(
+        current_context_text,
+        header,
+        records,
+        column_delimiter,
+        max_tokens,
+        token_counter or TokenCounter(token_encoder),
+    )
 
 
 def build_relationship_context(
@@ -162,6 +157,8 @@ def build_relationship_context(
     relationship_ranking_attribute: str = "rank",
     column_delimiter: str = "|",
     context_name: str = "Relationships",
+    adjacency: Adjacency[Relationship] | None = None,
+    token_counter: TokenCounter | None = None,
 ) -> tuple[str, pd.DataFrame]:
     """Prepare relationship data tables as context data for system prompt."""
     selected_relationships = _filter_relationships(
@@ -169,6 +166,7 @@ def build_relationship_context(
         relationships=relationships,
         top_k_relationships=top_k_relationships,
         relationship_ranking_attribute=relationship_ranking_attribute,
+        adjacency=adjacency,
     )
 
     if len(selected_entities) == 0 or len(selected_relationships) == 0:
@@ -188,9 +186,8 @@ def build_relationship_context(
     header.extend(attribute_cols)
 
     current_context_text += column_delimiter.join(header) + "\n"
-    current_tokens = num_tokens(current_context_text, token_encoder)
 
-    all_context_records = [header]
+    records = []
     for rel in selected_relationships:
         new_context = [
             rel.short_id if rel.short_id else "",
@@ -207,22 +204,35 @@ def build_relationship_context(
                 else ""
             )
             new_context.append(field_value)
-        new_context_text = column_delimiter.join(new_context) + "\n"
-        new_tokens = num_tokens(new_context_text, token_encoder)
-        if current_tokens + new_tokens > max_tokens:
-            break
-        current_context_text += new_context_text
-        all_context_records.append(new_context)
-        current_tokens += new_tokens
-
-    if len(all_context_records) > 1:
-        record_df = pd.DataFrame(
-            all_context_records[1:], columns=cast("Any", all_context_records[0])
-        )
-    else:
-        record_df = pd.DataFrame()
+        records.append(new_context)
+
+    return _pack_records(
+        current_context_text,
+        header,
+        records,
+        column_delimiter,
+        max_tokens,
+        token_counter or TokenCounter(token_encoder),
+    )
+
 
-    return current_context_text, record_df
+def _pack_records(
+    context_text: str,
+    header: list[str],
+    records: list[list[str]],
+    column_delimiter: str,
+    max_tokens: int,
+    token_counter: TokenCounter,
+) -> tuple[str, pd.DataFrame]:
+    """Add the leading records that fit in max_tokens to a context table with its header."""
+    record_texts = [column_delimiter.join(record) + "\n" for record in records]
+    fitted = fit_token_budget(
+        token_counter.counts(record_texts), max_tokens, token_counter(context_text)
+    )
+    context_text += "".join(record_texts[:fitted])
+    if fitted == 0:
+        return context_text, pd.DataFrame()
+    return context_text, pd.DataFrame(records[:fitted], columns=cast("Any", header))
 
 
 def _filter_relationships(
@@ -230,6 +240,7 @@ def _filter_relationships(
     relationships: list[Relationship],
     top_k_relationships: int = 10,
     relationship_ranking_attribute: str = "rank",
+    adjacency: Adjacency[Relationship] | None = None,
 ) -> list[Relationship]:
     """Filter and sort relationships based on a set of selected entities and a ranking attribute."""
     # First priority: in-network relationships (i.e. relationships between selected entities)
@@ -237,6 +248,7 @@ def _filter_relationships(
         selected_entities=selected_entities,
         relationships=relationships,
         ranking_attribute=relationship_ranking_attribute,
+        adjacency=adjacency,
     )
 
     # Second priority -  out-of-network relationships
@@ -245,39 +257,25 @@ def _filter_relationships(
         selected_entities=selected_entities,
         relationships=relationships,
         ranking_attribute=relationship_ranking_attribute,
+        adjacency=adjacency,
     )
     if len(out_network_relationships) <= 1:
         return in_network_relationships + out_network_relationships
 
     # within out-of-network relationships, prioritize mutual relationships
     # (i.e. relationships with out-network entities that are shared with multiple selected entities)
-    selected_entity_names = [entity.title for entity in selected_entities]
-    out_network_source_names = [
-        relationship.source
-        for relationship in out_network_relationships
-        if relationship.source not in selected_entity_names
-    ]
-    out_network_target_names = [
-        relationship.target
-        for relationship in out_network_relationships
-        if relationship.target not in selected_entity_names
-    ]
-    out_network_entity_names = list(
-        set(out_network_source_names + out_network_target_names)
-    )
-    out_network_entity_links = defaultdict(int)
-    for entity_name in out_network_entity_names:
-        targets = [
-            relationship.target
-            for relationship in out_network_relationships
-            if relationship.source == entity_name
-        ]
-        sources = [
-            relationship.source
-            for relationship in out_network_relationships
-            if relationship.target == entity_name
-        ]
-        out_network_entity_links[entity_name] = len(set(targets + sources))
+    # each out-network relationship links one out-network entity to one selected entity
+    selected_entity_names = {entity.title for entity in selected_entities}
+    out_network_entity_partners = defaultdict(set)
+    for relationship in out_network_relationships:
+        if relationship.source not in selected_entity_names:
+            out_network_entity_partners[relationship.source].add(relationship.target)
+        if relationship.target not in selected_entity_names:
+            out_network_entity_partners[relationship.target].add(relationship.source)
+    out_network_entity_links = {
+        entity_name: len(partners)
+        for entity_name, partners in out_network_entity_partners.items()
+    }
 
     # sort out-network relationships by number of links and rank_attributes
     for rel in out_network_relationships:
@@ -286,7 +284,7 @@ def _filter_relationships(
         rel.attributes["links"] = (
             out_network_entity_links[rel.source]
             if rel.source in out_network_entity_links
-            else out_network_entity_links[rel.target]
+            else out_network_entity_links.get(rel.target, 0)
         )
 
     # sort by attributes[links] first, then by ranking_attribute
@@ -317,16 +315,19 @@ def get_candidate_context(
     selected_entities: list[Entity],
     entities: list[Entity],
     relationships: list[Relationship],
-    covariates: dict[str, list[Covariate]],
+    covariates: dict[str, Sequence[Covariate]],
     include_entity_rank: bool = True,
     entity_rank_description: str = "number of relationships",
     include_relationship_weight: bool = False,
+    relationship_adjacency: Adjacency[Relationship] | None = None,
+    covariate_adjacency: dict[str, CovariateIndex] | None = None,
 ) -> dict[str, pd.DataFrame]:
     """Prepare entity, relationship, and covariate data tables as context data for system prompt."""
     candidate_context = {}
     candidate_relationships = get_candidate_relationships(
         selected_entities=selected_entities,
         relationships=relationships,
+        adjacency=relationship_adjacency,
     )
     candidate_context["relationships"] = to_relationship_dataframe(
         relationships=candidate_relationships,
@@ -345,6 +346,7 @@ def get_candidate_context(
         candidate_covariates = get_candidate_covariates(
             selected_entities=selected_entities,
             covariates=covariates[covariate],
+            adjacency=(covariate_adjacency or {}).get(covariate),
         )
         candidate_context[covariate.lower()] = to_covariate_dataframe(
             candidate_covariates
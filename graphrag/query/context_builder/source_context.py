@@ -11,7 +11,7 @@ import tiktoken
 
 from graphrag.model.relationship import Relationship
 from graphrag.model.text_unit import TextUnit
-from graphrag.query.llm.text_utils import num_tokens
+from graphrag.query.llm.text_utils import TokenCounter, fit_token_budget
 
 """
 Contain util functions to build text unit context for the search's system prompt
@@ -26,6 +26,7 @@ def build_text_unit_context(
     max_tokens: int = 8000,
     context_name: str = "Sources",
     random_state: int = 86,
+    token_counter: TokenCounter | None = None,
 ) -> tuple[str, dict[str, pd.DataFrame]]:
     """Prepare text-unit data table as context data for system prompt."""
     if text_units is None or len(text_units) == 0:
@@ -47,9 +48,9 @@ def build_text_unit_context(
     header.extend(attribute_cols)
 
     current_context_text += column_delimiter.join(header) + "\n"
-    current_tokens = num_tokens(current_context_text, token_encoder)
-    all_context_records = [header]
+    token_counter = token_counter or TokenCounter(token_encoder)
 
+    records = []
     for unit in text_units:
         new_context = [
             unit.short_id,
@@ -59,20 +60,18 @@ def build_text_unit_context(
                 for field in attribute_cols
             ],
         ]
-        new_context_text = column_delimiter.join(new_context) + "\n"
-        new_tokens = num_tokens(new_context_text, token_encoder)
+        records.append(new_context)
 
-        if current_tokens + new_tokens > max_tokens:
-            break
-
-        current_context_text += new_context_text
-        all_context_records.append(new_context)
-        current_tokens += new_tokens
+    record_texts = [column_delimiter.join(record) + "\n" for record in records]
+    fitted = fit_token_budget(
+        token_counter.counts(record_texts),
+        max_tokens,
+        token_counter(current_context_text),
+    )
+    current_context_text += "".join(record_texts[:fitted])
 
-    if len(all_context_records) > 1:
-        record_df = pd.DataFrame(
-            all_context_records[1:], columns=cast("Any", all_context_records[0])
-        )
+    if fitted > 0:
+        record_df = pd.DataFrame(records[:fitted], columns=cast("Any", header))
     else:
         record_df = pd.DataFrame()
     return current_context_text, {context_name.lower(): record_df}
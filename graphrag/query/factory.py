@@ -3,8 +3,10 @@
 
 """Query Factory methods to support CLI."""
 
+import numpy as np
 import tiktoken
 
+from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.query_callbacks import QueryCallbacks
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.model.community import Community
@@ -14,7 +16,10 @@ from graphrag.model.entity import Entity
 from graphrag.model.relationship import Relationship
 from graphrag.model.text_unit import TextUnit
 from graphrag.query.context_builder.entity_extraction import EntityVectorStoreKey
+from graphrag.query.input.retrieval.covariate_table import CovariateTable
 from graphrag.query.llm.get_client import get_llm, get_text_embedder
+from graphrag.query.llm.oai.chat_openai import ChatOpenAI
+from graphrag.query.llm.oai.embedding import OpenAIEmbedding
 from graphrag.query.structured_search.basic_search.basic_context import (
     BasicSearchContext,
 )
@@ -40,16 +45,21 @@ def get_local_search_engine(
     text_units: list[TextUnit],
     entities: list[Entity],
     relationships: list[Relationship],
-    covariates: dict[str, list[Covariate]],
+    covariates: dict[str, list[Covariate] | CovariateTable],
     response_type: str,
     description_embedding_store: BaseVectorStore,
     system_prompt: str | None = None,
     callbacks: list[QueryCallbacks] | None = None,
+    llm: ChatOpenAI | None = None,
+    text_embedder: OpenAIEmbedding | None = None,
+    context_builder: LocalSearchMixedContext | None = None,
 ) -> LocalSearch:
-    """Create a local search engine based on data + configuration."""
+    """Create a local search engine based on data + configuration.
+
+    The LLM clients and context builder of a previously created engine can be passed in to reuse them.
+    """
     default_llm_settings = config.get_language_model_config("default_chat_model")
-    llm = get_llm(config)
-    text_embedder = get_text_embedder(config)
+    llm = llm or get_llm(config)
     token_encoder = tiktoken.get_encoding(default_llm_settings.encoding_model)
 
     ls_config = config.local_search
@@ -57,7 +67,8 @@ def get_local_search_engine(
     return LocalSearch(
         llm=llm,
         system_prompt=system_prompt,
-        context_builder=LocalSearchMixedContext(
+        context_builder=context_builder
+        or LocalSearchMixedContext(
             community_reports=reports,
             text_units=text_units,
             entities=entities,
@@ -65,7 +76,7 @@ def get_local_search_engine(
             covariates=covariates,
             entity_text_embeddings=description_embedding_store,
             embedding_vectorstore_key=EntityVectorStoreKey.ID,  # if the vectorstore uses entity title as ids, set this to EntityVectorStoreKey.TITLE
-            text_embedder=text_embedder,
+            text_embedder=text_embedder or get_text_embedder(config),
             token_encoder=token_encoder,
         ),
         token_encoder=token_encoder,
@@ -105,8 +116,18 @@ def get_global_search_engine(
     reduce_system_prompt: str | None = None,
     general_knowledge_inclusion_prompt: str | None = None,
     callbacks: list[QueryCallbacks] | None = None,
+    llm: ChatOpenAI | None = None,
+    context_builder: GlobalCommunityContext | None = None,
+    context_cache: PipelineCache | None = None,
+    text_embedder: OpenAIEmbedding | None = None,
 ) -> GlobalSearch:
-    """Create a global search engine based on data + configuration."""
+    """Create a global search engine based on data + configuration.
+
+    The LLM client and context builder of a previously created engine can be passed in to reuse them.
+    A context cache persists the map context batches, which are built once otherwise.
+    The text embedder is only used to prefilter the reports rated by dynamic community selection.
+    """
+    llm = llm or get_llm(config)
     # TODO: Global search should select model based on config??
     default_llm_settings = config.get_language_model_config("default_chat_model")
 
@@ -115,11 +136,11 @@ def get_global_search_engine(
     gs_config = config.global_search
 
     dynamic_community_selection_kwargs = {}
-    if dynamic_community_selection:
+    if dynamic_community_selection and context_builder is None:
         # TODO: Allow for another llm definition only for Global Search to leverage -mini models
 
         dynamic_community_selection_kwargs.update({
-            "llm": get_llm(config),
+            "llm": llm,
             # And here we get encoding based on model
             "token_encoder": tiktoken.encoding_for_model(default_llm_settings.model),
             "keep_parent": gs_config.dynamic_search_keep_parent,
@@ -128,20 +149,29 @@ def get_global_search_engine(
             "concurrent_coroutines": gs_config.dynamic_search_concurrent_coroutines,
             "threshold": gs_config.dynamic_search_threshold,
             "max_level": gs_config.dynamic_search_max_level,
+            "rating_cache_size": gs_config.dynamic_search_rating_cache_size,
+            "rating_cache_ttl": gs_config.dynamic_search_rating_cache_ttl,
         })
+        if gs_config.dynamic_search_embedding_threshold is not None:
+            dynamic_community_selection_kwargs.update({
+                "text_embedder": text_embedder or get_text_embedder(config),
+                "embedding_threshold": gs_config.dynamic_search_embedding_threshold,
+            })
 
     return GlobalSearch(
-        llm=get_llm(config),
+        llm=llm,
         map_system_prompt=map_system_prompt,
         reduce_system_prompt=reduce_system_prompt,
         general_knowledge_inclusion_prompt=general_knowledge_inclusion_prompt,
-        context_builder=GlobalCommunityContext(
+        context_builder=context_builder
+        or GlobalCommunityContext(
             community_reports=reports,
             communities=communities,
             entities=entities,
             token_encoder=token_encoder,
             dynamic_community_selection=dynamic_community_selection,
             dynamic_community_selection_kwargs=dynamic_community_selection_kwargs,
+            context_cache=context_cache,
         ),
         token_encoder=token_encoder,
         max_data_tokens=gs_config.data_max_tokens,
@@ -172,6 +202,9 @@ def get_global_search_engine(
             "context_name": "Reports",
         },
         concurrent_coroutines=gs_config.concurrency,
+        early_reduce_fraction=gs_config.early_reduce_fraction,
+        early_reduce_score=gs_config.early_reduce_score,
+        map_deadline=gs_config.map_deadline,
         response_type=response_type,
         callbacks=callbacks,
     )
@@ -188,18 +221,26 @@ def get_drift_search_engine(
     local_system_prompt: str | None = None,
     reduce_system_prompt: str | None = None,
     callbacks: list[QueryCallbacks] | None = None,
+    llm: ChatOpenAI | None = None,
+    text_embedder: OpenAIEmbedding | None = None,
+    context_builder: DRIFTSearchContextBuilder | None = None,
+    report_embeddings: np.ndarray | None = None,
 ) -> DRIFTSearch:
-    """Create a local search engine based on data + configuration."""
+    """Create a local search engine based on data + configuration.
+
+    The LLM clients and context builder of a previously created engine can be passed in to reuse them.
+    The normalized report embedding matrix is built from the reports if not passed in.
+    """
     default_llm_settings = config.get_language_model_config("default_chat_model")
-    llm = get_llm(config)
-    text_embedder = get_text_embedder(config)
+    llm = llm or get_llm(config)
     token_encoder = tiktoken.get_encoding(default_llm_settings.encoding_model)
 
     return DRIFTSearch(
         llm=llm,
-        context_builder=DRIFTSearchContextBuilder(
+        context_builder=context_builder
+        or DRIFTSearchContextBuilder(
             chat_llm=llm,
-            text_embedder=text_embedder,
+            text_embedder=text_embedder or get_text_embedder(config),
             entities=entities,
             relationships=relationships,
             reports=reports,
@@ -209,6 +250,7 @@ def get_drift_search_engine(
             reduce_system_prompt=reduce_system_prompt,
             config=config.drift_search,
             response_type=response_type,
+            report_embeddings=report_embeddings,
         ),
         token_encoder=token_encoder,
         callbacks=callbacks,
@@ -221,11 +263,16 @@ def get_basic_search_engine(
     config: GraphRagConfig,
     system_prompt: str | None = None,
     callbacks: list[QueryCallbacks] | None = None,
+    llm: ChatOpenAI | None = None,
+    text_embedder: OpenAIEmbedding | None = None,
+    context_builder: BasicSearchContext | None = None,
 ) -> BasicSearch:
-    """Create a basic search engine based on data + configuration."""
+    """Create a basic search engine based on data + configuration.
+
+    The LLM clients and context builder of a previously created engine can be passed in to reuse them.
+    """
     default_llm_settings = config.get_language_model_config("default_chat_model")
-    llm = get_llm(config)
-    text_embedder = get_text_embedder(config)
+    llm = llm or get_llm(config)
     token_encoder = tiktoken.get_encoding(default_llm_settings.encoding_model)
 
     ls_config = config.basic_search
@@ -233,8 +280,9 @@ def get_basic_search_engine(
     return BasicSearch(
         llm=llm,
         system_prompt=system_prompt,
-        context_builder=BasicSearchContext(
-            text_embedder=text_embedder,
+        context_builder=context_builder
+        or BasicSearchContext(
+            text_embedder=text_embedder or get_text_embedder(config),
             text_unit_embeddings=text_unit_embeddings,
             text_units=text_units,
             token_encoder=token_encoder,
@@ -6,11 +6,15 @@ The parts of these functions that do type adaptation, renaming, collating, etc.
 Ideally this is just a straight read-through into the object model.
 """
 
+import asyncio
 import logging
+from pathlib import Path
 from typing import cast
 
+import numpy as np
 import pandas as pd
 
+import graphrag.config.defaults as defs
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.model.community import Community
 from graphrag.model.community_report import CommunityReport
@@ -27,6 +31,7 @@ from graphrag.query.input.loaders.dfs import (
     read_relationships,
     read_text_units,
 )
+from graphrag.query.input.retrieval.covariate_table import CovariateTable
 from graphrag.query.llm.oai.embedding import OpenAIEmbedding
 from graphrag.vector_stores.base import BaseVectorStore
 
@@ -60,6 +65,19 @@ def read_indexer_covariates(final_covariates: pd.DataFrame) -> list[Covariate]:
     )
 
 
+def read_indexer_covariate_table(
+    final_covariates: pd.DataFrame | str | Path,
+) -> CovariateTable:
+    """Read in the Claims from the raw indexing outputs, grouped by subject entity.
+
+    Given the path of a covariates parquet file, the claims are left on disk and only the row groups
+    of the entities looked up are read.
+    """
+    if isinstance(final_covariates, pd.DataFrame):
+        return CovariateTable.from_dataframe(final_covariates, read_indexer_covariates)
+    return CovariateTable.from_parquet(final_covariates, read_indexer_covariates)
+
+
 def read_indexer_relationships(final_relationships: pd.DataFrame) -> list[Relationship]:
     """Read in the Relationships from the raw indexing outputs."""
     return read_relationships(
@@ -122,10 +140,22 @@ def read_indexer_reports(
 def read_indexer_report_embeddings(
     community_reports: list[CommunityReport],
     embeddings_store: BaseVectorStore,
-):
-    """Read in the Community Reports from the raw indexing outputs."""
-    for report in community_reports:
-        report.full_content_embedding = embeddings_store.search_by_id(report.id).vector
+) -> np.ndarray:
+    """Read in the full content embeddings of the Community Reports from the vector store, in bulk.
+
+    Returns the embeddings as a float32 matrix with a row per report, NaN for reports without one.
+    When no report has an embedding, the matrix has no columns and every report is missing one.
+    """
+    embeddings = embeddings_store.get_by_ids([
+        report.id for report in community_reports
+    ])
+    for report, embedding in zip(community_reports, embeddings, strict=True):
+        report.full_content_embedding = (
+            None
+            if embedding.size == 0 or np.isnan(embedding).any()
+            else embedding.tolist()
+        )
+    return embeddings
 
 
 def read_indexer_entities(
@@ -215,16 +245,41 @@ def embed_community_reports(
     source_col: str = "full_content",
     embedding_col: str = "full_content_embedding",
 ) -> pd.DataFrame:
-    """Embed a source column of the reports dataframe using the given embedder."""
-    if source_col not in reports_df.columns:
-        error_msg = f"Reports missing {source_col} column"
-        raise ValueError(error_msg)
+    """Embed a source column of the reports dataframe, for the reports missing an embedding, one at a time.
 
-    if embedding_col not in reports_df.columns:
-        reports_df[embedding_col] = reports_df.loc[:, source_col].apply(
-            lambda x: embedder.embed(x)
-        )
+    This does not depend on an event loop, so it can be called with or without one running. Async
+    callers can use `aembed_community_reports` to send the requests concurrently.
+    """
+    missing = _missing_embeddings(reports_df, source_col, embedding_col)
+    reports_df.loc[missing, embedding_col] = pd.Series(
+        [embedder.embed(text) for text in reports_df.loc[missing, source_col]],
+        index=reports_df.index[missing],
+        dtype=object,
+    )
+    return reports_df
 
+
+async def aembed_community_reports(
+    reports_df: pd.DataFrame,
+    embedder: OpenAIEmbedding,
+    source_col: str = "full_content",
+    embedding_col: str = "full_content_embedding",
+    concurrent_requests: int = defs.LLM_CONCURRENT_REQUESTS,
+) -> pd.DataFrame:
+    """Embed a source column of the reports dataframe, for the reports missing an embedding, with concurrent requests."""
+    missing = _missing_embeddings(reports_df, source_col, embedding_col)
+    semaphore = asyncio.Semaphore(concurrent_requests)
+
+    async def embed(text: str) -> list[float]:
+        async with semaphore:
+            return await embedder.aembed(text)
+
+    embeddings = await asyncio.gather(*[
+        embed(text) for text in reports_df.loc[missing, source_col]
+    ])
+    reports_df.loc[missing, embedding_col] = pd.Series(
+        embeddings, index=reports_df.index[missing], dtype=object
+    )
     return reports_df
 
 
@@ -235,3 +290,16 @@ def _filter_under_community_level(
         "pd.DataFrame",
         df[df.level <= community_level],
     )
+
+
+def _missing_embeddings(
+    reports_df: pd.DataFrame, source_col: str, embedding_col: str
+) -> pd.Series:
+    """Get the mask of the reports without an embedding, adding the embedding column if needed."""
+    if source_col not in reports_df.columns:
+        error_msg = f"Reports missing {source_col} column"
+        raise ValueError(error_msg)
+
+    if embedding_col not in reports_df.columns:
+        reports_df[embedding_col] = None
+    return reports_df[embedding_col].isna()
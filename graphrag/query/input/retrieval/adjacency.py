@@ -0,0 +1,67 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""An adjacency index to retrieve the items of a collection by entity title or id."""
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from typing import Generic, TypeVar
+
+from graphrag.model.covariate import Covariate
+from graphrag.model.relationship import Relationship
+from graphrag.model.text_unit import TextUnit
+
+T = TypeVar("T")
+
+
+class Adjacency(Generic[T]):
+    """Map keys to the positions of the items they are incident to, built once over a collection.
+
+    Lookups return items in their original collection order, so results match a full scan of the
+    collection filtered on the same keys.
+    """
+
+    def __init__(self, items: list[T], keys: Callable[[T], Iterable[str]]):
+        self.items = items
+        self._positions: dict[str, list[int]] = defaultdict(list)
+        for position, item in enumerate(items):
+            for key in set(keys(item)):
+                self._positions[key].append(position)
+
+    def __len__(self) -> int:
+        """Return the number of items in the collection."""
+        return len(self.items)
+
+    def get(self, keys: Iterable[str]) -> list[T]:
+        """Get the items incident to any of the keys, in collection order."""
+        positions = set()
+        for key in keys:
+            positions.update(self._positions.get(key, ()))
+        return [self.items[position] for position in sorted(positions)]
+
+    def get_grouped(self, keys: Iterable[str]) -> list[T]:
+        """Get the items incident to each key in turn, in key order then collection order."""
+        return [
+            self.items[position]
+            for key in keys
+            for position in self._positions.get(key, ())
+        ]
+
+
+def relationship_adjacency(
+    relationships: list[Relationship],
+) -> Adjacency[Relationship]:
+    """Index relationships by the titles of their source and target entities."""
+    return Adjacency(
+        relationships, lambda relationship: (relationship.source, relationship.target)
+    )
+
+
+def covariate_adjacency(covariates: list[Covariate]) -> Adjacency[Covariate]:
+    """Index covariates by the title of their subject entity."""
+    return Adjacency(covariates, lambda covariate: (covariate.subject_id,))
+
+
+def text_unit_adjacency(text_units: list[TextUnit]) -> Adjacency[TextUnit]:
+    """Index text units by id."""
+    return Adjacency(text_units, lambda unit: (unit.id,))
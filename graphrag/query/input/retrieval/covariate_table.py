@@ -0,0 +1,145 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A columnar covariate collection grouped by subject, to retrieve covariates by entity title."""
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import overload
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from graphrag.model.covariate import Covariate
+from graphrag.query.input.retrieval.adjacency import Adjacency
+
+CovariateReader = Callable[[pd.DataFrame], list[Covariate]]
+"""Convert the rows of a covariate table into Covariate objects."""
+
+RowReader = Callable[[np.ndarray], pd.DataFrame]
+"""Read the rows at the given positions of a covariate table, in the given order."""
+
+ITER_BATCH_SIZE = 10_000
+
+
+class CovariateTable(Sequence[Covariate]):
+    """Covariates kept as table rows, with the row range of each subject in subject order.
+
+    Lookups by subject slice the ranges of the selected subjects and only build Covariate objects
+    for those rows. The rows are either held in a dataframe or left in a parquet file, in which
+    case only the row groups holding the selected rows are read.
+    """
+
+    def __init__(
+        self, subject_ids: np.ndarray, read_rows: RowReader, reader: CovariateReader
+    ):
+        codes, subjects = pd.factorize(subject_ids)
+        # shift so that missing subjects (code -1) sort first and are never looked up
+        codes = codes + 1
+        self._order = np.argsort(codes, kind="stable")
+        ends = np.cumsum(np.bincount(codes, minlength=len(subjects) + 1))
+        self._ranges = {
+            str(subject): (int(ends[code]), int(ends[code + 1]))
+            for code, subject in enumerate(subjects)
+        }
+        self._read_rows = read_rows
+        self._reader = reader
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        df: pd.DataFrame,
+        reader: CovariateReader,
+        subject_col: str = "subject_id",
+    ) -> "CovariateTable":
+        """Group the covariates of a dataframe by subject."""
+        return cls(
+            df[subject_col].to_numpy(), lambda rows: df.iloc[rows].copy(), reader
+        )
+
+    @classmethod
+    def from_parquet(
+        cls,
+        path: str | Path,
+        reader: CovariateReader,
+        subject_col: str = "subject_id",
+        columns: list[str] | None = None,
+    ) -> "CovariateTable":
+        """Group the covariates of a parquet file by subject, reading only the subject column up front."""
+        file = pq.ParquetFile(path)
+        group_sizes = np.array([
+            file.metadata.row_group(group).num_rows
+            for group in range(file.num_row_groups)
+        ])
+        group_ends = np.cumsum(group_sizes)
+
+        def read_rows(rows: np.ndarray) -> pd.DataFrame:
+            groups = np.searchsorted(group_ends, rows, side="right")
+            needed = np.unique(groups)
+            table = file.read_row_groups(needed.tolist(), columns=columns)
+            # offset of each needed row group in the file and in the table read
+            file_starts = group_ends[needed] - group_sizes[needed]
+            table_starts = np.cumsum(group_sizes[needed]) - group_sizes[needed]
+            position = np.searchsorted(needed, groups)
+            frame = table.take(
+                rows - file_starts[position] + table_starts[position]
+            ).to_pandas()
+            frame.index = pd.Index(rows)
+            return frame
+
+        subject_ids = file.read(columns=[subject_col]).column(0).to_numpy()
+        return cls(subject_ids, read_rows, reader)
+
+    def __len__(self) -> int:
+        """Return the number of covariates."""
+        return len(self._order)
+
+    @overload
+    def __getitem__(self, index: int) -> Covariate: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Covariate]: ...
+
+    def __getitem__(self, index: int | slice) -> Covariate | list[Covariate]:
+        """Get covariates by position in the original row order."""
+        if isinstance(index, slice):
+            return self._materialize(np.arange(len(self))[index])
+        if not -len(self) <= index < len(self):
+            msg = f"covariate index out of range: {index}"
+            raise IndexError(msg)
+        return self._materialize(np.array([index % len(self)]))[0]
+
+    def __iter__(self) -> Iterator[Covariate]:
+        """Iterate over the covariates in the original row order."""
+        for start in range(0, len(self), ITER_BATCH_SIZE):
+            yield from self._materialize(
+                np.arange(start, min(start + ITER_BATCH_SIZE, len(self)))
+            )
+
+    def get(self, subject_ids: Iterable[str]) -> list[Covariate]:
+        """Get the covariates of any of the subjects, in the original row order."""
+        return self._materialize(np.sort(self._rows(set(subject_ids))))
+
+    def get_grouped(self, subject_ids: Iterable[str]) -> list[Covariate]:
+        """Get the covariates of each subject in turn, in subject order then row order."""
+        return self._materialize(self._rows(subject_ids))
+
+    def _rows(self, subject_ids: Iterable[str]) -> np.ndarray:
+        ranges = [
+            self._ranges[subject_id]
+            for subject_id in subject_ids
+            if subject_id in self._ranges
+        ]
+        if not ranges:
+            return np.array([], dtype=np.int64)
+        return np.concatenate([self._order[start:end] for start, end in ranges])
+
+    def _materialize(self, rows: np.ndarray) -> list[Covariate]:
+        if len(rows) == 0:
+            return []
+        return self._reader(self._read_rows(rows))
+
+
+CovariateIndex = Adjacency[Covariate] | CovariateTable
+"""An index of covariates by subject, either built over Covariate objects or a covariate table."""
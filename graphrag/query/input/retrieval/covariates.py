@@ -3,20 +3,25 @@
 
 """Util functions to retrieve covariates from a collection."""
 
+from collections.abc import Sequence
 from typing import Any, cast
 
 import pandas as pd
 
 from graphrag.model.covariate import Covariate
 from graphrag.model.entity import Entity
+from graphrag.query.input.retrieval.covariate_table import CovariateIndex
 
 
 def get_candidate_covariates(
     selected_entities: list[Entity],
-    covariates: list[Covariate],
+    covariates: Sequence[Covariate],
+    adjacency: CovariateIndex | None = None,
 ) -> list[Covariate]:
     """Get all covariates that are related to selected entities."""
-    selected_entity_names = [entity.title for entity in selected_entities]
+    selected_entity_names = {entity.title for entity in selected_entities}
+    if adjacency is not None:
+        return adjacency.get(selected_entity_names)
     return [
         covariate
         for covariate in covariates
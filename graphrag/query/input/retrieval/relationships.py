@@ -9,18 +9,22 @@ import pandas as pd
 
 from graphrag.model.entity import Entity
 from graphrag.model.relationship import Relationship
+from graphrag.query.input.retrieval.adjacency import Adjacency
 
 
 def get_in_network_relationships(
     selected_entities: list[Entity],
     relationships: list[Relationship],
     ranking_attribute: str = "rank",
+    adjacency: Adjacency[Relationship] | None = None,
 ) -> list[Relationship]:
     """Get all directed relationships between selected entities, sorted by ranking_attribute."""
-    selected_entity_names = [entity.title for entity in selected_entities]
+    selected_entity_names = {entity.title for entity in selected_entities}
     selected_relationships = [
         relationship
-        for relationship in relationships
+        for relationship in _incident_relationships(
+            selected_entity_names, relationships, adjacency
+        )
         if relationship.source in selected_entity_names
         and relationship.target in selected_entity_names
     ]
@@ -35,18 +39,22 @@ def get_out_network_relationships(
     selected_entities: list[Entity],
     relationships: list[Relationship],
     ranking_attribute: str = "rank",
+    adjacency: Adjacency[Relationship] | None = None,
 ) -> list[Relationship]:
     """Get relationships from selected entities to other entities that are not within the selected entities, sorted by ranking_attribute."""
-    selected_entity_names = [entity.title for entity in selected_entities]
+    selected_entity_names = {entity.title for entity in selected_entities}
+    incident_relationships = _incident_relationships(
+        selected_entity_names, relationships, adjacency
+    )
     source_relationships = [
         relationship
-        for relationship in relationships
+        for relationship in incident_relationships
         if relationship.source in selected_entity_names
         and relationship.target not in selected_entity_names
     ]
     target_relationships = [
         relationship
-        for relationship in relationships
+        for relationship in incident_relationships
         if relationship.target in selected_entity_names
         and relationship.source not in selected_entity_names
     ]
@@ -57,27 +65,39 @@ def get_out_network_relationships(
 def get_candidate_relationships(
     selected_entities: list[Entity],
     relationships: list[Relationship],
+    adjacency: Adjacency[Relationship] | None = None,
 ) -> list[Relationship]:
     """Get all relationships that are associated with the selected entities."""
-    selected_entity_names = [entity.title for entity in selected_entities]
-    return [
-        relationship
-        for relationship in relationships
-        if relationship.source in selected_entity_names
-        or relationship.target in selected_entity_names
-    ]
+    selected_entity_names = {entity.title for entity in selected_entities}
+    return _incident_relationships(selected_entity_names, relationships, adjacency)
 
 
 def get_entities_from_relationships(
     relationships: list[Relationship], entities: list[Entity]
 ) -> list[Entity]:
     """Get all entities that are associated with the selected relationships."""
-    selected_entity_names = [relationship.source for relationship in relationships] + [
+    selected_entity_names = {relationship.source for relationship in relationships} | {
         relationship.target for relationship in relationships
-    ]
+    }
     return [entity for entity in entities if entity.title in selected_entity_names]
 
 
+def _incident_relationships(
+    selected_entity_names: set[str],
+    relationships: list[Relationship],
+    adjacency: Adjacency[Relationship] | None,
+) -> list[Relationship]:
+    """Get the relationships with either end in the selected entities, in collection order."""
+    if adjacency is not None:
+        return adjacency.get(selected_entity_names)
+    return [
+        relationship
+        for relationship in relationships
+        if relationship.source in selected_entity_names
+        or relationship.target in selected_entity_names
+    ]
+
+
 def sort_relationships_by_rank(
     relationships: list[Relationship],
     ranking_attribute: str = "rank",
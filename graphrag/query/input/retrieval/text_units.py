@@ -9,18 +9,26 @@ import pandas as pd
 
 from graphrag.model.entity import Entity
 from graphrag.model.text_unit import TextUnit
+from graphrag.query.input.retrieval.adjacency import Adjacency
 
 
 def get_candidate_text_units(
     selected_entities: list[Entity],
     text_units: list[TextUnit],
+    adjacency: Adjacency[TextUnit] | None = None,
 ) -> pd.DataFrame:
     """Get all text units that are associated to selected entities."""
-    selected_text_ids = [
-        entity.text_unit_ids for entity in selected_entities if entity.text_unit_ids
-    ]
-    selected_text_ids = [item for sublist in selected_text_ids for item in sublist]
-    selected_text_units = [unit for unit in text_units if unit.id in selected_text_ids]
+    selected_text_ids = {
+        text_id
+        for entity in selected_entities
+        for text_id in entity.text_unit_ids or []
+    }
+    if adjacency is not None:
+        selected_text_units = adjacency.get(selected_text_ids)
+    else:
+        selected_text_units = [
+            unit for unit in text_units if unit.id in selected_text_ids
+        ]
     return to_text_unit_dataframe(selected_text_units)
 
 
@@ -7,8 +7,10 @@ import json
 import logging
 import re
 from collections.abc import Iterator
+from functools import cache
 from itertools import islice
 
+import numpy as np
 import tiktoken
 from json_repair import repair_json
 
@@ -17,13 +19,90 @@ import graphrag.config.defaults as defs
 log = logging.getLogger(__name__)
 
 
+@cache
+def get_token_encoder(encoding_name: str = defs.ENCODING_MODEL) -> tiktoken.Encoding:
+    """Get a tiktoken encoding, resolved once per encoding name."""
+    return tiktoken.get_encoding(encoding_name)
+
+
 def num_tokens(text: str, token_encoder: tiktoken.Encoding | None = None) -> int:
     """Return the number of tokens in the given text."""
     if token_encoder is None:
-        token_encoder = tiktoken.get_encoding(defs.ENCODING_MODEL)
+        token_encoder = get_token_encoder()
     return len(token_encoder.encode(text))  # type: ignore
 
 
+class TokenCounter:
+    """Count tokens with a single encoder, caching the counts of the texts already seen.
+
+    Context builders keep one counter for the lifetime of the index they serve, so the context
+    rows of entities, relationships, reports and text units are only encoded the first time they
+    are considered for a context window. The cache is bounded by the total length of the cached
+    texts, since rendered rows can be long, and evicts the oldest texts first.
+    """
+
+    def __init__(
+        self,
+        token_encoder: tiktoken.Encoding | None = None,
+        max_cached_chars: int = defs.TOKEN_COUNT_CACHE_CHARS,
+    ):
+        self.token_encoder = token_encoder or get_token_encoder()
+        self.max_cached_chars = max_cached_chars
+        self._counts: dict[str, int] = {}
+        self._cached_chars = 0
+
+    def __call__(self, text: str) -> int:
+        """Return the number of tokens in the given text."""
+        count = self._counts.get(text)
+        if count is None:
+            count = len(self.token_encoder.encode(text))
+            self._cache(text, count)
+        return count
+
+    def counts(self, texts: list[str]) -> np.ndarray:
+        """Return the number of tokens in each of the given texts, encoding the uncached ones as a batch."""
+        missing = list(
+            dict.fromkeys(text for text in texts if text not in self._counts)
+        )
+        encoded_counts: dict[str, int] = {}
+        if missing:
+            encode_batch = getattr(self.token_encoder, "encode_batch", None)
+            encoded = (
+                encode_batch(missing)
+                if encode_batch is not None
+                else [self.token_encoder.encode(text) for text in missing]
+            )
+            for text, tokens in zip(missing, encoded, strict=True):
+                encoded_counts[text] = len(tokens)
+                self._cache(text, len(tokens))
+        return np.fromiter(
+            (
+                encoded_counts[text] if text in encoded_counts else self(text)
+                for text in texts
+            ),
+            dtype=np.int64,
+            count=len(texts),
+        )
+
+    def _cache(self, text: str, count: int) -> None:
+        if len(text) > self.max_cached_chars:
+            return
+        while self._counts and self._cached_chars + len(text) > self.max_cached_chars:
+            # evict the oldest entry
+            oldest = next(iter(self._counts))
+            del self._counts[oldest]
+            self._cached_chars -= len(oldest)
+        self._counts[text] = count
+        self._cached_chars += len(text)
+
+
+def fit_token_budget(token_counts: np.ndarray, max_tokens: int, used: int = 0) -> int:
+    """Return how many of the leading rows fit in the token budget after `used` tokens."""
+    return int(
+        np.searchsorted(used + np.cumsum(token_counts), max_tokens, side="right")
+    )
+
+
 def batched(iterable: Iterator, n: int):
     """
     Batch data into tuples of length n. The last batch may be shorter.
@@ -3,9 +3,10 @@
 
 """Base classes for search algos."""
 
+import math
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Generic, TypeVar
 
 import pandas as pd
@@ -42,6 +43,30 @@ class SearchResult:
     output_tokens_categories: dict[str, int] | None = None
 
 
+@dataclass
+class MapResponseStats:
+    """Latency statistics of the map step of a map-reduce search."""
+
+    batches: int
+    """The number of map batches started."""
+    completed: int
+    """The number of map batches that responded before the reduce step started."""
+    cancelled: int
+    """The number of map batches cancelled when the reduce step started."""
+    reduce_start: float
+    """Seconds from the start of the map step to the start of the reduce step."""
+    latencies: list[float] = field(default_factory=list)
+    """Seconds from the start of the map step to each response, in completion order."""
+
+    def percentile(self, percent: float) -> float:
+        """Return the given percentile of the response latencies (nearest rank), or 0 without responses."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+        return ordered[min(rank, len(ordered)) - 1]
+
+
 T = TypeVar(
     "T",
     GlobalContextBuilder,
@@ -0,0 +1,60 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Concurrency and token budget shared by the DRIFT queries of a search engine."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from graphrag.index.llm.rate_limits import TokenBucket
+
+
+class DRIFTBudget:
+    """Concurrency and token budget shared by every DRIFT query made through the same context builder.
+
+    Each LLM call of a DRIFT query (primer, local searches and reduce) holds one of the shared request
+    slots while it runs, and reserves its estimated tokens from a tokens-per-minute bucket. A single
+    query holds at most query_concurrency slots at once, leaving the rest to the other queries.
+    """
+
+    def __init__(
+        self,
+        concurrency: int,
+        query_concurrency: int,
+        tokens_per_minute: int | None = None,
+    ):
+        self.concurrency = concurrency
+        self.query_concurrency = min(query_concurrency, concurrency)
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def query(self) -> "QueryBudget":
+        """Start the share of the budget used by a new query."""
+        return QueryBudget(self)
+
+    def semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore of the shared request slots."""
+        # engines outlive event loops (e.g. one asyncio.run per CLI command), and semaphores are bound to a loop
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._loop = loop
+        return self._semaphore
+
+
+class QueryBudget:
+    """The share of a DRIFT budget used by a single query."""
+
+    def __init__(self, budget: DRIFTBudget):
+        self.budget = budget
+        self._semaphore = asyncio.Semaphore(budget.query_concurrency)
+
+    @asynccontextmanager
+    async def slot(self, estimated_tokens: int = 0) -> AsyncIterator[None]:
+        """Hold a request slot of the query and of the engine, and reserve the estimated tokens."""
+        async with self._semaphore, self.budget.semaphore():
+            if self.budget.tokens is not None:
+                await self.budget.tokens.acquire(estimated_tokens)
+            yield
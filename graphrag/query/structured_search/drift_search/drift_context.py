@@ -22,9 +22,14 @@ from graphrag.prompts.query.drift_search_system_prompt import (
     DRIFT_REDUCE_PROMPT,
 )
 from graphrag.query.context_builder.entity_extraction import EntityVectorStoreKey
+from graphrag.query.input.retrieval.covariate_table import CovariateTable
 from graphrag.query.llm.base import BaseTextEmbedding
 from graphrag.query.llm.oai.chat_openai import ChatOpenAI
 from graphrag.query.structured_search.base import DRIFTContextBuilder
+from graphrag.query.structured_search.drift_search.budget import (
+    DRIFTBudget,
+    QueryBudget,
+)
 from graphrag.query.structured_search.drift_search.primer import PrimerQueryProcessor
 from graphrag.query.structured_search.local_search.mixed_context import (
     LocalSearchMixedContext,
@@ -46,7 +51,7 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
         text_units: list[TextUnit] | None = None,
         reports: list[CommunityReport] | None = None,
         relationships: list[Relationship] | None = None,
-        covariates: dict[str, list[Covariate]] | None = None,
+        covariates: dict[str, list[Covariate] | CovariateTable] | None = None,
         token_encoder: tiktoken.Encoding | None = None,
         embedding_vectorstore_key: str = EntityVectorStoreKey.ID,
         config: DRIFTSearchConfig | None = None,
@@ -54,8 +59,14 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
         local_mixed_context: LocalSearchMixedContext | None = None,
         reduce_system_prompt: str | None = None,
         response_type: str | None = None,
+        report_embeddings: np.ndarray | None = None,
     ):
-        """Initialize the DRIFT search context builder with necessary components."""
+        """Initialize the DRIFT search context builder with necessary components.
+
+        The report embeddings can be given as a float32 matrix of unit rows aligned to the reports,
+        for instance memory-mapped from disk for large indexes. They are built from the reports
+        once otherwise.
+        """
         self.config = config or DRIFTSearchConfig()
         self.chat_llm = chat_llm
         self.text_embedder = text_embedder
@@ -73,6 +84,16 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
 
         self.response_type = response_type
 
+        self._report_embeddings = report_embeddings
+        self._similarities: np.ndarray | None = None
+
+        # shared by the queries of every search engine using this context builder
+        self.budget = DRIFTBudget(
+            concurrency=self.config.concurrency,
+            query_concurrency=self.config.query_concurrency,
+            tokens_per_minute=self.config.tokens_per_minute,
+        )
+
         self.local_mixed_context = (
             local_mixed_context or self.init_local_context_builder()
         )
@@ -163,8 +184,40 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
             and isinstance(query_embedding[0], type(embedding[0]))
         )
 
-    def build_context(
-        self, query: str, **kwargs
+    @staticmethod
+    def normalize_report_embeddings(embeddings: np.ndarray) -> np.ndarray:
+        """Convert report embeddings to a contiguous float32 matrix of unit rows."""
+        matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return np.divide(matrix, norms, out=matrix, where=norms > 0)
+
+    @property
+    def report_embeddings(self) -> np.ndarray:
+        """The normalized embedding matrix of the reports, built on first use.
+
+        Raises
+        ------
+        ValueError: If some reports are missing full content or full content embeddings.
+        """
+        if self._report_embeddings is None:
+            reports = self.reports or []
+            if any(report.full_content is None for report in reports):
+                missing_content_error = "Some reports are missing full content."
+                raise ValueError(missing_content_error)
+            missing = sum(report.full_content_embedding is None for report in reports)
+            if missing > 0:
+                missing_embedding_error = f"Some reports are missing full content embeddings. {missing} out of {len(reports)}"
+                raise ValueError(missing_embedding_error)
+            self._report_embeddings = self.normalize_report_embeddings(
+                np.array(
+                    [report.full_content_embedding for report in reports],
+                    dtype=np.float32,
+                )
+            )
+        return self._report_embeddings
+
+    async def build_context(
+        self, query: str, budget: QueryBudget | None = None, **kwargs
     ) -> tuple[pd.DataFrame, dict[str, int]]:
         """
         Build DRIFT search context.
@@ -173,6 +226,8 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
         ----
         query : str
             Search query string.
+        budget : QueryBudget, optional
+            The budget of the query to expand it in.
 
         Returns
         -------
@@ -197,13 +252,14 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
             reports=self.reports,
         )
 
-        query_embedding, token_ct = query_processor(query)
+        query_embedding, token_ct = await query_processor(query, budget)
 
-        report_df = self.convert_reports_to_df(self.reports)
+        report_embeddings = self.report_embeddings
 
         # Check compatibility between query embedding and document embeddings
-        if not self.check_query_doc_encodings(
-            query_embedding, report_df["full_content_embedding"].iloc[0]
+        if (
+            query_embedding is None
+            or len(query_embedding) != report_embeddings.shape[1]
         ):
             error_message = (
                 "Query and document embeddings are not compatible. "
@@ -211,17 +267,26 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
             )
             raise ValueError(error_message)
 
-        # Vectorized cosine similarity computation
-        query_norm = np.linalg.norm(query_embedding)
-        document_norms = np.linalg.norm(
-            report_df["full_content_embedding"].to_list(), axis=1
-        )
-        dot_products = np.dot(
-            np.vstack(report_df["full_content_embedding"].to_list()), query_embedding
-        )
-        report_df["similarity"] = dot_products / (document_norms * query_norm)
-
-        # Sort by similarity and select top-k
-        top_k = report_df.nlargest(self.config.drift_k_followups, "similarity")
-
-        return top_k.loc[:, ["short_id", "community_id", "full_content"]], token_ct
+        # Cosine similarity as a single product with the normalized report embeddings,
+        # written into a buffer kept across queries
+        query_vector = np.asarray(query_embedding, dtype=np.float32)
+        query_vector /= np.linalg.norm(query_vector)
+        if self._similarities is None:
+            self._similarities = np.empty(len(report_embeddings), dtype=np.float32)
+        similarities = np.dot(report_embeddings, query_vector, out=self._similarities)
+
+        # Select the top-k without sorting every report, ranking ties by report order
+        k = min(self.config.drift_k_followups, len(similarities))
+        top_k = np.argpartition(similarities, len(similarities) - k)[
+            len(similarities) - k :
+        ]
+        top_k = top_k[np.lexsort((top_k, -similarities[top_k]))]
+
+        return pd.DataFrame(
+            {
+                "short_id": [self.reports[i].short_id for i in top_k],
+                "community_id": [self.reports[i].community_id for i in top_k],
+                "full_content": [self.reports[i].full_content for i in top_k],
+            },
+            index=top_k,
+        ), token_ct
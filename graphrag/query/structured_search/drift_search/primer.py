@@ -7,6 +7,7 @@ import json
 import logging
 import secrets
 import time
+from contextlib import nullcontext
 
 import numpy as np
 import pandas as pd
@@ -22,6 +23,7 @@ from graphrag.query.llm.base import BaseTextEmbedding
 from graphrag.query.llm.oai.chat_openai import ChatOpenAI
 from graphrag.query.llm.text_utils import num_tokens
 from graphrag.query.structured_search.base import SearchResult
+from graphrag.query.structured_search.drift_search.budget import QueryBudget
 
 log = logging.getLogger(__name__)
 
@@ -50,12 +52,15 @@ class PrimerQueryProcessor:
         self.token_encoder = token_encoder
         self.reports = reports
 
-    def expand_query(self, query: str) -> tuple[str, dict[str, int]]:
+    async def expand_query(
+        self, query: str, budget: QueryBudget | None = None
+    ) -> tuple[str, dict[str, int]]:
         """
         Expand the query using a random community report template.
 
         Args:
             query (str): The original search query.
+            budget (QueryBudget, optional): The budget of the query to make the LLM call in.
 
         Returns
         -------
@@ -70,8 +75,9 @@ class PrimerQueryProcessor:
 
         messages = [{"role": "user", "content": prompt}]
 
-        text = self.chat_llm.generate(messages)
         prompt_tokens = num_tokens(prompt, self.token_encoder)
+        async with budget.slot(prompt_tokens) if budget is not None else nullcontext():
+            text = await self.chat_llm.agenerate(messages)
         output_tokens = num_tokens(text, self.token_encoder)
         token_ct = {
             "llm_calls": 1,
@@ -83,20 +89,23 @@ class PrimerQueryProcessor:
             return query, token_ct
         return text, token_ct
 
-    def __call__(self, query: str) -> tuple[list[float], dict[str, int]]:
+    async def __call__(
+        self, query: str, budget: QueryBudget | None = None
+    ) -> tuple[list[float], dict[str, int]]:
         """
         Call method to process the query, expand it, and embed the result.
 
         Args:
             query (str): The search query.
+            budget (QueryBudget, optional): The budget of the query to make the LLM call in.
 
         Returns
         -------
         tuple[list[float], int]: List of embeddings for the expanded query and the token count.
         """
-        hyde_query, token_ct = self.expand_query(query)
+        hyde_query, token_ct = await self.expand_query(query, budget)
         log.info("Expanded query: %s", hyde_query)
-        return self.text_embedder.embed(hyde_query), token_ct
+        return await self.text_embedder.aembed(hyde_query), token_ct
 
 
 class DRIFTPrimer:
@@ -121,7 +130,7 @@ class DRIFTPrimer:
         self.token_encoder = token_encoder
 
     async def decompose_query(
-        self, query: str, reports: pd.DataFrame
+        self, query: str, reports: pd.DataFrame, budget: QueryBudget | None = None
     ) -> tuple[dict, dict[str, int]]:
         """
         Decompose the query into subqueries based on the fetched global structures.
@@ -129,6 +138,7 @@ class DRIFTPrimer:
         Args:
             query (str): The original search query.
             reports (pd.DataFrame): DataFrame containing community reports.
+            budget (QueryBudget, optional): The budget of the query to make the LLM call in.
 
         Returns
         -------
@@ -139,16 +149,22 @@ class DRIFTPrimer:
             query=query, community_reports=community_reports
         )
         messages = [{"role": "user", "content": prompt}]
+        prompt_tokens = num_tokens(prompt, self.token_encoder)
 
-        response = await self.llm.agenerate(
-            messages, response_format={"type": "json_object"}
-        )
+        async with (
+            budget.slot(prompt_tokens + self.config.primer_llm_max_tokens)
+            if budget is not None
+            else nullcontext()
+        ):
+            response = await self.llm.agenerate(
+                messages, response_format={"type": "json_object"}
+            )
 
         parsed_response = json.loads(response)
 
         token_ct = {
             "llm_calls": 1,
-            "prompt_tokens": num_tokens(prompt, self.token_encoder),
+            "prompt_tokens": prompt_tokens,
             "output_tokens": num_tokens(response, self.token_encoder),
         }
 
@@ -158,6 +174,7 @@ class DRIFTPrimer:
         self,
         query: str,
         top_k_reports: pd.DataFrame,
+        budget: QueryBudget | None = None,
     ) -> SearchResult:
         """
         Asynchronous search method that processes the query and returns a SearchResult.
@@ -165,6 +182,7 @@ class DRIFTPrimer:
         Args:
             query (str): The search query.
             top_k_reports (pd.DataFrame): DataFrame containing the top-k reports.
+            budget (QueryBudget, optional): The budget of the query to make the LLM calls in.
 
         Returns
         -------
@@ -172,7 +190,7 @@ class DRIFTPrimer:
         """
         start_time = time.perf_counter()
         report_folds = self.split_reports(top_k_reports)
-        tasks = [self.decompose_query(query, fold) for fold in report_folds]
+        tasks = [self.decompose_query(query, fold, budget) for fold in report_folds]
         results_with_tokens = await tqdm_asyncio.gather(*tasks, leave=False)
 
         completion_time = time.perf_counter() - start_time
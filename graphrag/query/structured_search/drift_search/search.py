@@ -6,6 +6,7 @@
 import logging
 import time
 from collections.abc import AsyncGenerator
+from contextlib import nullcontext
 from typing import Any
 
 import tiktoken
@@ -18,6 +19,7 @@ from graphrag.query.llm.oai.chat_openai import ChatOpenAI
 from graphrag.query.llm.text_utils import num_tokens
 from graphrag.query.structured_search.base import BaseSearch, SearchResult
 from graphrag.query.structured_search.drift_search.action import DriftAction
+from graphrag.query.structured_search.drift_search.budget import QueryBudget
 from graphrag.query.structured_search.drift_search.drift_context import (
     DRIFTSearchContextBuilder,
 )
@@ -149,7 +151,11 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
         raise ValueError(error_msg)
 
     async def _search_step(
-        self, global_query: str, search_engine: LocalSearch, actions: list[DriftAction]
+        self,
+        global_query: str,
+        search_engine: LocalSearch,
+        actions: list[DriftAction],
+        budget: QueryBudget | None = None,
     ) -> list[DriftAction]:
         """
         Perform an asynchronous search step by executing each DriftAction asynchronously.
@@ -158,16 +164,28 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
             global_query (str): The global query for the search.
             search_engine (LocalSearch): The local search engine instance.
             actions (list[DriftAction]): A list of actions to perform.
+            budget (QueryBudget, optional): The budget of the query bounding the concurrent actions.
 
         Returns
         -------
         list[DriftAction]: The results from executing the search actions asynchronously.
         """
-        tasks = [
-            action.search(search_engine=search_engine, global_query=global_query)
-            for action in actions
-        ]
-        return await tqdm_asyncio.gather(*tasks, leave=False)
+        config = self.context_builder.config
+        estimated_tokens = (
+            config.local_search_max_data_tokens + config.local_search_llm_max_gen_tokens
+        )
+
+        async def search(action: DriftAction) -> DriftAction:
+            async with (
+                budget.slot(estimated_tokens) if budget is not None else nullcontext()
+            ):
+                return await action.search(
+                    search_engine=search_engine, global_query=global_query
+                )
+
+        return await tqdm_asyncio.gather(
+            *[search(action) for action in actions], leave=False
+        )
 
     async def search(
         self,
@@ -199,17 +217,20 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
         llm_calls, prompt_tokens, output_tokens = {}, {}, {}
 
         start_time = time.perf_counter()
+        budget = self.context_builder.budget.query()
 
         # Check if query state is empty
         if not self.query_state.graph:
             # Prime the search with the primer
-            primer_context, token_ct = self.context_builder.build_context(query)
+            primer_context, token_ct = await self.context_builder.build_context(
+                query, budget=budget
+            )
             llm_calls["build_context"] = token_ct["llm_calls"]
             prompt_tokens["build_context"] = token_ct["prompt_tokens"]
             output_tokens["build_context"] = token_ct["prompt_tokens"]
 
             primer_response = await self.primer.search(
-                query=query, top_k_reports=primer_context
+                query=query, top_k_reports=primer_context, budget=budget
             )
             llm_calls["primer"] = primer_response.llm_calls
             prompt_tokens["primer"] = primer_response.prompt_tokens
@@ -234,7 +255,10 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
             )
             # Process actions
             results = await self._search_step(
-                global_query=query, search_engine=self.local_search, actions=actions
+                global_query=query,
+                search_engine=self.local_search,
+                actions=actions,
+                budget=budget,
             )
 
             # Update query state
@@ -268,6 +292,7 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
                 llm_calls=llm_calls,
                 prompt_tokens=prompt_tokens,
                 output_tokens=output_tokens,
+                budget=budget,
                 max_tokens=self.context_builder.config.reduce_max_tokens,
                 temperature=self.context_builder.config.reduce_temperature,
             )
@@ -311,6 +336,7 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
         async for resp in self._reduce_response_streaming(
             responses=result.response,
             query=query,
+            budget=self.context_builder.budget.query(),
             max_tokens=self.context_builder.config.reduce_max_tokens,
             temperature=self.context_builder.config.reduce_temperature,
         ):
@@ -327,6 +353,7 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
         llm_calls: dict[str, int],
         prompt_tokens: dict[str, int],
         output_tokens: dict[str, int],
+        budget: QueryBudget | None = None,
         **llm_kwargs,
     ) -> str:
         """Reduce the response to a single comprehensive response.
@@ -365,25 +392,31 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
             {"role": "user", "content": query},
         ]
 
-        reduced_response = self.llm.generate(
-            messages=search_messages,
-            streaming=False,
-            callbacks=self.callbacks,  # type: ignore
-            **llm_kwargs,
-        )
-
-        llm_calls["reduce"] = 1
         prompt_tokens["reduce"] = num_tokens(
             search_prompt, self.token_encoder
         ) + num_tokens(query, self.token_encoder)
+        async with (
+            budget.slot(prompt_tokens["reduce"] + llm_kwargs.get("max_tokens", 0))
+            if budget is not None
+            else nullcontext()
+        ):
+            reduced_response = await self.llm.agenerate(
+                messages=search_messages,
+                streaming=False,
+                callbacks=self.callbacks,  # type: ignore
+                **llm_kwargs,
+            )
+
+        llm_calls["reduce"] = 1
         output_tokens["reduce"] = num_tokens(reduced_response, self.token_encoder)
 
         return reduced_response
 
-    def _reduce_response_streaming(
+    async def _reduce_response_streaming(
         self,
         responses: str | dict[str, Any],
         query: str,
+        budget: QueryBudget | None = None,
         **llm_kwargs,
     ) -> AsyncGenerator[str, None]:
         """Reduce the response to a single comprehensive response.
@@ -422,8 +455,17 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
             {"role": "user", "content": query},
         ]
 
-        return self.llm.astream_generate(
-            search_messages,
-            callbacks=self.callbacks,  # type: ignore
-            **llm_kwargs,
+        estimated_tokens = num_tokens(search_prompt, self.token_encoder) + num_tokens(
+            query, self.token_encoder
         )
+        async with (
+            budget.slot(estimated_tokens + llm_kwargs.get("max_tokens", 0))
+            if budget is not None
+            else nullcontext()
+        ):
+            async for resp in self.llm.astream_generate(
+                search_messages,
+                callbacks=self.callbacks,  # type: ignore
+                **llm_kwargs,
+            ):
+                yield resp
@@ -3,10 +3,14 @@
 
 """Contains algorithms to build context data for global search prompt."""
 
+import hashlib
+import json
 from typing import Any
 
+import pandas as pd
 import tiktoken
 
+from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.model.community import Community
 from graphrag.model.community_report import CommunityReport
 from graphrag.model.entity import Entity
@@ -20,6 +24,7 @@ from graphrag.query.context_builder.conversation_history import (
 from graphrag.query.context_builder.dynamic_community_selection import (
     DynamicCommunitySelection,
 )
+from graphrag.query.llm.text_utils import TokenCounter
 from graphrag.query.structured_search.base import GlobalContextBuilder
 
 
@@ -35,10 +40,12 @@ class GlobalCommunityContext(GlobalContextBuilder):
         dynamic_community_selection: bool = False,
         dynamic_community_selection_kwargs: dict[str, Any] | None = None,
         random_state: int = 86,
+        context_cache: PipelineCache | None = None,
     ):
         self.community_reports = community_reports
         self.entities = entities
         self.token_encoder = token_encoder
+        self.token_counter = TokenCounter(token_encoder)
         self.dynamic_community_selection = None
         if dynamic_community_selection and isinstance(
             dynamic_community_selection_kwargs, dict
@@ -51,6 +58,13 @@ class GlobalCommunityContext(GlobalContextBuilder):
                 **dynamic_community_selection_kwargs,
             )
         self.random_state = random_state
+        # without dynamic community selection the context batches do not depend on the query,
+        # so they are built once per set of parameters and optionally persisted
+        self.context_cache = context_cache
+        self._context_batches: dict[
+            str, tuple[str | list[str], dict[str, pd.DataFrame]]
+        ] = {}
+        self._reports_fingerprint: str | None = None
 
     async def build_context(
         self,
@@ -90,7 +104,19 @@ class GlobalCommunityContext(GlobalContextBuilder):
             if conversation_history_context != "":
                 final_context_data = conversation_history_context_data
 
-        community_reports = self.community_reports
+        context_params = {
+            "use_community_summary": use_community_summary,
+            "column_delimiter": column_delimiter,
+            "shuffle_data": shuffle_data,
+            "include_community_rank": include_community_rank,
+            "min_community_rank": min_community_rank,
+            "community_rank_name": community_rank_name,
+            "include_community_weight": include_community_weight,
+            "community_weight_name": community_weight_name,
+            "normalize_community_weight": normalize_community_weight,
+            "max_tokens": max_tokens,
+            "context_name": context_name,
+        }
         if self.dynamic_community_selection is not None:
             (
                 community_reports,
@@ -99,25 +125,14 @@ class GlobalCommunityContext(GlobalContextBuilder):
             llm_calls += dynamic_info["llm_calls"]
             prompt_tokens += dynamic_info["prompt_tokens"]
             output_tokens += dynamic_info["output_tokens"]
-
-        community_context, community_context_data = build_community_context(
-            community_reports=community_reports,
-            entities=self.entities,
-            token_encoder=self.token_encoder,
-            use_community_summary=use_community_summary,
-            column_delimiter=column_delimiter,
-            shuffle_data=shuffle_data,
-            include_community_rank=include_community_rank,
-            min_community_rank=min_community_rank,
-            community_rank_name=community_rank_name,
-            include_community_weight=include_community_weight,
-            community_weight_name=community_weight_name,
-            normalize_community_weight=normalize_community_weight,
-            max_tokens=max_tokens,
-            single_batch=False,
-            context_name=context_name,
-            random_state=self.random_state,
-        )
+            community_context, community_context_data = self._build_community_context(
+                community_reports, context_params
+            )
+        else:
+            (
+                community_context,
+                community_context_data,
+            ) = await self._get_community_context(context_params)
 
         # Prepare context_prefix based on whether conversation_history_context exists
         context_prefix = (
@@ -142,3 +157,104 @@ class GlobalCommunityContext(GlobalContextBuilder):
             prompt_tokens=prompt_tokens,
             output_tokens=output_tokens,
         )
+
+    def _build_community_context(
+        self, community_reports: list[CommunityReport], context_params: dict[str, Any]
+    ) -> tuple[str | list[str], dict[str, pd.DataFrame]]:
+        return build_community_context(
+            community_reports=community_reports,
+            entities=self.entities,
+            token_encoder=self.token_encoder,
+            single_batch=False,
+            random_state=self.random_state,
+            token_counter=self.token_counter,
+            **context_params,
+        )
+
+    async def _get_community_context(
+        self, context_params: dict[str, Any]
+    ) -> tuple[str | list[str], dict[str, pd.DataFrame]]:
+        """Get the context batches of all the community reports, building them once per set of parameters."""
+        key = json.dumps(
+            [
+                context_params,
+                self.random_state,
+                getattr(self.token_encoder, "name", None),
+            ],
+            sort_keys=True,
+        )
+        if key not in self._context_batches:
+            self._context_batches[key] = await self._load_community_context(
+                key, context_params
+            )
+
+        # callers own the records they are given
+        community_context, community_context_data = self._context_batches[key]
+        return community_context, {
+            name: records.copy() for name, records in community_context_data.items()
+        }
+
+    async def _load_community_context(
+        self, key: str, context_params: dict[str, Any]
+    ) -> tuple[str | list[str], dict[str, pd.DataFrame]]:
+        if self.context_cache is None:
+            return self._build_community_context(self.community_reports, context_params)
+
+        cache_key = self._context_cache_key(key)
+        cached = await self.context_cache.get(cache_key)
+        if cached is not None:
+            return _load_context_batches(cached)
+        batches = self._build_community_context(self.community_reports, context_params)
+        await self.context_cache.set(cache_key, _dump_context_batches(batches))
+        return batches
+
+    def _context_cache_key(self, key: str) -> str:
+        """Key persisted context batches on their parameters and the reports and entities they are built from."""
+        if self._reports_fingerprint is None:
+            # computed before the first build, which adds community weights to the reports
+            digest = hashlib.sha256()
+            for report in self.community_reports:
+                digest.update(
+                    json.dumps(
+                        [
+                            report.id,
+                            report.short_id,
+                            report.title,
+                            report.rank,
+                            report.summary,
+                            report.full_content,
+                            report.attributes,
+                        ],
+                        default=str,
+                    ).encode()
+                )
+            for entity in self.entities or []:
+                digest.update(
+                    json.dumps(
+                        [entity.id, entity.community_ids, entity.text_unit_ids],
+                        default=str,
+                    ).encode()
+                )
+            self._reports_fingerprint = digest.hexdigest()
+        return hashlib.sha256(f"{key}:{self._reports_fingerprint}".encode()).hexdigest()
+
+
+def _dump_context_batches(
+    batches: tuple[str | list[str], dict[str, pd.DataFrame]],
+) -> dict[str, Any]:
+    community_context, community_context_data = batches
+    return {
+        "context": community_context,
+        "records": {
+            name: records.to_dict(orient="split")
+            for name, records in community_context_data.items()
+        },
+    }
+
+
+def _load_context_batches(
+    value: dict[str, Any],
+) -> tuple[str | list[str], dict[str, pd.DataFrame]]:
+    return value["context"], {
+        name: pd.DataFrame(**records) for name, records in value["records"].items()
+    }
@@ -6,11 +6,13 @@
 import asyncio
 import json
 import logging
+import math
 import time
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import tiktoken
 
@@ -30,8 +32,16 @@ from graphrag.query.context_builder.conversation_history import (
     ConversationHistory,
 )
 from graphrag.query.llm.base import BaseLLM
-from graphrag.query.llm.text_utils import num_tokens, try_parse_json_object
-from graphrag.query.structured_search.base import BaseSearch, SearchResult
+from graphrag.query.llm.text_utils import (
+    fit_token_budget,
+    num_tokens,
+    try_parse_json_object,
+)
+from graphrag.query.structured_search.base import (
+    BaseSearch,
+    MapResponseStats,
+    SearchResult,
+)
 
 DEFAULT_MAP_LLM_PARAMS = {
     "max_tokens": 1000,
@@ -75,6 +85,9 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         reduce_llm_params: dict[str, Any] = DEFAULT_REDUCE_LLM_PARAMS,
         context_builder_params: dict[str, Any] | None = None,
         concurrent_coroutines: int = 32,
+        early_reduce_fraction: float = 1.0,
+        early_reduce_score: float | None = None,
+        map_deadline: float | None = None,
     ):
         super().__init__(
             llm=llm,
@@ -101,6 +114,10 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
             self.map_llm_params.pop("response_format", None)
 
         self.semaphore = asyncio.Semaphore(concurrent_coroutines)
+        # the reduce step can start before every map batch has responded, cancelling the rest
+        self.early_reduce_fraction = early_reduce_fraction
+        self.early_reduce_score = early_reduce_score
+        self.map_deadline = map_deadline
 
     async def stream_search(
         self,
@@ -116,12 +133,10 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         for callback in self.callbacks:
             callback.on_map_response_start(context_result.context_chunks)  # type: ignore
 
-        map_responses = await asyncio.gather(*[
-            self._map_response_single_batch(
-                context_data=data, query=query, **self.map_llm_params
-            )
-            for data in context_result.context_chunks
-        ])
+        map_responses, key_points = await self._map_responses(
+            context_result.context_chunks,  # type: ignore
+            query,
+        )
 
         for callback in self.callbacks:
             callback.on_map_response_end(map_responses)  # type: ignore
@@ -130,6 +145,7 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         async for response in self._stream_reduce_response(
             map_responses=map_responses,  # type: ignore
             query=query,
+            key_points=key_points,
             **self.reduce_llm_params,
         ):
             yield response
@@ -164,12 +180,10 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         for callback in self.callbacks:
             callback.on_map_response_start(context_result.context_chunks)  # type: ignore
 
-        map_responses = await asyncio.gather(*[
-            self._map_response_single_batch(
-                context_data=data, query=query, **self.map_llm_params
-            )
-            for data in context_result.context_chunks
-        ])
+        map_responses, key_points = await self._map_responses(
+            context_result.context_chunks,  # type: ignore
+            query,
+        )
 
         for callback in self.callbacks:
             callback.on_map_response_end(map_responses)
@@ -183,6 +197,7 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         reduce_response = await self._reduce_response(
             map_responses=map_responses,
             query=query,
+            key_points=key_points,
             **self.reduce_llm_params,
         )
         llm_calls["reduce"] = reduce_response.llm_calls
@@ -205,6 +220,67 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
             output_tokens_categories=output_tokens,
         )
 
+    async def _map_responses(
+        self, context_chunks: list[str], query: str
+    ) -> tuple[list[SearchResult], "_KeyPoints"]:
+        """Run the map batches, consuming their responses as they complete.
+
+        The key points that fit in the reduce token budget are kept as the responses arrive, so the
+        reduce step can start once enough of the batches or of the score have arrived, or once the
+        deadline has passed. The map batches still running are then cancelled.
+        """
+        key_points = _KeyPoints(self.max_data_tokens, self.token_encoder)
+        tasks = {
+            asyncio.create_task(
+                self._map_response_single_batch(
+                    context_data=data, query=query, **self.map_llm_params
+                )
+            ): index
+            for index, data in enumerate(context_chunks)
+        }
+        required = math.ceil(self.early_reduce_fraction * len(tasks))
+        responses: dict[int, SearchResult] = {}
+        latencies: list[float] = []
+        pending = set(tasks)
+        start_time = time.time()
+        try:
+            while pending and len(responses) < required:
+                if (
+                    self.early_reduce_score is not None
+                    and key_points.score >= self.early_reduce_score
+                ):
+                    break
+                timeout = None
+                if self.map_deadline is not None:
+                    timeout = self.map_deadline - (time.time() - start_time)
+                    if timeout <= 0:
+                        break
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                # add the responses in batch order, so they rank the same however they arrive
+                for task in sorted(done, key=tasks.__getitem__):
+                    responses[tasks[task]] = task.result()
+                    latencies.append(time.time() - start_time)
+                    key_points.add(tasks[task], responses[tasks[task]])
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                log.info("Cancelling %d map batches to start reducing", len(pending))
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        stats = MapResponseStats(
+            batches=len(tasks),
+            completed=len(responses),
+            cancelled=len(pending),
+            reduce_start=time.time() - start_time,
+            latencies=latencies,
+        )
+        for callback in self.callbacks:
+            callback.on_map_response_stats(stats)
+        return [responses[index] for index in sorted(responses)], key_points
+
     async def _map_response_single_batch(
         self,
         context_data: str,
@@ -290,6 +366,7 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         self,
         map_responses: list[SearchResult],
         query: str,
+        key_points: "_KeyPoints | None" = None,
         **llm_kwargs,
     ) -> SearchResult:
         """Combine all intermediate responses from single batches into a final answer to the user query."""
@@ -297,30 +374,12 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         search_prompt = ""
         start_time = time.time()
         try:
-            # collect all key points into a single list to prepare for sorting
-            key_points = []
-            for index, response in enumerate(map_responses):
-                if not isinstance(response.response, list):
-                    continue
-                for element in response.response:
-                    if not isinstance(element, dict):
-                        continue
-                    if "answer" not in element or "score" not in element:
-                        continue
-                    key_points.append({
-                        "analyst": index,
-                        "answer": element["answer"],
-                        "score": element["score"],
-                    })
-
-            # filter response with score = 0 and rank responses by descending order of score
-            filtered_key_points = [
-                point
-                for point in key_points
-                if point["score"] > 0  # type: ignore
-            ]
+            if key_points is None:
+                key_points = _KeyPoints.from_responses(
+                    map_responses, self.max_data_tokens, self.token_encoder
+                )
 
-            if len(filtered_key_points) == 0 and not self.allow_general_knowledge:
+            if key_points.count == 0 and not self.allow_general_knowledge:
                 # return no data answer if no key points are found
                 log.warning(
                     "Warning: All map responses have score 0 (i.e., no relevant information found from the dataset), returning a canned 'I do not know' answer. You can try enabling `allow_general_knowledge` to encourage the LLM to incorporate relevant general knowledge, at the risk of increasing hallucinations."
@@ -335,33 +394,7 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
                     output_tokens=0,
                 )
 
-            filtered_key_points = sorted(
-                filtered_key_points,
-                key=lambda x: x["score"],  # type: ignore
-                reverse=True,  # type: ignore
-            )
-
-            data = []
-            total_tokens = 0
-            for point in filtered_key_points:
-                formatted_response_data = []
-                formatted_response_data.append(
-                    f"----Analyst {point['analyst'] + 1}----"
-                )
-                formatted_response_data.append(
-                    f"Importance Score: {point['score']}"  # type: ignore
-                )
-                formatted_response_data.append(point["answer"])  # type: ignore
-                formatted_response_text = "\n".join(formatted_response_data)
-                if (
-                    total_tokens
-                    + num_tokens(formatted_response_text, self.token_encoder)
-                    > self.max_data_tokens
-                ):
-                    break
-                data.append(formatted_response_text)
-                total_tokens += num_tokens(formatted_response_text, self.token_encoder)
-            text_data = "\n\n".join(data)
+            text_data = key_points.text()
 
             search_prompt = self.reduce_system_prompt.format(
                 report_data=text_data, response_type=self.response_type
@@ -404,32 +437,15 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         self,
         map_responses: list[SearchResult],
         query: str,
+        key_points: "_KeyPoints | None" = None,
         **llm_kwargs,
     ) -> AsyncGenerator[str, None]:
-        # collect all key points into a single list to prepare for sorting
-        key_points = []
-        for index, response in enumerate(map_responses):
-            if not isinstance(response.response, list):
-                continue
-            for element in response.response:
-                if not isinstance(element, dict):
-                    continue
-                if "answer" not in element or "score" not in element:
-                    continue
-                key_points.append({
-                    "analyst": index,
-                    "answer": element["answer"],
-                    "score": element["score"],
-                })
-
-        # filter response with score = 0 and rank responses by descending order of score
-        filtered_key_points = [
-            point
-            for point in key_points
-            if point["score"] > 0  # type: ignore
-        ]
+        if key_points is None:
+            key_points = _KeyPoints.from_responses(
+                map_responses, self.max_data_tokens, self.token_encoder
+            )
 
-        if len(filtered_key_points) == 0 and not self.allow_general_knowledge:
+        if key_points.count == 0 and not self.allow_general_knowledge:
             # return no data answer if no key points are found
             log.warning(
                 "Warning: All map responses have score 0 (i.e., no relevant information found from the dataset), returning a canned 'I do not know' answer. You can try enabling `allow_general_knowledge` to encourage the LLM to incorporate relevant general knowledge, at the risk of increasing hallucinations."
@@ -437,29 +453,7 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
             yield NO_DATA_ANSWER
             return
 
-        filtered_key_points = sorted(
-            filtered_key_points,
-            key=lambda x: x["score"],  # type: ignore
-            reverse=True,  # type: ignore
-        )
-
-        data = []
-        total_tokens = 0
-        for point in filtered_key_points:
-            formatted_response_data = [
-                f"----Analyst {point['analyst'] + 1}----",
-                f"Importance Score: {point['score']}",
-                point["answer"],
-            ]
-            formatted_response_text = "\n".join(formatted_response_data)
-            if (
-                total_tokens + num_tokens(formatted_response_text, self.token_encoder)
-                > self.max_data_tokens
-            ):
-                break
-            data.append(formatted_response_text)
-            total_tokens += num_tokens(formatted_response_text, self.token_encoder)
-        text_data = "\n\n".join(data)
+        text_data = key_points.text()
 
         search_prompt = self.reduce_system_prompt.format(
             report_data=text_data, response_type=self.response_type
@@ -477,3 +471,67 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
             **llm_kwargs,  # type: ignore
         ):
             yield resp
+
+
+class _KeyPoints:
+    """The scored key points of the map responses, cut to the reduce token budget when formatted.
+
+    Key points rank by descending score, then by analyst and position in the analyst response. All
+    the scored key points are kept as the map responses arrive, and the formatted text is the longest
+    prefix of that ranking that fits in the budget, so it does not depend on the arrival order.
+    """
+
+    def __init__(self, max_tokens: int, token_encoder: tiktoken.Encoding | None):
+        self.max_tokens = max_tokens
+        self.token_encoder = token_encoder
+        # the number and total score of the key points added
+        self.count = 0
+        self.score = 0
+        self._points: list[tuple[Any, int, int, str]] = []
+
+    @classmethod
+    def from_responses(
+        cls,
+        map_responses: list[SearchResult],
+        max_tokens: int,
+        token_encoder: tiktoken.Encoding | None,
+    ) -> "_KeyPoints":
+        """Collect the key points of all the map responses."""
+        key_points = cls(max_tokens, token_encoder)
+        for index, response in enumerate(map_responses):
+            key_points.add(index, response)
+        return key_points
+
+    def add(self, analyst: int, response: SearchResult) -> None:
+        """Add the key points of the map response of an analyst, skipping those with score 0."""
+        if not isinstance(response.response, list):
+            return
+        for position, element in enumerate(response.response):
+            if not isinstance(element, dict):
+                continue
+            if "answer" not in element or "score" not in element:
+                continue
+            if element["score"] <= 0:
+                continue
+            text = "\n".join([
+                f"----Analyst {analyst + 1}----",
+                f"Importance Score: {element['score']}",
+                element["answer"],
+            ])
+            self._points.append((element["score"], analyst, position, text))
+            self.count += 1
+            self.score += element["score"]
+
+    def text(self) -> str:
+        """Format the longest prefix of the ranked key points that fits in the token budget."""
+        ranked = [
+            point[3]
+            for point in sorted(
+                self._points, key=lambda point: (-point[0], point[1], point[2])
+            )
+        ]
+        fitted = fit_token_budget(
+            np.array([num_tokens(text, self.token_encoder) for text in ranked]),
+            self.max_tokens,
+        )
+        return "\n\n".join(ranked[:fitted])
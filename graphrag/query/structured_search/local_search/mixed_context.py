@@ -35,12 +35,18 @@ from graphrag.query.context_builder.source_context import (
     build_text_unit_context,
     count_relationships,
 )
+from graphrag.query.input.retrieval.adjacency import (
+    covariate_adjacency,
+    relationship_adjacency,
+    text_unit_adjacency,
+)
 from graphrag.query.input.retrieval.community_reports import (
     get_candidate_communities,
 )
+from graphrag.query.input.retrieval.covariate_table import CovariateTable
 from graphrag.query.input.retrieval.text_units import get_candidate_text_units
 from graphrag.query.llm.base import BaseTextEmbedding
-from graphrag.query.llm.text_utils import num_tokens
+from graphrag.query.llm.text_utils import TokenCounter, num_tokens
 from graphrag.query.structured_search.base import LocalContextBuilder
 from graphrag.vector_stores.base import BaseVectorStore
 
@@ -58,7 +64,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
         text_units: list[TextUnit] | None = None,
         community_reports: list[CommunityReport] | None = None,
         relationships: list[Relationship] | None = None,
-        covariates: dict[str, list[Covariate]] | None = None,
+        covariates: dict[str, list[Covariate] | CovariateTable] | None = None,
         token_encoder: tiktoken.Encoding | None = None,
         embedding_vectorstore_key: str = EntityVectorStoreKey.ID,
     ):
@@ -79,9 +85,23 @@ class LocalSearchMixedContext(LocalContextBuilder):
             relationship.id: relationship for relationship in relationships
         }
         self.covariates = covariates
+        # incident relationships, covariates and text units are looked up per query
+        # through adjacency indexes built once here, rather than by scanning the collections
+        self.relationship_adjacency = relationship_adjacency(
+            list(self.relationships.values())
+        )
+        # covariate tables are already grouped by subject
+        self.covariate_adjacency = {
+            covariate_type: covariate_list
+            if isinstance(covariate_list, CovariateTable)
+            else covariate_adjacency(covariate_list)
+            for covariate_type, covariate_list in covariates.items()
+        }
+        self.text_unit_adjacency = text_unit_adjacency(list(self.text_units.values()))
         self.entity_text_embeddings = entity_text_embeddings
         self.text_embedder = text_embedder
         self.token_encoder = token_encoder
+        self.token_counter = TokenCounter(token_encoder)
         self.embedding_vectorstore_key = embedding_vectorstore_key
 
     def filter_by_entity_keys(self, entity_keys: list[int] | list[str]):
@@ -273,6 +293,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
             max_tokens=max_tokens,
             single_batch=True,
             context_name=context_name,
+            token_counter=self.token_counter,
         )
         if isinstance(context_text, list) and len(context_text) > 0:
             context_text = "\n\n".join(context_text)
@@ -318,15 +339,10 @@ class LocalSearchMixedContext(LocalContextBuilder):
         text_unit_ids_set = set()
 
         unit_info_list = []
-        relationship_values = list(self.relationships.values())
 
         for index, entity in enumerate(selected_entities):
             # get matching relationships
-            entity_relationships = [
-                rel
-                for rel in relationship_values
-                if rel.source == entity.title or rel.target == entity.title
-            ]
+            entity_relationships = self.relationship_adjacency.get([entity.title])
 
             for text_id in entity.text_unit_ids or []:
                 if text_id not in text_unit_ids_set and text_id in self.text_units:
@@ -349,12 +365,14 @@ class LocalSearchMixedContext(LocalContextBuilder):
             shuffle_data=False,
             context_name=context_name,
             column_delimiter=column_delimiter,
+            token_counter=self.token_counter,
         )
 
         if return_candidate_context:
             candidate_context_data = get_candidate_text_units(
                 selected_entities=selected_entities,
-                text_units=list(self.text_units.values()),
+                text_units=self.text_unit_adjacency.items,
+                adjacency=self.text_unit_adjacency,
             )
             context_key = context_name.lower()
             if context_key not in context_data:
@@ -396,6 +414,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
             include_entity_rank=include_entity_rank,
             rank_description=rank_description,
             context_name="Entities",
+            token_counter=self.token_counter,
         )
         entity_tokens = num_tokens(entity_context, self.token_encoder)
 
@@ -416,7 +435,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
                 relationship_context_data,
             ) = build_relationship_context(
                 selected_entities=added_entities,
-                relationships=list(self.relationships.values()),
+                relationships=self.relationship_adjacency.items,
                 token_encoder=self.token_encoder,
                 max_tokens=max_tokens,
                 column_delimiter=column_delimiter,
@@ -424,6 +443,8 @@ class LocalSearchMixedContext(LocalContextBuilder):
                 include_relationship_weight=include_relationship_weight,
                 relationship_ranking_attribute=relationship_ranking_attribute,
                 context_name="Relationships",
+                adjacency=self.relationship_adjacency,
+                token_counter=self.token_counter,
             )
             current_context.append(relationship_context)
             current_context_data["relationships"] = relationship_context_data
@@ -440,6 +461,8 @@ class LocalSearchMixedContext(LocalContextBuilder):
                     max_tokens=max_tokens,
                     column_delimiter=column_delimiter,
                     context_name=covariate,
+                    adjacency=self.covariate_adjacency[covariate],
+                    token_counter=self.token_counter,
                 )
                 total_tokens += num_tokens(covariate_context, self.token_encoder)
                 current_context.append(covariate_context)
@@ -462,11 +485,13 @@ class LocalSearchMixedContext(LocalContextBuilder):
             candidate_context_data = get_candidate_context(
                 selected_entities=selected_entities,
                 entities=list(self.entities.values()),
-                relationships=list(self.relationships.values()),
+                relationships=self.relationship_adjacency.items,
                 covariates=self.covariates,
                 include_entity_rank=include_entity_rank,
                 entity_rank_description=rank_description,
                 include_relationship_weight=include_relationship_weight,
+                relationship_adjacency=self.relationship_adjacency,
+                covariate_adjacency=self.covariate_adjacency,
             )
             for key in candidate_context_data:
                 candidate_df = candidate_context_data[key]
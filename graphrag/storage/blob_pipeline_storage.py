@@ -3,6 +3,8 @@
 
 """Azure Blob Storage implementation of PipelineStorage."""
 
+import asyncio
+import io
 import logging
 import re
 from collections.abc import Iterator
@@ -21,6 +23,8 @@ from graphrag.storage.pipeline_storage import (
 
 log = logging.getLogger(__name__)
 
+COPY_POLL_INTERVAL = 0.5
+
 
 class BlobPipelineStorage(PipelineStorage):
     """The Blob-Storage implementation."""
@@ -194,6 +198,7 @@ class BlobPipelineStorage(PipelineStorage):
 
     async def set(self, key: str, value: Any, encoding: str | None = None) -> None:
         """Set a value in the cache."""
+        self._record_table_version(key, None)
         try:
             key = self._keyname(key)
             container_client = self._blob_service_client.get_container_client(
@@ -246,6 +251,50 @@ class BlobPipelineStorage(PipelineStorage):
                 storage_options={"connection_string": self._connection_string},
             )
 
+    def table_source(self, key: str) -> io.RawIOBase | None:
+        """Get a seekable stream over a parquet blob, so only the footer and the requested row groups and columns are downloaded."""
+        container_client = self._blob_service_client.get_container_client(
+            self._container_name
+        )
+        blob_client = container_client.get_blob_client(self._keyname(key))
+        if not blob_client.exists():
+            return None
+        return BlobRangeReader(blob_client)
+
+    async def copy(
+        self,
+        key: str,
+        destination: PipelineStorage,
+        destination_key: str | None = None,
+    ) -> None:
+        """Copy a blob server-side when the destination is in the same storage account."""
+        if not isinstance(destination, BlobPipelineStorage):
+            await super().copy(key, destination, destination_key)
+            return
+        source_client = self._blob_client(key)
+        blob_client = destination._blob_client(destination_key or key)  # noqa: SLF001
+        if blob_client.primary_hostname != source_client.primary_hostname:
+            await super().copy(key, destination, destination_key)
+            return
+        blob_client.start_copy_from_url(source_client.url)
+        status = blob_client.get_blob_properties().copy.status
+        while status == "pending":
+            await asyncio.sleep(COPY_POLL_INTERVAL)
+            status = blob_client.get_blob_properties().copy.status
+        if status != "success":
+            log.warning("Copy of blob %s ended as %s, copying it again", key, status)
+            await super().copy(key, destination, destination_key)
+            return
+        destination._record_table_version(  # noqa: SLF001
+            destination_key or key, self.table_version(key)
+        )
+
+    def _blob_client(self, key: str) -> Any:
+        """Get the client of the blob of a key."""
+        return self._blob_service_client.get_blob_client(
+            self._container_name, self._keyname(key)
+        )
+
     async def has(self, key: str) -> bool:
         """Check if a key exists in the cache."""
         key = self._keyname(key)
@@ -257,6 +306,7 @@ class BlobPipelineStorage(PipelineStorage):
 
     async def delete(self, key: str) -> None:
         """Delete a key from the cache."""
+        self._record_table_version(key, None)
         key = self._keyname(key)
         container_client = self._blob_service_client.get_container_client(
             self._container_name
@@ -309,6 +359,55 @@ class BlobPipelineStorage(PipelineStorage):
             return ""
 
 
+class BlobRangeReader(io.RawIOBase):
+    """A read-only, seekable view of a blob that downloads only the byte ranges that are read."""
+
+    def __init__(self, blob_client: Any):
+        """Create a new reader over a blob client."""
+        self._blob_client = blob_client
+        self._size = blob_client.get_blob_properties().size
+        self._position = 0
+
+    def readable(self) -> bool:
+        """Return True, the reader is readable."""
+        return True
+
+    def seekable(self) -> bool:
+        """Return True, the reader is seekable."""
+        return True
+
+    def tell(self) -> int:
+        """Return the current position."""
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Move to a new position."""
+        match whence:
+            case io.SEEK_SET:
+                position = offset
+            case io.SEEK_CUR:
+                position = self._position + offset
+            case io.SEEK_END:
+                position = self._size + offset
+            case _:
+                msg = f"Invalid whence: {whence}"
+                raise ValueError(msg)
+        self._position = max(position, 0)
+        return self._position
+
+    def readinto(self, buffer: Any) -> int:
+        """Download the next range of the blob into the buffer."""
+        length = min(len(buffer), self._size - self._position)
+        if length <= 0:
+            return 0
+        data = self._blob_client.download_blob(
+            offset=self._position, length=length
+        ).readall()
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+
 def create_blob_storage(**kwargs: Any) -> PipelineStorage:
     """Create a blob based storage."""
     connection_string = kwargs.get("connection_string")
@@ -234,6 +234,7 @@ class CosmosDBPipelineStorage(PipelineStorage):
 
         For better optimization, the file is destructured such that each row is a unique cosmosdb item.
         """
+        self._record_table_version(key, None)
         try:
             if not self._database_client or not self._container_client:
                 msg = "Database or container not initialized"
@@ -288,6 +289,7 @@ class CosmosDBPipelineStorage(PipelineStorage):
 
     async def delete(self, key: str) -> None:
         """Delete all cosmosdb items belonging to the given filename key."""
+        self._record_table_version(key, None)
         if not self._database_client or not self._container_client:
             return
         try:
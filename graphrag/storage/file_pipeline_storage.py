@@ -3,6 +3,7 @@
 
 """A module containing 'FileStorage' and 'FilePipelineStorage' models."""
 
+import asyncio
 import logging
 import os
 import re
@@ -11,14 +12,17 @@ from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, cast
+from uuid import uuid4
 
 import aiofiles
+import pandas as pd
 from aiofiles.os import remove
 from aiofiles.ospath import exists
 
 from graphrag.logger.base import ProgressLogger
 from graphrag.logger.progress import Progress
 from graphrag.storage.pipeline_storage import (
+    HashingWriter,
     PipelineStorage,
     get_timestamp_formatted_with_local_tz,
 )
@@ -117,12 +121,60 @@ class FilePipelineStorage(PipelineStorage):
         is_bytes = isinstance(value, bytes)
         write_type = "wb" if is_bytes else "w"
         encoding = None if is_bytes else encoding or self._encoding
+        file_path = join_path(self._root_dir, key)
+        temp_path = _temp_path(file_path)
+        # write to a sibling file and swap it in, so readers holding a memory map of the
+        # previous version keep a valid view of it
         async with aiofiles.open(
-            join_path(self._root_dir, key),
+            temp_path,
             cast("Any", write_type),
             encoding=encoding,
         ) as f:
             await f.write(value)
+        temp_path.replace(file_path)
+        self._record_table_version(key, None)
+
+    def table_source(self, key: str) -> str | None:
+        """Get the local path of a parquet file, which pyarrow can memory-map."""
+        file_path = join_path(self._root_dir, key)
+        return str(file_path) if file_path.is_file() else None
+
+    async def set_table(self, key: str, table: pd.DataFrame) -> str:
+        """Write a DataFrame as parquet directly to its file, hashing the bytes as they are written."""
+        file_path = join_path(self._root_dir, key)
+        temp_path = _temp_path(file_path)
+        version = await asyncio.to_thread(_write_parquet, table, temp_path)
+        temp_path.replace(file_path)
+        self._record_table_version(key, version)
+        return version
+
+    async def copy(
+        self,
+        key: str,
+        destination: PipelineStorage,
+        destination_key: str | None = None,
+    ) -> None:
+        """Copy a file to another file storage as a hard link, or as a full copy if it cannot be linked.
+
+        Files are only ever replaced, never written in place, so the linked copies cannot change
+        when either storage writes to the key again.
+        """
+        if type(destination) is not FilePipelineStorage:
+            await super().copy(key, destination, destination_key)
+            return
+        source_path = join_path(self._root_dir, key)
+        file_path = join_path(destination._root_dir, destination_key or key)  # noqa: SLF001
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = _temp_path(file_path)
+        try:
+            os.link(source_path, temp_path)
+        except OSError:
+            # another device, or a file system without hard links
+            await asyncio.to_thread(shutil.copyfile, source_path, temp_path)
+        temp_path.replace(file_path)
+        destination._record_table_version(  # noqa: SLF001
+            destination_key or key, self.table_version(key)
+        )
 
     async def has(self, key: str) -> bool:
         """Has method definition."""
@@ -132,6 +184,7 @@ class FilePipelineStorage(PipelineStorage):
         """Delete method definition."""
         if await self.has(key):
             await remove(join_path(self._root_dir, key))
+        self._record_table_version(key, None)
 
     async def clear(self) -> None:
         """Clear method definition."""
@@ -140,6 +193,7 @@ class FilePipelineStorage(PipelineStorage):
                 shutil.rmtree(file)
             else:
                 file.unlink()
+        self.__dict__.pop("_table_versions", None)
 
     def child(self, name: str | None) -> "PipelineStorage":
         """Create a child storage instance."""
@@ -166,6 +220,17 @@ def join_path(file_path: str, file_name: str) -> Path:
     return Path(file_path) / Path(file_name).parent / Path(file_name).name
 
 
+def _temp_path(file_path: Path) -> Path:
+    return file_path.with_name(f".{file_path.name}.{uuid4().hex}.tmp")
+
+
+def _write_parquet(table: pd.DataFrame, file_path: Path) -> str:
+    with file_path.open("wb") as file:
+        writer = HashingWriter(file)
+        table.to_parquet(cast("Any", writer))
+    return writer.hexdigest()
+
+
 def create_file_storage(**kwargs: Any) -> PipelineStorage:
     """Create a file based storage."""
     base_dir = kwargs["base_dir"]
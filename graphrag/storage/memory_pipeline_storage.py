@@ -3,12 +3,12 @@
 
 """A module containing 'InMemoryStorage' model."""
 
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
-from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+import pandas as pd
 
-if TYPE_CHECKING:
-    from graphrag.storage.pipeline_storage import PipelineStorage
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+from graphrag.storage.pipeline_storage import PipelineStorage
 
 
 class MemoryPipelineStorage(FilePipelineStorage):
@@ -44,6 +44,30 @@ class MemoryPipelineStorage(FilePipelineStorage):
             - value - The value to set.
         """
         self._storage[key] = value
+        self._record_table_version(key, None)
+
+    def table_source(self, key: str) -> None:
+        """Tables are held as bytes, so there is no file to read them from in parts."""
+        return
+
+    async def set_table(self, key: str, table: pd.DataFrame) -> str:
+        """Write a DataFrame to the given key as parquet bytes."""
+        return await PipelineStorage.set_table(self, key, table)
+
+    async def copy(
+        self,
+        key: str,
+        destination: PipelineStorage,
+        destination_key: str | None = None,
+    ) -> None:
+        """Copy a value to another storage, by reference if the destination is also held in memory."""
+        if isinstance(destination, MemoryPipelineStorage):
+            destination._storage[destination_key or key] = self._storage[key]  # noqa: SLF001
+            destination._record_table_version(  # noqa: SLF001
+                destination_key or key, self.table_version(key)
+            )
+            return
+        await PipelineStorage.copy(self, key, destination, destination_key)
 
     async def has(self, key: str) -> bool:
         """Return True if the given key exists in the storage.
@@ -64,12 +88,14 @@ class MemoryPipelineStorage(FilePipelineStorage):
             - key - The key to delete.
         """
         del self._storage[key]
+        self._record_table_version(key, None)
 
     async def clear(self) -> None:
         """Clear the storage."""
         self._storage.clear()
+        self.__dict__.pop("_table_versions", None)
 
-    def child(self, name: str | None) -> "PipelineStorage":
+    def child(self, name: str | None) -> PipelineStorage:
         """Create a child storage instance."""
         return MemoryPipelineStorage()
 
@@ -3,11 +3,15 @@
 
 """A module containing 'PipelineStorage' model."""
 
+import hashlib
+import io
 import re
 from abc import ABCMeta, abstractmethod
 from collections.abc import Iterator
 from datetime import datetime
-from typing import Any
+from typing import IO, Any, cast
+
+import pandas as pd
 
 from graphrag.logger.base import ProgressLogger
 
@@ -94,6 +98,113 @@ class PipelineStorage(metaclass=ABCMeta):
             - output - The creation date for the given key.
         """
 
+    def table_source(self, key: str) -> "str | IO[bytes] | None":
+        """Get a local path or a seekable binary stream from which a parquet file can be read in parts.
+
+        Returning None (the default) means the storage can only return the whole value through `get`.
+
+        Args:
+            - key - The key of the parquet file.
+
+        Returns
+        -------
+            - output - A path or stream readable by pyarrow, or None.
+        """
+        return None
+
+    async def set_table(self, key: str, table: pd.DataFrame) -> str:
+        """Write a DataFrame to the given key as parquet.
+
+        The default serializes the table in memory and stores the bytes with `set`.
+
+        Args:
+            - key - The key to write the parquet file to.
+            - table - The table to write.
+
+        Returns
+        -------
+            - output - The sha256 hex digest of the written parquet file, also returned by `table_version`.
+        """
+        value = table.to_parquet()
+        await self.set(key, value)
+        version = hashlib.sha256(value).hexdigest()
+        self._record_table_version(key, version)
+        return version
+
+    def table_version(self, key: str) -> str | None:
+        """Get the content hash of the parquet file this instance last wrote to the key with `set_table`.
+
+        Returns None if the key was not written with `set_table` by this instance, or was written
+        or deleted through it since, in which case the caller has to hash the stored bytes itself.
+
+        Args:
+            - key - The key of the parquet file.
+        """
+        return self.__dict__.get("_table_versions", {}).get(key)
+
+    def _record_table_version(self, key: str, version: str | None) -> None:
+        # storages do not share an __init__, so the versions are created on first use
+        versions = self.__dict__.setdefault("_table_versions", {})
+        if version is None:
+            versions.pop(key, None)
+        else:
+            versions[key] = version
+
+    async def copy(
+        self,
+        key: str,
+        destination: "PipelineStorage",
+        destination_key: str | None = None,
+    ) -> None:
+        """Copy the value of a key to another storage.
+
+        The default reads the value as bytes and writes it to the destination with `set`. Storages
+        override this to copy without passing the data through the process when they can.
+
+        Args:
+            - key - The key to copy.
+            - destination - The storage to copy the value to.
+            - destination_key - The key to copy the value to, the same key by default.
+        """
+        value = await self.get(key, as_bytes=True)
+        await destination.set(destination_key or key, value)
+
+
+class HashingWriter(io.RawIOBase):
+    """A writable stream that hashes the bytes written through it, and optionally passes them on to another stream."""
+
+    def __init__(self, target: IO[bytes] | None = None):
+        self._target = target
+        self._hash = hashlib.sha256()
+        self._size = 0
+
+    def writable(self) -> bool:
+        """Return True, the stream is writable."""
+        return True
+
+    def tell(self) -> int:
+        """Return the number of bytes written so far."""
+        return self._size
+
+    def write(self, buffer: Any) -> int:
+        """Hash a buffer and write it to the target stream."""
+        self._hash.update(buffer)
+        self._size += len(buffer)
+        if self._target is not None:
+            self._target.write(buffer)
+        return len(buffer)
+
+    def hexdigest(self) -> str:
+        """Return the sha256 hex digest of the bytes written so far."""
+        return self._hash.hexdigest()
+
+
+def table_content_hash(table: pd.DataFrame) -> str:
+    """Hash the parquet serialization of a table without keeping the serialized bytes."""
+    writer = HashingWriter()
+    table.to_parquet(cast("Any", writer))
+    return writer.hexdigest()
+
 
 def get_timestamp_formatted_with_local_tz(timestamp: datetime) -> str:
     """Get the formatted timestamp with the local time zone."""
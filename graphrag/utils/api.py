@@ -39,6 +39,11 @@ class MultiVectorStore(BaseVectorStore):
         msg = "connect method not implemented"
         raise NotImplementedError(msg)
 
+    def delete(self, ids: list[str]) -> None:
+        """Delete documents from the vector store."""
+        msg = "delete method not implemented"
+        raise NotImplementedError(msg)
+
     def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
         """Build a query filter to filter documents by id."""
         msg = "filter_by_id method not implemented"
@@ -57,6 +62,26 @@ class MultiVectorStore(BaseVectorStore):
             message = f"Index {search_index_name} not found."
             raise ValueError(message)
 
+    def search_by_ids(self, ids: list[str]) -> list[VectorStoreDocument]:
+        """Search for documents by ids, in bulk from each index."""
+        positions: dict[str, list[int]] = {}
+        for position, id in enumerate(ids):
+            positions.setdefault(id.split("-")[1], []).append(position)
+        documents: list[VectorStoreDocument] = [None] * len(ids)  # type: ignore
+        for search_index_name, index_positions in positions.items():
+            if search_index_name not in self.index_names:
+                message = f"Index {search_index_name} not found."
+                raise ValueError(message)
+            embedding_store = self.embedding_stores[
+                self.index_names.index(search_index_name)
+            ]
+            found = embedding_store.search_by_ids([
+                ids[position].split("-")[0] for position in index_positions
+            ])
+            for position, document in zip(index_positions, found, strict=True):
+                documents[position] = document
+        return documents
+
     def similarity_search_by_vector(
         self, query_embedding: list[float], k: int = 10, **kwargs: Any
     ) -> list[VectorStoreSearchResult]:
@@ -3,39 +3,89 @@
 
 """Storage functions for the GraphRAG run module."""
 
+import asyncio
 import logging
-from io import BytesIO
+from typing import Any
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
+from graphrag.index.table_cache import TableCache
 from graphrag.storage.pipeline_storage import PipelineStorage
 
 log = logging.getLogger(__name__)
 
+TableFilters = list[tuple[str, str, Any]]
+"""Row filters in the pyarrow DNF format, e.g. `[("level", "<=", 2)]`."""
 
-async def load_table_from_storage(name: str, storage: PipelineStorage) -> pd.DataFrame:
-    """Load a parquet from the storage instance."""
+
+async def load_table_from_storage(
+    name: str,
+    storage: PipelineStorage,
+    columns: list[str] | None = None,
+    filters: TableFilters | None = None,
+    table_cache: TableCache | None = None,
+) -> pd.DataFrame:
+    """Load a parquet from the storage instance.
+
+    Only the given columns are decoded, and row groups that cannot match the filters are skipped.
+    Local files are memory-mapped and streaming storages fetch only the byte ranges needed.
+    If a table cache is given, unfiltered loads are served from and added to it.
+    """
+    if table_cache is not None and filters is None:
+        cached = table_cache.get(storage, name, columns)
+        if cached is not None:
+            log.info("reading table from cache: %s", name)
+            return cached
     filename = f"{name}.parquet"
     if not await storage.has(filename):
         msg = f"Could not find {filename} in storage!"
         raise ValueError(msg)
     try:
         log.info("reading table from storage: %s", filename)
-        return pd.read_parquet(BytesIO(await storage.get(filename, as_bytes=True)))
+        source = storage.table_source(filename)
+        if source is None:
+            source = pa.BufferReader(await storage.get(filename, as_bytes=True))
+        table = await asyncio.to_thread(
+            pq.read_table,
+            source,
+            columns=columns,
+            filters=filters,
+            memory_map=True,
+        )
+        arrow_dtypes = table_cache is not None and table_cache.arrow_dtypes
+        output = table.to_pandas(types_mapper=pd.ArrowDtype if arrow_dtypes else None)
     except Exception:
         log.exception("error loading table from storage: %s", filename)
         raise
+    if table_cache is not None and columns is None and filters is None:
+        table_cache.put(storage, name, output, converted=True)
+    return output
 
 
 async def write_table_to_storage(
-    table: pd.DataFrame, name: str, storage: PipelineStorage
-) -> None:
-    """Write a table to storage."""
-    await storage.set(f"{name}.parquet", table.to_parquet())
+    table: pd.DataFrame,
+    name: str,
+    storage: PipelineStorage,
+    table_cache: TableCache | None = None,
+) -> str:
+    """Write a table to storage, and through to the table cache if one is given.
 
+    Returns the content hash of the written parquet file.
+    """
+    version = await storage.set_table(f"{name}.parquet", table)
+    if table_cache is not None:
+        table_cache.put(storage, name, table)
+    return version
 
-async def delete_table_from_storage(name: str, storage: PipelineStorage) -> None:
+
+async def delete_table_from_storage(
+    name: str, storage: PipelineStorage, table_cache: TableCache | None = None
+) -> None:
     """Delete a table to storage."""
+    if table_cache is not None:
+        table_cache.invalidate(storage, name)
     await storage.delete(f"{name}.parquet")
 
 
@@ -27,6 +27,7 @@ from azure.search.documents.models import VectorizedQuery
 from graphrag.model.types import TextEmbedder
 from graphrag.vector_stores.base import (
     DEFAULT_VECTOR_SIZE,
+    ID_BATCH_SIZE,
     BaseVectorStore,
     VectorStoreDocument,
     VectorStoreSearchResult,
@@ -141,6 +142,21 @@ class AzureAISearchVectorStore(BaseVectorStore):
         if len(batch) > 0:
             self.db_connection.upload_documents(batch)
 
+    def upsert(self, documents: list[VectorStoreDocument]) -> None:
+        """Upload documents to an Azure AI Search index, replacing the documents with the same ids."""
+        # uploads replace the documents with the same key, so only a missing index needs to be created
+        self.load_documents(
+            documents,
+            overwrite=self.collection_name not in self.index_client.list_index_names(),
+        )
+
+    def delete(self, ids: list[str]) -> None:
+        """Delete the documents with the given ids from an Azure AI Search index."""
+        for start in range(0, len(ids), ID_BATCH_SIZE):
+            self.db_connection.delete_documents([
+                {"id": id} for id in ids[start : start + ID_BATCH_SIZE]
+            ])
+
     def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
         """Build a query filter to filter documents by a list of ids."""
         if include_ids is None or len(include_ids) == 0:
@@ -204,3 +220,25 @@ class AzureAISearchVectorStore(BaseVectorStore):
             vector=response.get("vector", []),
             attributes=(json.loads(response.get("attributes", "{}"))),
         )
+
+    def search_by_ids(self, ids: list[str]) -> list[VectorStoreDocument]:
+        """Search for documents by ids, filtering on a batch of ids per request."""
+        found = {}
+        for start in range(0, len(ids), ID_BATCH_SIZE):
+            batch = set(ids[start : start + ID_BATCH_SIZE])
+            response = self.db_connection.search(
+                search_text="*",
+                filter=f"search.in(id, '{','.join(batch)}', ',')",
+                top=len(batch),
+            )
+            for doc in response:
+                found[doc["id"]] = VectorStoreDocument(
+                    id=doc.get("id", ""),
+                    text=doc.get("text", ""),
+                    vector=doc.get("vector", []),
+                    attributes=(json.loads(doc.get("attributes", "{}"))),
+                )
+        return [
+            found.get(id) or VectorStoreDocument(id=id, text=None, vector=None)
+            for id in ids
+        ]
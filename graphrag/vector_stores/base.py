@@ -7,10 +7,15 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+
 from graphrag.model.types import TextEmbedder
 
 DEFAULT_VECTOR_SIZE: int = 1536
 
+ID_BATCH_SIZE: int = 1000
+"""The number of ids looked up per request when searching for documents by ids."""
+
 
 @dataclass
 class VectorStoreDocument:
@@ -64,6 +69,18 @@ class BaseVectorStore(ABC):
     ) -> None:
         """Load documents into the vector-store."""
 
+    def upsert(self, documents: list[VectorStoreDocument]) -> None:
+        """Insert documents into the vector-store, replacing the documents with the same ids.
+
+        Vector stores override this to replace the documents in place rather than deleting them first.
+        """
+        self.delete([document.id for document in documents])
+        self.load_documents(documents, overwrite=False)
+
+    @abstractmethod
+    def delete(self, ids: list[str]) -> None:
+        """Delete the documents with the given ids from the vector-store, ignoring the ids not found."""
+
     @abstractmethod
     def similarity_search_by_vector(
         self, query_embedding: list[float], k: int = 10, **kwargs: Any
@@ -83,3 +100,23 @@ class BaseVectorStore(ABC):
     @abstractmethod
     def search_by_id(self, id: str) -> VectorStoreDocument:
         """Search for a document by id."""
+
+    def search_by_ids(self, ids: list[str]) -> list[VectorStoreDocument]:
+        """Search for documents by ids, in the order of the ids, without a vector for the ids not found.
+
+        Vector stores override this to look the documents up in bulk rather than one id at a time.
+        """
+        return [self.search_by_id(id) for id in ids]
+
+    def get_by_ids(self, ids: list[str]) -> np.ndarray:
+        """Get the vectors of documents by ids, as a float32 matrix with a row per id.
+
+        The rows of the ids without a vector are NaN.
+        """
+        vectors = [document.vector for document in self.search_by_ids(ids)]
+        size = next((len(vector) for vector in vectors if vector), 0)
+        matrix = np.full((len(ids), size), np.nan, dtype=np.float32)
+        for row, vector in enumerate(vectors):
+            if vector:
+                matrix[row] = vector
+        return matrix
@@ -7,12 +7,14 @@ import json
 from typing import Any
 
 from azure.cosmos import ContainerProxy, CosmosClient, DatabaseProxy
+from azure.cosmos.exceptions import CosmosResourceNotFoundError
 from azure.cosmos.partition_key import PartitionKey
 from azure.identity import DefaultAzureCredential
 
 from graphrag.model.types import TextEmbedder
 from graphrag.vector_stores.base import (
     DEFAULT_VECTOR_SIZE,
+    ID_BATCH_SIZE,
     BaseVectorStore,
     VectorStoreDocument,
     VectorStoreSearchResult,
@@ -149,6 +151,23 @@ class CosmosDBVectoreStore(BaseVectorStore):
                 }
                 self._container_client.upsert_item(doc_json)
 
+    def upsert(self, documents: list[VectorStoreDocument]) -> None:
+        """Upsert documents into CosmosDB."""
+        # documents are always upserted, and the container is created on connect
+        self.load_documents(documents, overwrite=False)
+
+    def delete(self, ids: list[str]) -> None:
+        """Delete the documents with the given ids from CosmosDB."""
+        if self._container_client is None:
+            msg = "Container client is not initialized."
+            raise ValueError(msg)
+
+        for id in ids:
+            try:
+                self._container_client.delete_item(item=id, partition_key=id)
+            except CosmosResourceNotFoundError:
+                continue
+
     def similarity_search_by_vector(
         self, query_embedding: list[float], k: int = 10, **kwargs: Any
     ) -> list[VectorStoreSearchResult]:
@@ -214,3 +233,30 @@ class CosmosDBVectoreStore(BaseVectorStore):
             text=item.get("text", ""),
             attributes=(json.loads(item.get("attributes", "{}"))),
         )
+
+    def search_by_ids(self, ids: list[str]) -> list[VectorStoreDocument]:
+        """Search for documents by ids, querying a batch of ids per request."""
+        if self._container_client is None:
+            msg = "Container client is not initialized."
+            raise ValueError(msg)
+
+        found = {}
+        for start in range(0, len(ids), ID_BATCH_SIZE):
+            items = self._container_client.query_items(
+                query="SELECT c.id, c.text, c.vector, c.attributes FROM c WHERE ARRAY_CONTAINS(@ids, c.id)",
+                parameters=[
+                    {"name": "@ids", "value": ids[start : start + ID_BATCH_SIZE]}
+                ],
+                enable_cross_partition_query=True,
+            )
+            for item in items:
+                found[item["id"]] = VectorStoreDocument(
+                    id=item.get("id", ""),
+                    vector=item.get("vector", []),
+                    text=item.get("text", ""),
+                    attributes=(json.loads(item.get("attributes", "{}"))),
+                )
+        return [
+            found.get(id) or VectorStoreDocument(id=id, text=None, vector=None)
+            for id in ids
+        ]
@@ -7,10 +7,12 @@ import json  # noqa: I001
 from typing import Any
 
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from graphrag.model.types import TextEmbedder
 
 from graphrag.vector_stores.base import (
+    ID_BATCH_SIZE,
     BaseVectorStore,
     VectorStoreDocument,
     VectorStoreSearchResult,
@@ -79,6 +81,44 @@ class LanceDBVectorStore(BaseVectorStore):
             if data:
                 self.document_collection.add(data)
 
+    def upsert(self, documents: list[VectorStoreDocument]) -> None:
+        """Insert documents into vector storage, replacing the documents with the same ids."""
+        if (
+            self.document_collection is None
+            and self.collection_name not in self.db_connection.table_names()
+        ):
+            self.load_documents(documents, overwrite=True)
+            return
+
+        data = [
+            {
+                "id": document.id,
+                "text": document.text,
+                "vector": document.vector,
+                "attributes": json.dumps(document.attributes),
+            }
+            for document in documents
+            if document.vector is not None
+        ]
+        self.document_collection = self.db_connection.open_table(self.collection_name)
+        if data:
+            (
+                self.document_collection.merge_insert("id")
+                .when_matched_update_all()
+                .when_not_matched_insert_all()
+                .execute(data)
+            )
+
+    def delete(self, ids: list[str]) -> None:
+        """Delete the documents with the given ids from vector storage."""
+        if self.document_collection is None:
+            return
+        for start in range(0, len(ids), ID_BATCH_SIZE):
+            id_filter = ", ".join([
+                f"'{id}'" for id in ids[start : start + ID_BATCH_SIZE]
+            ])
+            self.document_collection.delete(f"id in ({id_filter})")
+
     def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
         """Build a query filter to filter documents by id."""
         if len(include_ids) == 0:
@@ -151,3 +191,42 @@ class LanceDBVectorStore(BaseVectorStore):
                 attributes=json.loads(doc[0]["attributes"]),
             )
         return VectorStoreDocument(id=id, text=None, vector=None)
+
+    def search_by_ids(self, ids: list[str]) -> list[VectorStoreDocument]:
+        """Search for documents by ids.
+
+        A few ids are looked up with a filtered query. More than a batch of ids, as when an update
+        run diffs every row against the store, would take an unindexed scan per batch, so the table
+        is read once instead and its rows are matched in memory.
+        """
+        if self.document_collection is None:
+            return [VectorStoreDocument(id=id, text=None, vector=None) for id in ids]
+        if len(ids) <= ID_BATCH_SIZE:
+            id_filter = ", ".join([f"'{id}'" for id in set(ids)])
+            docs = (
+                self.document_collection.search()
+                .where(f"id in ({id_filter})", prefilter=True)
+                .limit(len(ids))
+                .to_list()
+            )
+        else:
+            value_set = pa.array(set(ids), type=pa.string())
+            docs = []
+            for batch in self.document_collection.to_lance().to_batches(
+                columns=["id", "text", "vector", "attributes"]
+            ):
+                matches = batch.filter(pc.is_in(batch.column("id"), value_set))
+                docs.extend(matches.to_pylist())
+        found = {
+            doc["id"]: VectorStoreDocument(
+                id=doc["id"],
+                text=doc["text"],
+                vector=doc["vector"],
+                attributes=json.loads(doc["attributes"]),
+            )
+            for doc in docs
+        }
+        return [
+            found.get(id) or VectorStoreDocument(id=id, text=None, vector=None)
+            for id in ids
+        ]
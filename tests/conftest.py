@@ -1,8 +1,31 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
+import pytest
+
 
 def pytest_addoption(parser):
     parser.addoption(
         "--run_slow", action="store_true", default=False, help="run slow tests"
     )
+    parser.addoption(
+        "--run_benchmarks",
+        action="store_true",
+        default=False,
+        help="run the timing assertions of benchmark tests",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: timing test, skipped unless --run_benchmarks is given"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("run_benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="benchmark, use --run_benchmarks to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
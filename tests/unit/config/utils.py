@@ -5,6 +5,7 @@ from pydantic import BaseModel
 
 import graphrag.config.defaults as defs
 from graphrag.config.models.basic_search_config import BasicSearchConfig
+from graphrag.config.models.batch_config import BatchConfig
 from graphrag.config.models.cache_config import CacheConfig
 from graphrag.config.models.chunking_config import ChunkingConfig
 from graphrag.config.models.cluster_graph_config import ClusterGraphConfig
@@ -20,10 +21,12 @@ from graphrag.config.models.language_model_config import LanguageModelConfig
 from graphrag.config.models.local_search_config import LocalSearchConfig
 from graphrag.config.models.output_config import OutputConfig
 from graphrag.config.models.reporting_config import ReportingConfig
+from graphrag.config.models.scheduler_config import SchedulerConfig
 from graphrag.config.models.snapshots_config import SnapshotsConfig
 from graphrag.config.models.summarize_descriptions_config import (
     SummarizeDescriptionsConfig,
 )
+from graphrag.config.models.table_cache_config import TableCacheConfig
 from graphrag.config.models.text_embedding_config import TextEmbeddingConfig
 from graphrag.config.models.umap_config import UmapConfig
 from graphrag.config.models.vector_store_config import VectorStoreConfig
@@ -129,11 +132,31 @@ DEFAULT_GRAPHRAG_CONFIG_SETTINGS = {
         "encoding_model": defs.ENCODING_MODEL,
         "prepend_metadata": False,
         "chunk_size_includes_metadata": False,
+        "num_threads": defs.CHUNK_NUM_THREADS,
     },
     "snapshots": {
         "embeddings": defs.SNAPSHOTS_EMBEDDINGS,
         "graphml": defs.SNAPSHOTS_GRAPHML,
     },
+    "scheduler": {
+        "max_concurrent_workflows": defs.SCHEDULER_MAX_CONCURRENT_WORKFLOWS,
+        "concurrent_requests": defs.SCHEDULER_CONCURRENT_REQUESTS,
+    },
+    "table_cache": {
+        "max_size_mb": defs.TABLE_CACHE_MAX_SIZE_MB,
+        "arrow_dtypes": defs.TABLE_CACHE_ARROW_DTYPES,
+    },
+    "batch": {
+        "enabled": defs.BATCH_ENABLED,
+        "type": defs.BATCH_TYPE,
+        "base_dir": defs.BATCH_BASE_DIR,
+        "operations": defs.BATCH_OPERATIONS,
+        "max_batch_size": defs.BATCH_MAX_SIZE,
+        "max_wait": defs.BATCH_MAX_WAIT,
+        "poll_interval": defs.BATCH_POLL_INTERVAL,
+        "completion_window": defs.BATCH_COMPLETION_WINDOW,
+        "concurrent_requests": defs.BATCH_CONCURRENT_REQUESTS,
+    },
     "extract_graph": {
         "prompt": None,
         "entity_types": defs.EXTRACT_GRAPH_ENTITY_TYPES,
@@ -145,6 +168,7 @@ DEFAULT_GRAPHRAG_CONFIG_SETTINGS = {
     "summarize_descriptions": {
         "prompt": None,
         "max_length": defs.SUMMARIZE_DESCRIPTIONS_MAX_LENGTH,
+        "tree_reduce": defs.SUMMARIZE_DESCRIPTIONS_TREE_REDUCE,
         "strategy": None,
         "model_id": defs.SUMMARIZE_MODEL_ID,
     },
@@ -195,6 +219,10 @@ DEFAULT_GRAPHRAG_CONFIG_SETTINGS = {
         "map_max_tokens": defs.GLOBAL_SEARCH_MAP_MAX_TOKENS,
         "reduce_max_tokens": defs.GLOBAL_SEARCH_REDUCE_MAX_TOKENS,
         "concurrency": defs.GLOBAL_SEARCH_CONCURRENCY,
+        "persist_context": defs.GLOBAL_SEARCH_PERSIST_CONTEXT,
+        "early_reduce_fraction": defs.GLOBAL_SEARCH_EARLY_REDUCE_FRACTION,
+        "early_reduce_score": defs.GLOBAL_SEARCH_EARLY_REDUCE_SCORE,
+        "map_deadline": defs.GLOBAL_SEARCH_MAP_DEADLINE,
         "dynamic_search_llm": defs.DYNAMIC_SEARCH_LLM_MODEL,
         "dynamic_search_threshold": defs.DYNAMIC_SEARCH_RATE_THRESHOLD,
         "dynamic_search_keep_parent": defs.DYNAMIC_SEARCH_KEEP_PARENT,
@@ -202,6 +230,9 @@ DEFAULT_GRAPHRAG_CONFIG_SETTINGS = {
         "dynamic_search_use_summary": defs.DYNAMIC_SEARCH_USE_SUMMARY,
         "dynamic_search_concurrent_coroutines": defs.DYNAMIC_SEARCH_CONCURRENT_COROUTINES,
         "dynamic_search_max_level": defs.DYNAMIC_SEARCH_MAX_LEVEL,
+        "dynamic_search_rating_cache_size": defs.DYNAMIC_SEARCH_RATING_CACHE_SIZE,
+        "dynamic_search_rating_cache_ttl": defs.DYNAMIC_SEARCH_RATING_CACHE_TTL,
+        "dynamic_search_embedding_threshold": defs.DYNAMIC_SEARCH_EMBEDDING_THRESHOLD,
     },
     "drift_search": {
         "prompt": None,
@@ -211,6 +242,8 @@ DEFAULT_GRAPHRAG_CONFIG_SETTINGS = {
         "max_tokens": defs.DRIFT_SEARCH_MAX_TOKENS,
         "data_max_tokens": defs.DRIFT_SEARCH_DATA_MAX_TOKENS,
         "concurrency": defs.DRIFT_SEARCH_CONCURRENCY,
+        "query_concurrency": defs.DRIFT_SEARCH_QUERY_CONCURRENCY,
+        "tokens_per_minute": defs.DRIFT_SEARCH_TOKENS_PER_MINUTE,
         "drift_k_followups": defs.DRIFT_SEARCH_K_FOLLOW_UPS,
         "primer_folds": defs.DRIFT_SEARCH_PRIMER_FOLDS,
         "primer_llm_max_tokens": defs.DRIFT_SEARCH_PRIMER_MAX_TOKENS,
@@ -269,6 +302,8 @@ def assert_language_model_configs(
     assert actual.model_supports_json == expected.model_supports_json
     assert actual.tokens_per_minute == expected.tokens_per_minute
     assert actual.requests_per_minute == expected.requests_per_minute
+    assert actual.shared_rate_limits == expected.shared_rate_limits
+    assert actual.rate_limit_key == expected.rate_limit_key
     assert actual.max_retries == expected.max_retries
     assert actual.max_retry_wait == expected.max_retry_wait
     assert actual.concurrent_requests == expected.concurrent_requests
@@ -386,6 +421,7 @@ def assert_chunking_configs(actual: ChunkingConfig, expected: ChunkingConfig) ->
     assert actual.group_by_columns == expected.group_by_columns
     assert actual.strategy == expected.strategy
     assert actual.encoding_model == expected.encoding_model
+    assert actual.num_threads == expected.num_threads
 
 
 def assert_snapshots_configs(
@@ -395,6 +431,32 @@ def assert_snapshots_configs(
     assert actual.graphml == expected.graphml
 
 
+def assert_scheduler_configs(
+    actual: SchedulerConfig, expected: SchedulerConfig
+) -> None:
+    assert actual.max_concurrent_workflows == expected.max_concurrent_workflows
+    assert actual.concurrent_requests == expected.concurrent_requests
+
+
+def assert_table_cache_configs(
+    actual: TableCacheConfig, expected: TableCacheConfig
+) -> None:
+    assert actual.max_size_mb == expected.max_size_mb
+    assert actual.arrow_dtypes == expected.arrow_dtypes
+
+
+def assert_batch_configs(actual: BatchConfig, expected: BatchConfig) -> None:
+    assert actual.enabled == expected.enabled
+    assert actual.type == expected.type
+    assert actual.base_dir == expected.base_dir
+    assert actual.operations == expected.operations
+    assert actual.max_batch_size == expected.max_batch_size
+    assert actual.max_wait == expected.max_wait
+    assert actual.poll_interval == expected.poll_interval
+    assert actual.completion_window == expected.completion_window
+    assert actual.concurrent_requests == expected.concurrent_requests
+
+
 def assert_extract_graph_configs(
     actual: ExtractGraphConfig, expected: ExtractGraphConfig
 ) -> None:
@@ -411,6 +473,7 @@ def assert_summarize_descriptions_configs(
 ) -> None:
     assert actual.prompt == expected.prompt
     assert actual.max_length == expected.max_length
+    assert actual.tree_reduce == expected.tree_reduce
     assert actual.strategy == expected.strategy
     assert actual.model_id == expected.model_id
 
@@ -482,6 +545,10 @@ def assert_global_search_configs(
     assert actual.map_max_tokens == expected.map_max_tokens
     assert actual.reduce_max_tokens == expected.reduce_max_tokens
     assert actual.concurrency == expected.concurrency
+    assert actual.persist_context == expected.persist_context
+    assert actual.early_reduce_fraction == expected.early_reduce_fraction
+    assert actual.early_reduce_score == expected.early_reduce_score
+    assert actual.map_deadline == expected.map_deadline
     assert actual.dynamic_search_llm == expected.dynamic_search_llm
     assert actual.dynamic_search_threshold == expected.dynamic_search_threshold
     assert actual.dynamic_search_keep_parent == expected.dynamic_search_keep_parent
@@ -492,6 +559,18 @@ def assert_global_search_configs(
         == expected.dynamic_search_concurrent_coroutines
     )
     assert actual.dynamic_search_max_level == expected.dynamic_search_max_level
+    assert (
+        actual.dynamic_search_rating_cache_size
+        == expected.dynamic_search_rating_cache_size
+    )
+    assert (
+        actual.dynamic_search_rating_cache_ttl
+        == expected.dynamic_search_rating_cache_ttl
+    )
+    assert (
+        actual.dynamic_search_embedding_threshold
+        == expected.dynamic_search_embedding_threshold
+    )
 
 
 def assert_drift_search_configs(
@@ -504,6 +583,8 @@ def assert_drift_search_configs(
     assert actual.max_tokens == expected.max_tokens
     assert actual.data_max_tokens == expected.data_max_tokens
     assert actual.concurrency == expected.concurrency
+    assert actual.query_concurrency == expected.query_concurrency
+    assert actual.tokens_per_minute == expected.tokens_per_minute
     assert actual.drift_k_followups == expected.drift_k_followups
     assert actual.primer_folds == expected.primer_folds
     assert actual.primer_llm_max_tokens == expected.primer_llm_max_tokens
@@ -571,6 +652,9 @@ def assert_graphrag_configs(actual: GraphRagConfig, expected: GraphRagConfig) ->
     assert_text_embedding_configs(actual.embed_text, expected.embed_text)
     assert_chunking_configs(actual.chunks, expected.chunks)
     assert_snapshots_configs(actual.snapshots, expected.snapshots)
+    assert_scheduler_configs(actual.scheduler, expected.scheduler)
+    assert_table_cache_configs(actual.table_cache, expected.table_cache)
+    assert_batch_configs(actual.batch, expected.batch)
     assert_extract_graph_configs(actual.extract_graph, expected.extract_graph)
     assert_summarize_descriptions_configs(
         actual.summarize_descriptions, expected.summarize_descriptions
@@ -0,0 +1,193 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+import json
+from collections.abc import Callable
+from contextlib import suppress
+from pathlib import Path
+
+import pytest
+
+from graphrag.cache.json_pipeline_cache import JsonPipelineCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.config.models.batch_config import BatchConfig
+from graphrag.index.llm.batch import BatchChatClient, BatchError, FileBatchClient
+from graphrag.index.llm.manager import ChatLLMSingleton
+from graphrag.index.operations.extract_graph.graph_intelligence_strategy import (
+    run_graph_intelligence,
+)
+from graphrag.index.operations.extract_graph.typing import Document
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+from tests.unit.config.utils import DEFAULT_CHAT_MODEL_CONFIG
+
+
+class FileBatchServer:
+    """A local stand-in for a batch service, answering the jobs written to a directory."""
+
+    def __init__(self, base_dir: Path, respond: Callable[[dict], str | None]):
+        self.base_dir = base_dir
+        self.respond = respond
+        self.jobs: list[list[dict]] = []
+
+    async def run(self) -> None:
+        while True:
+            for input_path in sorted(self.base_dir.glob("*.input.jsonl")):
+                batch_id = input_path.name.removesuffix(".input.jsonl")
+                output_path = self.base_dir / f"{batch_id}.output.jsonl"
+                if output_path.exists():
+                    continue
+                requests = [
+                    json.loads(line) for line in input_path.read_text().splitlines()
+                ]
+                self.jobs.append(requests)
+                output_path.write_text(
+                    "\n".join(json.dumps(self._answer(r)) for r in requests)
+                )
+            await asyncio.sleep(0.01)
+
+    def _answer(self, request: dict) -> dict:
+        content = self.respond(request["body"])
+        if content is None:
+            return {
+                "custom_id": request["custom_id"],
+                "response": None,
+                "error": {"code": "invalid_request", "message": "bad request"},
+            }
+        return {
+            "custom_id": request["custom_id"],
+            "response": {
+                "status_code": 200,
+                "body": {
+                    "id": request["custom_id"],
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": request["body"]["model"],
+                    "choices": [
+                        {
+                            "index": 0,
+                            "finish_reason": "stop",
+                            "message": {"role": "assistant", "content": content},
+                        }
+                    ],
+                    "usage": {
+                        "prompt_tokens": 1,
+                        "completion_tokens": 1,
+                        "total_tokens": 2,
+                    },
+                },
+            },
+            "error": None,
+        }
+
+
+def last_message(body: dict) -> str:
+    return body["messages"][-1]["content"]
+
+
+@pytest.fixture
+async def server(tmp_path: Path):
+    server = FileBatchServer(tmp_path, lambda body: f"echo {last_message(body)}")
+    task = asyncio.create_task(server.run())
+    yield server
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+
+
+def create_client(base_dir: Path, max_batch_size: int = 100) -> BatchChatClient:
+    return BatchChatClient(
+        FileBatchClient(str(base_dir)),
+        url="/v1/chat/completions",
+        max_batch_size=max_batch_size,
+        max_wait=0.05,
+        poll_interval=0.01,
+    )
+
+
+async def complete(client: BatchChatClient, prompt: str) -> str:
+    completion = await client.chat.completions.create(
+        messages=[{"role": "user", "content": prompt}], model="gpt-4"
+    )
+    return completion.choices[0].message.content or ""
+
+
+async def test_concurrent_requests_share_a_job(server: FileBatchServer):
+    client = create_client(server.base_dir)
+
+    results = await asyncio.gather(*[complete(client, str(i)) for i in range(10)])
+
+    assert results == [f"echo {i}" for i in range(10)]
+    assert len(server.jobs) == 1
+    assert server.jobs[0][0]["url"] == "/v1/chat/completions"
+    assert server.jobs[0][0]["body"]["model"] == "gpt-4"
+
+
+async def test_jobs_are_capped_at_max_batch_size(server: FileBatchServer):
+    client = create_client(server.base_dir, max_batch_size=4)
+
+    results = await asyncio.gather(*[complete(client, str(i)) for i in range(10)])
+
+    assert results == [f"echo {i}" for i in range(10)]
+    assert [len(job) for job in server.jobs] == [4, 4, 2]
+
+
+async def test_failed_requests_and_jobs_raise(server: FileBatchServer):
+    server.respond = lambda body: None if last_message(body) == "bad" else "ok"
+    client = create_client(server.base_dir)
+
+    results = await asyncio.gather(
+        complete(client, "good"), complete(client, "bad"), return_exceptions=True
+    )
+
+    assert results[0] == "ok"
+    assert isinstance(results[1], BatchError)
+
+    # a failed job fails every request in it
+    batch_client = FileBatchClient(str(server.base_dir / "failed"))
+    batch_id = await batch_client.submit(b"{}")
+    (server.base_dir / "failed" / f"{batch_id}.error.txt").write_text("quota")
+    with pytest.raises(BatchError, match="quota"):
+        await batch_client.poll(batch_id)
+
+
+async def test_batched_extraction_is_parsed_and_cached(
+    server: FileBatchServer, tmp_path_factory: pytest.TempPathFactory
+):
+    records = '("entity"<|>ALICE<|>PERSON<|>Alice works at Contoso)##("entity"<|>CONTOSO<|>ORGANIZATION<|>A company)##("relationship"<|>ALICE<|>CONTOSO<|>Alice works at Contoso<|>2)'
+    server.respond = lambda body: (
+        records if "Alice" in last_message(body) else "<|COMPLETE|>"
+    )
+    ChatLLMSingleton().llm_dict.clear()
+    cache = JsonPipelineCache(
+        FilePipelineStorage(str(tmp_path_factory.mktemp("cache")))
+    )
+    args = {
+        "llm": {**DEFAULT_CHAT_MODEL_CONFIG, "model": "gpt-4"},
+        "batch": BatchConfig(
+            enabled=True,
+            type="file",
+            base_dir=str(server.base_dir),
+            max_wait=0.05,
+            poll_interval=0.01,
+        ).model_dump(),
+        "max_gleanings": 1,
+    }
+    docs = [Document(text="Alice works at Contoso", id="1")]
+
+    result = await run_graph_intelligence(
+        docs, ["person", "organization"], NoopWorkflowCallbacks(), cache, args
+    )
+
+    assert sorted(result.entities["title"]) == ["ALICE", "CONTOSO"]
+    assert len(result.relationships) == 1
+    # the extraction and its gleaning are sent as two consecutive jobs
+    assert len(server.jobs) == 2
+
+    ChatLLMSingleton().llm_dict.clear()
+    cached = await run_graph_intelligence(
+        docs, ["person", "organization"], NoopWorkflowCallbacks(), cache, args
+    )
+
+    assert cached.entities.equals(result.entities)
+    assert len(server.jobs) == 2
@@ -0,0 +1,96 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+import time
+
+from fnllm.limiting import Manifest
+from fnllm.types import LLMUsageMetrics
+
+from graphrag.config.models.language_model_config import LanguageModelConfig
+from graphrag.index.llm.load_llm import GraphRagLLMEvents
+from graphrag.index.llm.rate_limits import (
+    DeploymentRateLimiter,
+    DeploymentRateLimiterSingleton,
+    TokenBucket,
+    retry_after,
+)
+
+
+async def test_bucket_waits_for_refill():
+    bucket = TokenBucket(10, per=0.5)
+    assert await bucket.acquire(10) < 0.01
+
+    waited = await bucket.acquire(5)
+
+    # half the bucket refills in a quarter of the period
+    assert 0.2 <= waited < 0.4
+
+
+async def test_bucket_debt_and_pause_delay_requests():
+    bucket = TokenBucket(10, per=0.5)
+    bucket.adjust(15)  # actual usage exceeded the reservation
+    start = time.monotonic()
+    await bucket.acquire(1)
+    assert time.monotonic() - start >= 0.25
+
+    bucket = TokenBucket(10, per=0.5)
+    bucket.pause(0.2)
+    assert await bucket.acquire(1) >= 0.15
+
+
+async def test_concurrent_acquires_respect_the_rate():
+    limiter = DeploymentRateLimiter(requests_per_minute=None, tokens_per_minute=None)
+    limiter.requests = TokenBucket(4, per=0.4)
+
+    start = time.monotonic()
+    await asyncio.gather(*[limiter.acquire(0) for _ in range(8)])
+
+    assert time.monotonic() - start >= 0.35
+    assert limiter.stats.requests == 8
+
+
+def test_models_on_the_same_deployment_share_a_limiter():
+    extraction = LanguageModelConfig(
+        type="openai_chat", api_key="key", model="gpt-4o", tokens_per_minute=90_000
+    )
+    summarization = extraction.model_copy(update={"tokens_per_minute": 30_000})
+    embedding = LanguageModelConfig(
+        type="openai_embedding", api_key="key", model="text-embedding-3-small"
+    )
+    manager = DeploymentRateLimiterSingleton()
+
+    limiter = manager.get_limiter(extraction)
+
+    assert manager.get_limiter(summarization) is limiter
+    assert limiter.tokens is not None
+    assert limiter.tokens.capacity == 30_000
+    assert manager.get_limiter(embedding) is not limiter
+
+
+async def test_events_reserve_estimate_and_record_usage():
+    limiter = DeploymentRateLimiter(requests_per_minute=100, tokens_per_minute=1_000)
+    events = GraphRagLLMEvents(lambda *_: None, limiter, output_tokens=100)
+
+    await events.on_limit_acquired(Manifest(request_tokens=400))
+    assert limiter.stats.estimated_tokens == 200
+    await events.on_usage(LLMUsageMetrics(input_tokens=80, output_tokens=20))
+
+    assert limiter.stats.actual_tokens == 100
+    assert limiter.tokens is not None
+    # the over-estimate is given back
+    assert 899 < limiter.tokens.level < 910
+
+
+class FakeRateLimitError(Exception):
+    def __init__(self, message: str, headers: dict[str, str]):
+        super().__init__(message)
+        self.response = type("Response", (), {"headers": headers})()
+
+
+def test_retry_after():
+    assert retry_after(FakeRateLimitError("", {"retry-after-ms": "1500"})) == 1.5
+    assert retry_after(FakeRateLimitError("", {"retry-after": "7"})) == 7
+    message = "Rate limit is exceeded. Try again in 12 seconds."
+    assert retry_after(FakeRateLimitError(message, {})) == 12
+    assert retry_after(ValueError("boom")) is None
@@ -53,6 +53,9 @@ class TestRunTokens:
     def test_basic_functionality(self, mock_get_encoding):
         mock_encoder = Mock()
         mock_encoder.encode.side_effect = lambda x: list(x.encode())
+        mock_encoder.encode_batch.side_effect = lambda texts, num_threads: [
+            list(x.encode()) for x in texts
+        ]
         mock_encoder.decode.side_effect = lambda x: bytes(x).decode()
         mock_get_encoding.return_value = mock_encoder
 
@@ -76,6 +79,9 @@ class TestRunTokens:
         """Test handling of non-string input (e.g., numbers)."""
         mock_encoder = Mock()
         mock_encoder.encode.side_effect = lambda x: list(str(x).encode())
+        mock_encoder.encode_batch.side_effect = lambda texts, num_threads: [
+            list(str(x).encode()) for x in texts
+        ]
         mock_encoder.decode.side_effect = lambda x: bytes(x).decode()
         mock_get_encoding.return_value = mock_encoder
 
@@ -0,0 +1,102 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from importlib import import_module
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from graphrag.cache.memory_pipeline_cache import InMemoryCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.index.operations.embed_text.embed_text import embed_text
+from graphrag.index.operations.embed_text.strategies.mock import run as run_mock
+from graphrag.vector_stores.lancedb import LanceDBVectorStore
+
+# the package exports the embed_text function under the name of its module
+embed_text_module = import_module("graphrag.index.operations.embed_text.embed_text")
+lancedb_module = import_module("graphrag.vector_stores.lancedb")
+
+
+def create_strategy(tmp_path: Path) -> dict:
+    return {
+        "type": "mock",
+        "vector_store": {"type": "lancedb", "db_uri": str(tmp_path / "lancedb")},
+    }
+
+
+async def run_embed(
+    tmp_path: Path, input: pd.DataFrame, upsert: bool, removed_ids=None
+) -> list:
+    return await embed_text(
+        input,
+        NoopWorkflowCallbacks(),
+        InMemoryCache(),
+        embed_column="text",
+        strategy=create_strategy(tmp_path),
+        embedding_name="entity.description",
+        upsert=upsert,
+        removed_ids=removed_ids,
+    )
+
+
+def open_store(tmp_path: Path) -> LanceDBVectorStore:
+    store = LanceDBVectorStore(collection_name="default-entity-description")
+    store.connect(db_uri=str(tmp_path / "lancedb"))
+    return store
+
+
+async def test_upsert_embeds_only_new_and_changed_rows(tmp_path: Path, monkeypatch):
+    previous = pd.DataFrame({"id": ["a", "b", "c"], "text": ["one", "two", "three"]})
+    first = await run_embed(tmp_path, previous, upsert=False)
+
+    embedded = []
+
+    async def counting(input, callbacks, cache, args):
+        embedded.extend(input)
+        return await run_mock(input, callbacks, cache, args)
+
+    monkeypatch.setattr(embed_text_module, "load_strategy", lambda _: counting)
+    merged = pd.DataFrame({"id": ["a", "b", "d"], "text": ["one", "TWO", "four"]})
+    result = await run_embed(tmp_path, merged, upsert=True, removed_ids=["c"])
+
+    assert sorted(embedded) == ["TWO", "four"]
+    # the unchanged row keeps its stored vector
+    assert result[0] == pytest.approx(first[0])
+    assert result[1] != pytest.approx(first[1])
+
+    store = open_store(tmp_path)
+    documents = store.search_by_ids(["a", "b", "c", "d"])
+    assert [document.text for document in documents] == ["one", "TWO", None, "four"]
+    assert documents[2].vector is None
+    for document, vector in zip([*documents[:2], documents[3]], result, strict=True):
+        assert document.vector == pytest.approx(vector)
+    assert store.document_collection.count_rows() == 3
+
+    # a second update with the same rows embeds nothing
+    embedded.clear()
+    again = await run_embed(tmp_path, merged, upsert=True)
+    assert embedded == []
+    for vector, expected in zip(again, result, strict=True):
+        assert vector == pytest.approx(expected)
+
+
+async def test_upsert_diff_reads_the_store_in_one_scan(tmp_path: Path, monkeypatch):
+    rows = pd.DataFrame({"id": ["a", "b", "c"], "text": ["one", "two", "three"]})
+    first = await run_embed(tmp_path, rows, upsert=False)
+    store = open_store(tmp_path)
+    looked_up = store.search_by_ids(["c", "x", "a"])
+
+    # more ids than a batch are matched against a single read of the table
+    monkeypatch.setattr(lancedb_module, "ID_BATCH_SIZE", 1)
+    scanned = store.search_by_ids(["c", "x", "a"])
+    assert [document.id for document in scanned] == ["c", "x", "a"]
+    assert scanned[1].vector is None
+    for document, expected in zip(scanned, looked_up, strict=True):
+        assert document.text == expected.text
+        assert document.attributes == expected.attributes
+    assert scanned[0].vector == pytest.approx(first[2])
+
+    again = await run_embed(tmp_path, rows, upsert=True)
+    for vector, expected in zip(again, first, strict=True):
+        assert vector == pytest.approx(expected)
@@ -0,0 +1,106 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pandas as pd
+
+from graphrag.index.operations.extract_graph.extract_graph import (
+    _concat_records,
+    _merge_entities,
+    _merge_relationships,
+)
+
+ENTITY_DFS = [
+    pd.DataFrame([
+        {"title": "A", "type": "person", "description": "a1", "source_id": "1"},
+        {"title": "B", "type": "geo", "description": "b1", "source_id": "1"},
+        {"title": "A", "type": "person", "description": "a1", "source_id": "1"},
+        {"title": "A", "type": "person", "description": "a3", "source_id": "1"},
+    ]),
+    pd.DataFrame(),
+    pd.DataFrame([
+        {"title": "B", "type": "geo", "description": "b2", "source_id": "3"},
+        {"title": "C", "type": "event", "description": "c1", "source_id": "3"},
+    ]),
+    pd.DataFrame([
+        {"title": "A", "type": "person", "description": "a2", "source_id": "4"},
+    ]),
+]
+
+RELATIONSHIP_DFS = [
+    pd.DataFrame([
+        {
+            "source": "A",
+            "target": "B",
+            "description": "ab1",
+            "source_id": "1",
+            "weight": 1.0,
+        },
+        {
+            "source": "A",
+            "target": "B",
+            "description": "ab3",
+            "source_id": "1",
+            "weight": 1.0,
+        },
+    ]),
+    pd.DataFrame(),
+    pd.DataFrame([
+        {
+            "source": "B",
+            "target": "C",
+            "description": "bc1",
+            "source_id": "3",
+            "weight": 2.0,
+        },
+    ]),
+    pd.DataFrame([
+        {
+            "source": "A",
+            "target": "B",
+            "description": "ab2",
+            "source_id": "4",
+            "weight": 3.0,
+        },
+    ]),
+]
+
+
+def test_merge_entities():
+    entities = _merge_entities(ENTITY_DFS)
+
+    assert entities["title"].tolist() == ["A", "B", "C"]
+    first = entities.iloc[0]
+    # the repeated record is only counted once
+    assert first["description"] == ["a1", "a3", "a2"]
+    assert first["text_unit_ids"] == ["1", "4"]
+    assert first["frequency"] == 2
+
+
+def test_merge_relationships():
+    relationships = _merge_relationships(RELATIONSHIP_DFS)
+
+    assert relationships[["source", "target"]].to_numpy().tolist() == [
+        ["A", "B"],
+        ["B", "C"],
+    ]
+    first = relationships.iloc[0]
+    assert first["description"] == ["ab1", "ab3", "ab2"]
+    assert first["text_unit_ids"] == ["1", "4"]
+    assert first["weight"] == 5.0
+
+
+def test_batched_records_match_single_merge():
+    expected = _merge_entities(ENTITY_DFS)
+    batches = [_concat_records(ENTITY_DFS[:2]), _concat_records(ENTITY_DFS[2:])]
+
+    pd.testing.assert_frame_equal(_merge_entities(batches), expected)
+
+    expected = _merge_relationships(RELATIONSHIP_DFS)
+    batches = [_concat_records(RELATIONSHIP_DFS[:3]), *RELATIONSHIP_DFS[3:]]
+
+    pd.testing.assert_frame_equal(_merge_relationships(batches), expected)
+
+
+def test_merge_without_extractions():
+    assert len(_merge_entities([pd.DataFrame()])) == 0
+    assert len(_merge_relationships([])) == 0
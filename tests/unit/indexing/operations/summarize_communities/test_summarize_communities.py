@@ -0,0 +1,88 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+
+import pandas as pd
+import pytest
+
+import graphrag.index.operations.summarize_communities.summarize_communities as summarize
+from graphrag.cache.memory_pipeline_cache import InMemoryCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.index.operations.summarize_communities.summarize_communities import (
+    summarize_communities,
+)
+
+# community 0 has sub-communities 1 and 2, and community 3 has sub-community 4
+COMMUNITIES = pd.DataFrame({
+    "community": [0, 1, 2, 3, 4],
+    "level": [0, 1, 1, 0, 1],
+    "children": [[1, 2], [], [], [4], []],
+})
+EXCEEDED = {0}
+
+
+def level_context_builder(
+    report_df, community_hierarchy_df, local_context_df, level, max_tokens
+):
+    context = local_context_df[local_context_df["level"] == level].copy()
+    context["context_string"] = [
+        "reports " + ",".join(str(c) for c in sorted(report_df["community"]))
+        if not report_df.empty and exceeded
+        else f"local {community}"
+        for community, exceeded in zip(
+            context["community"], context["context_exceed_limit"], strict=True
+        )
+    ]
+    context["context_exceed_limit"] = False
+    return context
+
+
+class Runner:
+    def __init__(self):
+        self.events: list[tuple[str, int]] = []
+        self.contexts: dict[int, str] = {}
+
+    async def __call__(self, community, context, level, callbacks, cache, strategy):
+        self.events.append(("start", community))
+        self.contexts[community] = context
+        # sub-community 2 is slow, so its sibling and the other communities finish first
+        await asyncio.sleep(0.05 if community == 2 else 0.01)
+        self.events.append(("end", community))
+        if community == 4:
+            return None
+        return {"community": community, "level": level, "full_content": context}
+
+
+@pytest.fixture
+def runner(monkeypatch: pytest.MonkeyPatch) -> Runner:
+    runner = Runner()
+    monkeypatch.setattr(summarize, "load_strategy", lambda _: runner)
+    return runner
+
+
+async def test_reports_are_scheduled_along_the_hierarchy(runner: Runner):
+    local_contexts = COMMUNITIES.loc[:, ["community", "level"]].assign(
+        context_exceed_limit=COMMUNITIES["community"].isin(EXCEEDED)
+    )
+
+    reports = await summarize_communities(
+        COMMUNITIES.rename(columns={"community": "community_id"}),
+        COMMUNITIES,
+        local_contexts,
+        level_context_builder,
+        NoopWorkflowCallbacks(),
+        InMemoryCache(),
+        {"type": "graph_intelligence"},
+        max_input_length=100,
+        num_threads=10,
+    )
+
+    # the oversized community waits for its sub-communities and uses their reports
+    assert runner.events.index(("start", 0)) > runner.events.index(("end", 2))
+    assert runner.contexts[0] == "reports 1,2"
+    # communities that fit do not wait for the rest of the level below
+    assert runner.events.index(("start", 3)) < runner.events.index(("end", 1))
+    assert runner.contexts[3] == "local 3"
+    # reports are returned bottom-up, in level context order
+    assert reports["community"].tolist() == [1, 2, 0, 3]
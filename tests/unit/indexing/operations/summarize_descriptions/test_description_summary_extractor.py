@@ -0,0 +1,90 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from graphrag.cache.json_pipeline_cache import JsonPipelineCache
+from graphrag.cache.memory_pipeline_cache import InMemoryCache
+from graphrag.index.operations.summarize_descriptions.description_summary_extractor import (
+    SummarizeExtractor,
+)
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+
+PROMPT = "Summarize {entity_name}: {description_list}"
+
+
+class FakeLLM:
+    def __init__(self):
+        self.calls: list[list[str]] = []
+        self.running = 0
+        self.peak = 0
+
+    async def __call__(self, prompt: str, **kwargs):
+        descriptions = json.loads(prompt.split(": ", 1)[1])
+        self.calls.append(descriptions)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return SimpleNamespace(
+            output=SimpleNamespace(content=f"summary of {len(descriptions)}")
+        )
+
+
+def create_extractor(llm: FakeLLM, **kwargs) -> SummarizeExtractor:
+    return SummarizeExtractor(
+        llm,  # type: ignore
+        summarization_prompt=PROMPT,
+        max_input_tokens=100,
+        **kwargs,
+    )
+
+
+def descriptions(count: int) -> list[str]:
+    return [f"description number {i} of the hub entity" for i in range(count)]
+
+
+async def test_tree_reduce_summarizes_groups_concurrently():
+    sequential, tree = FakeLLM(), FakeLLM()
+
+    await create_extractor(sequential)("HUB", descriptions(200))
+    result = await create_extractor(tree, tree_reduce=True)("HUB", descriptions(200))
+
+    assert result.description.startswith("summary of")
+    assert tree.peak > 1
+    assert sequential.peak == 1
+    # every description is summarized in exactly one group of the first round
+    first_round = [call for call in tree.calls if "summary" not in call[0]]
+    assert sorted(d for call in first_round for d in call) == sorted(descriptions(200))
+    assert all(len(call) > 1 for call in tree.calls)
+
+
+@pytest.mark.parametrize(
+    "cache_factory",
+    [
+        lambda tmp_path: InMemoryCache(),
+        lambda tmp_path: JsonPipelineCache(FilePipelineStorage(str(tmp_path))),
+    ],
+)
+async def test_tree_reduce_reuses_cached_partials(tmp_path, cache_factory):
+    cache = cache_factory(tmp_path)
+    await create_extractor(FakeLLM(), tree_reduce=True, cache=cache)(
+        "HUB", descriptions(200)
+    )
+
+    llm = FakeLLM()
+    await create_extractor(llm, tree_reduce=True, cache=cache)(
+        "HUB", [*descriptions(200), "description number 1000 of the hub entity"]
+    )
+    first_round = [call for call in llm.calls if "summary" not in call[0]]
+    all_groups = len(first_round) + len([
+        call for call in llm.calls if "summary" in call[0]
+    ])
+
+    # only the groups around the new description are summarized again
+    assert 0 < len(first_round) <= 3
+    assert all_groups < 10
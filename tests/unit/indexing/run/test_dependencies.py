@@ -0,0 +1,72 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from graphrag.config.create_graphrag_config import create_graphrag_config
+from graphrag.index.run.dependencies import build_dependency_graph, infer_table_io
+from graphrag.index.workflows import (
+    run_create_final_text_units,
+    run_generate_text_embeddings,
+)
+from graphrag.index.workflows.factory import PipelineFactory
+from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from tests.unit.config.utils import DEFAULT_MODEL_CONFIG
+
+
+def test_infer_table_io():
+    table_io = infer_table_io(run_create_final_text_units)
+    assert table_io is not None
+    assert table_io.inputs == {"text_units", "entities", "relationships", "covariates"}
+    assert table_io.outputs == {"text_units"}
+
+    table_io = infer_table_io(run_generate_text_embeddings)
+    assert table_io is not None
+    assert table_io.outputs == set()
+
+
+def test_infer_table_io_dynamic_name():
+    async def workflow(config, context, callbacks):
+        table = await load_table_from_storage(config.name, context.storage)
+        await write_table_to_storage(table, "output", context.storage)
+
+    assert infer_table_io(workflow) is None
+
+
+def test_standard_pipeline_dependencies():
+    config = create_graphrag_config({
+        "models": DEFAULT_MODEL_CONFIG,
+        "extract_claims": {"enabled": True},
+    })
+    workflows = [
+        (name, infer_table_io(workflow))
+        for name, workflow in PipelineFactory.create_pipeline(config)
+    ]
+    dependencies = build_dependency_graph(workflows)
+
+    assert dependencies["create_base_text_units"] == set()
+    # claims only need the base text units, so they can overlap graph extraction and finalization
+    assert dependencies["extract_covariates"] == {"create_base_text_units"}
+    assert "extract_covariates" not in dependencies["finalize_graph"]
+    assert "extract_covariates" not in dependencies["create_communities"]
+    # the final text units overwrite the table that extraction reads
+    assert {"extract_graph", "extract_covariates"} <= dependencies[
+        "create_final_text_units"
+    ]
+    # the text unit and graph embeddings overlap report generation
+    assert "create_community_reports" not in dependencies["generate_text_embeddings"]
+    assert (
+        "create_community_reports"
+        in dependencies["generate_community_report_embeddings"]
+    )
+
+
+def test_uninspectable_workflow_is_a_barrier():
+    config = create_graphrag_config({"models": DEFAULT_MODEL_CONFIG})
+    workflows = [
+        (name, infer_table_io(workflow))
+        for name, workflow in PipelineFactory.create_pipeline(config)
+    ]
+    workflows.insert(3, ("custom", infer_table_io(print)))  # type: ignore
+    dependencies = build_dependency_graph(workflows)
+
+    assert dependencies["custom"] == {name for name, _ in workflows[:3]}
+    assert all("custom" in dependencies[name] for name, _ in workflows[4:])
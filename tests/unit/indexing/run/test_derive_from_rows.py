@@ -0,0 +1,109 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+import random
+
+import pandas as pd
+import pytest
+
+from graphrag.config.enums import AsyncType
+from graphrag.index.run.derive_from_rows import (
+    ParallelizationError,
+    derive_from_rows_stream,
+)
+
+
+async def test_stream_yields_in_row_order():
+    input = pd.DataFrame({"value": list(range(50))})
+
+    async def transform(row):
+        await asyncio.sleep(random.random() / 100)
+        return row["value"] * 2
+
+    results = [
+        result
+        async for result in derive_from_rows_stream(input, transform, num_threads=8)
+    ]
+    assert results == [value * 2 for value in range(50)]
+
+
+async def test_stream_bounds_rows_in_flight():
+    input = pd.DataFrame({"value": list(range(100))})
+    started = 0
+    max_ahead = 0
+    consumed = 0
+
+    async def transform(row):
+        nonlocal started, max_ahead
+        started += 1
+        max_ahead = max(max_ahead, started - consumed)
+        await asyncio.sleep(0)
+        return row["value"]
+
+    async for _ in derive_from_rows_stream(
+        input, transform, num_threads=4, buffer_size=10
+    ):
+        consumed += 1
+
+    assert consumed == 100
+    assert max_ahead <= 10
+
+
+async def test_stream_keeps_scheduling_behind_a_slow_row():
+    input = pd.DataFrame({"value": list(range(100))})
+    started = []
+    head_done = asyncio.Event()
+
+    async def transform(row):
+        started.append(head_done.is_set())
+        if row["value"] == 0:
+            await asyncio.sleep(0.2)
+            head_done.set()
+        else:
+            await asyncio.sleep(0.01)
+        return row["value"]
+
+    results = [
+        result
+        async for result in derive_from_rows_stream(input, transform, num_threads=4)
+    ]
+
+    assert results == list(range(100))
+    # rows keep starting while the first one runs, until the reorder buffer of 8x4 rows is full
+    assert started.count(False) == 32
+
+
+async def test_stream_threaded_mode():
+    input = pd.DataFrame({"value": ["a", "b", "c"]})
+
+    async def transform(row):
+        await asyncio.sleep(0)
+        return row["value"].upper()
+
+    results = [
+        result
+        async for result in derive_from_rows_stream(
+            input, transform, async_type=AsyncType.Threaded
+        )
+    ]
+    assert results == ["A", "B", "C"]
+
+
+async def test_stream_raises_after_exhausting_input():
+    input = pd.DataFrame({"value": [1, 0, 2]})
+
+    async def transform(row):
+        await asyncio.sleep(0)
+        return 10 // row["value"]
+
+    results = []
+
+    async def consume():
+        results.extend([
+            result async for result in derive_from_rows_stream(input, transform)
+        ])
+
+    with pytest.raises(ParallelizationError):
+        await consume()
+    assert results == []
@@ -0,0 +1,157 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pandas as pd
+
+from graphrag.cache.memory_pipeline_cache import InMemoryCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.config.create_graphrag_config import create_graphrag_config
+from graphrag.index.run.manifest import (
+    INPUT_CHECKPOINT,
+    content_hash,
+    dump_manifest,
+    load_manifest,
+)
+from graphrag.index.run.run_pipeline import _run_pipeline
+from graphrag.index.typing import WorkflowFunctionOutput
+from graphrag.logger.null_progress import NullProgressLogger
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from tests.unit.config.utils import DEFAULT_MODEL_CONFIG
+
+executed: list[str] = []
+failing: set[str] = set()
+
+
+async def create_items(_config, context, _callbacks):
+    documents = await load_table_from_storage("documents", context.storage)
+    executed.append("create_items")
+    await write_table_to_storage(documents, "items", context.storage)
+    return WorkflowFunctionOutput(result=None, config=None)
+
+
+async def finalize_items(_config, context, _callbacks):
+    items = await load_table_from_storage("items", context.storage)
+    executed.append("finalize_items")
+    items["final"] = True
+    await write_table_to_storage(items, "items", context.storage)
+    return WorkflowFunctionOutput(result=None, config=None)
+
+
+async def summarize_items(_config, context, _callbacks):
+    items = await load_table_from_storage("items", context.storage)
+    executed.append("summarize_items")
+    if "summarize_items" in failing:
+        msg = "summarization failed"
+        raise ValueError(msg)
+    await write_table_to_storage(items.head(1), "summary", context.storage)
+    return WorkflowFunctionOutput(result=None, config=None)
+
+
+PIPELINE = [
+    ("create_items", create_items),
+    ("finalize_items", finalize_items),
+    ("summarize_items", summarize_items),
+]
+DATASET = pd.DataFrame({"id": ["1", "2"], "text": ["a", "b"]})
+
+
+async def run(storage, resume=False, config=None):
+    executed.clear()
+    config = config or create_graphrag_config({"models": DEFAULT_MODEL_CONFIG})
+    return [
+        result
+        async for result in _run_pipeline(
+            iter(PIPELINE),
+            config,
+            DATASET,
+            InMemoryCache(),
+            storage,
+            NoopWorkflowCallbacks(),
+            NullProgressLogger(),
+            resume=resume,
+        )
+    ]
+
+
+async def test_manifest_records_each_workflow():
+    storage = MemoryPipelineStorage()
+    await run(storage)
+
+    manifest = await load_manifest(storage)
+    assert set(manifest.workflows) == {
+        INPUT_CHECKPOINT,
+        "create_items",
+        "finalize_items",
+        "summarize_items",
+    }
+    assert set(manifest.workflows["finalize_items"].outputs) == {"items"}
+
+
+async def test_resume_skips_completed_workflows():
+    storage = MemoryPipelineStorage()
+    await run(storage)
+    results = await run(storage, resume=True)
+
+    assert executed == []
+    assert all(result.errors is None for result in results)
+
+
+async def test_resume_after_failure():
+    storage = MemoryPipelineStorage()
+    failing.add("summarize_items")
+    try:
+        results = await run(storage)
+    finally:
+        failing.clear()
+    assert results[-1].errors is not None
+
+    await run(storage, resume=True)
+    assert executed == ["summarize_items"]
+
+
+async def test_resume_reruns_overwritten_outputs():
+    storage = MemoryPipelineStorage()
+    await run(storage)
+    manifest = await load_manifest(storage)
+    # forget the finalization, whose input version was overwritten in place
+    del manifest.workflows["finalize_items"]
+    await dump_manifest(manifest, storage)
+
+    await run(storage, resume=True)
+    assert executed == ["create_items", "finalize_items", "summarize_items"]
+    assert (await load_table_from_storage("items", storage))["final"].all()
+
+
+async def test_resume_reruns_on_config_change():
+    storage = MemoryPipelineStorage()
+    await run(storage)
+    config = create_graphrag_config({
+        "models": DEFAULT_MODEL_CONFIG,
+        "chunks": {"size": 10},
+    })
+    await run(storage, resume=True, config=config)
+    assert executed == ["create_items", "finalize_items", "summarize_items"]
+
+
+async def test_versions_are_hashed_while_writing(tmp_path, monkeypatch):
+    storage = FilePipelineStorage(str(tmp_path))
+    read = []
+    get = FilePipelineStorage.get
+
+    async def counting_get(self, key, *args, **kwargs):
+        read.append(key)
+        return await get(self, key, *args, **kwargs)
+
+    monkeypatch.setattr(FilePipelineStorage, "get", counting_get)
+    await run(storage)
+    assert [key for key in read if key.endswith(".parquet")] == []
+
+    # the recorded versions match the stored files, so a new process can resume from them
+    manifest = await load_manifest(storage)
+    for name, version in manifest.workflows["summarize_items"].outputs.items():
+        assert version == content_hash((tmp_path / f"{name}.parquet").read_bytes())
+
+    await run(FilePipelineStorage(str(tmp_path)), resume=True)
+    assert executed == []
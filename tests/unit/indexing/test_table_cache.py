@@ -0,0 +1,107 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pandas as pd
+
+from graphrag.index.table_cache import TableCache
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from graphrag.utils.storage import (
+    delete_table_from_storage,
+    load_table_from_storage,
+    write_table_to_storage,
+)
+
+ENTITIES = pd.DataFrame({
+    "title": ["A", "B"],
+    "text_unit_ids": [["1", "2"], ["3"]],
+    "frequency": [2, 1],
+})
+
+
+async def test_write_through_serves_next_load():
+    storage = MemoryPipelineStorage()
+    cache = TableCache(max_bytes=1024 * 1024)
+
+    await write_table_to_storage(ENTITIES, "entities", storage, table_cache=cache)
+    loaded = await load_table_from_storage("entities", storage, table_cache=cache)
+
+    # the cached table matches what a read from storage returns
+    expected = await load_table_from_storage("entities", storage)
+    pd.testing.assert_frame_equal(loaded, expected)
+    assert cache.stats.hits == 1
+    assert cache.stats.bytes_saved > 0
+
+
+async def test_loads_are_isolated_copies():
+    storage = MemoryPipelineStorage()
+    cache = TableCache(max_bytes=1024 * 1024)
+    await write_table_to_storage(ENTITIES, "entities", storage, table_cache=cache)
+
+    first = await load_table_from_storage("entities", storage, table_cache=cache)
+    first["frequency"] = 0
+    second = await load_table_from_storage("entities", storage, table_cache=cache)
+
+    assert second["frequency"].tolist() == [2, 1]
+
+
+async def test_list_cells_are_copied():
+    storage = MemoryPipelineStorage()
+    cache = TableCache(max_bytes=1024 * 1024)
+    await write_table_to_storage(ENTITIES, "entities", storage, table_cache=cache)
+
+    first = await load_table_from_storage("entities", storage, table_cache=cache)
+    first["text_unit_ids"].iloc[0][0] = "changed"
+    second = await load_table_from_storage("entities", storage, table_cache=cache)
+
+    assert second["text_unit_ids"].tolist()[0].tolist() == ["1", "2"]
+
+    # a table cached by a read does not share cells with the frame that was returned
+    cache.clear()
+    third = await load_table_from_storage("entities", storage, table_cache=cache)
+    third["text_unit_ids"].iloc[0][0] = "changed"
+    fourth = await load_table_from_storage("entities", storage, table_cache=cache)
+    assert fourth["text_unit_ids"].tolist()[0].tolist() == ["1", "2"]
+    assert cache.stats.hits == 3
+
+
+async def test_projection_and_delete():
+    storage = MemoryPipelineStorage()
+    cache = TableCache(max_bytes=1024 * 1024)
+    await write_table_to_storage(ENTITIES, "entities", storage, table_cache=cache)
+
+    projected = await load_table_from_storage(
+        "entities", storage, columns=["title"], table_cache=cache
+    )
+    assert projected.columns.tolist() == ["title"]
+    assert cache.stats.hits == 1
+
+    await delete_table_from_storage("entities", storage, table_cache=cache)
+    assert cache.get(storage, "entities") is None
+
+
+async def test_evicts_least_recently_used():
+    storage = MemoryPipelineStorage()
+    cache = TableCache(max_bytes=1024 * 1024)
+    await write_table_to_storage(ENTITIES, "a", storage, table_cache=cache)
+    table_size = cache.size
+    cache.max_bytes = table_size * 2
+
+    await write_table_to_storage(ENTITIES, "b", storage, table_cache=cache)
+    assert cache.get(storage, "a") is not None
+    await write_table_to_storage(ENTITIES, "c", storage, table_cache=cache)
+
+    assert cache.get(storage, "b") is None
+    assert cache.get(storage, "a") is not None
+    assert cache.stats.evictions == 1
+    assert cache.size <= cache.max_bytes
+
+
+async def test_arrow_dtypes():
+    storage = MemoryPipelineStorage()
+    cache = TableCache(max_bytes=1024 * 1024, arrow_dtypes=True)
+    await write_table_to_storage(ENTITIES, "entities", storage, table_cache=cache)
+
+    loaded = await load_table_from_storage("entities", storage, table_cache=cache)
+
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in loaded.dtypes)
+    assert loaded["text_unit_ids"].tolist()[0] == ["1", "2"]
@@ -1,16 +1,24 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
+import time
 from unittest import mock
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 import tiktoken
 
+from graphrag.index.operations.chunk_text.strategies import get_tokenizer
+from graphrag.index.operations.chunk_text.typing import TextChunk
 from graphrag.index.text_splitting.text_splitting import (
+    EncodedTexts,
     NoopTextSplitter,
+    TokenArrayTextSplitter,
     Tokenizer,
     TokenTextSplitter,
+    chunk_token_arrays,
+    encode_texts,
     split_multiple_texts_on_tokens,
     split_single_text_on_tokens,
 )
@@ -202,3 +210,161 @@ def test_split_single_text_on_tokens_no_overlap():
 
     result = split_single_text_on_tokens(text=text, tokenizer=tokenizer)
     assert result == expected_splits
+
+
+def split_token_tuples(texts: list[str], tokenizer: Tokenizer) -> list[TextChunk]:
+    """The reference chunking, keeping a (doc index, token id) tuple per token."""
+    input_ids = [
+        (doc_idx, id)
+        for doc_idx, text in enumerate(texts)
+        for id in tokenizer.encode(text)
+    ]
+    result = []
+    start_idx = 0
+    while start_idx < len(input_ids):
+        chunk_ids = input_ids[start_idx : start_idx + tokenizer.tokens_per_chunk]
+        result.append(
+            TextChunk(
+                tokenizer.decode([id for _, id in chunk_ids]),
+                list({doc_idx for doc_idx, _ in chunk_ids}),
+                len(chunk_ids),
+            )
+        )
+        start_idx += tokenizer.tokens_per_chunk - tokenizer.chunk_overlap
+    return result
+
+
+def test_split_multiple_texts_on_tokens_matches_token_tuples():
+    texts = ["", "First text.", "", "", "Second", f"Third {'word ' * 40}", ""] * 5
+    mocked_tokenizer = MockTokenizer()
+    for tokens_per_chunk, chunk_overlap in [(10, 5), (3, 0), (1, 0), (400, 10)]:
+        tokenizer = Tokenizer(
+            chunk_overlap=chunk_overlap,
+            tokens_per_chunk=tokens_per_chunk,
+            decode=mocked_tokenizer.decode,
+            encode=mocked_tokenizer.encode,
+        )
+
+        assert split_multiple_texts_on_tokens(texts, tokenizer) == split_token_tuples(
+            texts, tokenizer
+        )
+
+    assert split_multiple_texts_on_tokens(["", ""], tokenizer) == []
+
+
+def test_encoded_texts_concatenate_token_arrays():
+    texts = [f"Document {i}. " + "lorem ipsum dolor sit amet " * i for i in range(10)]
+    texts[3] = ""
+    mocked_tokenizer = MockTokenizer()
+    tokenizer = Tokenizer(
+        chunk_overlap=2,
+        tokens_per_chunk=50,
+        decode=mocked_tokenizer.decode,
+        encode=mocked_tokenizer.encode,
+    )
+
+    encoded = EncodedTexts.from_arrays(encode_texts(texts, tokenizer))
+
+    assert encoded.tokens.dtype == np.int32
+    assert (
+        encoded.offsets.tolist()
+        == np.cumsum(
+            [0] + [len(mocked_tokenizer.encode(text)) for text in texts]
+        ).tolist()
+    )
+    assert encoded.tokens.tolist() == [
+        token for text in texts for token in mocked_tokenizer.encode(text)
+    ]
+    assert split_multiple_texts_on_tokens(texts, tokenizer) == split_token_tuples(
+        texts, tokenizer
+    )
+
+
+def test_token_array_text_splitter():
+    splitter = TokenArrayTextSplitter(chunk_size=5, chunk_overlap=1)
+    texts = ["The first text to split.", "", "The second text."]
+    enc = tiktoken.get_encoding("cl100k_base")
+
+    chunks = splitter.split_texts(texts)
+
+    assert [chunk.text_chunk for chunk in chunks] == splitter.split_text(texts)
+    assert [chunk.source_doc_indices for chunk in chunks] == [[0], [0, 2], [2]]
+    tokens = enc.encode(texts[0]) + enc.encode(texts[2])
+    assert [chunk.text_chunk for chunk in chunks] == [
+        enc.decode(tokens[start : start + 5]) for start in range(0, len(tokens), 4)
+    ]
+    assert splitter.split_text("The first text to split.") == [
+        chunk.text_chunk for chunk in splitter.split_texts(["The first text to split."])
+    ]
+
+
+@pytest.mark.parametrize(
+    ("tokens_per_chunk", "chunk_overlap", "flush_tokens"),
+    [(10, 5, 1), (10, 0, 16), (7, 3, 1 << 16), (200, 20, 32)],
+)
+def test_chunk_token_arrays_matches_split_multiple_texts_on_tokens(
+    tokens_per_chunk, chunk_overlap, flush_tokens
+):
+    texts = [f"Text {i} " + "words and more words " * (i % 13) for i in range(60)]
+    texts[20:24] = ["", "", "", ""]
+    mocked_tokenizer = MockTokenizer()
+    tokenizer = Tokenizer(
+        chunk_overlap=chunk_overlap,
+        tokens_per_chunk=tokens_per_chunk,
+        decode=mocked_tokenizer.decode,
+        encode=mocked_tokenizer.encode,
+        encode_batch=lambda batch: [mocked_tokenizer.encode(t) for t in batch],
+    )
+    mock_tick = MagicMock()
+
+    expected = split_token_tuples(texts, tokenizer)
+    actual = [
+        (doc_indices, tokenizer.decode(tokens.tolist()), len(tokens))
+        for tokens, doc_indices in chunk_token_arrays(
+            encode_texts(texts, tokenizer, tick=mock_tick, batch_size=16),
+            tokens_per_chunk,
+            chunk_overlap,
+            flush_tokens=flush_tokens,
+        )
+    ]
+
+    assert actual == [
+        (chunk.source_doc_indices, chunk.text_chunk, chunk.n_tokens)
+        for chunk in expected
+    ]
+    assert [call.args[0] for call in mock_tick.call_args_list] == [16, 16, 16, 12]
+
+
+@pytest.mark.benchmark
+def test_chunk_token_arrays_benchmark():
+    """Batch encoding into token arrays keeps up with the per-token tuples it replaced."""
+    texts = [
+        f"Document {i}. " + "The quick brown fox jumps over the lazy dog. " * 200
+        for i in range(400)
+    ]
+    tokenizer = get_tokenizer("cl100k_base", 1200, 100)
+
+    def best_time(split) -> float:
+        times = []
+        for _ in range(3):
+            start = time.perf_counter()
+            split()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    baseline = best_time(lambda: split_token_tuples(texts, tokenizer))
+    arrays = best_time(
+        lambda: split_multiple_texts_on_tokens(texts, tokenizer, tick=MagicMock())
+    )
+    streamed = best_time(
+        lambda: [
+            tokenizer.decode(tokens.tolist())
+            for tokens, _ in chunk_token_arrays(
+                encode_texts(texts, tokenizer), 1200, 100
+            )
+        ]
+    )
+
+    # both array paths are usually several times faster; only guard against regressions
+    assert arrays < baseline * 1.5
+    assert streamed < baseline * 1.5
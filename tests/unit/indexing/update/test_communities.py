@@ -0,0 +1,128 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pandas as pd
+import pytest
+
+from graphrag.index.update.communities import (
+    _recluster_communities,
+    _update_community_reports,
+)
+
+SEED = 0xDEADBEEF
+
+
+@pytest.fixture
+def entities() -> pd.DataFrame:
+    return pd.read_parquet("tests/verbs/data/entities.parquet")
+
+
+@pytest.fixture
+def relationships() -> pd.DataFrame:
+    return pd.read_parquet("tests/verbs/data/relationships.parquet")
+
+
+@pytest.fixture
+def communities() -> pd.DataFrame:
+    return pd.read_parquet("tests/verbs/data/communities.parquet")
+
+
+def recluster(
+    communities, entities, relationships, delta_entities, delta_relationships
+):
+    return _recluster_communities(
+        communities.copy(),
+        pd.concat([entities, delta_entities], ignore_index=True),
+        pd.concat([relationships, delta_relationships], ignore_index=True),
+        delta_entities,
+        delta_relationships,
+        max_cluster_size=10,
+        use_lcc=True,
+        seed=SEED,
+    )
+
+
+def link_new_entity(entities: pd.DataFrame, relationships: pd.DataFrame, title: str):
+    delta_entities = pd.DataFrame([
+        {**entities.iloc[0].to_dict(), "id": "new", "title": "NEW ENTITY"}
+    ])
+    delta_relationships = pd.DataFrame([
+        {
+            **relationships.iloc[0].to_dict(),
+            "id": "new",
+            "source": "NEW ENTITY",
+            "target": title,
+        }
+    ])
+    return delta_entities, delta_relationships
+
+
+def test_untouched_communities_are_kept(entities, relationships, communities):
+    merged, delta = recluster(
+        communities, entities, relationships, entities.iloc[:0], relationships.iloc[:0]
+    )
+
+    assert delta.added == delta.changed == delta.removed == []
+    pd.testing.assert_series_equal(
+        merged["community"].sort_values(ignore_index=True),
+        communities["community"].sort_values(ignore_index=True),
+    )
+
+
+def test_only_touched_communities_are_reclustered(entities, relationships, communities):
+    root = communities.loc[communities["level"] == 0].sort_values("size").iloc[0]
+    title = entities.set_index("id").loc[root["entity_ids"][0], "title"]
+    subtree = set(
+        communities.loc[communities["parent"] == root["community"], "community"]
+    )
+
+    merged, delta = recluster(
+        communities,
+        entities,
+        relationships,
+        *link_new_entity(entities, relationships, title),
+    )
+
+    # the other trees keep their ids, the touched tree is replaced
+    assert set(delta.removed) | set(delta.changed) <= {root["community"], *subtree}
+    assert delta.added
+    assert min(delta.added) > communities["community"].max()
+    kept = communities.loc[~communities["community"].isin(delta.removed)]
+    assert set(kept["community"]) <= set(merged["community"])
+    assert merged["community"].is_unique
+    # the new entity is clustered with the entities of the touched tree
+    new_root = merged.loc[
+        (merged["level"] == 0) & merged["entity_ids"].apply(lambda ids: "new" in ids)
+    ]
+    assert len(new_root) == 1
+    assert set(new_root["community"]) <= set(delta.added)
+    # the hierarchy is consistent both ways
+    for community, parent in zip(merged["community"], merged["parent"], strict=True):
+        if parent != -1:
+            assert community in merged.set_index("community").loc[parent, "children"]
+
+
+def test_reports_of_outdated_communities_are_replaced(
+    entities, relationships, communities
+):
+    root = communities.loc[communities["level"] == 0].sort_values("size").iloc[0]
+    title = entities.set_index("id").loc[root["entity_ids"][0], "title"]
+    merged, delta = recluster(
+        communities,
+        entities,
+        relationships,
+        *link_new_entity(entities, relationships, title),
+    )
+    reports = pd.read_parquet("tests/verbs/data/community_reports.parquet")
+    new_reports = reports.iloc[: len(delta.outdated)].assign(
+        community=delta.outdated, title="regenerated"
+    )
+
+    updated = _update_community_reports(reports.copy(), new_reports, merged, delta)
+
+    assert updated["community"].is_unique
+    assert set(updated["community"]) <= set(merged["community"])
+    assert not set(updated["community"]) & set(delta.removed)
+    assert (
+        updated.loc[updated["community"].isin(delta.outdated), "title"] == "regenerated"
+    ).all()
@@ -0,0 +1,143 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+
+import pytest
+import tiktoken
+
+from graphrag.model.community import Community
+from graphrag.model.community_report import CommunityReport
+from graphrag.query.context_builder.dynamic_community_selection import (
+    DynamicCommunitySelection,
+    RatingCache,
+)
+from tests.unit.query.helpers.fake_llm import FakeTextEmbedding
+
+# community -> (level, parent, children, rating, rating delay)
+HIERARCHY = {
+    "0": ("0", "-1", ["2", "3"], 5, 0),
+    "1": ("0", "-1", ["4"], 5, 0.2),
+    "2": ("1", "0", [], 5, 0),
+    "3": ("1", "0", [], 0, 0),
+    "4": ("1", "1", [], 5, 0),
+}
+
+
+class FakeRatingLLM:
+    def __init__(self):
+        self.rated: list[str] = []
+
+    async def agenerate(self, messages, **kwargs):
+        community = messages[0]["content"].split("<report ")[1].split(">")[0]
+        _, _, _, rating, delay = HIERARCHY[community]
+        await asyncio.sleep(delay)
+        self.rated.append(community)
+        return f'{{"rating": {rating}}}'
+
+
+def create_selection(
+    llm: FakeRatingLLM, embeddings: dict[str, list[float]] | None = None, **kwargs
+):
+    embeddings = embeddings or {}
+    return DynamicCommunitySelection(
+        community_reports=[
+            CommunityReport(
+                id=community,
+                short_id=community,
+                title=community,
+                community_id=community,
+                full_content=f"<report {community}>",
+                full_content_embedding=embeddings.get(community),
+            )
+            for community in HIERARCHY
+        ],
+        communities=[
+            Community(
+                id=community,
+                short_id=community,
+                title=community,
+                level=level,
+                parent=parent,
+                children=children,
+            )
+            for community, (level, parent, children, _, _) in HIERARCHY.items()
+        ],
+        llm=llm,  # type: ignore
+        token_encoder=tiktoken.get_encoding("cl100k_base"),
+        **kwargs,
+    )
+
+
+async def test_children_are_rated_without_waiting_for_the_level():
+    llm = FakeRatingLLM()
+    selection = create_selection(llm)
+
+    reports, llm_info = await selection.select("question")
+
+    assert sorted(report.community_id for report in reports) == ["2", "4"]
+    assert llm_info["llm_calls"] == 5
+    # the children of community 0 are rated while community 1 is still being rated
+    assert llm.rated.index("2") < llm.rated.index("1")
+    assert llm.rated.index("3") < llm.rated.index("1")
+
+
+async def test_pending_ratings_are_cancelled_on_failure():
+    class FailingRatingLLM(FakeRatingLLM):
+        async def agenerate(self, messages, **kwargs):
+            if "<report 0>" in messages[0]["content"]:
+                msg = "rating failed"
+                raise ValueError(msg)
+            return await super().agenerate(messages, **kwargs)
+
+    selection = create_selection(FailingRatingLLM())
+
+    with pytest.raises(ValueError, match="rating failed"):
+        await selection.select("question")
+    # the rating of community 1 was cancelled and awaited before select returned
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+async def test_ratings_are_reused_across_queries():
+    llm = FakeRatingLLM()
+    selection = create_selection(llm, rating_cache_size=100)
+
+    first, _ = await selection.select("Question ")
+    second, llm_info = await selection.select("question")
+
+    assert sorted(report.id for report in first) == sorted(
+        report.id for report in second
+    )
+    assert llm_info["llm_calls"] == 0
+    assert len(llm.rated) == 5
+
+
+async def test_embedding_prefilter_skips_dissimilar_reports():
+    llm = FakeRatingLLM()
+    selection = create_selection(
+        llm,
+        embeddings={"1": [0.0, 1.0], "2": [0.0, 2.0], "4": [1.0, 1.0]},
+        text_embedder=FakeTextEmbedding([1.0, 0.0]),
+        embedding_threshold=0.5,
+    )
+
+    reports, llm_info = await selection.select("question")
+
+    # reports without an embedding are still rated
+    assert [report.community_id for report in reports] == ["0"]
+    assert llm_info["ratings"]["1"] == 0
+    assert sorted(llm.rated) == ["0", "3"]
+
+
+def test_rating_cache_evicts_and_expires():
+    cache = RatingCache(max_size=2)
+    cache.put("a question", "0", 1)
+    cache.put("a question", "1", 2)
+    assert cache.get("A  question", "0") == 1
+    cache.put("a question", "2", 3)
+    assert cache.get("a question", "1") is None
+    assert len(cache) == 2
+
+    cache = RatingCache(max_size=2, ttl=0)
+    cache.put("a question", "0", 1)
+    assert cache.get("a question", "0") is None
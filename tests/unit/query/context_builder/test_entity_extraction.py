@@ -30,6 +30,9 @@ class MockBaseVectorStore(BaseVectorStore):
     ) -> None:
         raise NotImplementedError
 
+    def delete(self, ids: list[str]) -> None:
+        raise NotImplementedError
+
     def similarity_search_by_vector(
         self, query_embedding: list[float], k: int = 10, **kwargs: Any
     ) -> list[VectorStoreSearchResult]:
@@ -0,0 +1,60 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+import re
+from collections.abc import Callable
+from typing import Any
+
+from graphrag.query.llm.base import BaseTextEmbedding
+
+
+class FakeChatLLM:
+    """A chat model that answers each prompt containing a marker with that marker's response.
+
+    Other prompts get the default response, and streaming yields the answer word by word. Every
+    prompt is recorded, in the order the calls were made.
+    """
+
+    def __init__(
+        self,
+        response: str = "the answer",
+        responses: dict[str, str] | None = None,
+        delays: dict[str, float] | None = None,
+        answer: str | None = None,
+    ):
+        self.response = response
+        self.responses = responses or {}
+        self.delays = delays or {}
+        self.answer = answer or response
+        self.prompts: list[str] = []
+
+    async def agenerate(self, messages, streaming=True, callbacks=None, **kwargs):
+        prompt = messages[0]["content"]
+        self.prompts.append(prompt)
+        for marker, response in self.responses.items():
+            if marker in prompt:
+                await asyncio.sleep(self.delays.get(marker, 0))
+                return response
+        await asyncio.sleep(0)
+        return self.response
+
+    async def astream_generate(self, messages, callbacks=None, **kwargs):
+        self.prompts.append(messages[0]["content"])
+        for chunk in re.findall(r"\S+\s*", self.answer):
+            await asyncio.sleep(0)
+            yield chunk
+
+
+class FakeTextEmbedding(BaseTextEmbedding):
+    """A text embedder returning a fixed vector, or one computed from the text, that records the embedded texts."""
+
+    def __init__(self, vector: list[float] | Callable[[str], list[float]]):
+        self.vector = vector
+        self.embedded: list[str] = []
+
+    def embed(self, text: str, **kwargs: Any) -> list[float]:
+        self.embedded.append(text)
+        return self.vector(text) if callable(self.vector) else self.vector
+
+    async def aembed(self, text: str, **kwargs: Any) -> list[float]:
+        return self.embed(text)
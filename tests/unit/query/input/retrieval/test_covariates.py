@@ -0,0 +1,72 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from graphrag.model.entity import Entity
+from graphrag.query.context_builder.local_context import build_covariates_context
+from graphrag.query.indexer_adapters import (
+    read_indexer_covariate_table,
+    read_indexer_covariates,
+)
+from graphrag.query.input.retrieval.covariates import get_candidate_covariates
+
+SUBJECTS = ["SCROOGE", "EBENEZER SCROOGE", "PROJECT GUTENBERG™", "NOT A SUBJECT"]
+
+
+@pytest.fixture
+def covariates() -> pd.DataFrame:
+    return pd.read_parquet("tests/verbs/data/covariates.parquet")
+
+
+def selected_entities() -> list[Entity]:
+    return [
+        Entity(id=str(i), short_id=str(i), title=title)
+        for i, title in enumerate(SUBJECTS)
+    ]
+
+
+def assert_same_context(expected: tuple[str, pd.DataFrame], actual):
+    assert actual[0] == expected[0]
+    assert actual[1].equals(expected[1])
+
+
+def test_table_lookups_match_scans(covariates: pd.DataFrame):
+    claims = read_indexer_covariates(covariates.copy())
+    table = read_indexer_covariate_table(covariates)
+    selected = selected_entities()
+
+    assert len(table) == len(claims)
+    assert table[0] == claims[0]
+    assert table[-1] == claims[-1]
+    assert list(table) == claims
+    assert get_candidate_covariates(selected, claims) == get_candidate_covariates(
+        selected, table, adjacency=table
+    )
+    assert_same_context(
+        build_covariates_context(selected, claims),
+        build_covariates_context(selected, table, adjacency=table),
+    )
+    assert [claim.subject_id for claim in table.get_grouped(SUBJECTS)] == (
+        ["SCROOGE"] * 40 + ["EBENEZER SCROOGE"] * 4 + ["PROJECT GUTENBERG™"] * 4
+    )
+
+
+def test_table_on_disk_matches_scans(covariates: pd.DataFrame, tmp_path: Path):
+    path = tmp_path / "covariates.parquet"
+    covariates.to_parquet(path, row_group_size=10)
+    claims = read_indexer_covariates(pd.read_parquet(path))
+    table = read_indexer_covariate_table(path)
+    selected = selected_entities()
+
+    assert get_candidate_covariates(selected, claims) == table.get(SUBJECTS)
+    assert_same_context(
+        build_covariates_context(selected, claims),
+        build_covariates_context(selected, table, adjacency=table),
+    )
+    assert table.get_grouped(["EBENEZER SCROOGE"]) == [
+        claim for claim in claims if claim.subject_id == "EBENEZER SCROOGE"
+    ]
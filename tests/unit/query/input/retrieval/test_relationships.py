@@ -0,0 +1,114 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import random
+
+from graphrag.model.covariate import Covariate
+from graphrag.model.entity import Entity
+from graphrag.model.relationship import Relationship
+from graphrag.model.text_unit import TextUnit
+from graphrag.query.context_builder.local_context import (
+    build_covariates_context,
+    build_relationship_context,
+)
+from graphrag.query.input.retrieval.adjacency import (
+    covariate_adjacency,
+    relationship_adjacency,
+    text_unit_adjacency,
+)
+from graphrag.query.input.retrieval.relationships import (
+    get_candidate_relationships,
+    get_in_network_relationships,
+    get_out_network_relationships,
+)
+from graphrag.query.input.retrieval.text_units import get_candidate_text_units
+
+
+def create_graph(seed: int = 0, size: int = 50):
+    rng = random.Random(seed)
+    entities = [
+        Entity(
+            id=str(i),
+            short_id=str(i),
+            title=f"entity {i}",
+            text_unit_ids=[f"unit {rng.randrange(size)}" for _ in range(3)],
+        )
+        for i in range(size)
+    ]
+    relationships = [
+        Relationship(
+            id=str(i),
+            short_id=str(i),
+            source=f"entity {rng.randrange(size)}",
+            target=f"entity {rng.randrange(size)}",
+            description=f"relationship {i}",
+            rank=rng.randrange(5),
+        )
+        for i in range(size * 4)
+    ]
+    covariates = [
+        Covariate(
+            id=str(i),
+            short_id=str(i),
+            subject_id=f"entity {rng.randrange(size)}",
+            attributes={"description": f"claim {i}"},
+        )
+        for i in range(size * 2)
+    ]
+    text_units = [
+        TextUnit(id=f"unit {i}", short_id=str(i), text="") for i in range(size)
+    ]
+    return rng, entities, relationships, covariates, text_units
+
+
+def test_indexed_retrieval_matches_scans():
+    rng, entities, relationships, covariates, text_units = create_graph()
+    relationship_index = relationship_adjacency(relationships)
+    covariate_index = covariate_adjacency(covariates)
+    text_unit_index = text_unit_adjacency(text_units)
+
+    for _ in range(20):
+        selected = rng.sample(entities, rng.randrange(1, 10))
+        for get in [
+            get_in_network_relationships,
+            get_out_network_relationships,
+            get_candidate_relationships,
+        ]:
+            assert get(selected, relationships) == get(
+                selected, relationships, adjacency=relationship_index
+            )
+
+        assert (
+            build_relationship_context(selected, relationships, max_tokens=100_000)[0]
+            == build_relationship_context(
+                selected,
+                relationships,
+                max_tokens=100_000,
+                adjacency=relationship_index,
+            )[0]
+        )
+        assert (
+            build_covariates_context(selected, covariates)[0]
+            == (
+                build_covariates_context(
+                    selected, covariates, adjacency=covariate_index
+                )[0]
+            )
+        )
+        assert get_candidate_text_units(selected, text_units).equals(
+            get_candidate_text_units(selected, text_units, adjacency=text_unit_index)
+        )
+
+
+def test_adjacency_keeps_collection_order():
+    _, _, relationships, _, _ = create_graph(size=5)
+    index = relationship_adjacency(relationships)
+
+    incident = index.get(["entity 3", "entity 1"])
+
+    assert incident == [
+        rel
+        for rel in relationships
+        if {rel.source, rel.target} & {"entity 1", "entity 3"}
+    ]
+    assert index.get(["missing"]) == []
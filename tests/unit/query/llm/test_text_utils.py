@@ -0,0 +1,63 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import numpy as np
+
+from graphrag.query.llm.text_utils import (
+    TokenCounter,
+    fit_token_budget,
+    get_token_encoder,
+    num_tokens,
+)
+
+
+class CountingEncoder:
+    def __init__(self):
+        self.encoded: list[str] = []
+
+    def encode(self, text: str) -> list[int]:
+        self.encoded.append(text)
+        return list(range(len(text.split())))
+
+    def encode_batch(self, texts: list[str]) -> list[list[int]]:
+        return [self.encode(text) for text in texts]
+
+
+def test_token_counts_are_cached():
+    encoder = CountingEncoder()
+    counter = TokenCounter(encoder)  # type: ignore
+
+    counts = counter.counts(["a b", "c", "a b", ""])
+    assert counts.tolist() == [2, 1, 2, 0]
+    assert counter("c") == 1
+    assert sorted(encoder.encoded) == ["", "a b", "c"]
+
+
+def test_token_count_cache_is_bounded():
+    encoder = CountingEncoder()
+    counter = TokenCounter(encoder, max_cached_chars=8)  # type: ignore
+
+    assert counter.counts(["a", "b c", "d e f"]).tolist() == [1, 2, 3]
+    assert counter("d e f") == 3
+    # a text longer than the whole cache is counted but never cached
+    assert counter("g h i j k") == 5
+    assert counter("g h i j k") == 5
+    assert encoder.encoded.count("g h i j k") == 2
+    assert counter("d e f") == 3
+    assert encoder.encoded.count("d e f") == 1
+
+
+def test_counts_match_the_encoder():
+    texts = ["hello world", "graph rag|context\n", ""]
+    counts = TokenCounter().counts(texts)
+    assert counts.tolist() == [num_tokens(text, get_token_encoder()) for text in texts]
+
+
+def test_fit_token_budget():
+    counts = np.array([3, 4, 5])
+    assert fit_token_budget(counts, 12) == 3
+    assert fit_token_budget(counts, 11) == 2
+    assert fit_token_budget(counts, 7) == 2
+    assert fit_token_budget(counts, 7, used=1) == 1
+    assert fit_token_budget(counts, 2) == 0
+    assert fit_token_budget(np.array([], dtype=np.int64), 10) == 0
@@ -0,0 +1,62 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+
+from graphrag.query.structured_search.drift_search.budget import DRIFTBudget
+
+
+class Tracker:
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+
+    async def call(self, budget, started: asyncio.Event | None = None):
+        async with budget.slot(10):
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            if started is not None:
+                started.set()
+            await asyncio.sleep(0.01)
+            self.running -= 1
+
+
+async def test_a_query_holds_at_most_its_share_of_the_slots():
+    budget = DRIFTBudget(concurrency=4, query_concurrency=2)
+    query = budget.query()
+    tracker = Tracker()
+
+    await asyncio.gather(*[tracker.call(query) for _ in range(10)])
+
+    assert tracker.peak == 2
+
+
+async def test_queries_share_the_engine_slots():
+    budget = DRIFTBudget(concurrency=3, query_concurrency=2)
+    tracker = Tracker()
+
+    await asyncio.gather(*[
+        tracker.call(query)
+        for query in [budget.query(), budget.query()]
+        for _ in range(5)
+    ])
+    assert tracker.peak == 3
+
+    # a second query is served while the first one has a backlog of actions
+    first, second = budget.query(), budget.query()
+    started = asyncio.Event()
+    backlog = [asyncio.create_task(tracker.call(first)) for _ in range(20)]
+    await asyncio.wait_for(tracker.call(second, started), timeout=1)
+    assert started.is_set()
+    assert not all(task.done() for task in backlog)
+    await asyncio.gather(*backlog)
+
+
+async def test_token_budget_delays_calls():
+    budget = DRIFTBudget(concurrency=4, query_concurrency=4, tokens_per_minute=20)
+    query = budget.query()
+
+    async with query.slot(20):
+        pass
+    assert budget.tokens is not None
+    assert budget.tokens.level < 1
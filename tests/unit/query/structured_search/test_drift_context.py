@@ -0,0 +1,96 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from graphrag.config.models.drift_search_config import DRIFTSearchConfig
+from graphrag.model.community_report import CommunityReport
+from graphrag.query.structured_search.drift_search.drift_context import (
+    DRIFTSearchContextBuilder,
+)
+from tests.unit.query.helpers.fake_llm import FakeChatLLM, FakeTextEmbedding
+
+rng = np.random.default_rng(0)
+QUERY_EMBEDDING = rng.normal(size=8).tolist()
+
+
+def create_reports(size: int) -> list[CommunityReport]:
+    return [
+        CommunityReport(
+            id=str(i),
+            short_id=str(i),
+            title=f"report {i}",
+            community_id=str(i),
+            full_content=f"report {i}",
+            full_content_embedding=rng.normal(size=8).tolist(),
+        )
+        for i in range(size)
+    ]
+
+
+def create_builder(reports: list[CommunityReport], **kwargs):
+    return DRIFTSearchContextBuilder(
+        chat_llm=FakeChatLLM("a hypothetical answer"),  # type: ignore
+        text_embedder=FakeTextEmbedding(QUERY_EMBEDDING),
+        entities=[],
+        entity_text_embeddings=None,  # type: ignore
+        reports=reports,
+        config=DRIFTSearchConfig(drift_k_followups=5),
+        local_mixed_context=object(),  # type: ignore
+        **kwargs,
+    )
+
+
+def top_k_by_dataframe(reports: list[CommunityReport], k: int) -> pd.DataFrame:
+    report_df = pd.DataFrame({
+        "short_id": [report.short_id for report in reports],
+        "community_id": [report.community_id for report in reports],
+        "full_content": [report.full_content for report in reports],
+    })
+    embeddings = np.vstack([report.full_content_embedding for report in reports])
+    report_df["similarity"] = (embeddings @ QUERY_EMBEDDING) / (
+        np.linalg.norm(embeddings, axis=1) * np.linalg.norm(QUERY_EMBEDDING)
+    )
+    return report_df.nlargest(k, "similarity").loc[
+        :, ["short_id", "community_id", "full_content"]
+    ]
+
+
+async def test_top_k_reports_match_a_full_sort():
+    reports = create_reports(200)
+    builder = create_builder(reports)
+
+    for _ in range(2):
+        top_k, token_ct = await builder.build_context("question")
+        pd.testing.assert_frame_equal(top_k, top_k_by_dataframe(reports, 5))
+    assert token_ct["llm_calls"] == 1
+    assert builder.report_embeddings.dtype == np.float32
+    assert builder.report_embeddings.flags.c_contiguous
+    np.testing.assert_allclose(
+        np.linalg.norm(builder.report_embeddings, axis=1), 1, rtol=1e-6
+    )
+
+
+async def test_memory_mapped_report_embeddings(tmp_path: Path):
+    reports = create_reports(50)
+    expected = top_k_by_dataframe(reports, 5)
+    path = tmp_path / "report_embeddings.npy"
+    np.save(
+        path,
+        DRIFTSearchContextBuilder.normalize_report_embeddings(
+            np.array([report.full_content_embedding for report in reports])
+        ),
+    )
+    for report in reports:
+        report.full_content_embedding = None
+
+    builder = create_builder(reports, report_embeddings=np.load(path, mmap_mode="r"))
+    top_k, _ = await builder.build_context("question")
+
+    pd.testing.assert_frame_equal(top_k, expected)
+    with pytest.raises(ValueError, match="50 out of 50"):
+        await create_builder(reports).build_context("question")
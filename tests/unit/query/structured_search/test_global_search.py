@@ -0,0 +1,118 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import json
+
+import tiktoken
+
+from graphrag.callbacks.noop_query_callbacks import NoopQueryCallbacks
+from graphrag.query.context_builder.builders import (
+    ContextBuilderResult,
+    GlobalContextBuilder,
+)
+from graphrag.query.structured_search.base import MapResponseStats, SearchResult
+from graphrag.query.structured_search.global_search.search import (
+    GlobalSearch,
+    _KeyPoints,
+)
+from tests.unit.query.helpers.fake_llm import FakeChatLLM
+
+
+class FakeContextBuilder(GlobalContextBuilder):
+    def __init__(self, chunks: list[str]):
+        self.chunks = chunks
+
+    async def build_context(self, query, conversation_history=None, **kwargs):
+        return ContextBuilderResult(context_chunks=self.chunks, context_records={})
+
+
+class StatsCallbacks(NoopQueryCallbacks):
+    def __init__(self):
+        self.stats: list[MapResponseStats] = []
+
+    def on_map_response_stats(self, map_response_stats: MapResponseStats) -> None:
+        self.stats.append(map_response_stats)
+
+
+def create_search(delays: dict[str, float], **kwargs):
+    # answer each map batch with its key point after its delay
+    llm = FakeChatLLM(
+        responses={
+            f"<{batch}>": json.dumps({
+                "points": [{"description": f"point from {batch}", "score": 50}]
+            })
+            for batch in delays
+        },
+        delays={f"<{batch}>": delay for batch, delay in delays.items()},
+    )
+    callbacks = StatsCallbacks()
+    search = GlobalSearch(
+        llm=llm,  # type: ignore
+        context_builder=FakeContextBuilder([f"<{batch}>" for batch in delays]),
+        token_encoder=tiktoken.get_encoding("cl100k_base"),
+        callbacks=[callbacks],
+        json_mode=False,
+        **kwargs,
+    )
+    return search, llm, callbacks
+
+
+async def test_map_deadline_cancels_stragglers():
+    search, llm, callbacks = create_search(
+        {"fast": 0, "also fast": 0, "straggler": 60}, map_deadline=0.5
+    )
+
+    result = await search.search("question")
+
+    assert result.response == "the answer"
+    assert len(result.map_responses) == 2
+    # the reduce prompt is the last one
+    assert "point from fast" in llm.prompts[-1]
+    assert "point from straggler" not in llm.prompts[-1]
+    [stats] = callbacks.stats
+    assert (stats.batches, stats.completed, stats.cancelled) == (3, 2, 1)
+    assert len(stats.latencies) == 2
+    assert stats.percentile(50) <= stats.percentile(99) <= stats.reduce_start < 60
+
+
+async def test_early_reduce_fraction_and_score():
+    delays = {"fast": 0, "slow": 0.05, "straggler": 60}
+    search, _, callbacks = create_search(delays, early_reduce_fraction=0.5)
+    await search.search("question")
+    assert callbacks.stats[0].completed == 2
+
+    search, _, callbacks = create_search(delays, early_reduce_score=50)
+    streamed = [chunk async for chunk in search.stream_search("question")]
+    assert "".join(streamed) == "the answer"
+    assert callbacks.stats[0].completed == 1
+
+
+def map_response(points: list[tuple[int, str]]) -> SearchResult:
+    return SearchResult(
+        response=[{"answer": answer, "score": score} for score, answer in points],
+        context_data="",
+        context_text="",
+        completion_time=0,
+        llm_calls=1,
+        prompt_tokens=0,
+        output_tokens=0,
+    )
+
+
+def test_key_points_keep_the_longest_fitting_prefix():
+    encoder = tiktoken.get_encoding("cl100k_base")
+    responses = [
+        map_response([(100, "a"), (90, "word " * 50)]),
+        map_response([(10, "b")]),
+    ]
+    expected = "----Analyst 1----\nImportance Score: 100\na"
+
+    # the point ranked after the first one that overflows is dropped, whatever the arrival order
+    for order in [[0, 1], [1, 0]]:
+        key_points = _KeyPoints(40, encoder)
+        for analyst in order:
+            key_points.add(analyst, responses[analyst])
+        assert key_points.text() == expected
+        assert key_points.count == 3
+    assert _KeyPoints.from_responses(responses, 40, encoder).text() == expected
+    assert _KeyPoints.from_responses(responses, 0, encoder).text() == ""
@@ -0,0 +1,104 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from graphrag.model.community_report import CommunityReport
+from graphrag.query.indexer_adapters import (
+    aembed_community_reports,
+    embed_community_reports,
+    read_indexer_report_embeddings,
+)
+from graphrag.utils.api import MultiVectorStore
+from graphrag.vector_stores.base import VectorStoreDocument
+from graphrag.vector_stores.lancedb import LanceDBVectorStore
+from tests.unit.query.helpers.fake_llm import FakeTextEmbedding
+
+
+def create_store(path: Path, size: int, prefix: str = "report ") -> LanceDBVectorStore:
+    store = LanceDBVectorStore(collection_name="reports")
+    store.connect(db_uri=str(path))
+    store.load_documents([
+        VectorStoreDocument(
+            id=f"{prefix}{i}", text=f"report {i}", vector=[float(i), 1.0, 0.5]
+        )
+        for i in range(size)
+    ])
+    return store
+
+
+def test_report_embeddings_are_read_in_bulk(tmp_path: Path):
+    store = create_store(tmp_path, size=30)
+    reports = [
+        CommunityReport(id=id, short_id=id, title=id, community_id=id)
+        for id in ["report 25", "missing", "report 3", "report 25"]
+    ]
+
+    embeddings = read_indexer_report_embeddings(reports, store)
+
+    assert embeddings.dtype == np.float32
+    assert embeddings.shape == (4, 3)
+    assert np.isnan(embeddings[1]).all()
+    assert [report.full_content_embedding for report in reports] == [
+        [25.0, 1.0, 0.5],
+        None,
+        [3.0, 1.0, 0.5],
+        [25.0, 1.0, 0.5],
+    ]
+    assert [document.vector for document in store.search_by_ids(["report 3"])] == [
+        store.search_by_id("report 3").vector
+    ]
+
+
+def test_reports_without_any_embedding_are_missing(tmp_path: Path):
+    store = create_store(tmp_path, size=3)
+    reports = [
+        CommunityReport(id=id, short_id=id, title=id, community_id=id)
+        for id in ["missing", "also missing"]
+    ]
+
+    embeddings = read_indexer_report_embeddings(reports, store)
+
+    assert embeddings.shape == (2, 0)
+    assert [report.full_content_embedding for report in reports] == [None, None]
+
+
+def test_multi_index_search_by_ids(tmp_path: Path):
+    store = MultiVectorStore(
+        [
+            create_store(tmp_path / "a", size=3, prefix=""),
+            create_store(tmp_path / "b", size=5, prefix=""),
+        ],
+        ["a", "b"],
+    )
+
+    embeddings = store.get_by_ids(["4-b", "1-a", "7-a"])
+
+    assert embeddings[:2].tolist() == [[4.0, 1.0, 0.5], [1.0, 1.0, 0.5]]
+    assert np.isnan(embeddings[2]).all()
+
+
+@pytest.mark.parametrize("concurrent", [True, False])
+async def test_only_missing_report_embeddings_are_embedded(concurrent: bool):
+    embedder = FakeTextEmbedding(lambda text: [float(len(text)), 1.0])
+    reports_df = pd.DataFrame({
+        "full_content": ["a", "bb", "ccc"],
+        "full_content_embedding": [None, [0.0, 1.0], None],
+    })
+
+    if concurrent:
+        reports_df = await aembed_community_reports(reports_df, embedder)  # type: ignore
+    else:
+        # the sync helper also works under a running event loop
+        reports_df = embed_community_reports(reports_df, embedder)  # type: ignore
+
+    assert sorted(embedder.embedded) == ["a", "ccc"]
+    assert reports_df["full_content_embedding"].tolist() == [
+        [1.0, 1.0],
+        [0.0, 1.0],
+        [3.0, 1.0],
+    ]
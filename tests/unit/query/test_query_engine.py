@@ -0,0 +1,193 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+import shutil
+from pathlib import Path
+
+import pytest
+
+import graphrag.api.query_engine as query_engine
+import graphrag.query.structured_search.global_search.community_context as community_context
+from graphrag.api.query_engine import GraphRagQueryEngine, load_query_index
+from graphrag.cli.serve import handle_request
+from graphrag.config.create_graphrag_config import create_graphrag_config
+from graphrag.config.enums import SearchMethod
+from tests.unit.query.helpers.fake_llm import FakeChatLLM
+from tests.verbs.util import DEFAULT_MODEL_CONFIG
+
+MAP_RESPONSE = (
+    '{"points": [{"description": "A key point [Data: Reports (1)]", "score": 80}]}'
+)
+
+
+def write_index(path: Path, tables: list[str] | None = None) -> None:
+    path.mkdir(parents=True, exist_ok=True)
+    for name in tables or [
+        "entities",
+        "communities",
+        "community_reports",
+        "text_units",
+        "relationships",
+    ]:
+        shutil.copy(f"tests/verbs/data/{name}.parquet", path / f"{name}.parquet")
+
+
+@pytest.fixture
+def llm(monkeypatch: pytest.MonkeyPatch) -> FakeChatLLM:
+    llm = FakeChatLLM(MAP_RESPONSE, answer="the answer")
+    created = []
+
+    def get_llm(config):
+        created.append(config)
+        return llm
+
+    monkeypatch.setattr(query_engine, "get_llm", get_llm)
+    llm.created = created  # type: ignore
+    return llm
+
+
+@pytest.fixture
+def counted_reports(monkeypatch: pytest.MonkeyPatch) -> list:
+    calls = []
+    read_indexer_reports = query_engine.read_indexer_reports
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return read_indexer_reports(*args, **kwargs)
+
+    monkeypatch.setattr(query_engine, "read_indexer_reports", counting)
+    return calls
+
+
+def create_config(output_dir: Path, **settings):
+    return create_graphrag_config({
+        "models": DEFAULT_MODEL_CONFIG,
+        "output": {"base_dir": str(output_dir)},
+        **settings,
+    })
+
+
+async def test_concurrent_queries_share_the_loaded_index(
+    tmp_path: Path, llm: FakeChatLLM, counted_reports: list
+):
+    write_index(tmp_path / "v1")
+    engine = await GraphRagQueryEngine.load(
+        create_config(tmp_path / "v1"), warm=[SearchMethod.GLOBAL]
+    )
+    assert engine.index.covariates is None
+    assert len(counted_reports) == 1
+
+    results = await asyncio.gather(*[
+        engine.global_search(f"question {i}") for i in range(5)
+    ])
+
+    assert [response for response, _ in results] == ["the answer"] * 5
+    assert all(len(context["reports"]) > 0 for _, context in results)  # type: ignore
+    # the reports were adapted and the client created once, while warming
+    assert len(counted_reports) == 1
+    assert len(llm.created) == 1  # type: ignore
+    assert len(llm.prompts) >= 5
+
+    streamed = [chunk async for chunk in engine.global_search_streaming("question", 1)]
+    assert "".join(streamed) == "the answer"
+    assert len(counted_reports) == 2
+
+
+async def test_warm_builds_the_context_on_the_running_loop(
+    tmp_path: Path, llm: FakeChatLLM, monkeypatch: pytest.MonkeyPatch
+):
+    loops = []
+    build_context = community_context.GlobalCommunityContext.build_context
+
+    async def recording(self, *args, **kwargs):
+        loops.append(asyncio.get_running_loop())
+        return await build_context(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        community_context.GlobalCommunityContext, "build_context", recording
+    )
+    write_index(tmp_path / "v1")
+
+    await GraphRagQueryEngine.load(
+        create_config(tmp_path / "v1"), warm=[SearchMethod.GLOBAL]
+    )
+
+    assert loops == [asyncio.get_running_loop()]
+
+
+async def test_swap_to_a_new_index_version(
+    tmp_path: Path, llm: FakeChatLLM, counted_reports: list
+):
+    write_index(tmp_path / "v1")
+    write_index(tmp_path / "v2")
+    engine = await GraphRagQueryEngine.load(create_config(tmp_path / "v1"))
+    await engine.global_search("question")
+    first_reports = len(counted_reports)
+
+    index = await load_query_index(create_config(tmp_path / "v2"), version="v2")
+    index.community_reports = index.community_reports.head(1)
+    await engine.swap(index, warm=[SearchMethod.GLOBAL])
+
+    assert engine.index.version == "v2"
+    assert len(counted_reports) == first_reports + 1
+    _, context = await engine.global_search("question")
+    assert len(context["reports"]) == 1  # type: ignore
+    # the LLM client is kept when the configuration does not change
+    assert len(llm.created) == 1  # type: ignore
+
+
+async def test_map_context_batches_are_built_once_and_persisted(
+    tmp_path: Path, llm: FakeChatLLM, monkeypatch: pytest.MonkeyPatch
+):
+    builds = []
+    build_community_context = community_context.build_community_context
+
+    def counting(*args, **kwargs):
+        builds.append(kwargs)
+        return build_community_context(*args, **kwargs)
+
+    monkeypatch.setattr(community_context, "build_community_context", counting)
+    write_index(tmp_path / "v1")
+    config = create_config(tmp_path / "v1", global_search={"persist_context": True})
+
+    engine = await GraphRagQueryEngine.load(config, warm=[SearchMethod.GLOBAL])
+    assert len(builds) == 1
+    _, first = await engine.global_search("question")
+    _, second = await engine.global_search("another question")
+    assert len(builds) == 1
+    assert first["reports"].equals(second["reports"])  # type: ignore
+    assert any((tmp_path / "v1" / "global_search_context").iterdir())
+
+    # a new engine over the same index reads the persisted batches
+    engine = await GraphRagQueryEngine.load(config)
+    _, persisted = await engine.global_search("question")
+    assert len(builds) == 1
+    assert persisted["reports"].equals(first["reports"])  # type: ignore
+
+
+async def test_server_requests(tmp_path: Path, llm: FakeChatLLM):
+    write_index(tmp_path / "v1")
+    write_index(tmp_path / "v2")
+    engine = await GraphRagQueryEngine.load(create_config(tmp_path / "v1"))
+
+    async def reload(data: str | None) -> None:
+        await engine.reload(create_config(Path(data or tmp_path / "v1")))
+
+    result = await handle_request(
+        engine, {"method": "global", "query": "question"}, reload
+    )
+    assert result["response"] == "the answer"
+    assert isinstance(result["context_data"]["reports"], list)
+    assert result["version"] == str(tmp_path / "v1")
+
+    result = await handle_request(
+        engine, {"command": "reload", "data": str(tmp_path / "v2")}, reload
+    )
+    assert result == {"version": str(tmp_path / "v2")}
+    await handle_request(engine, {"method": "global", "query": "question"}, reload)
+    # a new configuration gets new clients
+    assert len(llm.created) == 2  # type: ignore
+
+    with pytest.raises(ValueError, match="Unknown command"):
+        await handle_request(engine, {"command": "stop"}, reload)
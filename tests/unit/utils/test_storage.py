@@ -0,0 +1,130 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import os
+
+import pandas as pd
+import pytest
+
+from graphrag.storage.blob_pipeline_storage import BlobRangeReader
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+
+TEXT_UNITS = pd.DataFrame({
+    "id": ["a", "b", "c"],
+    "text": ["first", "second", "third"],
+    "n_tokens": [10, 20, 30],
+})
+
+
+class FakeBlobClient:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.downloaded = 0
+
+    def get_blob_properties(self):
+        return type("Properties", (), {"size": len(self.data)})
+
+    def download_blob(self, offset: int, length: int):
+        self.downloaded += length
+        chunk = self.data[offset : offset + length]
+        return type("Downloader", (), {"readall": lambda self: chunk})()
+
+
+class FakeBlobStorage(MemoryPipelineStorage):
+    def __init__(self):
+        super().__init__()
+        self.clients: list[FakeBlobClient] = []
+
+    def table_source(self, key: str):
+        client = FakeBlobClient(self._storage[key])
+        self.clients.append(client)
+        return BlobRangeReader(client)
+
+
+@pytest.mark.parametrize(
+    "storage_factory",
+    [
+        lambda tmp_path: FilePipelineStorage(str(tmp_path)),
+        lambda tmp_path: MemoryPipelineStorage(),
+        lambda tmp_path: FakeBlobStorage(),
+    ],
+)
+async def test_round_trip(tmp_path, storage_factory):
+    storage = storage_factory(tmp_path)
+    await write_table_to_storage(TEXT_UNITS, "text_units", storage)
+
+    table = await load_table_from_storage("text_units", storage)
+    pd.testing.assert_frame_equal(table, TEXT_UNITS)
+
+    projected = await load_table_from_storage(
+        "text_units", storage, columns=["id", "text"]
+    )
+    pd.testing.assert_frame_equal(projected, TEXT_UNITS[["id", "text"]])
+
+    filtered = await load_table_from_storage(
+        "text_units", storage, columns=["id"], filters=[("n_tokens", ">", 15)]
+    )
+    assert filtered["id"].tolist() == ["b", "c"]
+
+
+async def test_file_storage_overwrites_mapped_table(tmp_path):
+    storage = FilePipelineStorage(str(tmp_path))
+    await write_table_to_storage(TEXT_UNITS, "text_units", storage)
+    first = await load_table_from_storage("text_units", storage)
+
+    await write_table_to_storage(TEXT_UNITS.iloc[:1], "text_units", storage)
+    second = await load_table_from_storage("text_units", storage)
+
+    assert first["n_tokens"].sum() == 60
+    assert len(second) == 1
+    assert sorted(storage.keys()) == ["text_units.parquet"]
+
+
+async def test_blob_reader_fetches_only_requested_ranges():
+    storage = FakeBlobStorage()
+    wide = TEXT_UNITS.assign(text=[os.urandom(200_000).hex() for _ in range(3)])
+    await write_table_to_storage(wide, "text_units", storage)
+
+    table = await load_table_from_storage("text_units", storage, columns=["id"])
+
+    assert table["id"].tolist() == ["a", "b", "c"]
+    size = len(await storage.get("text_units.parquet"))
+    assert storage.clients[-1].downloaded < size / 4
+
+
+async def test_file_storage_copies_as_hard_links(tmp_path):
+    storage = FilePipelineStorage(str(tmp_path / "output"))
+    backup = FilePipelineStorage(str(tmp_path / "backup"))
+    await write_table_to_storage(TEXT_UNITS, "text_units", storage)
+
+    await storage.copy("text_units.parquet", backup)
+
+    source = tmp_path / "output" / "text_units.parquet"
+    copy = tmp_path / "backup" / "text_units.parquet"
+    assert os.path.samefile(source, copy)
+    # writing the table again replaces the file, the copy keeps the previous version
+    await write_table_to_storage(TEXT_UNITS.iloc[:1], "text_units", storage)
+    assert not os.path.samefile(source, copy)
+    pd.testing.assert_frame_equal(
+        await load_table_from_storage("text_units", backup), TEXT_UNITS
+    )
+    assert sorted(backup.keys()) == ["text_units.parquet"]
+
+
+async def test_copy_across_storage_types(tmp_path):
+    storage = FilePipelineStorage(str(tmp_path))
+    memory = MemoryPipelineStorage()
+    await write_table_to_storage(TEXT_UNITS, "text_units", storage)
+
+    await storage.copy("text_units.parquet", memory)
+    await memory.copy("text_units.parquet", memory, "previous.parquet")
+    await memory.copy("previous.parquet", storage, "previous.parquet")
+
+    assert await memory.get("previous.parquet") is await memory.get(
+        "text_units.parquet"
+    )
+    pd.testing.assert_frame_equal(
+        await load_table_from_storage("previous", storage), TEXT_UNITS
+    )
@@ -5,8 +5,12 @@ from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
 from graphrag.config.create_graphrag_config import create_graphrag_config
 from graphrag.config.embeddings import (
     all_embeddings,
+    community_report_embeddings,
 )
 from graphrag.config.enums import TextEmbeddingTarget
+from graphrag.index.workflows.generate_community_report_embeddings import (
+    run_workflow as run_community_report_workflow,
+)
 from graphrag.index.workflows.generate_text_embeddings import (
     run_workflow,
 )
@@ -49,6 +53,19 @@ async def test_generate_text_embeddings():
 
     parquet_files = context.storage.keys()
 
+    for field in all_embeddings:
+        assert (f"embeddings.{field}.parquet" in parquet_files) == (
+            field not in community_report_embeddings
+        )
+
+    await run_community_report_workflow(
+        config,
+        context,
+        NoopWorkflowCallbacks(),
+    )
+
+    parquet_files = context.storage.keys()
+
     for field in all_embeddings:
         assert f"embeddings.{field}.parquet" in parquet_files
 